@@ -0,0 +1,142 @@
+"""
+Admission Control
+=================
+Bounded concurrency and load shedding for /extract-skills.
+
+At most `max_in_flight` extractions run at once; up to `max_queue` more wait
+(FIFO) for at most `max_wait_s`. Everything else is shed immediately instead
+of piling up in uvicorn until the Node caller times out (120s) on work that
+finishes anyway:
+
+    queue full          -> 429, counted as reason="queue_full"
+    waited max_wait_s   -> 503, counted as reason="queue_timeout"
+
+Both carry a Retry-After hint estimated from the current queue length and
+the recent average service time.
+
+Environment:
+    NLP_MAX_IN_FLIGHT       - concurrent extractions (default: NLP_EXTRACT_WORKERS)
+    NLP_MAX_QUEUE           - requests allowed to wait for a slot (default: 32)
+    NLP_MAX_QUEUE_WAIT_MS   - longest a request may wait for a slot (default: 30000)
+"""
+
+import asyncio
+import math
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Optional
+
+from fastapi import HTTPException
+
+try:
+    from .metrics import Counter, Gauge, Histogram
+except ImportError:
+    from metrics import Counter, Gauge, Histogram
+
+ADMISSION_IN_FLIGHT = Gauge("nlp_admission_in_flight", "Admitted /extract-skills requests currently being served")
+ADMISSION_QUEUE_DEPTH = Gauge("nlp_admission_queue_depth", "/extract-skills requests waiting for an admission slot")
+ADMISSION_SHED = Counter(
+    "nlp_admission_shed_total", "/extract-skills requests rejected by admission control", ["reason"]
+)
+ADMISSION_WAIT = Histogram("nlp_admission_wait_seconds", "Time admitted requests waited for a slot")
+
+# Bounds for the Retry-After hint (seconds)
+MIN_RETRY_AFTER_S = 1
+MAX_RETRY_AFTER_S = 60
+
+
+class AdmissionController:
+    """
+    In-flight limit plus bounded FIFO wait queue, for use on the event loop.
+
+    Usage:
+        async with controller.admit():
+            ...  # run the extraction
+    """
+
+    def __init__(self, max_in_flight: int, max_queue: int, max_wait_s: float):
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_queue = max(0, max_queue)
+        self.max_wait_s = max(0.0, max_wait_s)
+        self.in_flight = 0
+        self.queued = 0
+        # EWMA of service time, seeds the Retry-After estimate
+        self.avg_service_s = 1.0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # Semaphores bind to the loop that first waits on them; the app may be
+        # started more than once per process (benchmarks, TestClient)
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or (self._loop is not loop and self.in_flight == 0 and self.queued == 0):
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+            self._loop = loop
+        return self._semaphore
+
+    def retry_after_s(self) -> int:
+        """Seconds until a slot is likely to free up for a new request"""
+        backlog = self.queued + self.in_flight
+        estimate = math.ceil(backlog * self.avg_service_s / self.max_in_flight)
+        return int(min(MAX_RETRY_AFTER_S, max(MIN_RETRY_AFTER_S, estimate)))
+
+    def _shed(self, status_code: int, reason: str, detail: str) -> HTTPException:
+        ADMISSION_SHED.inc(reason=reason)
+        return HTTPException(
+            status_code=status_code, detail=detail, headers={"Retry-After": str(self.retry_after_s())}
+        )
+
+    @asynccontextmanager
+    async def admit(self):
+        """Wait for a slot (bounded), or raise a 429/503 HTTPException"""
+        semaphore = self._get_semaphore()
+
+        wait_start = time.perf_counter()
+        if self.in_flight >= self.max_in_flight or self.queued > 0:
+            if self.queued >= self.max_queue:
+                raise self._shed(429, "queue_full", f"Server busy: {self.queued} requests already queued")
+            self.queued += 1
+            ADMISSION_QUEUE_DEPTH.inc()
+            try:
+                await asyncio.wait_for(semaphore.acquire(), timeout=self.max_wait_s)
+            except asyncio.TimeoutError:
+                raise self._shed(
+                    503, "queue_timeout", f"Server busy: no extraction slot within {self.max_wait_s:.0f}s"
+                )
+            finally:
+                self.queued -= 1
+                ADMISSION_QUEUE_DEPTH.dec()
+        else:
+            await semaphore.acquire()
+        ADMISSION_WAIT.observe(time.perf_counter() - wait_start)
+
+        self.in_flight += 1
+        ADMISSION_IN_FLIGHT.inc()
+        service_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.avg_service_s = 0.8 * self.avg_service_s + 0.2 * (time.perf_counter() - service_start)
+            self.in_flight -= 1
+            ADMISSION_IN_FLIGHT.dec()
+            semaphore.release()
+
+    def get_state(self) -> Dict[str, Any]:
+        return {
+            "max_in_flight": self.max_in_flight,
+            "max_queue": self.max_queue,
+            "max_wait_s": self.max_wait_s,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "avg_service_ms": round(self.avg_service_s * 1000, 1),
+        }
+
+
+def controller_from_env(default_in_flight: int) -> AdmissionController:
+    """Build the /extract-skills controller from NLP_MAX_IN_FLIGHT / NLP_MAX_QUEUE / NLP_MAX_QUEUE_WAIT_MS"""
+    return AdmissionController(
+        max_in_flight=int(os.environ.get("NLP_MAX_IN_FLIGHT", str(default_in_flight))),
+        max_queue=int(os.environ.get("NLP_MAX_QUEUE", "32")),
+        max_wait_s=int(os.environ.get("NLP_MAX_QUEUE_WAIT_MS", "30000")) / 1000.0,
+    )
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Boilerplate Store Benchmark
+===========================
+Simulates one employer's postings: every short/typical corpus document gets
+the same company paragraphs (overview, ways of working, interview process,
+benefits, EEO, fraud notice - taken from the long documents) appended, the
+way careers sites repeat them on every job page.
+
+The postings are sent once through extract_skills_with_phrasematcher with a
+fresh BoilerplateStore so it learns the repeated paragraphs, then timed with
+the learned store (on) and without a store (off):
+
+    tokens      - tokens spaCy parsed per posting
+    extract     - extraction p50 (on includes the store lookups)
+    skills      - skills only found off (lost) or only on (gained)
+    hit rate    - store lookups answered as boilerplate while timing
+
+Usage (from backend/nlp_service):
+    python benchmarks/bench_boilerplate.py
+    python benchmarks/bench_boilerplate.py --min-documents 2 --iterations 50
+    python benchmarks/bench_boilerplate.py --save /tmp/boilerplate.json
+"""
+
+import argparse
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from harness import (  # noqa: E402
+    add_common_arguments, environment_info, load_corpus, p50_ms, save_baseline, silenced_output,
+)
+
+# Company paragraphs of the long documents, by how they start
+_EMPLOYER_PARAGRAPH_RE = re.compile(
+    r"^(?:company overview|how we work|interview process|compensation and benefits|diversity, equity|"
+    r"we are a global|competitive salary|we are an equal opportunity|we never ask)",
+    re.IGNORECASE,
+)
+
+
+def build_postings(corpus: str) -> List[Dict[str, str]]:
+    """Short/typical corpus documents, each followed by the same employer paragraphs"""
+    from text_preprocessing import preprocess_text
+
+    employer = []
+    for doc in load_corpus(corpus, ["long"]):
+        for paragraph in preprocess_text(doc["text"]).split("\n\n"):
+            if _EMPLOYER_PARAGRAPH_RE.match(paragraph) and paragraph not in employer:
+                employer.append(paragraph)
+    block = "\n\n".join(employer)
+    return [
+        {"id": doc["id"], "text": f"{preprocess_text(doc['text'])}\n\n{block}"}
+        for doc in load_corpus(corpus, ["short", "typical"])
+    ]
+
+
+def run(args) -> Dict[str, Any]:
+    with silenced_output(args.quiet):
+        import main
+        from boilerplate import BoilerplateStore
+        from skills_matcher import extract_skills_with_phrasematcher, get_skills_database
+
+        postings = build_postings(args.corpus)
+        if not postings:
+            raise SystemExit(f"No short/typical documents in corpus {args.corpus}")
+
+        nlp_model = main.load_spacy_model()
+        skills_db = get_skills_database()
+        skills_db.get_phrase_matcher(nlp_model)
+
+        def extract(text, store=None):
+            return extract_skills_with_phrasematcher(text, nlp_model, skills_db, boilerplate=store)
+
+        store = BoilerplateStore(capacity=args.capacity, min_documents=args.min_documents, min_chars=args.min_chars)
+        for posting in postings:
+            extract(posting["text"], store)
+        learned = store.get_state()
+        store.hits = store.misses = 0
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for posting in postings:
+            text = posting["text"]
+            check = store.check(text)
+            off_skills = {name for name, _, _ in extract(text)}
+            on_skills = {name for name, _, _ in extract(text, store)}
+            results[posting["id"]] = {
+                "chars": len(text),
+                "paragraphs_skipped": check.skipped,
+                "off_tokens": len(nlp_model(text)),
+                "on_tokens": len(nlp_model(check.text)),
+                "off_extract_p50_ms": p50_ms(lambda: extract(text), args.iterations, args.warmup),
+                "on_extract_p50_ms": p50_ms(lambda: extract(text, store), args.iterations, args.warmup),
+                "skills_lost": sorted(off_skills - on_skills),
+                "skills_gained": sorted(on_skills - off_skills),
+            }
+
+    return {
+        "corpus_version": args.corpus,
+        "config": {
+            "iterations": args.iterations, "warmup": args.warmup, "capacity": args.capacity,
+            "min_documents": args.min_documents, "min_chars": args.min_chars,
+        },
+        "environment": environment_info(),
+        "learned": learned,
+        "store": store.get_state(),
+        "results": results,
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    learned = report["learned"]
+    print(f"\nLearned from {len(report['results'])} postings: {learned['boilerplate_paragraphs']} boilerplate "
+          f"paragraphs of {learned['entries']} tracked")
+    print(f"\n{'posting':<28} {'skipped':>7} {'tokens off':>10} {'on':>6} {'extract off':>12} {'on':>7} {'saved':>6}")
+    total_off = total_on = 0.0
+    for posting_id, r in report["results"].items():
+        total_off += r["off_extract_p50_ms"]
+        total_on += r["on_extract_p50_ms"]
+        saved = 1 - r["on_extract_p50_ms"] / r["off_extract_p50_ms"] if r["off_extract_p50_ms"] else 0.0
+        print(f"{posting_id:<28} {r['paragraphs_skipped']:>7} {r['off_tokens']:>10} {r['on_tokens']:>6} "
+              f"{r['off_extract_p50_ms']:>12.2f} {r['on_extract_p50_ms']:>7.2f} {saved:>6.0%}")
+        if r["skills_lost"] or r["skills_gained"]:
+            print(f"{'':<28} skills lost: {r['skills_lost']}  gained: {r['skills_gained']}")
+    if total_off:
+        print(f"\nExtraction p50 summed: {total_off:.2f} ms -> {total_on:.2f} ms ({1 - total_on / total_off:.0%} less)")
+    print(f"Store hit rate while timing: {report['store']['hit_rate']:.0%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark skipping learned boilerplate paragraphs")
+    add_common_arguments(parser, "posting and variant", categories=False)
+    parser.add_argument("--capacity", type=int, default=20000, help="Store capacity (fingerprints)")
+    parser.add_argument("--min-documents", type=int, default=3, help="Distinct postings before a paragraph is skipped")
+    parser.add_argument("--min-chars", type=int, default=120, help="Shorter paragraphs are not tracked")
+    args = parser.parse_args()
+
+    report = run(args)
+    print_report(report)
+    if args.save:
+        save_baseline(args.save, report)
+        print(f"\nSaved report to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Fuzzy Stage Benchmark
+=====================
+Measures the typo lookup of near-miss tokens (fuzzy_matcher.py) on every
+preprocessed corpus document and on a typo'd copy of it, where each
+one-word skill the clean text yields is misspelled by swapping two of its
+inner letters ("Kubernetes" -> "Kuebrnetes") wherever it occurs.
+
+Per document the report gives the p50 of a full extraction with use_fuzzy
+off and on (the word cache cleared before each call, so every near-miss
+word is scored), the fuzzy stage time alone (cold, and warm: every word
+already in the cross-request cache), the near-miss words looked up, and on
+the typo'd copy how many of the misspelled skills come back.
+
+`cap` feeds one synthetic posting with --noise distinct near-miss words
+(random letters, none in the dictionary's vocabulary) through the fuzzy
+stage with the per-request cap at each of --caps, to show that the cap, not
+the text, bounds its latency. `index` gives the build time, target count
+and retained memory of the FuzzyMatcher.
+
+Usage (from backend/nlp_service):
+    python benchmarks/bench_fuzzy.py
+    python benchmarks/bench_fuzzy.py --categories long --iterations 50
+    python benchmarks/bench_fuzzy.py --noise 5000 --caps 50 200 1000 5000 --save /tmp/fuzzy.json
+"""
+
+import argparse
+import random
+import re
+import string
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from harness import (  # noqa: E402
+    add_common_arguments, environment_info, load_corpus, measure_allocations, p50_ms, percentile, save_baseline,
+    silenced_output,
+)
+
+
+def _misspell(word: str) -> str:
+    """Swap the two letters after the second one: one OSA edit, same first and last letter"""
+    return word[:2] + word[3] + word[2] + word[4:]
+
+
+def typoed(text: str, skills: List[str]) -> Tuple[str, Dict[str, str]]:
+    """`text` with every occurrence of each one-word skill misspelled; returns (text, typo -> skill)"""
+    typos = {}
+    for skill in skills:
+        if not skill.isalpha() or len(skill) < 6 or skill[2] == skill[3]:
+            continue
+        pattern = re.compile(rf"\b{re.escape(skill)}\b", re.IGNORECASE)
+        if pattern.search(text):
+            text = pattern.sub(lambda m: _misspell(m.group(0)), text)
+            typos[_misspell(skill)] = skill
+    return text, typos
+
+
+def noise_text(count: int, seed: int) -> str:
+    rng = random.Random(seed)
+    words = {"".join(rng.choices(string.ascii_lowercase, k=rng.randint(6, 10))) for _ in range(count)}
+    return "Requirements:\n" + "\n".join(f"- Experience with {word}" for word in sorted(words))
+
+
+def run(args) -> Dict[str, Any]:
+    documents = load_corpus(args.corpus, args.categories)
+    if not documents:
+        raise SystemExit(f"No documents in corpus {args.corpus} for categories {args.categories}")
+
+    with silenced_output(args.quiet):
+        import time
+
+        import main
+        from fuzzy_matcher import FuzzyMatcher
+        from skills_matcher import (
+            PhraseMatcherExtraction, _prepare_match_text, extract_skills_with_phrasematcher, get_skills_database,
+        )
+        from text_preprocessing import preprocess_text
+
+        nlp_model = main.load_spacy_model()
+        skills_db = get_skills_database()
+        skills_db.get_phrase_matcher(nlp_model)
+
+        start = time.perf_counter()
+        fuzzy = skills_db.get_fuzzy_matcher()
+        build_ms = round((time.perf_counter() - start) * 1000, 1)
+        if fuzzy is None:
+            raise SystemExit("Fuzzy matching is off (NLP_FUZZY_MATCHING=0) or rapidfuzz is not installed")
+        built: List[FuzzyMatcher] = []
+        memory = measure_allocations(lambda: built.append(FuzzyMatcher.from_skills(skills_db.skills)))
+        built.clear()
+
+        def extract(text: str, use_fuzzy: bool):
+            fuzzy.clear_cache()
+            return extract_skills_with_phrasematcher(text, nlp_model, skills_db, use_fuzzy=use_fuzzy)
+
+        def fuzzy_stage(text: str, limit: int, cold: bool = True) -> PhraseMatcherExtraction:
+            if cold:
+                fuzzy.clear_cache()
+            extraction = PhraseMatcherExtraction(nlp_model, skills_db)
+            extraction.fuzzy_limit = limit
+            extraction.add_docs([nlp_model(_prepare_match_text(text))])
+            return extraction
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for doc in documents:
+            text = preprocess_text(doc["text"])
+            clean = {name for name, _, _ in extract(text, False)}
+            variant, typos = typoed(text, sorted(clean))
+            recovered = {name for name, _, _ in extract(variant, True)}
+            missed_without = {name for name, _, _ in extract(variant, False)}
+            row: Dict[str, Any] = {"category": doc["category"], "typos": len(typos)}
+            row["recovered"] = sum(skill in recovered for skill in typos.values())
+            row["recovered_without_fuzzy"] = sum(skill in missed_without for skill in typos.values())
+            for name, sample in (("clean", text), ("typoed", variant)):
+                row[f"{name}_off_p50_ms"] = p50_ms(lambda: extract(sample, False), args.iterations, args.warmup)
+                row[f"{name}_on_p50_ms"] = p50_ms(lambda: extract(sample, True), args.iterations, args.warmup)
+                stage = [fuzzy_stage(sample, args.caps[-1]) for _ in range(args.iterations)]
+                row[f"{name}_stage_p50_ms"] = round(percentile([e.fuzzy_seconds for e in stage], 50) * 1000, 3)
+                row[f"{name}_words"] = len(stage[0].fuzzy_words)
+                warm = [fuzzy_stage(sample, args.caps[-1], cold=False) for _ in range(args.iterations)]
+                row[f"{name}_stage_warm_p50_ms"] = round(percentile([e.fuzzy_seconds for e in warm], 50) * 1000, 3)
+            results[doc["id"]] = row
+
+        noise = noise_text(args.noise, args.seed)
+        cap: Dict[str, Dict[str, Any]] = {}
+        for limit in args.caps:
+            runs = [fuzzy_stage(noise, limit) for _ in range(args.iterations)]
+            cap[str(limit)] = {
+                "words": len(runs[0].fuzzy_words),
+                "capped": len(runs[0].fuzzy_capped),
+                "stage_p50_ms": round(percentile([e.fuzzy_seconds for e in runs], 50) * 1000, 3),
+            }
+
+    return {
+        "corpus_version": args.corpus,
+        "config": {
+            "iterations": args.iterations, "warmup": args.warmup, "noise": args.noise, "caps": args.caps,
+            "seed": args.seed,
+        },
+        "environment": environment_info(),
+        "index": {"targets": len(fuzzy), "build_ms": build_ms, "memory_kb": memory["alloc_retained_kb"]},
+        "cap": cap,
+        "results": results,
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    index = report["index"]
+    print(f"\nFuzzyMatcher: {index['targets']} targets, built in {index['build_ms']:.0f} ms, {index['memory_kb']:.0f} KB")
+
+    print(f"\n{'document':<32} {'typos':>5} {'found':>5} {'w/o':>4}"
+          f" {'clean off':>9} {'on':>7} {'stage':>6} {'warm':>5} {'words':>5}"
+          f" {'typo off':>9} {'on':>7} {'stage':>6} {'warm':>5} {'words':>5}")
+    for doc_id, r in report["results"].items():
+        cells = " ".join(
+            f"{r[f'{name}_off_p50_ms']:>9.2f} {r[f'{name}_on_p50_ms']:>7.2f} {r[f'{name}_stage_p50_ms']:>6.2f}"
+            f" {r[f'{name}_stage_warm_p50_ms']:>5.2f} {r[f'{name}_words']:>5}"
+            for name in ("clean", "typoed")
+        )
+        print(f"{doc_id:<32} {r['typos']:>5} {r['recovered']:>5} {r['recovered_without_fuzzy']:>4} {cells}")
+    print("(p50 ms; found = misspelled skills extracted with the fuzzy stage, w/o = without it)")
+
+    print(f"\n{'cap':>6} {'looked up':>10} {'capped':>7} {'stage p50 ms':>13}   ({report['config']['noise']} noise words)")
+    for limit, c in report["cap"].items():
+        print(f"{limit:>6} {c['words']:>10} {c['capped']:>7} {c['stage_p50_ms']:>13.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the fuzzy (typo) matching stage")
+    add_common_arguments(parser, "document and setting")
+    parser.add_argument("--noise", type=int, default=2000, help="Distinct near-miss words in the cap posting")
+    parser.add_argument("--caps", type=int, nargs="+", default=[50, 200, 1000, 2000],
+                        help="Per-request candidate caps to run the noise posting with (the last one is also "
+                             "used for the per-document stage timing)")
+    parser.add_argument("--seed", type=int, default=13, help="Seed for the noise posting")
+    args = parser.parse_args()
+
+    report = run(args)
+    print_report(report)
+    if args.save:
+        save_baseline(args.save, report)
+        print(f"\nSaved report to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
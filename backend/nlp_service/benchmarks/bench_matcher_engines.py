@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Matcher Engine Benchmark
+========================
+Builds every matcher engine (matcher_engines.py) over the full skills
+database and runs it on each preprocessed corpus document:
+
+    phrasematcher          spaCy PhraseMatcher (the default)
+    aho_corasick           Aho-Corasick automaton, pyahocorasick when installed
+    aho_corasick_python    the pure-Python automaton (only listed when
+                           pyahocorasick is installed, otherwise it is the row above)
+
+Per engine the report gives the build time and retained memory (tracemalloc,
+or the automaton's own size for pyahocorasick, which allocates in C).
+Per document it gives the p50 of matching a tokenized Doc, and whether the
+matches equal PhraseMatcher's. `lookup` times a dictionary-only lookup on
+the raw text: make_doc + PhraseMatcher, against AhoCorasickEngine.find().
+
+`dedupe` builds PhraseMatcher over the skills plus every generated custom
+keyword variation (the dictionary before any deduplication) with and
+without PhraseMatcherEngine.build(dedupe=True), and reports the patterns
+dropped and the build time (p50 of --builds) and memory saved.
+
+Usage (from backend/nlp_service):
+    python benchmarks/bench_matcher_engines.py
+    python benchmarks/bench_matcher_engines.py --categories long --iterations 50
+    python benchmarks/bench_matcher_engines.py --save /tmp/matcher_engines.json
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from harness import (  # noqa: E402
+    add_common_arguments, environment_info, load_corpus, measure_allocations, p50_ms, percentile, save_baseline,
+    silenced_output,
+)
+
+
+def run(args) -> Dict[str, Any]:
+    documents = load_corpus(args.corpus, args.categories)
+    if not documents:
+        raise SystemExit(f"No documents in corpus {args.corpus} for categories {args.categories}")
+
+    with silenced_output(args.quiet):
+        import main
+        from custom_keywords_loader import load_custom_keywords
+        from matcher_engines import AhoCorasickEngine, PhraseMatcherEngine, ahocorasick
+        from skills_matcher import get_skills_database
+        from text_preprocessing import preprocess_text
+
+        nlp_model = main.load_spacy_model()
+        skills = get_skills_database().skills
+
+        builders = {
+            "phrasematcher": lambda: PhraseMatcherEngine.build(nlp_model, skills),
+            "aho_corasick": lambda: AhoCorasickEngine(skills),
+        }
+        if ahocorasick is not None:
+            builders["aho_corasick_python"] = lambda: AhoCorasickEngine(skills, native=False)
+
+        engines: Dict[str, Any] = {}
+        builds: Dict[str, Dict[str, Any]] = {}
+        for name, build in builders.items():
+            # Timed untraced; a second, traced build gives the retained memory
+            engine = engines[name] = build()
+            built: List[Any] = []
+            memory = measure_allocations(lambda: built.append(build()))
+            built.clear()
+            builds[name] = {
+                "implementation": getattr(engine, "implementation", "spacy"),
+                "patterns": engine.pattern_count,
+                "build_ms": round(engine.build_seconds * 1000, 1),
+                # pyahocorasick allocates outside the Python heap, so tracemalloc misses it
+                "memory_kb": (round(engine.automaton.get_stats()["total_size"] / 1024, 1)
+                              if getattr(engine, "implementation", "") == "pyahocorasick"
+                              else memory["alloc_retained_kb"]),
+            }
+
+        enumerated = skills + [v for keyword in load_custom_keywords() for v in keyword["variations"]]
+        dedupe: Dict[str, Dict[str, Any]] = {}
+        for enabled in (False, True):
+            timings = []
+            for _ in range(args.builds):
+                engine = PhraseMatcherEngine.build(nlp_model, enumerated, dedupe=enabled)
+                timings.append(engine.build_seconds)
+            built = []
+            memory = measure_allocations(lambda: built.append(PhraseMatcherEngine.build(nlp_model, enumerated, dedupe=enabled)))
+            built.clear()
+            dedupe["on" if enabled else "off"] = {
+                "input": len(enumerated),
+                "patterns": engine.pattern_count,
+                "build_ms": round(percentile(timings, 50) * 1000, 1),
+                "memory_kb": memory["alloc_retained_kb"],
+            }
+
+        texts = {doc["id"]: preprocess_text(doc["text"]) for doc in documents}
+        results: Dict[str, Dict[str, Any]] = {}
+        for doc in documents:
+            text = texts[doc["id"]]
+            parsed = nlp_model.make_doc(text)
+            reference = [(start, end) for _, start, end in engines["phrasematcher"](parsed)]
+            row: Dict[str, Any] = {"category": doc["category"], "tokens": len(parsed), "matches": len(reference)}
+            for name, engine in engines.items():
+                row[f"{name}_match_p50_ms"] = p50_ms(lambda: engine(parsed), args.iterations, args.warmup)
+                row[f"{name}_agrees"] = [(start, end) for _, start, end in engine(parsed)] == reference
+            row["phrasematcher_lookup_p50_ms"] = p50_ms(
+                lambda: engines["phrasematcher"](nlp_model.make_doc(text)), args.iterations, args.warmup
+            )
+            for name, engine in engines.items():
+                if name != "phrasematcher":
+                    row[f"{name}_lookup_p50_ms"] = p50_ms(lambda: engine.find(text), args.iterations, args.warmup)
+            results[doc["id"]] = row
+
+    return {
+        "corpus_version": args.corpus,
+        "config": {"iterations": args.iterations, "warmup": args.warmup, "builds": args.builds},
+        "environment": environment_info(),
+        "engines": builds,
+        "dedupe": dedupe,
+        "results": results,
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    engines = list(report["engines"])
+    print(f"\n{'engine':<22} {'implementation':<15} {'patterns':>9} {'build ms':>9} {'memory KB':>10}")
+    for name, b in report["engines"].items():
+        print(f"{name:<22} {b['implementation']:<15} {b['patterns']:>9} {b['build_ms']:>9.0f} {b['memory_kb']:>10.0f}")
+
+    header = " ".join(f"{name:>20}" for name in engines)
+    print(f"\n{'match p50 ms':<32} {'tokens':>6} {'matches':>7} {header}")
+    for doc_id, r in report["results"].items():
+        cells = " ".join(f"{r[f'{name}_match_p50_ms']:>19.3f}{' ' if r[f'{name}_agrees'] else '!'}" for name in engines)
+        print(f"{doc_id:<32} {r['tokens']:>6} {r['matches']:>7} {cells}")
+    print("(! = matches differ from phrasematcher)")
+
+    print(f"\n{'lookup p50 ms (raw text)':<32} {header}")
+    for doc_id, r in report["results"].items():
+        print(f"{doc_id:<32} " + " ".join(f"{r[f'{name}_lookup_p50_ms']:>20.3f}" for name in engines))
+
+    print(f"\n{'dedupe':<8} {'input':>7} {'patterns':>9} {'build ms':>9} {'memory KB':>10}")
+    for name, d in report["dedupe"].items():
+        print(f"{name:<8} {d['input']:>7} {d['patterns']:>9} {d['build_ms']:>9.0f} {d['memory_kb']:>10.0f}")
+
+    disagreements = {name: sum(not r[f"{name}_agrees"] for r in report["results"].values()) for name in engines}
+    print("\nDocuments with different matches: " + ", ".join(f"{n}={c}" for n, c in disagreements.items()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the PhraseMatcher and Aho-Corasick matcher engines")
+    add_common_arguments(parser, "document and engine")
+    parser.add_argument("--builds", type=int, default=5, help="Timed PhraseMatcher builds per dedupe setting")
+    args = parser.parse_args()
+
+    report = run(args)
+    print_report(report)
+    if args.save:
+        save_baseline(args.save, report)
+        print(f"\nSaved report to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicate Index Benchmark
+==============================
+Re-posts every preprocessed corpus document the way other job boards do and
+looks each variant up in a NearDuplicateIndex holding the originals (plus
+--fill synthetic postings, so lookups run against a full index):
+
+    footer      - a board's tracking footer appended
+    header      - a "Posted 3 days ago" line prepended
+    reordered   - lines shuffled within each paragraph (bullets reordered)
+    board       - footer, header and reordered together
+    edited      - one requirement line with new skills added (hard negative:
+                  reusing the original result loses those skills)
+
+A reuse is correct when the reused result has the same skills as a fresh
+extraction of the variant. Per threshold the report gives precision (correct
+reuses / reuses) and recall (correct reuses / variants whose skills equal
+their original's), and how many of the reuses refresh mode keeps (same line
+set; the others are extracted again) and how many of those are correct.
+Latency compares the lookup (signature + LSH candidates) with a fresh
+extraction; memory is the tracemalloc size of the filled index.
+
+Usage (from backend/nlp_service):
+    python benchmarks/bench_near_duplicates.py
+    python benchmarks/bench_near_duplicates.py --fill 5000 --thresholds 0.8 0.9 0.95
+    python benchmarks/bench_near_duplicates.py --save /tmp/near_duplicates.json
+"""
+
+import argparse
+import random
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from harness import (  # noqa: E402
+    add_common_arguments, environment_info, load_corpus, measure_allocations, p50_ms, save_baseline,
+    silenced_output,
+)
+
+FOOTER = (
+    "Apply via JobBoard Pro. Job ID 48213-XY. Posted 3 days ago. 120 applicants. "
+    "Ref: utm_source=jobboard&utm_medium=listing&utm_campaign=eng_hiring"
+)
+HEADER = "Posted 3 days ago · Over 100 applicants · Promoted"
+EDIT = "Must have: hands-on experience with Rust, Elixir and Apache Cassandra."
+
+
+def _reordered(text: str, rng: random.Random) -> str:
+    paragraphs = []
+    for paragraph in text.split("\n\n"):
+        lines = paragraph.split("\n")
+        if len(lines) >= 3:
+            # Keep the heading line in place, shuffle the bullets below it
+            body = lines[1:]
+            rng.shuffle(body)
+            lines = lines[:1] + body
+        paragraphs.append("\n".join(lines))
+    return "\n\n".join(paragraphs)
+
+
+def _edited(text: str) -> str:
+    paragraphs = text.split("\n\n")
+    middle = len(paragraphs) // 2
+    paragraphs[middle] = f"{paragraphs[middle]}\n{EDIT}"
+    return "\n\n".join(paragraphs)
+
+
+def build_variants(text: str, seed: int) -> Dict[str, str]:
+    rng = random.Random(seed)
+    reordered = _reordered(text, rng)
+    return {
+        "footer": f"{text}\n\n{FOOTER}",
+        "header": f"{HEADER}\n\n{text}",
+        "reordered": reordered,
+        "board": f"{HEADER}\n\n{reordered}\n\n{FOOTER}",
+        "edited": _edited(text),
+    }
+
+
+def _scrambled(text: str, seed: int) -> str:
+    """Same words and line lengths in random order: an unseen posting of the same size"""
+    rng = random.Random(seed)
+    lines = [line.split() for line in text.split("\n")]
+    words = [word for line in lines for word in line]
+    rng.shuffle(words)
+    scrambled = iter(words)
+    return "\n".join(" ".join(next(scrambled) for _ in line) for line in lines)
+
+
+def _filler(vocabulary: List[str], count: int, seed: int) -> List[str]:
+    """Distinct synthetic postings: random word sequences from the corpus vocabulary"""
+    rng = random.Random(seed)
+    return [
+        "\n".join(" ".join(rng.choices(vocabulary, k=12)) for _ in range(rng.randint(5, 40)))
+        for _ in range(count)
+    ]
+
+
+def run(args) -> Dict[str, Any]:
+    documents = load_corpus(args.corpus, args.categories)
+    if not documents:
+        raise SystemExit(f"No documents in corpus {args.corpus} for categories {args.categories}")
+
+    with silenced_output(args.quiet):
+        import main
+        from near_duplicates import REFRESH, NearDuplicateIndex, minhash_signature, similarity
+        from skills_matcher import extract_skills_with_phrasematcher, get_skills_database
+        from text_preprocessing import preprocess_text
+
+        nlp_model = main.load_spacy_model()
+        skills_db = get_skills_database()
+        skills_db.get_phrase_matcher(nlp_model)
+
+        def skills(text):
+            return sorted({name for name, _, _ in extract_skills_with_phrasematcher(text, nlp_model, skills_db)})
+
+        originals = {doc["id"]: preprocess_text(doc["text"]) for doc in documents}
+        vocabulary = sorted({word for text in originals.values() for word in text.split()})
+        fillers = _filler(vocabulary, args.fill, args.seed)
+
+        def build_index(threshold: float, mode: str = "reuse") -> NearDuplicateIndex:
+            index = NearDuplicateIndex(capacity=len(originals) + len(fillers), threshold=threshold, mode=mode)
+            for text in fillers:
+                index.store(index.lookup(text), {"skills": [], "stats": {}})
+            for doc_id, text in originals.items():
+                index.store(index.lookup(text), {"skills": original_skills[doc_id], "stats": {}, "id": doc_id})
+            return index
+
+        original_skills = {doc_id: skills(text) for doc_id, text in originals.items()}
+        lowest = min(args.thresholds)
+        index = build_index(lowest)
+        refresh_index = build_index(lowest, REFRESH)
+        built: List[NearDuplicateIndex] = []
+        memory = measure_allocations(lambda: built.append(build_index(lowest)))
+        built.clear()
+
+        lookups: List[Dict[str, Any]] = []
+        results: Dict[str, Dict[str, Any]] = {}
+        for position, doc in enumerate(documents):
+            doc_id = doc["id"]
+            signature = minhash_signature(originals[doc_id])
+            cross = max(
+                (similarity(signature, minhash_signature(other)) for other_id, other in originals.items() if other_id != doc_id),
+                default=0.0,
+            )
+            variants = build_variants(originals[doc_id], args.seed + position)
+            for name, variant in variants.items():
+                check = index.lookup(variant)
+                fresh = skills(variant)
+                lookups.append({
+                    "document": doc_id,
+                    "variant": name,
+                    "similarity": check.similarity,
+                    "matched": check.payload.get("id") if check.payload else None,
+                    "correct": check.payload is not None and check.payload["skills"] == fresh,
+                    "safe": fresh == original_skills[doc_id],
+                    "refresh_reused": refresh_index.lookup(variant).payload is not None,
+                })
+            board, unseen = variants["board"], _scrambled(originals[doc_id], args.seed + position)
+            results[doc_id] = {
+                "category": doc["category"],
+                "cross_document_similarity": round(cross, 3),
+                "lookup_hit_p50_ms": p50_ms(lambda: index.lookup(board), args.iterations, args.warmup),
+                "lookup_miss_p50_ms": p50_ms(lambda: index.lookup(unseen), args.iterations, args.warmup),
+                "extract_p50_ms": p50_ms(lambda: skills(board), args.iterations, args.warmup),
+            }
+
+    sweep = {}
+    for threshold in args.thresholds:
+        reused = [r for r in lookups if r["matched"] is not None and r["similarity"] >= threshold]
+        correct = sum(r["correct"] for r in reused)
+        safe = sum(r["safe"] for r in lookups)
+        sweep[str(threshold)] = {
+            "reused": len(reused),
+            "correct": correct,
+            "precision": round(correct / len(reused), 4) if reused else 1.0,
+            "recall": round(correct / safe, 4) if safe else 0.0,
+            "refresh_reused": sum(r["refresh_reused"] for r in reused),
+            "refresh_correct": sum(r["refresh_reused"] and r["correct"] for r in reused),
+        }
+
+    return {
+        "corpus_version": args.corpus,
+        "config": {
+            "iterations": args.iterations, "warmup": args.warmup, "fill": args.fill,
+            "thresholds": args.thresholds, "seed": args.seed,
+        },
+        "environment": environment_info(),
+        "index_entries": len(originals) + len(fillers),
+        "index_memory": memory,
+        "sweep": sweep,
+        "lookups": lookups,
+        "results": results,
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(f"\n{'document':<32} {'cross sim.':>10} {'lookup hit':>11} {'miss':>6} {'extract':>8}  (p50 ms)")
+    for doc_id, r in report["results"].items():
+        print(f"{doc_id:<32} {r['cross_document_similarity']:>10.2f} {r['lookup_hit_p50_ms']:>11.3f} "
+              f"{r['lookup_miss_p50_ms']:>6.3f} {r['extract_p50_ms']:>8.2f}")
+
+    print(f"\n{'variant':<10} similarity per document")
+    variants = list(dict.fromkeys(r["variant"] for r in report["lookups"]))
+    for variant in variants:
+        scores = [r["similarity"] for r in report["lookups"] if r["variant"] == variant]
+        unsafe = sum(not r["safe"] for r in report["lookups"] if r["variant"] == variant)
+        print(f"{variant:<10} {' '.join(f'{score:.2f}' for score in scores)}"
+              + (f"   ({unsafe} with different skills)" if unsafe else ""))
+
+    print(f"\n{'threshold':>9} {'reused':>7} {'correct':>8} {'precision':>10} {'recall':>7} "
+          f"{'refresh reused':>15} {'correct':>8}")
+    for threshold, s in report["sweep"].items():
+        print(f"{threshold:>9} {s['reused']:>7} {s['correct']:>8} {s['precision']:>10.1%} {s['recall']:>7.1%} "
+              f"{s['refresh_reused']:>15} {s['refresh_correct']:>8}")
+    memory = report["index_memory"]
+    print(f"\nIndex of {report['index_entries']} postings: {memory['alloc_retained_kb']:.0f} KB retained "
+          f"({memory['alloc_retained_kb'] * 1024 / report['index_entries']:.0f} bytes per posting, "
+          f"placeholder payloads)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark near-duplicate reuse of extraction results")
+    add_common_arguments(parser)
+    parser.add_argument("--fill", type=int, default=1000, help="Synthetic distinct postings added to the index")
+    parser.add_argument("--thresholds", nargs="+", type=float, default=[0.8, 0.85, 0.9, 0.95],
+                        help="Similarity thresholds to report precision/recall for")
+    parser.add_argument("--seed", type=int, default=7, help="Seed for reordering and filler postings")
+    args = parser.parse_args()
+
+    report = run(args)
+    print_report(report)
+    if args.save:
+        save_baseline(args.save, report)
+        print(f"\nSaved report to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Paragraph Cache Benchmark
+=========================
+Models the GenerateKeywordsScreen loop (edit the JD, generate again) on each
+preprocessed corpus document:
+
+    uncached    - extract_skills_with_phrasematcher without a paragraph cache
+    cold        - with an empty cache (unit splitting and cache writes included)
+    rerun       - same text again, every unit cached
+    edit        - one sentence changed in the middle unit (a different edit
+                  on every call, so exactly one unit misses)
+    skills      - skills differing from the uncached path, for the original
+                  text (cold) and for an edited text (edit)
+
+Usage (from backend/nlp_service):
+    python benchmarks/bench_paragraph_cache.py
+    python benchmarks/bench_paragraph_cache.py --categories long --iterations 50
+    python benchmarks/bench_paragraph_cache.py --save /tmp/paragraph_cache.json
+"""
+
+import argparse
+import itertools
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from harness import (  # noqa: E402
+    add_common_arguments, environment_info, load_corpus, p50_ms, save_baseline, silenced_output,
+)
+
+
+def _editor(text: str, units):
+    """Return edit(n): `text` with the middle unit's first line changed (distinct per n)"""
+    start, end = units[len(units) // 2]
+    line_end = text.find("\n", start, end)
+    line_end = end if line_end == -1 else line_end
+    return lambda n: f"{text[:line_end]} Experience with Terraform is a plus ({n}).{text[line_end:]}"
+
+
+def run(args) -> Dict[str, Any]:
+    documents = load_corpus(args.corpus, args.categories)
+    if not documents:
+        raise SystemExit(f"No documents in corpus {args.corpus} for categories {args.categories}")
+
+    with silenced_output(args.quiet):
+        import main
+        from paragraph_cache import ParagraphCache, split_units
+        from skills_matcher import extract_skills_with_phrasematcher, get_skills_database
+        from text_preprocessing import preprocess_text
+
+        nlp_model = main.load_spacy_model()
+        skills_db = get_skills_database()
+        skills_db.get_phrase_matcher(nlp_model)
+
+        def extract(text, cache=None):
+            return extract_skills_with_phrasematcher(text, nlp_model, skills_db, paragraph_cache=cache)
+
+        def skills(text, cache=None):
+            return {name for name, _, _ in extract(text, cache)}
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for doc in documents:
+            text = preprocess_text(doc["text"])
+            units = split_units(text)
+            edit = _editor(text, units)
+            edits = itertools.count()
+
+            warm = ParagraphCache()
+            extract(text, warm)
+            uncached_skills, cold_skills = skills(text), skills(text, ParagraphCache())
+            edited = edit(-1)
+            results[doc["id"]] = {
+                "category": doc["category"],
+                "units": len(units),
+                "uncached_p50_ms": p50_ms(lambda: extract(text), args.iterations, args.warmup),
+                "cold_p50_ms": p50_ms(lambda: extract(text, ParagraphCache()), args.iterations, args.warmup),
+                "rerun_p50_ms": p50_ms(lambda: extract(text, warm), args.iterations, args.warmup),
+                "edit_p50_ms": p50_ms(lambda: extract(edit(next(edits)), warm), args.iterations, args.warmup),
+                "cold_skills_lost": sorted(uncached_skills - cold_skills),
+                "cold_skills_gained": sorted(cold_skills - uncached_skills),
+                "edit_skills_differing": sorted(skills(edited) ^ skills(edited, warm)),
+            }
+
+    return {
+        "corpus_version": args.corpus,
+        "config": {"iterations": args.iterations, "warmup": args.warmup},
+        "environment": environment_info(),
+        "results": results,
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(f"\n{'document':<32} {'units':>5} {'uncached':>9} {'cold':>7} {'rerun':>7} {'edit':>7}  (p50 ms)")
+    for doc_id, r in report["results"].items():
+        print(f"{doc_id:<32} {r['units']:>5} {r['uncached_p50_ms']:>9.2f} {r['cold_p50_ms']:>7.2f} "
+              f"{r['rerun_p50_ms']:>7.2f} {r['edit_p50_ms']:>7.2f}")
+        if r["cold_skills_lost"] or r["cold_skills_gained"] or r["edit_skills_differing"]:
+            print(f"{'':<32} vs uncached - lost: {r['cold_skills_lost']}  gained: {r['cold_skills_gained']}  "
+                  f"after edit: {r['edit_skills_differing']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the per-paragraph extraction cache")
+    add_common_arguments(parser)
+    args = parser.parse_args()
+
+    report = run(args)
+    print_report(report)
+    if args.save:
+        save_baseline(args.save, report)
+        print(f"\nSaved report to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
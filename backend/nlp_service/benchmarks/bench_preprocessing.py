@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Text Preprocessing Benchmark
+============================
+Compares parsing each corpus document as received (raw) with parsing its
+text_preprocessing.preprocess_text output (clean):
+
+    tokens      - tokens in the spaCy doc (what the tagger/parser pay for)
+    parse       - nlp_model(text) latency
+    extract     - extract_skills_with_phrasematcher latency (clean includes
+                  the preprocessing itself)
+    skills      - extracted skills only found raw (lost) or only clean (gained)
+
+Usage (from backend/nlp_service):
+    python benchmarks/bench_preprocessing.py
+    python benchmarks/bench_preprocessing.py --categories long --iterations 50
+    python benchmarks/bench_preprocessing.py --save /tmp/preprocessing.json
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from harness import (  # noqa: E402
+    add_common_arguments, environment_info, load_corpus, p50_ms, save_baseline, silenced_output,
+)
+
+
+def run(args) -> Dict[str, Any]:
+    documents = load_corpus(args.corpus, args.categories)
+    if not documents:
+        raise SystemExit(f"No documents in corpus {args.corpus} for categories {args.categories}")
+
+    with silenced_output(args.quiet):
+        import main
+        from skills_matcher import extract_skills_with_phrasematcher, get_skills_database
+        from text_preprocessing import preprocess_text
+
+        nlp_model = main.load_spacy_model()
+        skills_db = get_skills_database()
+        skills_db.get_phrase_matcher(nlp_model)
+
+        def skills(text):
+            return {name for name, _, _ in extract_skills_with_phrasematcher(text, nlp_model, skills_db)}
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for doc in documents:
+            raw = doc["text"]
+            clean = preprocess_text(raw)
+            raw_skills, clean_skills = skills(raw), skills(clean)
+            results[doc["id"]] = {
+                "category": doc["category"],
+                "raw_chars": len(raw),
+                "clean_chars": len(clean),
+                "raw_tokens": len(nlp_model(raw)),
+                "clean_tokens": len(nlp_model(clean)),
+                "preprocess_p50_ms": p50_ms(lambda: preprocess_text(raw), args.iterations, args.warmup),
+                "raw_parse_p50_ms": p50_ms(lambda: nlp_model(raw), args.iterations, args.warmup),
+                "clean_parse_p50_ms": p50_ms(lambda: nlp_model(clean), args.iterations, args.warmup),
+                "raw_extract_p50_ms": p50_ms(
+                    lambda: extract_skills_with_phrasematcher(raw, nlp_model, skills_db), args.iterations, args.warmup
+                ),
+                "clean_extract_p50_ms": p50_ms(
+                    lambda: extract_skills_with_phrasematcher(preprocess_text(raw), nlp_model, skills_db),
+                    args.iterations, args.warmup,
+                ),
+                "skills_lost": sorted(raw_skills - clean_skills),
+                "skills_gained": sorted(clean_skills - raw_skills),
+            }
+
+    return {
+        "corpus_version": args.corpus,
+        "config": {"iterations": args.iterations, "warmup": args.warmup},
+        "environment": environment_info(),
+        "results": results,
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(f"\n{'document':<32} {'tokens raw':>10} {'clean':>7} {'saved':>7} {'prep ms':>8} "
+          f"{'parse raw':>10} {'clean':>7} {'extract raw':>12} {'clean':>7}")
+    total_raw = total_clean = 0
+    for doc_id, r in report["results"].items():
+        total_raw += r["raw_tokens"]
+        total_clean += r["clean_tokens"]
+        saved = 1 - r["clean_tokens"] / r["raw_tokens"] if r["raw_tokens"] else 0.0
+        print(f"{doc_id:<32} {r['raw_tokens']:>10} {r['clean_tokens']:>7} {saved:>7.0%} "
+              f"{r['preprocess_p50_ms']:>8.3f} {r['raw_parse_p50_ms']:>10.2f} {r['clean_parse_p50_ms']:>7.2f} "
+              f"{r['raw_extract_p50_ms']:>12.2f} {r['clean_extract_p50_ms']:>7.2f}")
+        if r["skills_lost"] or r["skills_gained"]:
+            print(f"{'':<32} skills lost: {r['skills_lost']}  gained: {r['skills_gained']}")
+    if total_raw:
+        print(f"\nTokens parsed: {total_raw} -> {total_clean} ({1 - total_clean / total_raw:.0%} fewer)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark text preprocessing ahead of spaCy")
+    add_common_arguments(parser)
+    args = parser.parse_args()
+
+    report = run(args)
+    print_report(report)
+    if args.save:
+        save_baseline(args.save, report)
+        print(f"\nSaved report to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
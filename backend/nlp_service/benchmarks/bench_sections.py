@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Section-Aware Parsing Benchmark
+===============================
+Compares the current whole-document parse (every token through the tagger,
+parser and NER) with section-aware parsing (narrative sections such as
+"About us" or "Benefits" only tokenized, see sections.py), per corpus
+document after preprocess_text:
+
+    narrative   - share of the text in narrative sections
+    tokens      - tokens that went through the full pipeline
+    parse       - nlp_model(text) vs parse_by_section latency
+    extract     - extract_skills_with_phrasematcher latency, whole vs sectioned
+    accuracy    - skills only found by the whole parse (lost) or only by the
+                  sectioned one (gained); overall precision/recall of the
+                  sectioned skills against the whole-document skills
+
+Usage (from backend/nlp_service):
+    python benchmarks/bench_sections.py
+    python benchmarks/bench_sections.py --categories long --iterations 50
+    python benchmarks/bench_sections.py --save /tmp/sections.json
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from harness import (  # noqa: E402
+    add_common_arguments, environment_info, load_corpus, p50_ms, save_baseline, silenced_output,
+)
+
+
+def run(args) -> Dict[str, Any]:
+    documents = load_corpus(args.corpus, args.categories)
+    if not documents:
+        raise SystemExit(f"No documents in corpus {args.corpus} for categories {args.categories}")
+
+    with silenced_output(args.quiet):
+        import main
+        import skills_matcher
+        from sections import NARRATIVE, detect_sections
+        from skills_matcher import extract_skills_with_phrasematcher, get_skills_database, parse_by_section
+        from text_preprocessing import preprocess_text
+
+        nlp_model = main.load_spacy_model()
+        skills_db = get_skills_database()
+        skills_db.get_phrase_matcher(nlp_model)
+
+        def extract(text, sectioned):
+            skills_matcher.SECTION_AWARE_PARSING = sectioned
+            return extract_skills_with_phrasematcher(text, nlp_model, skills_db)
+
+        def skills(text, sectioned):
+            return {name for name, _, _ in extract(text, sectioned)}
+
+        results: Dict[str, Dict[str, Any]] = {}
+        configured = skills_matcher.SECTION_AWARE_PARSING
+        try:
+            for doc in documents:
+                text = preprocess_text(doc["text"])
+                narrative = sum(s.end - s.start for s in detect_sections(text) if s.kind == NARRATIVE)
+                sectioned_docs = parse_by_section(nlp_model, text)
+                whole_skills, sectioned_skills = skills(text, False), skills(text, True)
+                results[doc["id"]] = {
+                    "category": doc["category"],
+                    "chars": len(text),
+                    "narrative_chars": narrative,
+                    "whole_tokens": len(nlp_model.make_doc(text)),
+                    "sectioned_tokens": sum(len(d) for d in sectioned_docs if not d.user_data.get("tokenized_only")),
+                    "whole_parse_p50_ms": p50_ms(lambda: nlp_model(text), args.iterations, args.warmup),
+                    "sectioned_parse_p50_ms": p50_ms(
+                        lambda: parse_by_section(nlp_model, text), args.iterations, args.warmup
+                    ),
+                    "whole_extract_p50_ms": p50_ms(lambda: extract(text, False), args.iterations, args.warmup),
+                    "sectioned_extract_p50_ms": p50_ms(lambda: extract(text, True), args.iterations, args.warmup),
+                    "whole_skills": len(whole_skills),
+                    "sectioned_skills": len(sectioned_skills),
+                    "skills_lost": sorted(whole_skills - sectioned_skills),
+                    "skills_gained": sorted(sectioned_skills - whole_skills),
+                }
+        finally:
+            skills_matcher.SECTION_AWARE_PARSING = configured
+
+    return {
+        "corpus_version": args.corpus,
+        "config": {"iterations": args.iterations, "warmup": args.warmup},
+        "environment": environment_info(),
+        "results": results,
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(f"\n{'document':<32} {'narr.':>6} {'tokens whole':>12} {'sect.':>6} {'parse whole':>12} {'sect.':>7} "
+          f"{'extract whole':>14} {'sect.':>7}")
+    whole = sectioned = common = 0
+    for doc_id, r in report["results"].items():
+        narrative = r["narrative_chars"] / r["chars"] if r["chars"] else 0.0
+        print(f"{doc_id:<32} {narrative:>6.0%} {r['whole_tokens']:>12} {r['sectioned_tokens']:>6} "
+              f"{r['whole_parse_p50_ms']:>12.2f} {r['sectioned_parse_p50_ms']:>7.2f} "
+              f"{r['whole_extract_p50_ms']:>14.2f} {r['sectioned_extract_p50_ms']:>7.2f}")
+        if r["skills_lost"] or r["skills_gained"]:
+            print(f"{'':<32} skills lost: {r['skills_lost']}  gained: {r['skills_gained']}")
+        whole += r["whole_skills"]
+        sectioned += r["sectioned_skills"]
+        common += r["sectioned_skills"] - len(r["skills_gained"])
+    if whole and sectioned:
+        print(f"\nSectioned vs whole-document skills: precision {common / sectioned:.1%}, recall {common / whole:.1%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark section-aware parsing against the whole-document parse")
+    add_common_arguments(parser)
+    args = parser.parse_args()
+
+    report = run(args)
+    print_report(report)
+    if args.save:
+        save_baseline(args.save, report)
+        print(f"\nSaved report to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
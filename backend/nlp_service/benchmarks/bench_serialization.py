@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Response Serialization Benchmark
+================================
+Times turning an /extract-skills result into response bytes, per result size:
+
+    model    - previous path: SkillMatch/ExtractSkillsResponse models, FastAPI
+               response_model round trip (dump, re-validate, serialize) and
+               stdlib json rendering
+    full     - plain dicts rendered by FastJSONResponse (orjson if installed)
+    compact  - compact payload ("weights" instead of skills + matches) rendered
+               by FastJSONResponse
+
+Results come from real extractions of the long corpus documents plus
+synthetic results of --sizes skills, so large responses can be measured
+without a JD that big.
+
+Usage (from backend/nlp_service):
+    python benchmarks/bench_serialization.py
+    python benchmarks/bench_serialization.py --sizes 100 1000 5000 --no-corpus
+    python benchmarks/bench_serialization.py --save /tmp/serialization.json
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from harness import (  # noqa: E402
+    CORPUS_VERSION, environment_info, load_corpus, save_baseline, silenced_output,
+    summarize_latencies, timed,
+)
+
+ENCODINGS = ("model", "full", "compact")
+
+
+def synthetic_payloads(size: int) -> Dict[str, Dict[str, Any]]:
+    """Full and compact payloads for a result of `size` skills"""
+    skills = [f"Skill {i}" for i in range(size)]
+    weights = [float(3 - i % 4) for i in range(size)]
+    lists = {
+        "stats": {"total_matches": size * 2, "unique_skills": size, "weighted_skills": size},
+        "important_skills": [s for s, w in zip(skills, weights) if w >= 2],
+        "less_important_skills": [s for s, w in zip(skills, weights) if w == 1],
+        "non_technical_skills": [s for s, w in zip(skills, weights) if w == 0],
+    }
+    full = {
+        "skills": skills,
+        "matches": [{"skill": s, "canonical": s.lower(), "weight": w} for s, w in zip(skills, weights)],
+        "count": size,
+        **lists,
+    }
+    compact = {"weights": [[s, w] for s, w in zip(skills, weights)], "count": size, **lists}
+    return {"full": full, "compact": compact}
+
+
+def corpus_payloads(version: str, quiet: bool) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Full and compact payloads from real extractions of the long corpus documents"""
+    with silenced_output(quiet):
+        import main
+        payloads = {}
+        for doc in load_corpus(version, ["long"]):
+            payloads[doc["id"]] = {
+                "full": main._extract_skills_internal(main.ExtractSkillsRequest(text=doc["text"])),
+                "compact": main._extract_skills_internal(main.ExtractSkillsRequest(text=doc["text"], compact=True)),
+            }
+    return payloads
+
+
+def encoders() -> Dict[str, Callable[[Dict[str, Dict[str, Any]]], bytes]]:
+    from fastapi.responses import JSONResponse
+    import main
+    from serialization import FastJSONResponse
+
+    def model_path(payloads):
+        full = payloads["full"]
+        response = main.ExtractSkillsResponse(
+            skills=full["skills"],
+            matches=[main.SkillMatch(**m) for m in full["matches"]],
+            count=full["count"],
+            stats=full["stats"],
+            important_skills=full["important_skills"],
+            less_important_skills=full["less_important_skills"],
+            non_technical_skills=full["non_technical_skills"],
+        )
+        # What FastAPI's response_model handling does with a returned model
+        content = main.ExtractSkillsResponse.model_validate(response.model_dump()).model_dump(mode="json")
+        return JSONResponse(content).body
+
+    return {
+        "model": model_path,
+        "full": lambda payloads: FastJSONResponse(payloads["full"]).body,
+        "compact": lambda payloads: FastJSONResponse(payloads["compact"]).body,
+    }
+
+
+def run(args) -> Dict[str, Any]:
+    groups: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    if not args.no_corpus:
+        groups.update(corpus_payloads(args.corpus, args.quiet))
+    for size in args.sizes:
+        groups[f"synthetic_{size}"] = synthetic_payloads(size)
+
+    results: Dict[str, Dict[str, Dict[str, float]]] = {name: {} for name in ENCODINGS}
+    for name, encode in encoders().items():
+        for group, payloads in groups.items():
+            body = encode(payloads)
+            for _ in range(args.warmup):
+                encode(payloads)
+            latencies: List[float] = [timed(lambda: encode(payloads)) for _ in range(args.iterations)]
+            stats = summarize_latencies(latencies)
+            stats["bytes"] = len(body)
+            stats["skills"] = payloads["full"]["count"]
+            results[name][group] = stats
+
+    from serialization import ORJSON_AVAILABLE
+    return {
+        "corpus_version": args.corpus,
+        "config": {"iterations": args.iterations, "warmup": args.warmup, "sizes": args.sizes,
+                   "orjson": ORJSON_AVAILABLE},
+        "environment": environment_info(),
+        "results": results,
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(f"orjson available: {report['config']['orjson']}")
+    print(f"\n{'encoding':<9} {'group':<28} {'skills':>7} {'p50 ms':>9} {'p95 ms':>9} {'bytes':>9} {'vs model':>9}")
+    model = report["results"]["model"]
+    for name, groups in report["results"].items():
+        for group, s in groups.items():
+            speedup = model[group]["p50_ms"] / s["p50_ms"] if s["p50_ms"] else 0.0
+            print(f"{name:<9} {group:<28} {s['skills']:>7} {s['p50_ms']:>9.3f} {s['p95_ms']:>9.3f} "
+                  f"{s['bytes']:>9} {speedup:>8.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark /extract-skills response serialization")
+    parser.add_argument("--sizes", nargs="+", type=int, default=[50, 500, 2000],
+                        help="Synthetic result sizes (number of skills)")
+    parser.add_argument("--no-corpus", action="store_true",
+                        help="Skip real extractions (no spaCy model / skills database needed)")
+    parser.add_argument("--corpus", default=CORPUS_VERSION, help="Corpus version directory under benchmarks/corpus/")
+    parser.add_argument("--iterations", type=int, default=200, help="Timed encodings per group")
+    parser.add_argument("--warmup", type=int, default=10, help="Untimed encodings per group before timing")
+    parser.add_argument("--save", metavar="PATH", help="Write the JSON report to PATH")
+    parser.add_argument("--verbose", dest="quiet", action="store_false", help="Keep service logs on stdout")
+    args = parser.parse_args()
+
+    report = run(args)
+    print_report(report)
+    if args.save:
+        save_baseline(args.save, report)
+        print(f"\nSaved report to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Skill Match Benchmark
+=====================
+Measures /match's matching (skill_match.py) on every preprocessed corpus
+document. The JD side is the document's extracted skills; the resume side is
+the skill list of the next document in the corpus (another posting's skills,
+so part of them overlap), sent as free-form names.
+
+Per document the report gives the counts of matched, semantic and missing
+JD skills, and the p50 of:
+
+    resolve    resolve_skills() on the resume list (canonical IDs, typo lookup)
+    loop       scoring the unmatched JD skills one at a time against the
+               unmatched resume skills, as semantic_skill_match did
+    batched    the same pairs as one SimilarityScorer.matrix call + assign()
+    match      match_skills() end to end (exact pass, matrix, assignment)
+
+`sweep` scores --sizes random dictionary skills against as many others, to
+show how loop and batched scale with the list sizes. The scorer is the one
+/match uses: embeddings when sentence-transformers and the classifier cache
+are available, otherwise rapidfuzz string similarity (the report says which).
+The embedding cache is cleared before each timed call.
+
+Usage (from backend/nlp_service):
+    python benchmarks/bench_skill_match.py
+    python benchmarks/bench_skill_match.py --sizes 10 50 200 1000 --save /tmp/skill_match.json
+"""
+
+import argparse
+import random
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from harness import (  # noqa: E402
+    add_common_arguments, environment_info, load_corpus, p50_ms, save_baseline, silenced_output,
+)
+
+
+def run(args) -> Dict[str, Any]:
+    documents = load_corpus(args.corpus, args.categories)
+    if len(documents) < 2:
+        raise SystemExit(f"Need at least two documents in corpus {args.corpus} for categories {args.categories}")
+
+    with silenced_output(args.quiet):
+        import numpy as np
+
+        import main
+        from skill_match import assign, from_extraction, match_skills, resolve_skills
+        from skills_matcher import extract_skills_with_phrasematcher, get_skills_database
+        from text_preprocessing import preprocess_text
+
+        nlp_model = main.load_spacy_model()
+        skills_db = get_skills_database()
+        fuzzy = skills_db.get_fuzzy_matcher()
+        scorer = skills_db.get_similarity_scorer()
+
+        def loop(rows: List[str], columns: List[str]):
+            scorer.clear_cache()
+            for row in rows:
+                scores = scorer.matrix([row], columns)[0]
+                if len(columns):
+                    int(np.argmax(scores))
+
+        def batched(rows: List[str], columns: List[str]):
+            scorer.clear_cache()
+            return assign(scorer.matrix(rows, columns), scorer.threshold)
+
+        extracted = []
+        for doc in documents:
+            matches = extract_skills_with_phrasematcher(preprocess_text(doc["text"]), nlp_model, skills_db)
+            extracted.append(from_extraction(matches, skills_db))
+
+        results: Dict[str, Dict[str, Any]] = {}
+        for position, doc in enumerate(documents):
+            jd = extracted[position]
+            resume_names = [skill.name for skill in extracted[(position + 1) % len(documents)]]
+            resume = resolve_skills(resume_names, skills_db, fuzzy)
+            result = match_skills(jd, resume, scorer)
+            covered = {entry["canonical"] for entry in result["matched"]}
+            used = {entry["resume_skill"] for entry in result["matched"]}
+            rows = [skill.name for skill in jd if skill.canonical not in covered]
+            columns = [skill.name for skill in resume if skill.name not in used]
+            results[doc["id"]] = {
+                "category": doc["category"],
+                "jd_skills": len(jd),
+                "resume_skills": len(resume),
+                "matched": len(result["matched"]),
+                "semantic": len(result["semantic"]),
+                "missing": len(result["missing"]),
+                "pairs": len(rows) * len(columns),
+                "resolve_p50_ms": p50_ms(lambda: resolve_skills(resume_names, skills_db, fuzzy),
+                                          args.iterations, args.warmup),
+                "loop_p50_ms": p50_ms(lambda: loop(rows, columns), args.iterations, args.warmup),
+                "batched_p50_ms": p50_ms(lambda: batched(rows, columns), args.iterations, args.warmup),
+                "match_p50_ms": p50_ms(lambda: (scorer.clear_cache(), match_skills(jd, resume, scorer)),
+                                        args.iterations, args.warmup),
+            }
+
+        rng = random.Random(args.seed)
+        sweep: Dict[str, Dict[str, Any]] = {}
+        for size in args.sizes:
+            names = rng.sample(skills_db.skills, 2 * size)
+            rows, columns = names[:size], names[size:]
+            sweep[str(size)] = {
+                "pairs": size * size,
+                "loop_p50_ms": p50_ms(lambda: loop(rows, columns), args.iterations, args.warmup),
+                "batched_p50_ms": p50_ms(lambda: batched(rows, columns), args.iterations, args.warmup),
+            }
+
+    return {
+        "corpus_version": args.corpus,
+        "config": {"iterations": args.iterations, "warmup": args.warmup, "sizes": args.sizes, "seed": args.seed},
+        "environment": environment_info(),
+        "method": scorer.method,
+        "threshold": scorer.threshold,
+        "sweep": sweep,
+        "results": results,
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(f"\nScorer: {report['method']} (threshold {report['threshold']})")
+
+    print(f"\n{'document':<32} {'jd':>4} {'resume':>6} {'match':>5} {'sem':>4} {'miss':>4} {'pairs':>6}"
+          f" {'resolve':>8} {'loop':>8} {'batched':>8} {'match':>8}")
+    for doc_id, r in report["results"].items():
+        print(f"{doc_id:<32} {r['jd_skills']:>4} {r['resume_skills']:>6} {r['matched']:>5} {r['semantic']:>4}"
+              f" {r['missing']:>4} {r['pairs']:>6} {r['resolve_p50_ms']:>8.3f} {r['loop_p50_ms']:>8.3f}"
+              f" {r['batched_p50_ms']:>8.3f} {r['match_p50_ms']:>8.3f}")
+    print("(p50 ms; resume = the next document's skills)")
+
+    print(f"\n{'size':>6} {'pairs':>9} {'loop p50 ms':>12} {'batched p50 ms':>15}")
+    for size, s in report["sweep"].items():
+        print(f"{size:>6} {s['pairs']:>9} {s['loop_p50_ms']:>12.3f} {s['batched_p50_ms']:>15.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark resume-to-JD skill matching (/match)")
+    add_common_arguments(parser)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 200],
+                        help="JD and resume list sizes for the sweep")
+    parser.add_argument("--seed", type=int, default=13, help="Seed for the sweep's skill sample")
+    args = parser.parse_args()
+
+    report = run(args)
+    print_report(report)
+    if args.save:
+        save_baseline(args.save, report)
+        print(f"\nSaved report to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+"""
+Benchmark Harness
+=================
+Shared helpers for the benchmark scripts: the versioned JD corpus, request
+cache settings, latency statistics, peak RSS / allocation measurement, output
+silencing and JSON baselines.
+"""
+
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+BENCHMARKS_DIR = Path(__file__).parent
+NLP_SERVICE_DIR = BENCHMARKS_DIR.parent
+CORPUS_DIR = BENCHMARKS_DIR / "corpus"
+CORPUS_VERSION = "v1"
+CATEGORIES = ("short", "typical", "long")
+
+# Request-level caches that answer a replayed document without running the
+# pipeline. The route/stream/load benchmarks send every corpus document many
+# times, so they turn these off unless --caches is given.
+CACHE_DISABLED_ENV = {
+    "NLP_NEAR_DUPLICATE_CACHE_SIZE": "0",
+    "NLP_PARAGRAPH_CACHE_SIZE": "0",
+    "NLP_BOILERPLATE_CACHE_SIZE": "0",
+    "NLP_COALESCE_REQUESTS": "0",
+}
+
+# Make main.py / skills_matcher.py importable when run as a script
+if str(NLP_SERVICE_DIR) not in sys.path:
+    sys.path.insert(0, str(NLP_SERVICE_DIR))
+
+
+# ============================================================================
+# Corpus
+# ============================================================================
+
+def load_corpus(version: str = CORPUS_VERSION, categories: Optional[List[str]] = None) -> List[Dict[str, str]]:
+    """
+    Load the versioned JD corpus.
+
+    Files are named <category>_<nn>_<name>.txt under corpus/<version>/. The
+    corpus is never edited in place: add a new version directory instead so
+    baselines stay comparable.
+
+    Returns:
+        List of {"id", "category", "text"} sorted by id
+    """
+    corpus_path = CORPUS_DIR / version
+    if not corpus_path.is_dir():
+        raise FileNotFoundError(f"Corpus version '{version}' not found at {corpus_path}")
+
+    documents = []
+    for path in sorted(corpus_path.glob("*.txt")):
+        category = path.name.split("_", 1)[0]
+        if category not in CATEGORIES:
+            continue
+        if categories and category not in categories:
+            continue
+        documents.append({"id": path.stem, "category": category, "text": path.read_text(encoding="utf-8")})
+    return documents
+
+
+# ============================================================================
+# Statistics
+# ============================================================================
+
+def percentile(values: List[float], pct: float) -> float:
+    """Linear-interpolated percentile (pct in 0..100)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize_latencies(latencies_s: List[float], wall_time_s: Optional[float] = None) -> Dict[str, float]:
+    """p50/p95/p99/mean/max in ms plus throughput (calls per second)"""
+    wall_time_s = wall_time_s if wall_time_s is not None else sum(latencies_s)
+    return {
+        "n": len(latencies_s),
+        "p50_ms": round(percentile(latencies_s, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies_s, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies_s, 99) * 1000, 3),
+        "mean_ms": round(sum(latencies_s) / len(latencies_s) * 1000, 3) if latencies_s else 0.0,
+        "max_ms": round(max(latencies_s) * 1000, 3) if latencies_s else 0.0,
+        "throughput_per_s": round(len(latencies_s) / wall_time_s, 2) if wall_time_s else 0.0,
+    }
+
+
+# ============================================================================
+# Memory
+# ============================================================================
+
+def reset_peak_rss() -> bool:
+    """Reset the kernel's peak RSS counter (Linux only); returns False if unsupported"""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss_mb() -> float:
+    """Peak RSS since the last reset_peak_rss() (Linux), else since process start"""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KB on Linux, bytes on macOS
+    return round(maxrss / (1024 * 1024) if sys.platform == "darwin" else maxrss / 1024, 1)
+
+
+def measure_allocations(func: Callable[[], Any]) -> Dict[str, float]:
+    """
+    Run func once under tracemalloc.
+
+    Kept separate from the timed runs because tracing slows Python code
+    down several-fold.
+
+    Returns:
+        Peak traced memory during the call and memory still held after it (KB)
+    """
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        func()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "alloc_peak_kb": round((peak - baseline) / 1024, 1),
+        "alloc_retained_kb": round((current - baseline) / 1024, 1),
+    }
+
+
+# ============================================================================
+# Output
+# ============================================================================
+
+@contextmanager
+def silenced_output(enabled: bool = True):
+    """
+    Point fd 1/2 at /dev/null while benchmarking.
+
+    The service logs and prints heavily to stdout. Redirecting at the file
+    descriptor level keeps that work (formatting, write syscalls) inside the
+    measurement, as it is in production, without flooding the terminal.
+    """
+    if not enabled:
+        yield
+        return
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved_stdout, saved_stderr = os.dup(1), os.dup(2)
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    try:
+        os.dup2(devnull, 1)
+        os.dup2(devnull, 2)
+        yield
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(saved_stdout, 1)
+        os.dup2(saved_stderr, 2)
+        os.close(devnull)
+        os.close(saved_stdout)
+        os.close(saved_stderr)
+
+
+def environment_info() -> Dict[str, Any]:
+    """Identify the run so baselines from different branches/hosts can be told apart"""
+    try:
+        git_rev = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=NLP_SERVICE_DIR,
+            capture_output=True, text=True, timeout=5
+        ).stdout.strip() or None
+        git_branch = subprocess.run(
+            ["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=NLP_SERVICE_DIR,
+            capture_output=True, text=True, timeout=5
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        git_rev = git_branch = None
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "git_rev": git_rev,
+        "git_branch": git_branch,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+# ============================================================================
+# Baselines
+# ============================================================================
+
+def save_baseline(path: str, report: Dict[str, Any]) -> None:
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+
+
+def load_baseline(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_reports(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float,
+                    metrics=("p50_ms", "p95_ms")) -> List[Dict[str, Any]]:
+    """
+    Compare two reports result-by-result.
+
+    Args:
+        threshold: Relative slowdown (0.15 = 15%) above which a row is a regression
+
+    Returns:
+        One row per (target, group, metric) present in both reports
+    """
+    rows = []
+    for target, groups in current.get("results", {}).items():
+        base_groups = baseline.get("results", {}).get(target, {})
+        for group, stats in groups.items():
+            base_stats = base_groups.get(group)
+            if not base_stats:
+                continue
+            for metric in metrics:
+                old, new = base_stats.get(metric), stats.get(metric)
+                if not old or new is None:
+                    continue
+                change = (new - old) / old
+                rows.append({
+                    "target": target, "group": group, "metric": metric,
+                    "baseline": old, "current": new, "change": change,
+                    "regression": change > threshold,
+                })
+    return rows
+
+
+def print_comparison(rows: List[Dict[str, Any]], baseline_info: Dict[str, Any]) -> None:
+    print(f"\nComparison against baseline {baseline_info.get('git_rev')} "
+          f"({baseline_info.get('git_branch')}, {baseline_info.get('timestamp')})")
+    print(f"{'target':<10} {'group':<10} {'metric':<8} {'baseline':>12} {'current':>12} {'change':>9}")
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(f"{row['target']:<10} {row['group']:<10} {row['metric']:<8} "
+              f"{row['baseline']:>12.2f} {row['current']:>12.2f} {row['change']:>+8.1%}{flag}")
+
+
+def timed(func: Callable[[], Any]) -> float:
+    """Wall time of one call in seconds"""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def p50_ms(func: Callable[[], Any], iterations: int, warmup: int) -> float:
+    """Median wall time of `iterations` calls in ms, after `warmup` untimed calls"""
+    for _ in range(warmup):
+        func()
+    latencies = [timed(func) for _ in range(iterations)]
+    return round(percentile(latencies, 50) * 1000, 3)
+
+
+# ============================================================================
+# Command line
+# ============================================================================
+
+def add_common_arguments(parser, timed_per: str = "document and variant", categories: bool = True) -> None:
+    """
+    Add the options every corpus benchmark takes: --categories (optional),
+    --corpus, --iterations, --warmup, --save and --verbose (args.quiet).
+
+    Args:
+        timed_per: What one timed call covers, for the --iterations help text
+    """
+    if categories:
+        parser.add_argument("--categories", nargs="+", choices=CATEGORIES, default=None,
+                            help="Restrict to these JD lengths (default: all)")
+    parser.add_argument("--corpus", default=CORPUS_VERSION, help="Corpus version directory under benchmarks/corpus/")
+    parser.add_argument("--iterations", type=int, default=20, help=f"Timed calls per {timed_per}")
+    parser.add_argument("--warmup", type=int, default=2,
+                        help=f"Untimed calls per {timed_per.split(' and ')[0]} before timing")
+    parser.add_argument("--save", metavar="PATH", help="Write the JSON report to PATH")
+    parser.add_argument("--verbose", dest="quiet", action="store_false", help="Keep service logs on stdout")
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Load Test
+=========
+Replays the payload generateKeywords (backend/src/controllers/keywords.js)
+sends - {"text": ..., "use_fuzzy": true, "compact": true} to POST /extract-skills - against a
+locally started main:app, spawned the same way keywords.js spawns it.
+
+Modes:
+    closed  - concurrency sweep: N clients each send back-to-back requests
+    open    - open-loop Poisson arrivals at fixed rates; latency is measured
+              from the scheduled send time, so queueing is not hidden
+              (no coordinated omission)
+
+The spawned service runs with the near-duplicate index, paragraph cache,
+boilerplate store and request coalescing disabled (harness.CACHE_DISABLED_ENV):
+the workload replays the same corpus documents, which would otherwise be
+answered from those caches. --caches keeps them on; with --url the running
+service's own settings apply.
+
+While each level runs, /health is probed every --probe-interval seconds.
+/health does no work, so a high probe p99 means the event loop is blocked.
+
+Usage (from backend/nlp_service):
+    python benchmarks/load_test.py --mode closed --concurrency 1 2 4 8
+    python benchmarks/load_test.py --mode open --rates 2 5 10 20 --mix short=0.5,typical=0.4,long=0.1
+    python benchmarks/load_test.py --url http://127.0.0.1:8001 --mode open --rates 5
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from harness import (  # noqa: E402
+    CACHE_DISABLED_ENV, CATEGORIES, CORPUS_VERSION, NLP_SERVICE_DIR, environment_info, load_corpus, save_baseline,
+    summarize_latencies,
+)
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+# ============================================================================
+# Service process
+# ============================================================================
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_service(port: int, extra_env: Dict[str, str], log_path: Optional[str]) -> subprocess.Popen:
+    """
+    Spawn `python -m uvicorn main:app` like keywords.js does.
+
+    stdout/stderr are drained continuously (as the Node parent does) so a full
+    pipe never stalls the service.
+    """
+    env = {
+        **os.environ,
+        "PYTHONUNBUFFERED": os.environ.get("PYTHONUNBUFFERED", "1"),
+        "PYTHONIOENCODING": os.environ.get("PYTHONIOENCODING", "utf-8"),
+        "PYTHONWARNINGS": os.environ.get("PYTHONWARNINGS", "ignore"),
+        **extra_env,
+    }
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port)],
+        cwd=NLP_SERVICE_DIR, env=env, stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+    )
+
+    def drain():
+        sink = open(log_path, "wb") if log_path else None
+        try:
+            for line in process.stdout:
+                if sink:
+                    sink.write(line)
+        finally:
+            if sink:
+                sink.close()
+
+    threading.Thread(target=drain, daemon=True).start()
+    return process
+
+
+async def wait_until_ready(client, base_url: str, timeout_s: float, process: Optional[subprocess.Popen]) -> float:
+    """Poll /ready; returns seconds until ready"""
+    start = time.perf_counter()
+    while time.perf_counter() - start < timeout_s:
+        if process is not None and process.poll() is not None:
+            raise RuntimeError(f"Service exited during startup (code {process.returncode})")
+        try:
+            response = await client.get(f"{base_url}/ready", timeout=5)
+            if response.status_code == 200:
+                return time.perf_counter() - start
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.5)
+    raise RuntimeError(f"Service not ready after {timeout_s:.0f}s")
+
+
+# ============================================================================
+# Workload
+# ============================================================================
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """'short=0.5,typical=0.4,long=0.1' -> weights by category"""
+    mix = {}
+    for part in spec.split(","):
+        category, _, weight = part.partition("=")
+        category = category.strip()
+        if category not in CATEGORIES:
+            raise argparse.ArgumentTypeError(f"Unknown category '{category}' (expected one of {CATEGORIES})")
+        mix[category] = float(weight)
+    return mix
+
+
+class Workload:
+    """Picks JDs from the corpus according to the length mix (seeded, reproducible)"""
+
+    def __init__(self, documents: List[Dict[str, str]], mix: Dict[str, float], seed: int):
+        self.by_category = {c: [d for d in documents if d["category"] == c] for c in CATEGORIES}
+        self.categories = [c for c in mix if mix[c] > 0 and self.by_category.get(c)]
+        self.weights = [mix[c] for c in self.categories]
+        if not self.categories:
+            raise SystemExit("Mix selects no documents from the corpus")
+        self.rng = random.Random(seed)
+
+    def next(self) -> Dict[str, str]:
+        category = self.rng.choices(self.categories, self.weights)[0]
+        return self.rng.choice(self.by_category[category])
+
+
+class LevelResult:
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.by_category: Dict[str, List[float]] = {c: [] for c in CATEGORIES}
+        self.errors: Dict[str, int] = {}
+        self.health_latencies: List[float] = []
+        self.sent = 0
+
+    def error(self, kind: str) -> None:
+        self.errors[kind] = self.errors.get(kind, 0) + 1
+
+
+async def send(client, url: str, doc: Dict[str, str], result: LevelResult, timeout_s: float,
+               scheduled_at: Optional[float] = None) -> None:
+    start = scheduled_at if scheduled_at is not None else time.perf_counter()
+    result.sent += 1
+    try:
+        # Same body as generateKeywords in keywords.js
+        response = await client.post(url, json={"text": doc["text"], "use_fuzzy": True, "compact": True}, timeout=timeout_s)
+        if response.status_code != 200:
+            result.error(f"http_{response.status_code}")
+            return
+    except httpx.TimeoutException:
+        result.error("timeout")
+        return
+    except httpx.TransportError as e:
+        result.error(type(e).__name__)
+        return
+    elapsed = time.perf_counter() - start
+    result.latencies.append(elapsed)
+    result.by_category[doc["category"]].append(elapsed)
+
+
+async def probe_health(client, base_url: str, interval_s: float, result: LevelResult, stop: asyncio.Event) -> None:
+    """Measure /health latency while the level runs (event-loop blocking detector)"""
+    while not stop.is_set():
+        start = time.perf_counter()
+        try:
+            await client.get(f"{base_url}/health", timeout=30)
+            result.health_latencies.append(time.perf_counter() - start)
+        except httpx.TransportError:
+            result.error("health_probe")
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=interval_s)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def run_closed_level(client, base_url: str, workload: Workload, concurrency: int,
+                           duration_s: float, timeout_s: float, probe_interval_s: float) -> Dict[str, Any]:
+    result = LevelResult()
+    url = f"{base_url}/extract-skills"
+    deadline = time.perf_counter() + duration_s
+    stop = asyncio.Event()
+
+    async def worker():
+        while time.perf_counter() < deadline:
+            await send(client, url, workload.next(), result, timeout_s)
+
+    probe = asyncio.create_task(probe_health(client, base_url, probe_interval_s, result, stop))
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - start
+    stop.set()
+    await probe
+    return summarize_level(result, wall, {"mode": "closed", "concurrency": concurrency})
+
+
+async def run_open_level(client, base_url: str, workload: Workload, rate: float, duration_s: float,
+                         timeout_s: float, probe_interval_s: float, seed: int) -> Dict[str, Any]:
+    result = LevelResult()
+    url = f"{base_url}/extract-skills"
+    rng = random.Random(seed)
+    stop = asyncio.Event()
+    tasks = []
+
+    probe = asyncio.create_task(probe_health(client, base_url, probe_interval_s, result, stop))
+    start = time.perf_counter()
+    next_at = start
+    while True:
+        next_at += rng.expovariate(rate)
+        if next_at - start >= duration_s:
+            break
+        delay = next_at - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        tasks.append(asyncio.create_task(send(client, url, workload.next(), result, timeout_s, scheduled_at=next_at)))
+    await asyncio.gather(*tasks)
+    wall = time.perf_counter() - start
+    stop.set()
+    await probe
+    return summarize_level(result, wall, {"mode": "open", "offered_rate": rate})
+
+
+def summarize_level(result: LevelResult, wall_s: float, level: Dict[str, Any]) -> Dict[str, Any]:
+    summary = dict(level)
+    summary.update(summarize_latencies(result.latencies, wall_s))
+    summary["sent"] = result.sent
+    summary["errors"] = result.errors
+    summary["error_rate"] = round(sum(v for k, v in result.errors.items() if k != "health_probe") / result.sent, 4) if result.sent else 0.0
+    summary["by_category_p95_ms"] = {
+        c: summarize_latencies(lat)["p95_ms"] for c, lat in result.by_category.items() if lat
+    }
+    health = summarize_latencies(result.health_latencies)
+    summary["health_p50_ms"] = health["p50_ms"]
+    summary["health_p99_ms"] = health["p99_ms"]
+    return summary
+
+
+# ============================================================================
+# Main
+# ============================================================================
+
+async def run(args) -> Dict[str, Any]:
+    documents = load_corpus(args.corpus)
+    workload = Workload(documents, args.mix, args.seed)
+
+    process = None
+    base_url = args.url.rstrip("/") if args.url else None
+    if base_url is None:
+        port = _free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        extra_env = {} if args.caches else dict(CACHE_DISABLED_ENV)
+        if args.workers:
+            extra_env["NLP_EXTRACT_WORKERS"] = str(args.workers)
+        process = start_service(port, extra_env, args.service_log)
+        print(f"Started main:app on {base_url} (pid {process.pid})", flush=True)
+
+    # Keep-alive pool like the axios agent in keywords.js (maxSockets: 50)
+    limits = httpx.Limits(max_connections=50, max_keepalive_connections=50)
+    levels = []
+    try:
+        async with httpx.AsyncClient(limits=limits) as client:
+            ready_s = await wait_until_ready(client, base_url, args.ready_timeout, process)
+            print(f"Service ready after {ready_s:.1f}s", flush=True)
+
+            if args.mode == "closed":
+                for concurrency in args.concurrency:
+                    level = await run_closed_level(client, base_url, workload, concurrency, args.duration,
+                                                   args.timeout, args.probe_interval)
+                    levels.append(level)
+                    print_level(level)
+            else:
+                for i, rate in enumerate(args.rates):
+                    level = await run_open_level(client, base_url, workload, rate, args.duration,
+                                                 args.timeout, args.probe_interval, args.seed + i)
+                    levels.append(level)
+                    print_level(level)
+    finally:
+        if process is not None:
+            process.terminate()
+            try:
+                process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    return {
+        "corpus_version": args.corpus,
+        "mode": args.mode,
+        "mix": args.mix,
+        "config": {"duration_s": args.duration, "timeout_s": args.timeout, "seed": args.seed,
+                   "extract_workers": args.workers, "caches": args.caches if not args.url else None},
+        "environment": environment_info(),
+        "levels": levels,
+        "saturation": find_saturation(levels, args.slo_p99_ms),
+    }
+
+
+def find_saturation(levels: List[Dict[str, Any]], slo_p99_ms: float) -> Dict[str, Any]:
+    """
+    Saturation throughput = highest successful throughput seen; the last level
+    meeting the p99 SLO without errors is the recommended operating point.
+    """
+    if not levels:
+        return {}
+    peak = max(levels, key=lambda level: level["throughput_per_s"])
+    within_slo = [l for l in levels if l["p99_ms"] <= slo_p99_ms and l["error_rate"] == 0 and l["n"]]
+    return {
+        "max_throughput_per_s": peak["throughput_per_s"],
+        "at_level": {k: peak[k] for k in ("concurrency", "offered_rate") if k in peak},
+        "slo_p99_ms": slo_p99_ms,
+        "max_throughput_within_slo_per_s": max((l["throughput_per_s"] for l in within_slo), default=0.0),
+    }
+
+
+def print_level(level: Dict[str, Any]) -> None:
+    label = f"c={level['concurrency']}" if level["mode"] == "closed" else f"rate={level['offered_rate']}/s"
+    print(f"{label:<12} ok={level['n']:<5} err={level['error_rate']:.1%}  {level['throughput_per_s']:>7.1f} req/s  "
+          f"p50={level['p50_ms']:>8.1f}  p95={level['p95_ms']:>8.1f}  p99={level['p99_ms']:>8.1f} ms  "
+          f"health p99={level['health_p99_ms']:>7.1f} ms", flush=True)
+
+
+def main():
+    if httpx is None:
+        raise SystemExit("httpx is required: pip install httpx")
+
+    parser = argparse.ArgumentParser(description="Load-test POST /extract-skills with keywords.js payloads")
+    parser.add_argument("--mode", choices=("closed", "open"), default="closed")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--rates", type=float, nargs="+", default=[1, 2, 5, 10, 20], help="Open-loop arrivals per second")
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds per level")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix("short=0.3,typical=0.5,long=0.2"))
+    parser.add_argument("--corpus", default=CORPUS_VERSION)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--timeout", type=float, default=120.0, help="Per-request timeout (keywords.js NLP_SERVICE_TIMEOUT)")
+    parser.add_argument("--probe-interval", type=float, default=0.1, help="Seconds between /health probes")
+    parser.add_argument("--slo-p99-ms", type=float, default=2000.0)
+    parser.add_argument("--url", help="Target an already running service instead of spawning one")
+    parser.add_argument("--workers", type=int, help="NLP_EXTRACT_WORKERS for the spawned service")
+    parser.add_argument("--caches", action="store_true",
+                        help="Keep the spawned service's request caches and coalescing on (default: off)")
+    parser.add_argument("--ready-timeout", type=float, default=300.0)
+    parser.add_argument("--service-log", help="Write the spawned service's output to this file")
+    parser.add_argument("--save", metavar="PATH", help="Write the JSON report to PATH")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    saturation = report["saturation"]
+    print(f"\nSaturation throughput: {saturation.get('max_throughput_per_s', 0):.1f} req/s "
+          f"at {saturation.get('at_level')}; within p99 <= {args.slo_p99_ms:.0f}ms: "
+          f"{saturation.get('max_throughput_within_slo_per_s', 0):.1f} req/s")
+    if args.save:
+        save_baseline(args.save, report)
+        print(f"Saved report to {args.save}")
+
+
+if __name__ == "__main__":
+    main()
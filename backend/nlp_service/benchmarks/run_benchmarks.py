@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Extraction Pipeline Benchmarks
+==============================
+Runs the extraction pipeline against the versioned JD corpus and reports
+p50/p95/p99 latency, throughput, peak RSS and allocations per target and
+JD length.
+
+Targets:
+    keywords  - main.extract_keywords_from_text (legacy /extract)
+    skills    - skills_matcher.extract_skills_with_phrasematcher
+    db_load   - SkillsDatabase.load on a fresh instance
+    route     - full POST /extract-skills through FastAPI (TestClient)
+    stream    - /extract-skills/stream event generator; reported as `stream`
+                (whole stream) and `stream_ttfr` (time to the first event)
+
+The near-duplicate index, paragraph cache, boilerplate store and request
+coalescing are disabled (harness.CACHE_DISABLED_ENV) so every timed call
+runs the pipeline; --caches keeps their configured settings.
+
+Usage (from backend/nlp_service):
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --targets skills route --iterations 50
+    python benchmarks/run_benchmarks.py --save benchmarks/baselines/main.json
+    python benchmarks/run_benchmarks.py --compare benchmarks/baselines/main.json
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from harness import (  # noqa: E402
+    CACHE_DISABLED_ENV, CATEGORIES, CORPUS_VERSION, compare_reports, environment_info, load_baseline, load_corpus,
+    measure_allocations, peak_rss_mb, print_comparison, reset_peak_rss, save_baseline,
+    silenced_output, summarize_latencies, timed,
+)
+
+TARGETS = ("keywords", "skills", "db_load", "route", "stream")
+
+
+def _bench_per_document(name: str, documents: List[Dict[str, str]], call: Callable[[str], Any],
+                        iterations: int, warmup: int, quiet: bool) -> Dict[str, Dict[str, float]]:
+    """Time call(text) for every document, grouped by JD length and overall"""
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    allocations: Dict[str, List[Dict[str, float]]] = defaultdict(list)
+
+    reset_peak_rss()
+    with silenced_output(quiet):
+        for doc in documents:
+            text = doc["text"]
+            for _ in range(warmup):
+                call(text)
+            for _ in range(iterations):
+                elapsed = timed(lambda: call(text))
+                latencies[doc["category"]].append(elapsed)
+                latencies["all"].append(elapsed)
+        rss = peak_rss_mb()
+        for doc in documents:
+            alloc = measure_allocations(lambda: call(doc["text"]))
+            allocations[doc["category"]].append(alloc)
+            allocations["all"].append(alloc)
+
+    results = {}
+    for group in [c for c in CATEGORIES if c in latencies] + ["all"]:
+        stats = summarize_latencies(latencies[group])
+        stats["peak_rss_mb"] = rss
+        stats["alloc_peak_kb"] = max(a["alloc_peak_kb"] for a in allocations[group])
+        stats["alloc_retained_kb"] = max(a["alloc_retained_kb"] for a in allocations[group])
+        results[group] = stats
+    print(f"  {name}: done ({len(latencies['all'])} timed calls)", flush=True)
+    return results
+
+
+def _bench_db_load(iterations: int, quiet: bool) -> Dict[str, Dict[str, float]]:
+    """Time SkillsDatabase.load on fresh instances (CSV, custom keywords, classifier, embeddings)"""
+    from skills_matcher import SkillsDatabase, get_skills_database
+
+    csv_path = get_skills_database().csv_path
+    latencies = []
+    reset_peak_rss()
+    with silenced_output(quiet):
+        for _ in range(iterations):
+            latencies.append(timed(lambda: SkillsDatabase(csv_path).load()))
+        rss = peak_rss_mb()
+        alloc = measure_allocations(lambda: SkillsDatabase(csv_path).load()) if iterations else {}
+
+    stats = summarize_latencies(latencies)
+    stats["peak_rss_mb"] = rss
+    stats.update(alloc)
+    print(f"  db_load: done ({iterations} loads)", flush=True)
+    return {"all": stats}
+
+
+def _bench_stream(documents: List[Dict[str, str]], iterations: int, warmup: int,
+                  quiet: bool) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """
+    Time the /extract-skills/stream event generator (main._stream_skills_internal).
+
+    Timed in-process rather than through TestClient, which buffers streamed
+    bodies and would hide the time to the first event.
+    """
+    import threading
+    import main
+
+    def consume(text):
+        request = main.ExtractSkillsRequest(text=text, use_fuzzy=True, compact=True)
+        start = time.perf_counter()
+        first_s = None
+        for _ in main._stream_skills_internal(request, threading.Event()):
+            if first_s is None:
+                first_s = time.perf_counter() - start
+        return first_s, time.perf_counter() - start
+
+    first: Dict[str, List[float]] = defaultdict(list)
+    total: Dict[str, List[float]] = defaultdict(list)
+    reset_peak_rss()
+    with silenced_output(quiet):
+        for doc in documents:
+            for _ in range(warmup):
+                consume(doc["text"])
+            for _ in range(iterations):
+                first_s, total_s = consume(doc["text"])
+                for group in (doc["category"], "all"):
+                    first[group].append(first_s)
+                    total[group].append(total_s)
+        rss = peak_rss_mb()
+
+    results: Dict[str, Dict[str, Dict[str, float]]] = {"stream": {}, "stream_ttfr": {}}
+    for group in [c for c in CATEGORIES if c in total] + ["all"]:
+        for name, latencies in (("stream", total), ("stream_ttfr", first)):
+            stats = summarize_latencies(latencies[group])
+            stats["peak_rss_mb"] = rss
+            results[name][group] = stats
+    print(f"  stream: done ({len(total['all'])} timed streams)", flush=True)
+    return results
+
+
+def _route_client(quiet: bool):
+    """Start the app (runs startup warm-up) and wait until /ready"""
+    from fastapi.testclient import TestClient
+    import main
+
+    client = TestClient(main.app)
+    with silenced_output(quiet):
+        client.__enter__()
+        deadline = time.time() + 600
+        while client.get("/ready").status_code != 200:
+            if time.time() > deadline or main.STARTUP_STATE["stage"].startswith("failed"):
+                raise RuntimeError(f"Service did not become ready: {main.STARTUP_STATE}")
+            time.sleep(0.2)
+    return client
+
+
+def run(args) -> Dict[str, Any]:
+    documents = load_corpus(args.corpus, args.categories)
+    if not documents:
+        raise SystemExit(f"No documents in corpus {args.corpus} for categories {args.categories}")
+
+    counts = {c: sum(1 for d in documents if d["category"] == c) for c in CATEGORIES}
+    print(f"Corpus {args.corpus}: {len(documents)} documents "
+          f"({', '.join(f'{c}={n}' for c, n in counts.items())})")
+    if not args.caches:
+        # Read when main.py is imported below
+        os.environ.update(CACHE_DISABLED_ENV)
+    print(f"Request caches: {'on' if args.caches else 'off'}")
+
+    setup_ms: Dict[str, float] = {}
+    with silenced_output(args.quiet):
+        start = time.perf_counter()
+        import main
+        from skills_matcher import extract_skills_with_phrasematcher, get_skills_database
+        setup_ms["import"] = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        nlp_model = main.load_spacy_model()
+        setup_ms["spacy_model"] = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        skills_db = get_skills_database()
+        skills_db.get_phrase_matcher(nlp_model)
+        setup_ms["skills_database"] = (time.perf_counter() - start) * 1000
+    print("Setup (ms): " + ", ".join(f"{k}={v:.0f}" for k, v in setup_ms.items()))
+
+    results: Dict[str, Any] = {}
+    for target in args.targets:
+        if target == "keywords":
+            results[target] = _bench_per_document(
+                target, documents, main.extract_keywords_from_text, args.iterations, args.warmup, args.quiet
+            )
+        elif target == "skills":
+            results[target] = _bench_per_document(
+                target, documents,
+                lambda text: extract_skills_with_phrasematcher(text, nlp_model, skills_db, use_fuzzy=True),
+                args.iterations, args.warmup, args.quiet,
+            )
+        elif target == "db_load":
+            results[target] = _bench_db_load(args.load_iterations, args.quiet)
+        elif target == "route":
+            client = _route_client(args.quiet)
+            try:
+                def post(text):
+                    # Same payload as generateKeywords in backend/src/controllers/keywords.js
+                    response = client.post("/extract-skills", json={"text": text, "use_fuzzy": True, "compact": True})
+                    response.raise_for_status()
+                results[target] = _bench_per_document(
+                    target, documents, post, args.iterations, args.warmup, args.quiet
+                )
+            finally:
+                with silenced_output(args.quiet):
+                    client.__exit__(None, None, None)
+        elif target == "stream":
+            results.update(_bench_stream(documents, args.iterations, args.warmup, args.quiet))
+
+    return {
+        "corpus_version": args.corpus,
+        "config": {"iterations": args.iterations, "warmup": args.warmup, "load_iterations": args.load_iterations,
+                   "caches": args.caches},
+        "environment": environment_info(),
+        "setup_ms": {k: round(v, 1) for k, v in setup_ms.items()},
+        "results": results,
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    print(f"\n{'target':<12} {'group':<8} {'n':>5} {'p50 ms':>10} {'p95 ms':>10} {'p99 ms':>10} "
+          f"{'ops/s':>9} {'RSS MB':>8} {'alloc KB':>10}")
+    for target, groups in report["results"].items():
+        for group, s in groups.items():
+            print(f"{target:<12} {group:<8} {s['n']:>5} {s['p50_ms']:>10.2f} {s['p95_ms']:>10.2f} "
+                  f"{s['p99_ms']:>10.2f} {s['throughput_per_s']:>9.1f} {s['peak_rss_mb']:>8.1f} "
+                  f"{s.get('alloc_peak_kb', 0):>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the NLP extraction pipeline")
+    parser.add_argument("--targets", nargs="+", choices=TARGETS, default=list(TARGETS))
+    parser.add_argument("--categories", nargs="+", choices=CATEGORIES, default=None,
+                        help="Restrict to these JD lengths (default: all)")
+    parser.add_argument("--corpus", default=CORPUS_VERSION, help="Corpus version directory under benchmarks/corpus/")
+    parser.add_argument("--iterations", type=int, default=20, help="Timed calls per document")
+    parser.add_argument("--warmup", type=int, default=2, help="Untimed calls per document before timing")
+    parser.add_argument("--load-iterations", type=int, default=1, help="Timed SkillsDatabase loads (slow)")
+    parser.add_argument("--caches", action="store_true",
+                        help="Keep the near-duplicate/paragraph/boilerplate caches and coalescing on (default: off)")
+    parser.add_argument("--save", metavar="PATH", help="Write the JSON report (baseline) to PATH")
+    parser.add_argument("--compare", metavar="PATH", help="Compare against a saved JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.15,
+                        help="Relative p50/p95 slowdown flagged as a regression (default: 0.15)")
+    parser.add_argument("--verbose", dest="quiet", action="store_false", help="Keep service logs on stdout")
+    args = parser.parse_args()
+
+    report = run(args)
+    print_report(report)
+
+    if args.save:
+        save_baseline(args.save, report)
+        print(f"\nSaved baseline to {args.save}")
+
+    if args.compare:
+        baseline = load_baseline(args.compare)
+        if baseline.get("corpus_version") != report["corpus_version"]:
+            print(f"\n⚠️  Baseline uses corpus {baseline.get('corpus_version')}, "
+                  f"this run uses {report['corpus_version']} - results are not comparable")
+        if baseline.get("config", {}).get("caches", False) != args.caches:
+            print(f"\n⚠️  Baseline was run with caches {'on' if baseline['config'].get('caches') else 'off'}, "
+                  f"this run has them {'on' if args.caches else 'off'} - results are not comparable")
+        rows = compare_reports(baseline, report, args.threshold)
+        print_comparison(rows, baseline.get("environment", {}))
+        if any(row["regression"] for row in rows):
+            print(f"\n❌ Regressions above {args.threshold:.0%} detected")
+            sys.exit(1)
+        print("\n✅ No regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""
+Boilerplate Paragraphs
+======================
+Learns paragraphs that repeat across postings (EEO statements, benefits,
+"about us") and drops them before spaCy.
+
+Each paragraph of a parsed /extract-skills text is fingerprinted (lowercased,
+whitespace collapsed, blake2b). Per fingerprint the store remembers how many
+distinct documents it appeared in and whether an accepted skill was matched
+inside it. Once a skill-free paragraph has been seen in
+NLP_BOILERPLATE_MIN_DOCUMENTS different documents, later requests skip it:
+no tagging or parsing, and none of the junk candidates the garbage filters
+would discard.
+
+    - A paragraph that ever contributed an accepted skill is never skipped,
+      so a "Our stack: Python, AWS" block repeated in every posting of an
+      employer still counts.
+    - Documents are told apart by the digest of the whole text, so one
+      posting requested by many users does not make its own paragraphs
+      boilerplate.
+    - Short paragraphs (headings such as "Requirements") are not tracked:
+      they are cheap, and their words are context for the next paragraph.
+
+The store is an LRU of at most NLP_BOILERPLATE_CACHE_SIZE fingerprints
+(~250 bytes each), kept in process memory; it starts empty after a restart.
+
+Environment:
+    NLP_BOILERPLATE_CACHE_SIZE     - fingerprints kept, "0" disables (default: 20000)
+    NLP_BOILERPLATE_MIN_DOCUMENTS  - distinct documents before a paragraph is skipped (default: 3)
+    NLP_BOILERPLATE_MIN_CHARS      - shorter paragraphs are never tracked (default: 120)
+"""
+
+import bisect
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Tuple
+
+try:
+    from .metrics import Gauge, record_cache
+except ImportError:
+    from metrics import Gauge, record_cache
+
+BOILERPLATE_ENTRIES = Gauge("nlp_boilerplate_entries", "Paragraph fingerprints held by the boilerplate store")
+
+# Paragraphs are separated by blank lines (preprocess_text joins them with exactly one)
+_PARAGRAPH_SEPARATOR_RE = re.compile(r"\n[ \t]*\n\s*")
+
+
+def _digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=8).digest()
+
+
+def paragraph_fingerprint(paragraph: str) -> bytes:
+    """Fingerprint that ignores case and whitespace differences"""
+    return _digest(" ".join(paragraph.lower().split()))
+
+
+class _Entry:
+    __slots__ = ("documents", "has_skills")
+
+    def __init__(self):
+        self.documents: Tuple[bytes, ...] = ()
+        self.has_skills = False
+
+
+class BoilerplateCheck:
+    """
+    Outcome of BoilerplateStore.check() for one text.
+
+    Attributes:
+        text: The text without its boilerplate paragraphs (the input if none were found)
+        document: Digest of the input text
+        paragraphs: (fingerprint, start, end) of each tracked paragraph in `text`
+        skipped: Number of paragraphs removed
+    """
+
+    __slots__ = ("text", "document", "paragraphs", "skipped")
+
+    def __init__(self, text: str, document: bytes, paragraphs: List[Tuple[bytes, int, int]], skipped: int):
+        self.text = text
+        self.document = document
+        self.paragraphs = paragraphs
+        self.skipped = skipped
+
+
+class BoilerplateStore:
+    """
+    Bounded LRU of paragraph fingerprints; thread-safe (used from executor threads).
+
+    Usage:
+        check = store.check(text)
+        doc = nlp(check.text)
+        ...
+        store.learn(check, start offsets of accepted skill matches in check.text)
+    """
+
+    def __init__(self, capacity: int = 20000, min_documents: int = 3, min_chars: int = 120):
+        self.capacity = capacity
+        self.min_documents = max(1, min_documents)
+        self.min_chars = min_chars
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[bytes, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.capacity > 0
+
+    def _is_boilerplate(self, entry: _Entry) -> bool:
+        return not entry.has_skills and len(entry.documents) >= self.min_documents
+
+    def check(self, text: str) -> BoilerplateCheck:
+        """Split `text` into paragraphs and remove the known boilerplate ones"""
+        document = _digest(text)
+        bounds = []
+        start = 0
+        for separator in _PARAGRAPH_SEPARATOR_RE.finditer(text):
+            bounds.append((start, separator.start()))
+            start = separator.end()
+        bounds.append((start, len(text)))
+
+        kept: List[Tuple[str, bytes]] = []  # (paragraph, fingerprint or b"" if untracked)
+        skipped = 0
+        with self._lock:
+            for start, end in bounds:
+                paragraph = text[start:end]
+                if len(paragraph) < self.min_chars:
+                    kept.append((paragraph, b""))
+                    continue
+                fingerprint = paragraph_fingerprint(paragraph)
+                entry = self._entries.get(fingerprint)
+                if entry is not None and self._is_boilerplate(entry):
+                    self._entries.move_to_end(fingerprint)
+                    self.hits += 1
+                    skipped += 1
+                    record_cache("boilerplate", hit=True)
+                    continue
+                self.misses += 1
+                record_cache("boilerplate", hit=False)
+                kept.append((paragraph, fingerprint))
+
+        if skipped:
+            # Rebuild with one blank line between paragraphs; offsets refer to the new text
+            bounds = []
+            start = 0
+            for paragraph, _ in kept:
+                bounds.append((start, start + len(paragraph)))
+                start += len(paragraph) + 2
+            text = "\n\n".join(paragraph for paragraph, _ in kept)
+        paragraphs = [
+            (fingerprint, start, end) for (_, fingerprint), (start, end) in zip(kept, bounds) if fingerprint
+        ]
+        return BoilerplateCheck(text, document, paragraphs, skipped)
+
+    def learn(self, check: BoilerplateCheck, skill_offsets: Iterable[int]) -> None:
+        """Record the paragraphs of a parsed text; `skill_offsets` are accepted match starts in check.text"""
+        if not check.paragraphs:
+            return
+        offsets = sorted(skill_offsets)
+        with self._lock:
+            for fingerprint, start, end in check.paragraphs:
+                # Any accepted skill match starting inside [start, end)?
+                index = bisect.bisect_left(offsets, start)
+                has_skills = index < len(offsets) and offsets[index] < end
+                entry = self._entries.get(fingerprint)
+                if entry is None:
+                    entry = self._entries[fingerprint] = _Entry()
+                    if len(self._entries) > self.capacity:
+                        self._entries.popitem(last=False)
+                else:
+                    self._entries.move_to_end(fingerprint)
+                entry.has_skills = entry.has_skills or has_skills
+                if len(entry.documents) < self.min_documents and check.document not in entry.documents:
+                    entry.documents += (check.document,)
+            BOILERPLATE_ENTRIES.set(len(self._entries))
+
+    def get_state(self) -> Dict[str, Any]:
+        """Hit rate and size, for /diagnostics"""
+        with self._lock:
+            boilerplate = sum(1 for entry in self._entries.values() if self._is_boilerplate(entry))
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "capacity": self.capacity,
+                "boilerplate_paragraphs": boilerplate,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+def boilerplate_store_from_env() -> BoilerplateStore:
+    """Build a BoilerplateStore honouring NLP_BOILERPLATE_* settings"""
+    return BoilerplateStore(
+        capacity=int(os.environ.get("NLP_BOILERPLATE_CACHE_SIZE", "20000")),
+        min_documents=int(os.environ.get("NLP_BOILERPLATE_MIN_DOCUMENTS", "3")),
+        min_chars=int(os.environ.get("NLP_BOILERPLATE_MIN_CHARS", "120")),
+    )
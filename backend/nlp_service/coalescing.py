@@ -0,0 +1,86 @@
+"""
+Request Coalescing
+==================
+Single-flight for identical concurrent /extract-skills requests.
+
+When the same posting is opened by several users at once, the first request
+(the leader) runs the extraction and later identical requests (followers)
+await the leader's result instead of starting their own. Followers take no
+admission slot or executor thread while they wait. This only merges work
+that is in flight at the same moment - nothing is cached once the leader
+finishes, so it works with or without a response cache in front of it.
+
+The leader runs as its own task, so a follower (or the leader's client)
+going away does not cancel the computation for the others. Errors,
+including 429/503 from admission control, are shared with every waiter.
+
+Environment:
+    NLP_COALESCE_REQUESTS   - "0" to disable (default: enabled)
+"""
+
+import asyncio
+import hashlib
+import os
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+try:
+    from .metrics import Counter, Gauge
+except ImportError:
+    from metrics import Counter, Gauge
+
+COALESCED_REQUESTS = Counter(
+    "nlp_coalesced_requests_total", "Requests served from an identical in-flight computation", ["endpoint"]
+)
+SINGLE_FLIGHT_KEYS = Gauge("nlp_single_flight_keys", "Distinct computations currently shared by single-flight")
+
+
+def text_key(text: str, *options: Hashable) -> tuple:
+    """Coalescing key: digest of the text plus the options that change the result"""
+    digest = hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+    return (digest, *options)
+
+
+class SingleFlight:
+    """
+    At most one in-flight computation per key, for use on the event loop.
+
+    Usage:
+        payload = await flight.do(key, lambda: compute(...))
+    """
+
+    def __init__(self, endpoint: str, enabled: bool = True):
+        self.endpoint = endpoint
+        self.enabled = enabled
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """Await the in-flight computation for `key`, or start it with `compute()`"""
+        if not self.enabled:
+            return await compute()
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            COALESCED_REQUESTS.inc(endpoint=self.endpoint)
+        else:
+            task = asyncio.ensure_future(compute())
+            self._in_flight[key] = task
+            SINGLE_FLIGHT_KEYS.inc()
+            task.add_done_callback(lambda done, key=key: self._forget(key, done))
+        # shield: cancelling one waiter must not cancel the shared computation
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+            SINGLE_FLIGHT_KEYS.dec()
+        # Mark the exception retrieved even if every waiter has gone away
+        if not task.cancelled():
+            task.exception()
+
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+
+def single_flight_from_env(endpoint: str) -> SingleFlight:
+    """Build a SingleFlight honouring NLP_COALESCE_REQUESTS"""
+    return SingleFlight(endpoint, enabled=os.environ.get("NLP_COALESCE_REQUESTS", "1") != "0")
@@ -0,0 +1,106 @@
+"""
+Deadline
+========
+Per-request latency budget for /extract-skills.
+
+A caller may send a budget (X-Latency-Budget-Ms header or the
+latency_budget_ms request field). The clock starts when the request arrives,
+so time spent waiting for admission counts against it. Mandatory work (spaCy
+parse, PhraseMatcher) always runs; before each optional stage the pipeline
+asks whether that stage's recent cost still fits in what is left, and
+otherwise takes the cheaper path:
+
+    batch_classification     - cap candidates classified by the transformer,
+                               or skip it; the rest go through the rule-based
+                               filters (is_valid_skill_type, is_specific_enough,
+                               is_garbage_skill)
+    context_filtering        - skip has_skill_context checks
+    classification_3section  - weight-based Important/Less Important split
+    fuzzy                    - skip the typo lookup of near-miss tokens
+
+Skipped and capped stages are reported in the response stats and counted in
+nlp_degraded_stages_total.
+"""
+
+import time
+from typing import Any, Dict, List, Optional
+
+try:
+    from .metrics import Counter, expected_stage_seconds
+except ImportError:
+    from metrics import Counter, expected_stage_seconds
+
+LATENCY_BUDGET_HEADER = "x-latency-budget-ms"
+
+# Kept back for response building and serialization when deciding whether an
+# optional stage fits
+RESERVE_S = 0.005
+
+DEGRADED_STAGES = Counter(
+    "nlp_degraded_stages_total", "Optional extraction stages skipped or capped to meet a latency budget",
+    ["stage", "action"],
+)
+
+
+class Deadline:
+    """Remaining latency budget for one request, plus what was skipped to meet it"""
+
+    def __init__(self, budget_ms: float, start: Optional[float] = None):
+        self.budget_ms = float(budget_ms)
+        self.start = time.perf_counter() if start is None else start
+        self.expires_at = self.start + self.budget_ms / 1000.0
+        self.skipped: List[str] = []
+        self.capped: Dict[str, Dict[str, int]] = {}
+
+    @classmethod
+    def from_request(cls, header_value: Optional[str], field_value: Optional[float]) -> Optional["Deadline"]:
+        """Build from the header and/or body field (the tighter one wins); None if neither is set"""
+        budgets = []
+        if header_value:
+            try:
+                budgets.append(float(header_value))
+            except ValueError:
+                pass
+        if field_value is not None:
+            budgets.append(float(field_value))
+        budgets = [b for b in budgets if b > 0]
+        return cls(min(budgets)) if budgets else None
+
+    def remaining_s(self) -> float:
+        return self.expires_at - time.perf_counter()
+
+    def allows(self, stage: str, units: int = 1) -> bool:
+        """
+        True if `units` x the stage's recent cost still fits in the budget.
+
+        Stages with no recorded cost yet are allowed (nothing to go on).
+        """
+        expected = expected_stage_seconds(stage)
+        if expected is None:
+            return True
+        return self.remaining_s() - RESERVE_S >= expected * units
+
+    def affordable_units(self, stage: str, units: int) -> int:
+        """How many of `units` items (at the stage's recent per-item cost) fit in the budget"""
+        expected = expected_stage_seconds(stage)
+        if not expected:
+            return units
+        available = self.remaining_s() - RESERVE_S
+        return max(0, min(units, int(available / expected)))
+
+    def skip(self, stage: str) -> None:
+        self.skipped.append(stage)
+        DEGRADED_STAGES.inc(stage=stage, action="skipped")
+
+    def cap(self, stage: str, kept: int, total: int) -> None:
+        self.capped[stage] = {"kept": kept, "total": total}
+        DEGRADED_STAGES.inc(stage=stage, action="capped")
+
+    def to_stats(self) -> Dict[str, Any]:
+        return {
+            "latency_budget_ms": self.budget_ms,
+            "budget_remaining_ms": round(self.remaining_s() * 1000, 1),
+            "degraded": bool(self.skipped or self.capped),
+            "skipped_stages": list(self.skipped),
+            "capped_stages": dict(self.capped),
+        }
@@ -0,0 +1,180 @@
+"""
+Fuzzy Skill Matching
+====================
+Typo-tolerant matching of single-word skills ("Kubernets" -> Kubernetes,
+"Terrafrom" -> Terraform, "Postgress" -> PostgreSQL via the ontology
+alias "postgres"), run after the matcher engine and VariantLookup.
+
+Near-miss candidates are the tokens no exact or variant match covers that
+could be a misspelled skill: alphabetic, at least MIN_WORD_LENGTH letters,
+not a stop word and not a word the dictionary itself uses (any word of any
+skill, so "machine", "review" or "detection" are never candidates). Only
+these are looked up, so ordinary English words cannot be "corrected" into a
+look-alike skill ("encourage" is not Entourage).
+
+Lookup is blocked: the targets (one-word skills and ontology aliases) are
+indexed by first letter, last letter and character trigram, and a word is
+only scored against the targets with its first and last letter that share
+enough of its trigrams and differ in length by at most one. rapidfuzz
+scores those pairs, for all new candidates of a doc in one process.cdist
+call. A target within one edit (OSA distance: one substitution, insertion,
+deletion or swap of adjacent letters) is a match if it is the only one at
+that distance, or outranks the others (ontology weight), so "pyhton" is
+Python rather than Pyston. Results are cached per word across requests.
+
+Matches go through the same validation as exact matches, under the
+skill's own text; the misspelled span is only used for context checks.
+
+Environment:
+    NLP_FUZZY_MATCHING       - "0" to disable the stage (default: enabled)
+    NLP_FUZZY_MAX_CANDIDATES - distinct near-miss words looked up per request;
+                               the rest are left unmatched (default: 200)
+"""
+
+import os
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from rapidfuzz import process
+    from rapidfuzz.distance import OSA
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    process = None
+    OSA = None
+    RAPIDFUZZ_AVAILABLE = False
+
+FUZZY_MATCHING = os.environ.get("NLP_FUZZY_MATCHING", "1") != "0"
+FUZZY_MAX_CANDIDATES = int(os.environ.get("NLP_FUZZY_MAX_CANDIDATES", "200"))
+
+MIN_WORD_LENGTH = 6
+MAX_DISTANCE = 1
+# Targets kept per word after blocking, most shared trigrams first
+MAX_BLOCK = 64
+# Trigrams one edit can remove from a word (an adjacent swap touches four)
+_TRIGRAMS_PER_EDIT = 4
+
+_WORD_RE = re.compile(r"[a-z]+")
+
+
+def _trigrams(word: str) -> List[str]:
+    padded = f" {word} "
+    return list({padded[i:i + 3] for i in range(len(padded) - 2)})
+
+
+class FuzzyMatcher:
+    """
+    One-edit typo lookup of single words against a trigram blocking index.
+
+    `targets` maps a lowercase target word to the skill it stands for;
+    `lexicon` holds the words that are never candidates; `rank` breaks ties
+    between targets at the same distance (higher wins).
+    """
+
+    def __init__(self, targets: Dict[str, str], lexicon: Iterable[str],
+                 rank: Optional[Callable[[str], float]] = None):
+        self.lexicon = frozenset(lexicon)
+        self.rank = rank
+        self.words = sorted(targets)
+        self.skills = [targets[word] for word in self.words]
+        # First letter + last letter + trigram -> target indexes
+        postings: Dict[str, List[int]] = {}
+        for index, word in enumerate(self.words):
+            for gram in _trigrams(word):
+                postings.setdefault(word[0] + word[-1] + gram, []).append(index)
+        self.postings = {key: tuple(indexes) for key, indexes in postings.items()}
+        # Word -> skill or None, over all requests
+        self._cache: Dict[str, Optional[str]] = {}
+
+    @classmethod
+    def from_skills(cls, skills: Iterable[str], aliases: Optional[Dict[str, str]] = None,
+                    rank: Optional[Callable[[str], float]] = None) -> "FuzzyMatcher":
+        """
+        Targets are the one-word skills (and `aliases`, alias -> skill) of at
+        least MIN_WORD_LENGTH - 1 letters; the lexicon is every word of every skill.
+        """
+        targets: Dict[str, str] = {}
+        lexicon = set()
+        for skill in skills:
+            lower = skill.lower()
+            lexicon.update(_WORD_RE.findall(lower))
+            if lower.isalpha() and len(lower) >= MIN_WORD_LENGTH - 1:
+                targets.setdefault(lower, skill)
+        for alias, skill in (aliases or {}).items():
+            lexicon.update(_WORD_RE.findall(alias))
+            if alias.isalpha() and len(alias) >= MIN_WORD_LENGTH - 1:
+                targets.setdefault(alias, skill)
+        return cls(targets, lexicon, rank)
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+    def candidates(self, doc, matches: List[Tuple[int, int, int]]) -> List[Tuple[int, str]]:
+        """(token index, lowercase text) of the near-miss tokens outside `matches`"""
+        from spacy.attrs import IS_ALPHA, IS_STOP, LENGTH, LOWER
+
+        if not len(doc):
+            return []
+        attrs = doc.to_array([IS_ALPHA, IS_STOP, LENGTH, LOWER])
+        mask = (attrs[:, 0] == 1) & (attrs[:, 1] == 0) & (attrs[:, 2] >= MIN_WORD_LENGTH)
+        for _, start, end in matches:
+            mask[start:end] = False
+        strings = doc.vocab.strings
+        found = []
+        for index, lower in zip(np.flatnonzero(mask).tolist(), attrs[mask, 3].tolist()):
+            word = strings[lower]
+            if word not in self.lexicon:
+                found.append((index, word))
+        return found
+
+    def _block(self, word: str) -> List[int]:
+        """Indexes of the targets worth scoring against `word`"""
+        trigrams = _trigrams(word)
+        prefix = word[0] + word[-1]
+        shared: Dict[int, int] = {}
+        for gram in trigrams:
+            for index in self.postings.get(prefix + gram, ()):
+                shared[index] = shared.get(index, 0) + 1
+        minimum = max(1, len(trigrams) - _TRIGRAMS_PER_EDIT * MAX_DISTANCE)
+        words = self.words
+        block = [
+            index for index, count in shared.items()
+            if count >= minimum and abs(len(words[index]) - len(word)) <= MAX_DISTANCE
+        ]
+        if len(block) > MAX_BLOCK:
+            block = sorted(block, key=lambda index: -shared[index])[:MAX_BLOCK]
+        return block
+
+    def lookup(self, words: List[str]) -> Dict[str, Optional[str]]:
+        """Skill (or None) for each of `words`, scoring new words together"""
+        results = {word: self._cache[word] for word in words if word in self._cache}
+        new = [word for word in dict.fromkeys(words) if word not in results]
+        if new:
+            blocks = [self._block(word) for word in new]
+            columns = sorted({index for block in blocks for index in block})
+            position = {index: column for column, index in enumerate(columns)}
+            distances = None
+            if columns:
+                distances = process.cdist(
+                    new, [self.words[i] for i in columns], scorer=OSA.distance,
+                    score_cutoff=MAX_DISTANCE, dtype=np.int32,
+                )
+            for row, (word, block) in enumerate(zip(new, blocks)):
+                skill = None
+                scores = [int(distances[row, position[index]]) for index in block]
+                lowest = min(scores, default=MAX_DISTANCE + 1)
+                best = [index for index, score in zip(block, scores) if score == lowest <= MAX_DISTANCE]
+                if len(best) > 1 and self.rank is not None:
+                    top = max(self.rank(self.skills[i]) for i in best)
+                    best = [index for index in best if self.rank(self.skills[index]) == top]
+                if len(best) == 1:
+                    skill = self.skills[best[0]]
+                if len(self._cache) >= 100_000:
+                    self._cache.clear()
+                self._cache[word] = results[word] = skill
+        return results
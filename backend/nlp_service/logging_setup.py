@@ -0,0 +1,183 @@
+"""
+Logging Setup
+=============
+Queue-backed logging for the NLP service.
+
+Request threads only put records on a bounded queue; a single listener
+thread formats them and writes to stdout (piped to the Node parent) and to
+the in-memory buffer served by /diagnostics.
+
+If the parent stops draining the pipe, only the listener thread blocks. Once
+the queue is full new records are dropped (counted in
+nlp_log_records_dropped_total) instead of stalling requests. A closed pipe
+disables the stdout writer instead of raising on every record.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import sys
+import threading
+from collections import deque
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, List, Optional
+
+try:
+    from .metrics import Counter, Gauge
+except ImportError:
+    from metrics import Counter, Gauge
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOG_LEVEL = os.environ.get("NLP_LOG_LEVEL", "INFO").upper()
+LOG_QUEUE_SIZE = int(os.environ.get("NLP_LOG_QUEUE_SIZE", "10000"))
+LOG_BUFFER_SIZE = 500
+
+# Recent records for /diagnostics, formatted by the listener thread
+LOG_BUFFER: deque = deque(maxlen=LOG_BUFFER_SIZE)
+
+LOG_RECORDS_DROPPED = Counter(
+    "nlp_log_records_dropped_total", "Log records dropped because the log queue was full or stdout was closed", ["reason"]
+)
+LOG_QUEUE_DEPTH = Gauge("nlp_log_queue_depth", "Log records waiting for the listener thread")
+
+_listener: Optional[QueueListener] = None
+_log_queue: Optional[queue.Queue] = None
+_configure_lock = threading.Lock()
+
+
+class DroppingQueueHandler(QueueHandler):
+    """
+    QueueHandler that never blocks the caller.
+
+    Records are enqueued unformatted (they never leave the process, so the
+    stdlib prepare() step is skipped) and dropped when the queue is full.
+    """
+
+    def prepare(self, record):
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            LOG_RECORDS_DROPPED.inc(reason="queue_full")
+
+
+class PipeStreamHandler(logging.StreamHandler):
+    """
+    Stream writer for the listener thread.
+
+    After a BrokenPipeError the stream is considered gone: later records are
+    counted as dropped rather than retried.
+    """
+
+    def __init__(self, stream=None):
+        super().__init__(stream)
+        self.closed_pipe = False
+
+    def emit(self, record):
+        if self.closed_pipe:
+            LOG_RECORDS_DROPPED.inc(reason="pipe_closed")
+            return
+        try:
+            super().emit(record)
+        except (BrokenPipeError, OSError):
+            self.closed_pipe = True
+            LOG_RECORDS_DROPPED.inc(reason="pipe_closed")
+
+    def handleError(self, record):
+        # StreamHandler.emit routes write errors here; treat them like a closed pipe
+        exc = sys.exc_info()[1]
+        if isinstance(exc, (BrokenPipeError, OSError)):
+            self.closed_pipe = True
+            LOG_RECORDS_DROPPED.inc(reason="pipe_closed")
+        else:
+            super().handleError(record)
+
+
+class DrainingQueueListener(QueueListener):
+    """QueueListener whose shutdown cannot hang on a full queue or a stuck pipe"""
+
+    def enqueue_sentinel(self):
+        try:
+            self.queue.put(self._sentinel, timeout=1.0)
+        except queue.Full:
+            pass
+
+    def stop(self):
+        if self._thread:
+            self.enqueue_sentinel()
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+
+class BufferHandler(logging.Handler):
+    """
+    Keeps the last LOG_BUFFER_SIZE records in LOG_BUFFER, already formatted.
+
+    Runs on the listener thread. Raw records would keep their args and
+    exc_info (and through the traceback, every frame's locals, request text
+    included) alive for as long as they stay in the buffer.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    def emit(self, record):
+        try:
+            message = self.format(record)
+        except Exception:
+            self.handleError(record)
+            return
+        LOG_BUFFER.append({
+            'timestamp': datetime.fromtimestamp(record.created).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': message
+        })
+
+
+def get_buffered_logs(limit: int) -> List[Dict[str, str]]:
+    """The most recent `limit` buffered records"""
+    return list(LOG_BUFFER)[-limit:] if limit > 0 else []
+
+
+def configure_logging(level: str = LOG_LEVEL, queue_size: int = LOG_QUEUE_SIZE) -> QueueListener:
+    """
+    Install the queue handler on the root logger and start the listener.
+
+    Idempotent: main.py and skills_matcher.py (when used standalone) both
+    call it, and only the first call configures anything.
+
+    Args:
+        level: Root log level name
+        queue_size: Maximum records waiting to be written before dropping
+
+    Returns:
+        The running QueueListener
+    """
+    global _listener, _log_queue
+
+    with _configure_lock:
+        if _listener is not None:
+            return _listener
+
+        _log_queue = queue.Queue(maxsize=queue_size)
+        LOG_QUEUE_DEPTH.set_function(lambda: {(): float(_log_queue.qsize())})
+
+        stream_handler = PipeStreamHandler(sys.stdout)  # stdout: Node spawns the service with stderr on the same pipe
+        stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+        root_logger = logging.getLogger()
+        root_logger.setLevel(level)
+        for handler in root_logger.handlers[:]:
+            root_logger.removeHandler(handler)
+        root_logger.addHandler(DroppingQueueHandler(_log_queue))
+
+        _listener = DrainingQueueListener(_log_queue, stream_handler, BufferHandler(), respect_handler_level=True)
+        _listener.start()
+        atexit.register(_listener.stop)
+        return _listener
@@ -11,100 +11,56 @@ Features:
 - Smart filtering of generic terms
 """
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, Field
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from starlette.background import BackgroundTask
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, Field, model_validator
 from typing import List, Dict, Set, Optional, Union, Any
 import re
 import logging
 import sys
 import os
+import random
+import threading
 from pathlib import Path
 from collections import deque
+from contextlib import AsyncExitStack
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-# CRITICAL FIX: Redirect stderr to stdout at startup to prevent broken pipe errors
-# This must be done BEFORE any imports that might write to stderr
+# Configure logging FIRST (before imports that might log)
+# Request threads only enqueue records; see logging_setup.py
 try:
-    # Redirect stderr to stdout to prevent broken pipe errors
-    # This ensures all output goes to stdout, which is properly handled by Node.js
-    sys.stderr = sys.stdout
-except (BrokenPipeError, OSError, AttributeError):
-    # If redirection fails, create a null device for stderr
-    try:
-        sys.stderr = open(os.devnull, 'w')
-    except:
-        pass  # If all else fails, stderr will use safe_stderr_print
-
-# Helper function to safely write to stderr (handles broken pipe errors)
-def safe_stderr_print(*args, **kwargs):
-    """Safely print to stderr, handling broken pipe errors gracefully"""
-    try:
-        # Since stderr is redirected to stdout, this will write to stdout
-        print(*args, file=sys.stderr, **kwargs)
-    except (BrokenPipeError, OSError):
-        # Broken pipe or other I/O error - stderr pipe was closed
-        # Silently ignore to prevent crashes
-        pass
-
-# Log buffer to store recent logs for /health endpoint
-LOG_BUFFER = deque(maxlen=500)  # Store last 500 log entries
-
-class LogBufferHandler(logging.Handler):
-    """Custom handler that stores logs in a buffer"""
-    def emit(self, record):
-        try:
-            log_entry = {
-                'timestamp': datetime.now().isoformat(),
-                'level': record.levelname,
-                'logger': record.name,
-                'message': self.format(record)
-            }
-            LOG_BUFFER.append(log_entry)
-        except Exception:
-            pass  # Silently ignore errors in log buffering
+    from .logging_setup import configure_logging, get_buffered_logs, LOG_BUFFER
+except ImportError:
+    from logging_setup import configure_logging, get_buffered_logs, LOG_BUFFER
+configure_logging()
+logger = logging.getLogger(__name__)
 
-# Configure logging FIRST (before imports that might log)
-# Use a custom handler that safely handles broken pipe errors
-class SafeStreamHandler(logging.StreamHandler):
-    """Stream handler that safely handles broken pipe errors"""
-    def emit(self, record):
-        try:
-            super().emit(record)
-        except (BrokenPipeError, OSError):
-            # Silently ignore broken pipe errors in logging
-            pass
+# Fraction of requests that log a one-line INFO summary
+REQUEST_LOG_SAMPLE_RATE = float(os.environ.get("NLP_REQUEST_LOG_SAMPLE_RATE", "0.1"))
 
-# Configure logging with safe handler and log buffer
-log_buffer_handler = LogBufferHandler()
-log_buffer_handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
-
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    force=True,  # Force reconfiguration if already configured
-    handlers=[
-        SafeStreamHandler(sys.stdout),  # Use stdout instead of stderr for logging
-        log_buffer_handler  # Also store in buffer for /health endpoint
-    ]
-)
-logger = logging.getLogger(__name__)
 
-# Also configure root logger to ensure all logs are visible
-root_logger = logging.getLogger()
-root_logger.setLevel(logging.INFO)
-# Replace any existing handlers with safe handlers
-for handler in root_logger.handlers[:]:
-    root_logger.removeHandler(handler)
-root_logger.addHandler(SafeStreamHandler(sys.stdout))
-root_logger.addHandler(log_buffer_handler)  # Add buffer handler to root logger too
+def should_log_request() -> bool:
+    """Sample per-request INFO summaries (NLP_REQUEST_LOG_SAMPLE_RATE)"""
+    return REQUEST_LOG_SAMPLE_RATE > 0 and random.random() < REQUEST_LOG_SAMPLE_RATE and logger.isEnabledFor(logging.INFO)
 
 # Import skills matcher
 try:
     try:
-        from .skills_matcher import get_skills_database, extract_skills_with_phrasematcher
+        from .skills_matcher import (
+            get_skills_database, get_loaded_skills_database, extract_skills_with_phrasematcher,
+            PhraseMatcherExtraction, split_paragraphs,
+        )
+        from .skill_match import from_extraction, match_skills, resolve_skills
     except ImportError:
         # Fallback for when running as script
-        from skills_matcher import get_skills_database, extract_skills_with_phrasematcher
+        from skills_matcher import (
+            get_skills_database, get_loaded_skills_database, extract_skills_with_phrasematcher,
+            PhraseMatcherExtraction, split_paragraphs,
+        )
+        from skill_match import from_extraction, match_skills, resolve_skills
     SKILLS_MATCHER_AVAILABLE = True
     logger.info("Skills matcher module loaded successfully")
 except ImportError as e:
@@ -112,6 +68,74 @@ except ImportError as e:
     logger.warning("The /extract-skills endpoint will not be available")
     SKILLS_MATCHER_AVAILABLE = False
 
+# Import metrics (Prometheus text format, served by /metrics)
+try:
+    from .metrics import (
+        REQUEST_COUNT, REQUEST_LATENCY, EXECUTOR_QUEUE_DEPTH, EXECUTOR_ACTIVE,
+        CLASSIFIER_STATS, observe_stage, record_batch_size, render_metrics, update_stage_cost,
+    )
+except ImportError:
+    from metrics import (
+        REQUEST_COUNT, REQUEST_LATENCY, EXECUTOR_QUEUE_DEPTH, EXECUTOR_ACTIVE,
+        CLASSIFIER_STATS, observe_stage, record_batch_size, render_metrics, update_stage_cost,
+    )
+
+# Import opt-in request profiler (cProfile, served by /admin/profiles)
+try:
+    from .profiling import profiling_reason, run_profiled, is_admin_enabled, is_admin_authorized, get_profiles, get_profiling_config
+except ImportError:
+    from profiling import profiling_reason, run_profiled, is_admin_enabled, is_admin_authorized, get_profiles, get_profiling_config
+
+# Import response negotiation for /extract-skills (orjson JSON, or msgpack when accepted)
+try:
+    from .transport import NegotiatedRoute, negotiated_response, MSGPACK_MEDIA_TYPE
+    from .serialization import dumps
+except ImportError:
+    from transport import NegotiatedRoute, negotiated_response, MSGPACK_MEDIA_TYPE
+    from serialization import dumps
+
+# Import admission control (bounded in-flight + queue, load shedding for /extract-skills)
+try:
+    from .admission import controller_from_env
+except ImportError:
+    from admission import controller_from_env
+
+# Import per-request latency budgets (degrade optional stages to answer in time)
+try:
+    from .deadline import Deadline, LATENCY_BUDGET_HEADER
+except ImportError:
+    from deadline import Deadline, LATENCY_BUDGET_HEADER
+
+# Import text preprocessing (markup, whitespace and page chrome stripped before parsing)
+try:
+    from .text_preprocessing import preprocess_text
+except ImportError:
+    from text_preprocessing import preprocess_text
+
+# Import boilerplate paragraph store (repeated skill-free company text skipped before parsing)
+try:
+    from .boilerplate import boilerplate_store_from_env
+except ImportError:
+    from boilerplate import boilerplate_store_from_env
+
+# Import paragraph result cache (unchanged paragraphs of an edited JD are not re-extracted)
+try:
+    from .paragraph_cache import paragraph_cache_from_env
+except ImportError:
+    from paragraph_cache import paragraph_cache_from_env
+
+# Import near-duplicate index (the same posting from another job board reuses its result)
+try:
+    from .near_duplicates import near_duplicate_index_from_env
+except ImportError:
+    from near_duplicates import near_duplicate_index_from_env
+
+# Import single-flight coalescing (identical concurrent requests share one extraction)
+try:
+    from .coalescing import single_flight_from_env, text_key
+except ImportError:
+    from coalescing import single_flight_from_env, text_key
+
 # Initialize FastAPI app
 app = FastAPI(
     title="NLP Keyword Extraction Service",
@@ -119,6 +143,27 @@ app = FastAPI(
     version="2.0.0"
 )
 
+# Routes accept msgpack request bodies (Content-Type: application/msgpack)
+app.router.route_class = NegotiatedRoute
+
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    """Count requests and observe latency per endpoint (route template, not raw path)"""
+    import time
+
+    start_time = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = request.scope.get("route")
+        endpoint = getattr(route, "path", None) or "unmatched"
+        REQUEST_LATENCY.observe(time.perf_counter() - start_time, endpoint=endpoint, method=request.method)
+        REQUEST_COUNT.inc(endpoint=endpoint, method=request.method, status=str(status))
+
 # Global spaCy model instance
 nlp = None
 
@@ -141,7 +186,12 @@ class ExtractResponse(BaseModel):
 class ExtractSkillsRequest(BaseModel):
     """Request model for skill extraction using PhraseMatcher"""
     text: str = Field(..., description="Text to extract skills from", min_length=1)
-    use_fuzzy: bool = Field(default=True, description="Use fuzzy matching for missed skills")
+    use_fuzzy: bool = Field(default=True, description="Match one-edit typos of skills (e.g. \"Kubernets\")")
+    compact: bool = Field(default=False, description="Return `weights` ([skill, weight] pairs) instead of the duplicated `skills`/`matches` lists")
+    latency_budget_ms: Optional[int] = Field(
+        default=None, ge=1,
+        description="Latency budget; optional stages are skipped to answer in time (also X-Latency-Budget-Ms header)"
+    )
 
 
 class SkillMatch(BaseModel):
@@ -152,7 +202,14 @@ class SkillMatch(BaseModel):
 
 
 class ExtractSkillsResponse(BaseModel):
-    """Response model containing extracted skills with matching details"""
+    """
+    Response model containing extracted skills with matching details.
+    
+    Documentation only: /extract-skills builds plain dicts and returns them via
+    negotiated_response (orjson JSON, or msgpack), skipping model validation. In compact mode `skills` and
+    `matches` are omitted and `weights` lists [display name, weight] pairs, in
+    the same order `skills` would have.
+    """
     skills: List[str] = Field(default_factory=list, description="List of extracted skill names (canonical)")
     matches: List[SkillMatch] = Field(default_factory=list, description="Detailed match information")
     count: int = Field(default=0, description="Total number of skills extracted")
@@ -161,95 +218,429 @@ class ExtractSkillsResponse(BaseModel):
     important_skills: List[str] = Field(default_factory=list, description="Important technical skills")
     less_important_skills: List[str] = Field(default_factory=list, description="Less important technical skills")
     non_technical_skills: List[str] = Field(default_factory=list, description="Non-technical terms")
+    weights: Optional[List[List[Union[str, float]]]] = Field(default=None, description="Compact mode only: [skill display name, weight] pairs, sorted by importance")
+
+
+class MatchRequest(BaseModel):
+    """Request model for resume-to-JD skill matching"""
+    jd_text: Optional[str] = Field(default=None, description="Job description text; skills are extracted as by /extract-skills")
+    jd_skills: Optional[List[str]] = Field(default=None, description="Job description skills, instead of jd_text")
+    resume_skills: List[str] = Field(..., description="Skills listed on the resume")
+    use_fuzzy: bool = Field(default=True, description="Match one-edit typos of skills (e.g. \"Kubernets\")")
+    threshold: Optional[float] = Field(
+        default=None, ge=0, le=1,
+        description="Minimum similarity of a semantic match (default: NLP_MATCH_THRESHOLD, or NLP_MATCH_STRING_THRESHOLD without embeddings)"
+    )
+
+    @model_validator(mode="after")
+    def _one_jd_source(self):
+        if (self.jd_text is None) == (self.jd_skills is None):
+            raise ValueError("Provide exactly one of jd_text or jd_skills")
+        return self
+
+
+class SkillPairMatch(SkillMatch):
+    """A JD skill covered by a resume skill"""
+    resume_skill: str = Field(..., description="Resume skill that covers it (display name)")
+    score: Optional[float] = Field(default=None, description="Similarity, for semantic matches only")
+
+
+class MatchResponse(BaseModel):
+    """
+    Response model for /match.
+    
+    Documentation only: /match returns plain dicts via negotiated_response.
+    """
+    matched: List[SkillPairMatch] = Field(default_factory=list, description="JD skills on the resume under the same canonical ID")
+    semantic: List[SkillPairMatch] = Field(default_factory=list, description="JD skills covered by a similar resume skill")
+    missing: List[SkillMatch] = Field(default_factory=list, description="JD skills not covered")
+    score: float = Field(default=0.0, description="Share of JD skill weight covered by matched and semantic skills")
+    method: str = Field(default="none", description="Similarity used for semantic matches: embedding, string or none")
+    threshold: float = Field(default=0.0, description="Minimum similarity applied")
+    stats: Dict[str, Any] = Field(default_factory=dict, description="Skill counts, pairs scored and similarity time")
 
 
 class HealthResponse(BaseModel):
-    """Health check response"""
+    """Liveness check response"""
+    model_config = {"protected_namespaces": ()}
+    
+    status: str
+    spacy_model_loaded: bool
+    ready: bool = False  # True once warm-up has finished (see /ready)
+    stage: str = "pending"  # Warm-up stage; "failed:<stage>" while a failed warm-up waits to retry
+    model_name: Optional[str] = None
+
+
+class DiagnosticsResponse(BaseModel):
+    """Diagnostics response: recent logs, startup state and skills database stats"""
     model_config = {"protected_namespaces": ()}
     
     status: str
     spacy_model_loaded: bool
+    ready: bool = False
     model_name: Optional[str] = None
+    stage: str
     logs: Optional[List[Dict[str, str]]] = None  # Recent logs
-    log_count: Optional[int] = None  # Total number of logs in buffer
-    skills_info: Optional[Dict[str, Any]] = None  # Skills database information
+    log_count: int = 0  # Total number of logs in buffer
+    skills_info: Optional[Dict[str, Any]] = None  # Skills database information (None until loaded)
+    admission: Optional[Dict[str, Any]] = None  # /extract-skills admission control limits and current load
+    boilerplate: Optional[Dict[str, Any]] = None  # Boilerplate paragraph store size and hit rate
+    paragraph_cache: Optional[Dict[str, Any]] = None  # Paragraph result cache size and hit rate
+    near_duplicates: Optional[Dict[str, Any]] = None  # Near-duplicate index size, mode and hit rate
+
+
+class ReadinessResponse(BaseModel):
+    """Readiness check response with per-stage startup timings"""
+    ready: bool
+    stage: str
+    error: Optional[str] = None
+    attempts: int = 0  # Warm-up attempts so far (see NLP_WARMUP_MAX_ATTEMPTS)
+    started_at: Optional[str] = None
+    completed_at: Optional[str] = None
+    timings_ms: Dict[str, float] = Field(default_factory=dict, description="Duration of each warm-up stage in milliseconds")
 
 
 # ============================================================================
 # SpaCy Model Management
 # ============================================================================
 
+# Pinned model (must match the en_core_web_sm wheel in requirements.txt and
+# the version fetched by vendor_spacy_model.sh)
+SPACY_MODEL_NAME = "en_core_web_sm"
+SPACY_MODEL_VERSION = "3.7.1"
+
+# Vendored model directory (populated by vendor_spacy_model.sh)
+VENDORED_MODELS_DIR = Path(__file__).parent / "models"
+
+
+def resolve_spacy_model_path() -> Optional[str]:
+    """
+    Resolve where the spaCy model should be loaded from, without downloading.
+
+    Resolution order:
+    1. SPACY_MODEL_PATH environment variable (explicit model directory)
+    2. Vendored directory: models/en_core_web_sm-<version>
+    3. Installed package: en_core_web_sm (pinned wheel in requirements.txt)
+
+    Returns:
+        Model directory path or installed package name, or None if not found
+    """
+    env_path = os.environ.get("SPACY_MODEL_PATH")
+    if env_path:
+        return env_path if (Path(env_path) / "config.cfg").exists() else None
+
+    vendored_path = VENDORED_MODELS_DIR / f"{SPACY_MODEL_NAME}-{SPACY_MODEL_VERSION}"
+    if (vendored_path / "config.cfg").exists():
+        return str(vendored_path)
+
+    import importlib.util
+    if importlib.util.find_spec(SPACY_MODEL_NAME) is not None:
+        return SPACY_MODEL_NAME
+
+    return None
+
+
+def check_spacy_model() -> str:
+    """
+    Fail fast if the spaCy model is missing or incompatible.
+
+    Only inspects the filesystem and model metadata (no model load, no
+    network access), so it is cheap enough to run before accepting traffic.
+
+    Returns:
+        Resolved model path or package name
+
+    Raises:
+        RuntimeError: If the model cannot be found or targets another spaCy version
+    """
+    import spacy
+    from spacy import util as spacy_util
+
+    model_ref = resolve_spacy_model_path()
+    if model_ref is None:
+        raise RuntimeError(
+            f"spaCy model '{SPACY_MODEL_NAME}' not found. Install the pinned wheel with "
+            f"'pip install -r requirements.txt', run ./vendor_spacy_model.sh to vendor it into "
+            f"{VENDORED_MODELS_DIR}, or set SPACY_MODEL_PATH to a model directory. "
+            f"The service no longer downloads models at runtime."
+        )
+
+    if model_ref == SPACY_MODEL_NAME:
+        model_dir = spacy_util.get_package_path(SPACY_MODEL_NAME)
+    else:
+        model_dir = Path(model_ref)
+    meta = spacy_util.get_model_meta(model_dir) if (model_dir / "meta.json").exists() else {}
+
+    required = meta.get("spacy_version")
+    if required and not spacy_util.is_compatible_version(spacy.__version__, required):
+        raise RuntimeError(
+            f"spaCy model at '{model_ref}' requires spaCy {required}, "
+            f"but spaCy {spacy.__version__} is installed"
+        )
+    if meta.get("version") and meta["version"] != SPACY_MODEL_VERSION:
+        logger.warning(f"spaCy model version {meta['version']} differs from pinned {SPACY_MODEL_VERSION}")
+
+    return model_ref
+
+
 def load_spacy_model():
     """
-    Load the spaCy language model. Downloads if not present.
-    
+    Load the spaCy language model from the vendored directory or pinned package.
+    Never downloads at runtime - see check_spacy_model for the startup check.
+
     Returns:
         spacy.Language: Loaded spaCy model
     """
     global nlp
-    
+
     if nlp is not None:
         return nlp
-    
-    logger.info("Loading spaCy model...")
-    
+
+    model_ref = check_spacy_model()
+    logger.info(f"Loading spaCy model from {model_ref}...")
+
+    import spacy
+    nlp = spacy.load(model_ref)
+    logger.info(f"Successfully loaded spaCy model: {nlp.meta.get('name', SPACY_MODEL_NAME)} {nlp.meta.get('version', '')}")
+
+    return nlp
+
+
+# ============================================================================
+# Startup Readiness and Warm-up
+# ============================================================================
+
+# Synthetic job description pushed through the full pipeline during warm-up.
+# It touches the tagger/parser/NER, PhraseMatcher, batch classification,
+# context filtering and the 3-section classification so the first real
+# request does not pay for lazy initialization or first-inference overhead.
+WARMUP_TEXT = (
+    "Senior Backend Engineer. Must Have Skills: Python, Java, Spring Boot, "
+    "React.js, Node.js, PostgreSQL, Docker, Kubernetes and AWS. "
+    "You will design REST APIs, build data pipelines with Apache Spark and "
+    "Kafka, and deploy services with Terraform and Jenkins. "
+    "Good To Have Skills: machine learning, TensorFlow, Agile, Scrum, Jira."
+)
+
+# Startup state served by /ready (and summarized in /health and /diagnostics)
+STARTUP_STATE: Dict[str, Any] = {
+    "ready": False,
+    "stage": "pending",
+    "error": None,
+    "attempts": 0,
+    "started_at": None,
+    "completed_at": None,
+    "timings_ms": {},
+}
+
+
+def _run_startup_stage(name: str, func):
+    """Run one warm-up stage, recording its duration in STARTUP_STATE"""
+    import time
+
+    STARTUP_STATE["stage"] = name
+    start_time = time.perf_counter()
     try:
-        import spacy
-        nlp = spacy.load("en_core_web_sm")
-        logger.info("Successfully loaded spaCy model: en_core_web_sm")
-    except OSError:
-        logger.warning("spaCy model not found. Downloading en_core_web_sm...")
+        return func()
+    finally:
+        STARTUP_STATE["timings_ms"][name] = round((time.perf_counter() - start_time) * 1000, 1)
+
+
+WARMUP_MAX_ATTEMPTS = int(os.environ.get("NLP_WARMUP_MAX_ATTEMPTS", "5"))
+WARMUP_RETRY_MAX_SECONDS = float(os.environ.get("NLP_WARMUP_RETRY_MAX_SECONDS", "60"))
+
+
+def _warm_up_once() -> None:
+    """
+    Load every resource and run a synthetic JD through the full pipeline.
+
+    Stages (each timed into STARTUP_STATE["timings_ms"]):
+    1. spacy_model       - load en_core_web_sm
+    2. skills_database   - load skills.csv, custom keywords and embeddings
+    3. phrase_matcher    - build the skill matcher engine (NLP_MATCHER_ENGINE), variant lookup and fuzzy matcher
+    4. warmup_spacy      - first tagger/parser/NER pass
+    5. warmup_extract    - legacy /extract pipeline
+    6. warmup_skills     - full /extract-skills pipeline (torch inference included)
+
+    Raises whatever the failing stage raised; STARTUP_STATE["stage"] names it.
+    """
+    nlp_model = _run_startup_stage("spacy_model", load_spacy_model)
+
+    if SKILLS_MATCHER_AVAILABLE:
+        skills_db = _run_startup_stage("skills_database", get_skills_database)
+        _run_startup_stage(
+            "phrase_matcher",
+            lambda: (
+                skills_db.get_matcher_engine(nlp_model), skills_db.get_variant_lookup(),
+                skills_db.get_fuzzy_matcher(),
+            ),
+        )
+
+        classifier = skills_db.classifier
+        if classifier and classifier.available:
+            if (classifier.important_tech_embeddings is not None and
+                classifier.less_important_tech_embeddings is not None and
+                classifier.non_tech_embeddings is not None):
+                logger.info("✅ Pre-computed embeddings loaded from cache - no computation needed")
+            else:
+                logger.warning("⚠️  Embeddings cache not found - will compute on first request (slow)")
+        else:
+            logger.warning("⚠️  Sentence Transformers not available - using rule-based filters only")
+
+    _run_startup_stage("warmup_spacy", lambda: nlp_model(WARMUP_TEXT))
+    _run_startup_stage("warmup_extract", lambda: extract_keywords_from_text(WARMUP_TEXT))
+
+    if SKILLS_MATCHER_AVAILABLE:
+        warmup_request = ExtractSkillsRequest(text=WARMUP_TEXT, use_fuzzy=True)
+        warmup_response = _run_startup_stage("warmup_skills", lambda: _extract_skills_internal(warmup_request))
+        logger.info(f"Warm-up extraction found {warmup_response['count']} skills")
+
+
+def warm_up_service(max_attempts: int = WARMUP_MAX_ATTEMPTS, sleep=None) -> bool:
+    """
+    Run _warm_up_once until it succeeds, with exponential backoff between
+    attempts (1s, 2s, 4s, ... capped at NLP_WARMUP_RETRY_MAX_SECONDS).
+
+    Only flips STARTUP_STATE["ready"] once every stage has succeeded. While a
+    failed attempt waits to be retried, STARTUP_STATE["stage"] is
+    "failed:<stage>" (also served by /health). Loaders are cached, so a
+    retry only redoes the stages that did not finish.
+
+    Returns:
+        True once ready; False after `max_attempts` failures (0 = retry forever)
+    """
+    import time
+
+    sleep = sleep or time.sleep
+    STARTUP_STATE["started_at"] = datetime.now().isoformat()
+    total_start = time.perf_counter()
+
+    while True:
+        STARTUP_STATE["attempts"] += 1
         try:
-            from spacy.cli import download
-            download("en_core_web_sm")
-            import spacy
-            nlp = spacy.load("en_core_web_sm")
-            logger.info("Successfully downloaded and loaded spaCy model")
+            _warm_up_once()
+            STARTUP_STATE["ready"] = True
+            STARTUP_STATE["stage"] = "ready"
+            STARTUP_STATE["error"] = None
         except Exception as e:
-            logger.error(f"Failed to download spaCy model: {e}")
-            raise
-    
-    return nlp
+            failed_stage = STARTUP_STATE["stage"]
+            STARTUP_STATE["error"] = str(e)
+            STARTUP_STATE["stage"] = f"failed:{failed_stage}"
+            logger.error(f"Warm-up attempt {STARTUP_STATE['attempts']} failed during stage '{failed_stage}': {e}")
+        finally:
+            STARTUP_STATE["timings_ms"]["total"] = round((time.perf_counter() - total_start) * 1000, 1)
+            STARTUP_STATE["completed_at"] = datetime.now().isoformat()
+
+        if STARTUP_STATE["ready"]:
+            logger.info(f"✅ NLP service ready - startup timings (ms): {STARTUP_STATE['timings_ms']}")
+            return True
+        if max_attempts and STARTUP_STATE["attempts"] >= max_attempts:
+            return False
+        delay = min(2 ** (STARTUP_STATE["attempts"] - 1), WARMUP_RETRY_MAX_SECONDS)
+        logger.warning(f"Retrying warm-up in {delay:.0f}s")
+        sleep(delay)
+
+
+def _warm_up_or_exit() -> None:
+    """
+    Background warm-up: when every attempt has failed, exit non-zero so the
+    supervisor (the Node backend, or the platform) restarts the process
+    instead of leaving it up and never ready.
+    """
+    if warm_up_service():
+        return
+    logger.critical(f"❌ Warm-up failed {STARTUP_STATE['attempts']} times - exiting for a restart")
+    configure_logging().stop()  # Flush queued log records; os._exit skips atexit
+    os._exit(1)
 
 
 @app.on_event("startup")
 async def startup_event():
-    """Pre-load the spaCy model and embeddings at startup to avoid delays on first request"""
+    """Warm up the spaCy model, skills database and full pipeline in the background"""
     import asyncio
-    import concurrent.futures
-    
-    def load_resources_sync():
-        """Load resources synchronously (runs in thread pool)"""
-        try:
-            # Load spaCy model first (quick)
-            load_spacy_model()
-            logger.info("NLP service startup complete - spaCy model loaded")
-            
-            # Pre-load skills database (this loads embeddings from cache if available)
-            # This can take time, so we do it in background thread
-            try:
-                from .skills_matcher import get_skills_database
-            except ImportError:
-                from skills_matcher import get_skills_database
-            
-            skills_db = get_skills_database()
-            if skills_db and skills_db.classifier and skills_db.classifier.available:
-                if (skills_db.classifier.important_tech_embeddings is not None and
-                    skills_db.classifier.less_important_tech_embeddings is not None and
-                    skills_db.classifier.non_tech_embeddings is not None):
-                    logger.info("✅ Pre-computed embeddings loaded from cache - no computation needed")
-                else:
-                    logger.warning("⚠️  Embeddings cache not found - will compute on first request (slow)")
-            else:
-                logger.warning("⚠️  Sentence Transformers not available - using rule-based filters only")
-        except Exception as e:
-            logger.error(f"Warning: Failed to pre-load during startup: {e}")
-    
-    # Run blocking operations in thread pool to avoid blocking startup
-    # This allows the service to respond to health checks immediately
+
+    # Fail fast (abort startup) if the model is missing instead of downloading it
+    try:
+        model_ref = check_spacy_model()
+        logger.info(f"spaCy model found: {model_ref}")
+    except Exception as e:
+        STARTUP_STATE["stage"] = "failed:spacy_model"
+        STARTUP_STATE["error"] = str(e)
+        logger.error(f"❌ {e}")
+        raise
+
+    # Run blocking operations in thread pool so /health answers immediately;
+    # /ready only reports ready once warm_up_service has finished
     loop = asyncio.get_event_loop()
-    loop.run_in_executor(None, load_resources_sync)
-    logger.info("🚀 FastAPI app started - resources loading in background thread")
+    loop.run_in_executor(None, _warm_up_or_exit)
+    logger.info("🚀 FastAPI app started - warming up in background thread (poll /ready)")
+
+
+# ============================================================================
+# Extraction Executor
+# ============================================================================
+
+# /extract-skills is CPU-bound (spaCy parse + torch inference). Running it on a
+# dedicated pool keeps the event loop free for /health, /ready and /metrics,
+# and gives a real queue whose depth is exported as nlp_executor_queue_depth.
+# One worker by default: spaCy and torch already parallelize internally and the
+# skills database is shared, so more workers mostly add contention.
+EXTRACT_WORKERS = max(1, int(os.environ.get("NLP_EXTRACT_WORKERS", "1")))
+EXTRACTION_EXECUTOR = ThreadPoolExecutor(max_workers=EXTRACT_WORKERS, thread_name_prefix="extract")
+
+# Admission control in front of the pool: at most NLP_MAX_IN_FLIGHT requests
+# (default: one per worker) are submitted, a bounded number wait, and the rest
+# get a fast 429/503 with Retry-After instead of queueing until Node times out
+EXTRACT_ADMISSION = controller_from_env(EXTRACT_WORKERS)
+
+# Identical /extract-skills requests arriving while one is in flight wait for
+# its result (without taking an admission slot) instead of recomputing it
+EXTRACT_SINGLE_FLIGHT = single_flight_from_env("/extract-skills")
+
+# Paragraphs repeated across postings without any skill (EEO, benefits, "about
+# us") are learned from /extract-skills and skipped before parsing
+BOILERPLATE_STORE = boilerplate_store_from_env()
+
+# Matches and verdicts per paragraph: re-running an edited JD only extracts the
+# paragraphs that changed (aggregation, collapse and 3-section split still run)
+PARAGRAPH_CACHE = paragraph_cache_from_env()
+
+# Results of recent postings by MinHash similarity: the same posting with another
+# board's tracking text or reordered bullets is answered before admission
+NEAR_DUPLICATES = near_duplicate_index_from_env()
+
+
+def _run_tracked(func, *args):
+    """Run func on a worker thread, moving it from queued to active in the gauges"""
+    EXECUTOR_QUEUE_DEPTH.dec()
+    EXECUTOR_ACTIVE.inc()
+    try:
+        return func(*args)
+    finally:
+        EXECUTOR_ACTIVE.dec()
+
+
+async def run_in_extraction_executor(func, *args):
+    """Submit a blocking extraction call to EXTRACTION_EXECUTOR and await it"""
+    import asyncio
+
+    EXECUTOR_QUEUE_DEPTH.inc()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(EXTRACTION_EXECUTOR, _run_tracked, func, *args)
+
+
+def _classifier_stats_samples() -> Dict[tuple, float]:
+    """Expose SkillClassifier counters as gauges, without triggering a DB load"""
+    if not SKILLS_MATCHER_AVAILABLE:
+        return {}
+    skills_db = get_loaded_skills_database()
+    if skills_db is None or not skills_db.classifier.available:
+        return {}
+    stats = skills_db.classifier.get_stats()
+    return {(key,): float(value) for key, value in stats.items() if isinstance(value, (int, float))}
+
+
+CLASSIFIER_STATS.set_function(_classifier_stats_samples)
 
 
 # ============================================================================
@@ -876,54 +1267,115 @@ def extract_keywords_from_text(text: str) -> List[str]:
 # ============================================================================
 
 @app.get("/health", response_model=HealthResponse)
-async def health_check(include_logs: bool = True, log_limit: int = 100):
+async def health_check():
     """
-    Health check endpoint to verify service status.
+    Liveness check polled by the Node backend.
+    
+    Constant time: reads a few globals and skips response-model validation.
+    No log copying, imports or skills database access; recent logs and
+    dictionary stats are served by /diagnostics.
+    
+    Returns:
+        Health status, spaCy model information and warm-up state
+    """
+    loaded = nlp is not None
+    return JSONResponse({
+        "status": "healthy",
+        "spacy_model_loaded": loaded,
+        "ready": STARTUP_STATE["ready"],
+        "stage": STARTUP_STATE["stage"],
+        "model_name": SPACY_MODEL_NAME if loaded else None,
+    })
+
+
+@app.get("/diagnostics", response_model=DiagnosticsResponse)
+async def diagnostics(include_logs: bool = True, log_limit: int = 100):
+    """
+    Diagnostics endpoint for humans and dashboards (not for health polling).
     
     Args:
         include_logs: Whether to include recent logs in response (default: True)
         log_limit: Maximum number of log entries to return (default: 100, max: 500)
     
     Returns:
-        Health status, spaCy model information, and recent logs
+        Service status, recent logs and skills database information
     """
-    global nlp
-    
-    # Get recent logs if requested
-    logs = None
-    log_count = len(LOG_BUFFER)
-    
-    if include_logs:
-        # Limit the number of logs returned
-        limit = min(log_limit, 500)
-        recent_logs = list(LOG_BUFFER)[-limit:] if LOG_BUFFER else []
-        logs = recent_logs
+    logs = get_buffered_logs(min(log_limit, 500)) if include_logs else None
+    
+    # Only report on an already-loaded database; never trigger a load from here
+    skills_info = None
+    skills_db = get_loaded_skills_database() if SKILLS_MATCHER_AVAILABLE else None
+    if skills_db is not None:
+        skills_info = {
+            "total_skills": len(skills_db.skills),
+            "custom_keywords_count": len(getattr(skills_db, 'custom_keywords_normalized', ())),
+            "case_variants_dropped": len(skills_db.case_variants),
+            "classifier_available": skills_db.classifier.available
+        }
     
-    # Get skills database info if available
-    skills_info = {}
-    try:
-        if SKILLS_MATCHER_AVAILABLE:
-            from skills_matcher import get_skills_database
-            skills_db = get_skills_database()
-            if skills_db and skills_db.loaded:
-                skills_info = {
-                    "total_skills": len(skills_db.skills),
-                    "custom_keywords_count": len(skills_db.custom_keywords_normalized) if hasattr(skills_db, 'custom_keywords_normalized') else 0,
-                    "classifier_available": skills_db.classifier.available if hasattr(skills_db, 'classifier') else False
-                }
-    except Exception:
-        pass  # Ignore errors getting skills info
-    
-    return HealthResponse(
+    return DiagnosticsResponse(
         status="healthy",
         spacy_model_loaded=nlp is not None,
-        model_name="en_core_web_sm" if nlp is not None else None,
+        ready=STARTUP_STATE["ready"],
+        model_name=SPACY_MODEL_NAME if nlp is not None else None,
+        stage=STARTUP_STATE["stage"],
         logs=logs,
-        log_count=log_count,
-        skills_info=skills_info if skills_info else None
+        log_count=len(LOG_BUFFER),
+        skills_info=skills_info,
+        admission={**EXTRACT_ADMISSION.get_state(), "single_flight_keys": EXTRACT_SINGLE_FLIGHT.in_flight()},
+        boilerplate=BOILERPLATE_STORE.get_state(),
+        paragraph_cache=PARAGRAPH_CACHE.get_state(),
+        near_duplicates=NEAR_DUPLICATES.get_state()
     )
 
 
+@app.get("/ready", response_model=ReadinessResponse)
+async def readiness_check():
+    """
+    Readiness check: 200 once warm-up has loaded every resource and run the
+    full pipeline, 503 while still warming up (or if warm-up failed).
+
+    Returns:
+        Current startup stage, error (if any) and per-stage timings
+    """
+    body = ReadinessResponse(**STARTUP_STATE)
+    if not body.ready:
+        return JSONResponse(status_code=503, content=body.model_dump())
+    return body
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """
+    Prometheus scrape endpoint.
+
+    Exposes per-endpoint request counts and latency, per-stage extraction
+    latency, cache hit/miss counts, extraction executor queue depth and
+    model-inference batch sizes.
+    """
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+
+@app.get("/admin/profiles")
+async def admin_profiles(http_request: Request, limit: Optional[int] = None):
+    """
+    Recent /extract-skills profiles (newest first).
+
+    Requests are profiled when sampled (NLP_PROFILE_SAMPLE_RATE) or sent with
+    `X-Profile: <NLP_ADMIN_TOKEN>`. This endpoint requires
+    `X-Admin-Token: <NLP_ADMIN_TOKEN>`, and is 404 when NLP_ADMIN_TOKEN is unset.
+
+    Args:
+        limit: Maximum number of profiles to return (default: all buffered)
+    """
+    if not is_admin_enabled():
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not is_admin_authorized(http_request.headers):
+        raise HTTPException(status_code=403, detail="Invalid or missing X-Admin-Token")
+    profiles = get_profiles(limit)
+    return {"config": get_profiling_config(), "count": len(profiles), "profiles": profiles}
+
+
 @app.post("/extract", response_model=ExtractResponse)
 async def extract_keywords(request: ExtractRequest):
     """
@@ -944,10 +1396,10 @@ async def extract_keywords(request: ExtractRequest):
             return ExtractResponse(keywords=[], count=0)
         
         # Extract keywords
-        logger.info(f"Extracting keywords from text (length: {len(request.text)})")
         keywords = extract_keywords_from_text(request.text)
         
-        logger.info(f"Extracted {len(keywords)} keywords")
+        if should_log_request():
+            logger.info("extract text_len=%d keywords=%d", len(request.text), len(keywords))
         
         return ExtractResponse(
             keywords=keywords,
@@ -962,8 +1414,12 @@ async def extract_keywords(request: ExtractRequest):
         )
 
 
-@app.post("/extract-skills", response_model=ExtractSkillsResponse)
-async def extract_skills_phrasematcher(request: ExtractSkillsRequest):
+@app.post(
+    "/extract-skills",
+    response_model=ExtractSkillsResponse,
+    responses={200: {"content": {MSGPACK_MEDIA_TYPE: {}}, "description": "JSON, or msgpack when accepted"}},
+)
+async def extract_skills_phrasematcher(request: ExtractSkillsRequest, http_request: Request):
     """
     Extract skills from text using spaCy PhraseMatcher with skills.csv.
     
@@ -985,9 +1441,29 @@ async def extract_skills_phrasematcher(request: ExtractSkillsRequest):
             detail="Skills matcher module not available. Check server logs."
         )
     
+    # Budget clock starts now, so time queued for admission counts against it
+    deadline = Deadline.from_request(http_request.headers.get(LATENCY_BUDGET_HEADER), request.latency_budget_ms)
+    
+    # Strip markup and page chrome once: spaCy and the coalescing key both see the cleaned text
+    request = request.model_copy(update={"text": preprocess_text(request.text)})
+    
     # Top-level wrapper to catch any broken pipe errors before processing
     try:
-        return await _extract_skills_internal(request)
+        reason = profiling_reason(http_request.headers)
+        if reason:
+            # A profile belongs to one request: never coalesced
+            payload = await _admitted_extraction(request, deadline, reason)
+        else:
+            # MinHash of the whole text: off the event loop
+            near_duplicate = await run_in_threadpool(
+                NEAR_DUPLICATES.lookup, request.text, request.use_fuzzy, request.compact
+            )
+            payload = near_duplicate.payload
+            if payload is None:
+                key = text_key(request.text, request.use_fuzzy, request.compact, deadline.budget_ms if deadline else None)
+                payload = await EXTRACT_SINGLE_FLIGHT.do(key, lambda: _admitted_extraction(request, deadline))
+                NEAR_DUPLICATES.store(near_duplicate, payload)
+        return negotiated_response(payload, http_request.headers.get("accept"))
     except (BrokenPipeError, OSError) as e:
         # Catch broken pipe at the very top level
         error_str = str(e)
@@ -1004,12 +1480,9 @@ async def extract_skills_phrasematcher(request: ExtractSkillsRequest):
                 logger.warning(f"Broken pipe error at top level: {e}")
             except:
                 pass
-            return ExtractSkillsResponse(
-                skills=[],
-                matches=[],
-                count=0,
-                stats={"total_matches": 0, "error": "stderr_pipe_closed", "message": "Broken pipe - stderr closed"}
-            )
+            return negotiated_response(_empty_skills_response(
+                {"total_matches": 0, "error": "stderr_pipe_closed", "message": "Broken pipe - stderr closed"}
+            ), http_request.headers.get("accept"))
         raise
     except Exception as e:
         # Check error message for broken pipe
@@ -1020,26 +1493,432 @@ async def extract_skills_phrasematcher(request: ExtractSkillsRequest):
                 logger.warning(f"Broken pipe error (in exception message): {e}")
             except:
                 pass
-            return ExtractSkillsResponse(
-                skills=[],
-                matches=[],
-                count=0,
-                stats={"total_matches": 0, "error": "stderr_pipe_closed", "message": str(e)}
-            )
+            return negotiated_response(_empty_skills_response(
+                {"total_matches": 0, "error": "stderr_pipe_closed", "message": str(e)}
+            ), http_request.headers.get("accept"))
         raise
 
 
-async def _extract_skills_internal(request: ExtractSkillsRequest):
-    """Internal function to extract skills - separated for better error handling"""
+async def _admitted_extraction(
+    request: ExtractSkillsRequest, deadline: Optional[Deadline], profile_reason: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Run one extraction off the event loop, on the instrumented extraction pool,
+    once admitted (raises 429/503 with Retry-After when the queue is full or too slow).
+    """
+    async with EXTRACT_ADMISSION.admit():
+        if profile_reason:
+            label = f"/extract-skills text_length={len(request.text)}"
+            return await run_in_extraction_executor(
+                run_profiled, _extract_skills_internal, profile_reason, label, request, deadline
+            )
+        return await run_in_extraction_executor(_extract_skills_internal, request, deadline)
+
+
+@app.post("/extract-skills/stream")
+async def extract_skills_stream(request: ExtractSkillsRequest, http_request: Request):
+    """
+    Streaming /extract-skills for long texts, as NDJSON (one JSON object per line).
+    
+    The text is cleaned (text_preprocessing), split into paragraphs and parsed
+    with nlp.pipe. After each paragraph that confirms new skills, one event is
+    sent:
+    
+        {"event": "skills", "paragraph": 0, "elapsed_ms": 4.1,
+         "skills": [{"skill": "Python", "canonical": "python", "weight": 3.0}]}
+    
+    followed by exactly one final event with the merged, collapsed and
+    classified result (the /extract-skills payload, compact or full):
+    
+        {"event": "summary", "paragraphs": 12, "elapsed_ms": 38.0, "count": ..., ...}
+    
+    Weights in "skills" events are before the frequency boost, and a skill may
+    still be collapsed into a longer one; the summary is authoritative. An
+    error after streaming has started ends the stream with
+    {"event": "error", "detail": "..."}.
+    
+    Admission control applies as for /extract-skills (429/503 before any
+    output is sent); coalescing and latency budgets do not.
+    """
+    import asyncio
+
+    if not SKILLS_MATCHER_AVAILABLE:
+        raise HTTPException(
+            status_code=503,
+            detail="Skills matcher module not available. Check server logs."
+        )
+    
+    admission = AsyncExitStack()
+    await admission.enter_async_context(EXTRACT_ADMISSION.admit())
+    
+    loop = asyncio.get_running_loop()
+    events: asyncio.Queue = asyncio.Queue()
+    stop = threading.Event()
+    
+    def produce():
+        try:
+            for event in _stream_skills_internal(request, stop):
+                loop.call_soon_threadsafe(events.put_nowait, event)
+        except Exception as e:
+            logger.warning("Streaming extraction failed: %s", e)
+            loop.call_soon_threadsafe(events.put_nowait, {"event": "error", "detail": str(e)})
+        finally:
+            loop.call_soon_threadsafe(events.put_nowait, None)
+    
+    def release(worker):
+        # The slot is held until the worker is done, even if the client went away
+        if not worker.cancelled():
+            worker.exception()
+        asyncio.ensure_future(admission.aclose())
+    
+    worker = asyncio.ensure_future(run_in_extraction_executor(produce))
+    worker.add_done_callback(release)
+    
+    async def ndjson():
+        try:
+            while True:
+                event = await events.get()
+                if event is None:
+                    break
+                yield dumps(event) + b"\n"
+        finally:
+            # Client disconnected (or stream done): stop after the current paragraph
+            stop.set()
+    
+    # The generator's finally never runs if the client is gone before the body is
+    # iterated; Starlette still runs the background task once the response ends
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson", background=BackgroundTask(stop.set))
+
+
+def _stream_skills_internal(request: ExtractSkillsRequest, stop: threading.Event):
+    """
+    Generate /extract-skills/stream events; runs on the extraction pool.
+    
+    Stops early (without a summary) once `stop` is set.
+    """
+    import time
+
+    start = time.perf_counter()
+    
+    def elapsed_ms() -> float:
+        return round((time.perf_counter() - start) * 1000, 1)
+    
+    text = preprocess_text(request.text)
+    skills_db = get_skills_database()
+    if not text or not text.strip():
+        # Same shape (compact or full) as a non-empty summary
+        yield {"event": "summary", "paragraphs": 0, "elapsed_ms": elapsed_ms(),
+               **_build_skills_payload(request, [], skills_db)}
+        return
+    
+    nlp_model = load_spacy_model()
+    extraction = PhraseMatcherExtraction(nlp_model, skills_db, use_context_filter=True, use_fuzzy=request.use_fuzzy)
+    # Skip known boilerplate like /extract-skills does (only /extract-skills teaches the store)
+    if BOILERPLATE_STORE.enabled:
+        text = BOILERPLATE_STORE.check(text).text
+    paragraphs = split_paragraphs(text)
+    
+    for index, new_skills in extraction.iter_paragraphs(nlp_model, paragraphs):
+        if stop.is_set():
+            return
+        if new_skills:
+            yield {
+                "event": "skills",
+                "paragraph": index,
+                "elapsed_ms": elapsed_ms(),
+                "skills": [
+                    {"skill": skills_db.normalize_skill_display(skill), "canonical": canonical, "weight": float(weight)}
+                    for skill, canonical, weight in new_skills
+                ],
+            }
+    
+    matches = extraction.finish()
+    payload = _build_skills_payload(request, matches, skills_db)
+    yield {"event": "summary", "paragraphs": len(paragraphs), "elapsed_ms": elapsed_ms(), **payload}
+
+
+def _empty_skills_response(stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Empty /extract-skills payload (full shape) carrying only stats"""
+    return {
+        "skills": [],
+        "matches": [],
+        "count": 0,
+        "stats": stats,
+        "important_skills": [],
+        "less_important_skills": [],
+        "non_technical_skills": [],
+    }
+
+
+def _build_skills_payload(
+    request: ExtractSkillsRequest, matches: List[tuple], skills_db, deadline: Optional[Deadline] = None
+) -> Dict[str, Any]:
+    """
+    Turn collapsed (skill, canonical, weight) matches into the /extract-skills
+    payload: dedupe and sort, normalize display names, 3-section split, stats.
+    
+    Returns a plain dict in the ExtractSkillsResponse shape (or the compact
+    shape when request.compact is set).
+    """
+    import time
+    
+    # response_build = everything from here to the return, minus the 3-section classification
+    build_start = time.perf_counter()
+    
+    # Extract unique canonical skills with weights (already collapsed and filtered)
+    # Store as (skill, canonical, weight) tuples for sorting
+    skill_tuples = []
+    seen_canonicals = set()
+    
+    for skill, canonical, weight in matches:
+        if canonical not in seen_canonicals:
+            seen_canonicals.add(canonical)
+            skill_tuples.append((skill, canonical, weight))
+    
+    # Sort by weight (descending) - most important skills first
+    # Weight 3 = core languages (highest priority)
+    # Weight 2 = frameworks
+    # Weight 1 = tools/platforms
+    skill_tuples.sort(key=lambda x: (-x[2], x[0].lower()))  # Sort by weight desc, then alphabetically
+    
+    # Normalize skills to display names once (e.g., "ts" → "TypeScript", "node" → "Node.js")
+    normalized_skills = [skills_db.normalize_skill_display(skill) for skill, _, _ in skill_tuples]
+    
+    # Two canonicals can share a display name ("postgres", "postgresql" -> PostgreSQL):
+    # keep the first (heaviest) so skills, weights and count all agree
+    seen_display = set()
+    deduped = [
+        (normalized_skill, skill_tuple) for normalized_skill, skill_tuple in zip(normalized_skills, skill_tuples)
+        if not (normalized_skill.lower() in seen_display or seen_display.add(normalized_skill.lower()))
+    ]
+    normalized_skills = [normalized_skill for normalized_skill, _ in deduped]
+    skill_tuples = [skill_tuple for _, skill_tuple in deduped]
+    
+    # Blacklist: Skills that should NEVER be classified as Important
+    IMPORTANT_KEYWORDS_BLACKLIST = {
+        "computer science", "cs", "information technology", "it",
+        "software development", "web development", "application development",
+        "programming", "coding", "code", "codes", "coded", "coder", "coders",
+        "software engineering", "code review", "code reviews",
+        "technical skills", "technical knowledge", "technical writing"
+    }
+    
+    def is_blacklisted_skill(skill_name: str) -> bool:
+        """Check if a skill is blacklisted (case-insensitive with substring matching)"""
+        if not skill_name:
+            return False
+        skill_lower = skill_name.lower().strip()
+        # Check exact match
+        if skill_lower in IMPORTANT_KEYWORDS_BLACKLIST:
+            return True
+        # Check if skill contains any blacklisted term as substring
+        for blacklisted_term in IMPORTANT_KEYWORDS_BLACKLIST:
+            if blacklisted_term in skill_lower or skill_lower in blacklisted_term:
+                return True
+        return False
+    
+    # Classify skills into 3 categories: Important Tech, Less Important Tech, Non-Tech
+    important_skills = []
+    less_important_skills = []
+    non_technical_skills = []
+    
+    classifier = skills_db.classifier if hasattr(skills_db, 'classifier') else None
+    
+    # Check if classifier and embeddings are available
+    has_classifier = (classifier and classifier.available and 
+                     classifier.model is not None and
+                     classifier.important_tech_embeddings is not None and
+                     classifier.less_important_tech_embeddings is not None and
+                     classifier.non_tech_embeddings is not None)
+    
+    # One encode per skill: fall back to weight-based when it no longer fits the budget
+    if has_classifier and deadline is not None and not deadline.allows("classification_3section_per_skill", len(skill_tuples)):
+        has_classifier = False
+        deadline.skip("classification_3section")
+    
+    logger.debug("3-section categorization: %s", "semantic" if has_classifier else "weight-based")
+    
+    classification_start = time.perf_counter()
+    for (skill, canonical, weight), normalized_skill in zip(skill_tuples, normalized_skills):
+        skill_lower = normalized_skill.lower().strip()
+        original_skill_lower = skill.lower().strip()
+        
+        # Check blacklist first - never allow these as Important
+        # Check both normalized and original skill names with substring matching
+        is_blacklisted = (is_blacklisted_skill(normalized_skill) or 
+                        is_blacklisted_skill(skill))
+        
+        if is_blacklisted:
+            logger.debug("🚫 Blacklisted skill '%s' (original: '%s') - forcing to Less Important or Non-Technical", normalized_skill, skill)
+            # Force to Less Important or Non-Technical based on similarity
+            if has_classifier:
+                try:
+                    import torch
+                    from sentence_transformers import util
+                    record_batch_size("classification_3section", 1)
+                    skill_embedding = classifier.model.encode(normalized_skill, convert_to_tensor=True)
+                    less_important_sim = torch.max(util.cos_sim(skill_embedding, classifier.less_important_tech_embeddings)).item()
+                    non_tech_sim = torch.max(util.cos_sim(skill_embedding, classifier.non_tech_embeddings)).item()
+                    if less_important_sim > non_tech_sim and less_important_sim > 0.3:
+                        less_important_skills.append(normalized_skill)
+                    else:
+                        non_technical_skills.append(normalized_skill)
+                except Exception as e:
+                    logger.warning("Error classifying blacklisted skill '%s': %s", normalized_skill, e)
+                    # Fallback: put in non-technical
+                    non_technical_skills.append(normalized_skill)
+            else:
+                # Fallback: put in less important
+                less_important_skills.append(normalized_skill)
+            continue  # Skip to next skill
+        
+        if has_classifier:
+            # Use semantic classification
+            try:
+                import torch
+                from sentence_transformers import util
+                
+                record_batch_size("classification_3section", 1)
+                skill_embedding = classifier.model.encode(normalized_skill, convert_to_tensor=True)
+                
+                # Compare with all three categories
+                important_sim = torch.max(util.cos_sim(skill_embedding, classifier.important_tech_embeddings)).item()
+                less_important_sim = torch.max(util.cos_sim(skill_embedding, classifier.less_important_tech_embeddings)).item()
+                non_tech_sim = torch.max(util.cos_sim(skill_embedding, classifier.non_tech_embeddings)).item()
+                
+                # Classify based on highest similarity
+                max_sim = max(important_sim, less_important_sim, non_tech_sim)
+                
+                if max_sim > 0.3:  # Minimum similarity threshold
+                    if important_sim == max_sim and important_sim > 0.3:
+                        important_skills.append(normalized_skill)
+                    elif less_important_sim == max_sim and less_important_sim > 0.3:
+                        less_important_skills.append(normalized_skill)
+                    else:
+                        non_technical_skills.append(normalized_skill)
+                else:
+                    # Low similarity - classify based on weight as fallback
+                    if weight >= 2:
+                        important_skills.append(normalized_skill)
+                    elif weight >= 1:
+                        less_important_skills.append(normalized_skill)
+                    else:
+                        non_technical_skills.append(normalized_skill)
+            except Exception as e:
+                logger.warning("Error classifying skill '%s': %s, using weight-based classification", normalized_skill, e)
+                logger.debug("3-section classification error", exc_info=True)
+                # Fallback to weight-based classification
+                if weight >= 2:
+                    important_skills.append(normalized_skill)
+                elif weight >= 1:
+                    less_important_skills.append(normalized_skill)
+                else:
+                    non_technical_skills.append(normalized_skill)
+        else:
+            # Fallback: classify based on weight
+            if weight >= 2:
+                important_skills.append(normalized_skill)
+            elif weight >= 1:
+                less_important_skills.append(normalized_skill)
+            else:
+                non_technical_skills.append(normalized_skill)
+    
+    # Final filter: Remove any blacklisted items from important_skills (defensive check)
+    # This ensures blacklisted items never appear in Important, even if they somehow got through
+    important_skills_filtered = []
+    for skill in important_skills:
+        if not is_blacklisted_skill(skill):
+            important_skills_filtered.append(skill)
+        else:
+            # Move to less important or non-technical
+            logger.debug("🚫 Removed blacklisted skill '%s' from Important (final filter)", skill)
+            skill_lower = skill.lower().strip()
+            if skill_lower in ["computer science", "cs", "information technology", "it"]:
+                non_technical_skills.append(skill)
+            else:
+                less_important_skills.append(skill)
+    important_skills = important_skills_filtered
+    classification_seconds = time.perf_counter() - classification_start
+    observe_stage("classification_3section", classification_seconds)
+    if has_classifier and skill_tuples:
+        update_stage_cost("classification_3section_per_skill", classification_seconds / len(skill_tuples))
+    
+    # Calculate weighted statistics
+    total_weight = sum(weight for _, _, weight in matches)
+    weighted_skills = [skill for skill, _, weight in matches if weight > 0]
+    
+    stats = {
+        "total_matches": len(matches),
+        "unique_skills": len(normalized_skills),
+        "weighted_skills": len(weighted_skills),
+        "total_weight": total_weight,
+        "garbage_filtered": len(matches) - len(weighted_skills),
+        "validation_passed": len(weighted_skills),  # All skills passed type + specificity validation
+        "important_count": len(important_skills),
+        "less_important_count": len(less_important_skills),
+        "non_technical_count": len(non_technical_skills)
+    }
+    if deadline is not None:
+        stats.update(deadline.to_stats())
+    
+    # Ensure all lists are initialized (defensive programming)
+    if not important_skills:
+        important_skills = []
+    if not less_important_skills:
+        less_important_skills = []
+    if not non_technical_skills:
+        non_technical_skills = []
+    
+    # One sampled summary line per request instead of per-stage INFO chatter
+    if should_log_request():
+        logger.info(
+            "extract-skills text_len=%d matches=%d skills=%d important=%d less_important=%d non_technical=%d",
+            len(request.text), len(matches), len(normalized_skills),
+            len(important_skills), len(less_important_skills), len(non_technical_skills)
+        )
+    
+    # Plain structures in the ExtractSkillsResponse shape (weights as floats, like SkillMatch)
+    if request.compact:
+        # [skill, weight] pairs, not an object: JS reorders integer-like keys ("3", "5")
+        response = {
+            "weights": [
+                [normalized_skill, float(weight)]
+                for normalized_skill, (_, _, weight) in zip(normalized_skills, skill_tuples)
+            ],
+            "count": len(normalized_skills),
+        }
+    else:
+        response = {
+            "skills": normalized_skills,
+            "matches": [
+                {"skill": normalized_skill, "canonical": canonical, "weight": float(weight)}
+                for normalized_skill, (_, canonical, weight) in zip(normalized_skills, skill_tuples)
+            ],
+            "count": len(normalized_skills),
+        }
+    response["stats"] = stats
+    response["important_skills"] = important_skills
+    response["less_important_skills"] = less_important_skills
+    response["non_technical_skills"] = non_technical_skills
+    observe_stage("response_build", time.perf_counter() - build_start - classification_seconds)
+    return response
+
+
+def _extract_skills_internal(request: ExtractSkillsRequest, deadline: Optional[Deadline] = None) -> Dict[str, Any]:
+    """
+    Internal function to extract skills - separated for better error handling.
+    Synchronous so the startup warm-up can run it from the thread pool.
+    
+    With a deadline, optional stages that no longer fit in the budget are
+    skipped or capped and listed in stats (skipped_stages, capped_stages).
+    
+    Returns a plain dict in the ExtractSkillsResponse shape (or the compact
+    shape when request.compact is set), ready for negotiated_response.
+    """
     try:
         # Validate input
         if not request.text or not request.text.strip():
-            return ExtractSkillsResponse(
-                skills=[],
-                matches=[],
-                count=0,
-                stats={"total_matches": 0, "low_priority_filtered": 0}
-            )
+            return _empty_skills_response({"total_matches": 0, "low_priority_filtered": 0})
         
         # Load NLP model
         nlp_model = load_spacy_model()
@@ -1047,12 +1926,6 @@ async def _extract_skills_internal(request: ExtractSkillsRequest):
         # Get skills database (this will initialize Sentence Transformers if available)
         # Wrap in try-except to handle broken pipe during initialization
         try:
-            safe_stderr_print("=" * 60, flush=True)
-            safe_stderr_print("🔍 [EMBEDDINGS] Initializing skills database...", flush=True)
-            safe_stderr_print("=" * 60, flush=True)
-            
-            logger.info("=" * 60)
-            logger.info("🔍 [Sentence Transformers] Checking availability...")
             skills_db = get_skills_database()
         except (BrokenPipeError, OSError) as e:
             # Handle broken pipe during database initialization
@@ -1063,278 +1936,41 @@ async def _extract_skills_internal(request: ExtractSkillsRequest):
             if is_broken_pipe:
                 # Broken pipe during init - return empty result
                 try:
-                    logger.warning(f"Broken pipe during skills database initialization: {e}")
+                    logger.warning("Broken pipe during skills database initialization: %s", e)
                 except:
                     pass
-                return ExtractSkillsResponse(
-                    skills=[],
-                    matches=[],
-                    count=0,
-                    stats={"total_matches": 0, "error": "init_broken_pipe", "message": "Broken pipe during initialization"}
+                return _empty_skills_response(
+                    {"total_matches": 0, "error": "init_broken_pipe", "message": "Broken pipe during initialization"}
                 )
             else:
                 raise
         
-        safe_stderr_print(f"[EMBEDDINGS] Classifier available: {skills_db.classifier.available}", flush=True)
-        
-        # Log Sentence Transformers status
-        if skills_db.classifier.available:
-            safe_stderr_print("✅ [EMBEDDINGS] Classifier is ACTIVE - semantic filtering ENABLED", flush=True)
-            logger.info("✅ [Sentence Transformers] Classifier is ACTIVE")
-            logger.info("   Will validate all extracted skills semantically")
-        else:
-            safe_stderr_print("=" * 60, flush=True)
-            safe_stderr_print("⚠️  [EMBEDDINGS] Classifier NOT available", flush=True)
-            safe_stderr_print("   Install with: pip install sentence-transformers torch", flush=True)
-            safe_stderr_print("   Continuing without semantic validation...", flush=True)
-            safe_stderr_print("=" * 60, flush=True)
-            logger.warning("=" * 60)
-            logger.warning("⚠️  [Sentence Transformers] Classifier NOT available")
-            logger.warning("   Install with: pip install sentence-transformers torch")
-            logger.warning("   Continuing without semantic validation...")
-            logger.warning("=" * 60)
-        logger.info("=" * 60)
+        # Classifier availability is logged once at startup (warm_up_service / get_skills_database)
+        logger.debug("Extracting skills: text_len=%d classifier=%s", len(request.text), skills_db.classifier.available)
         
         # Extract skills using PhraseMatcher with context filtering
-        logger.info(f"Extracting skills from text (length: {len(request.text)})")
-        logger.info(f"Text preview: {request.text[:100]}...")
-        logger.info(f"Skills database loaded: {skills_db.loaded if hasattr(skills_db, 'loaded') else 'unknown'}")
-        logger.info(f"Total skills in database: {len(skills_db.skills) if hasattr(skills_db, 'skills') else 'unknown'}")
-        if hasattr(skills_db, 'custom_keywords_normalized'):
-            logger.info(f"Custom keywords count: {len(skills_db.custom_keywords_normalized)}")
         try:
             matches = extract_skills_with_phrasematcher(
                 request.text,
                 nlp_model,
                 skills_db,
                 use_fuzzy=request.use_fuzzy,
-                use_context_filter=True  # Enable context filtering (Option 2)
+                use_context_filter=True,  # Enable context filtering (Option 2)
+                deadline=deadline,
+                boilerplate=BOILERPLATE_STORE,
+                paragraph_cache=PARAGRAPH_CACHE
             )
         except (BrokenPipeError, OSError) as e:
             # Handle broken pipe during extraction - return empty result
             if isinstance(e, OSError) and e.errno != 32:
                 raise  # Re-raise if not broken pipe
             try:
-                logger.warning(f"Broken pipe during skill extraction: {e}")
+                logger.warning("Broken pipe during skill extraction: %s", e)
             except:
                 pass
             matches = []  # Return empty matches on broken pipe
         
-        # Extract unique canonical skills with weights (already collapsed and filtered)
-        # Store as (skill, canonical, weight) tuples for sorting
-        skill_tuples = []
-        seen_canonicals = set()
-        
-        for skill, canonical, weight in matches:
-            if canonical not in seen_canonicals:
-                seen_canonicals.add(canonical)
-                skill_tuples.append((skill, canonical, weight))
-        
-        # Sort by weight (descending) - most important skills first
-        # Weight 3 = core languages (highest priority)
-        # Weight 2 = frameworks
-        # Weight 1 = tools/platforms
-        skill_tuples.sort(key=lambda x: (-x[2], x[0].lower()))  # Sort by weight desc, then alphabetically
-        
-        # Normalize skills to display names (e.g., "ts" → "TypeScript", "node" → "Node.js")
-        normalized_skills = []
-        for skill, canonical, weight in skill_tuples:
-            normalized = skills_db.normalize_skill_display(skill)
-            normalized_skills.append(normalized)
-        
-        # Build response with weights and normalized display names (sorted by importance)
-        normalized_matches = []
-        for skill, canonical, weight in skill_tuples:
-            normalized_skill = skills_db.normalize_skill_display(skill)
-            normalized_matches.append(SkillMatch(
-                skill=normalized_skill,
-                canonical=canonical,
-                weight=weight
-            ))
-        
-        # Blacklist: Skills that should NEVER be classified as Important
-        IMPORTANT_KEYWORDS_BLACKLIST = {
-            "computer science", "cs", "information technology", "it",
-            "software development", "web development", "application development",
-            "programming", "coding", "code", "codes", "coded", "coder", "coders",
-            "software engineering", "code review", "code reviews",
-            "technical skills", "technical knowledge", "technical writing"
-        }
-        
-        def is_blacklisted_skill(skill_name: str) -> bool:
-            """Check if a skill is blacklisted (case-insensitive with substring matching)"""
-            if not skill_name:
-                return False
-            skill_lower = skill_name.lower().strip()
-            # Check exact match
-            if skill_lower in IMPORTANT_KEYWORDS_BLACKLIST:
-                return True
-            # Check if skill contains any blacklisted term as substring
-            for blacklisted_term in IMPORTANT_KEYWORDS_BLACKLIST:
-                if blacklisted_term in skill_lower or skill_lower in blacklisted_term:
-                    return True
-            return False
-        
-        # Classify skills into 3 categories: Important Tech, Less Important Tech, Non-Tech
-        important_skills = []
-        less_important_skills = []
-        non_technical_skills = []
-        
-        classifier = skills_db.classifier if hasattr(skills_db, 'classifier') else None
-        
-        # Check if classifier and embeddings are available
-        has_classifier = (classifier and classifier.available and 
-                         classifier.model is not None and
-                         classifier.important_tech_embeddings is not None and
-                         classifier.less_important_tech_embeddings is not None and
-                         classifier.non_tech_embeddings is not None)
-        
-        if has_classifier:
-            logger.info("Using semantic classification for 3-section categorization")
-        else:
-            logger.info("Using weight-based classification (classifier/embeddings not available)")
-        
-        for skill, canonical, weight in skill_tuples:
-            normalized_skill = skills_db.normalize_skill_display(skill)
-            skill_lower = normalized_skill.lower().strip()
-            original_skill_lower = skill.lower().strip()
-            
-            # Check blacklist first - never allow these as Important
-            # Check both normalized and original skill names with substring matching
-            is_blacklisted = (is_blacklisted_skill(normalized_skill) or 
-                            is_blacklisted_skill(skill))
-            
-            if is_blacklisted:
-                logger.info(f"🚫 Blacklisted skill '{normalized_skill}' (original: '{skill}') - forcing to Less Important or Non-Technical")
-                safe_stderr_print(f"[EMBEDDINGS] 🚫 Blacklisted: '{normalized_skill}' - will NOT be Important", flush=True)
-                # Force to Less Important or Non-Technical based on similarity
-                if has_classifier:
-                    try:
-                        import torch
-                        from sentence_transformers import util
-                        skill_embedding = classifier.model.encode(normalized_skill, convert_to_tensor=True)
-                        less_important_sim = torch.max(util.cos_sim(skill_embedding, classifier.less_important_tech_embeddings)).item()
-                        non_tech_sim = torch.max(util.cos_sim(skill_embedding, classifier.non_tech_embeddings)).item()
-                        if less_important_sim > non_tech_sim and less_important_sim > 0.3:
-                            less_important_skills.append(normalized_skill)
-                        else:
-                            non_technical_skills.append(normalized_skill)
-                    except Exception as e:
-                        logger.warning(f"Error classifying blacklisted skill '{normalized_skill}': {e}")
-                        # Fallback: put in non-technical
-                        non_technical_skills.append(normalized_skill)
-                else:
-                    # Fallback: put in less important
-                    less_important_skills.append(normalized_skill)
-                continue  # Skip to next skill
-            
-            if has_classifier:
-                # Use semantic classification
-                try:
-                    import torch
-                    from sentence_transformers import util
-                    
-                    skill_embedding = classifier.model.encode(normalized_skill, convert_to_tensor=True)
-                    
-                    # Compare with all three categories
-                    important_sim = torch.max(util.cos_sim(skill_embedding, classifier.important_tech_embeddings)).item()
-                    less_important_sim = torch.max(util.cos_sim(skill_embedding, classifier.less_important_tech_embeddings)).item()
-                    non_tech_sim = torch.max(util.cos_sim(skill_embedding, classifier.non_tech_embeddings)).item()
-                    
-                    # Classify based on highest similarity
-                    max_sim = max(important_sim, less_important_sim, non_tech_sim)
-                    
-                    if max_sim > 0.3:  # Minimum similarity threshold
-                        if important_sim == max_sim and important_sim > 0.3:
-                            important_skills.append(normalized_skill)
-                        elif less_important_sim == max_sim and less_important_sim > 0.3:
-                            less_important_skills.append(normalized_skill)
-                        else:
-                            non_technical_skills.append(normalized_skill)
-                    else:
-                        # Low similarity - classify based on weight as fallback
-                        if weight >= 2:
-                            important_skills.append(normalized_skill)
-                        elif weight >= 1:
-                            less_important_skills.append(normalized_skill)
-                        else:
-                            non_technical_skills.append(normalized_skill)
-                except Exception as e:
-                    logger.warning(f"Error classifying skill '{normalized_skill}': {e}, using weight-based classification")
-                    import traceback
-                    logger.debug(traceback.format_exc())
-                    # Fallback to weight-based classification
-                    if weight >= 2:
-                        important_skills.append(normalized_skill)
-                    elif weight >= 1:
-                        less_important_skills.append(normalized_skill)
-                    else:
-                        non_technical_skills.append(normalized_skill)
-            else:
-                # Fallback: classify based on weight
-                if weight >= 2:
-                    important_skills.append(normalized_skill)
-                elif weight >= 1:
-                    less_important_skills.append(normalized_skill)
-                else:
-                    non_technical_skills.append(normalized_skill)
-        
-        # Final filter: Remove any blacklisted items from important_skills (defensive check)
-        # This ensures blacklisted items never appear in Important, even if they somehow got through
-        important_skills_filtered = []
-        for skill in important_skills:
-            if not is_blacklisted_skill(skill):
-                important_skills_filtered.append(skill)
-            else:
-                # Move to less important or non-technical
-                logger.warning(f"🚫 Removed blacklisted skill '{skill}' from Important (final filter)")
-                safe_stderr_print(f"[EMBEDDINGS] 🚫 Final filter: Removed '{skill}' from Important", flush=True)
-                skill_lower = skill.lower().strip()
-                if skill_lower in ["computer science", "cs", "information technology", "it"]:
-                    non_technical_skills.append(skill)
-                else:
-                    less_important_skills.append(skill)
-        important_skills = important_skills_filtered
-        
-        # Calculate weighted statistics
-        total_weight = sum(weight for _, _, weight in matches)
-        weighted_skills = [skill for skill, _, weight in matches if weight > 0]
-        
-        stats = {
-            "total_matches": len(matches),
-            "unique_skills": len(normalized_skills),
-            "weighted_skills": len(weighted_skills),
-            "total_weight": total_weight,
-            "garbage_filtered": len(matches) - len(weighted_skills),
-            "validation_passed": len(weighted_skills),  # All skills passed type + specificity validation
-            "important_count": len(important_skills),
-            "less_important_count": len(less_important_skills),
-            "non_technical_count": len(non_technical_skills)
-        }
-        
-        logger.info(f"Extracted {len(normalized_skills)} unique skills from {len(matches)} matches")
-        logger.info(f"Classification: {len(important_skills)} important, {len(less_important_skills)} less important, {len(non_technical_skills)} non-technical")
-        logger.info(f"Skills normalized to display names (e.g., 'ts' → 'TypeScript', 'node' → 'Node.js')")
-        
-        # Ensure all lists are initialized (defensive programming)
-        if not important_skills:
-            important_skills = []
-        if not less_important_skills:
-            less_important_skills = []
-        if not non_technical_skills:
-            non_technical_skills = []
-        
-        safe_stderr_print(f"[EMBEDDINGS] Classification results: Important={len(important_skills)}, Less Important={len(less_important_skills)}, Non-Tech={len(non_technical_skills)}", flush=True)
-        
-        return ExtractSkillsResponse(
-            skills=normalized_skills,
-            matches=normalized_matches,
-            count=len(normalized_skills),
-            stats=stats,
-            important_skills=important_skills,
-            less_important_skills=less_important_skills,
-            non_technical_skills=non_technical_skills
-        )
+        return _build_skills_payload(request, matches, skills_db, deadline)
         
     except (BrokenPipeError, OSError) as e:
         # Handle broken pipe errors - these happen when stderr pipe is closed
@@ -1351,11 +1987,8 @@ async def _extract_skills_internal(request: ExtractSkillsRequest):
                 logger.warning(f"Broken pipe error during skill extraction (stderr closed): {e}")
             except:
                 pass  # Even logger might fail if stderr is broken
-            return ExtractSkillsResponse(
-                skills=[],
-                matches=[],
-                count=0,
-                stats={"total_matches": 0, "error": "stderr_pipe_closed", "message": "Broken pipe - stderr closed"}
+            return _empty_skills_response(
+                {"total_matches": 0, "error": "stderr_pipe_closed", "message": "Broken pipe - stderr closed"}
             )
         else:
             # Other OSError - check if it's actually a broken pipe by checking the error message
@@ -1366,11 +1999,8 @@ async def _extract_skills_internal(request: ExtractSkillsRequest):
                     logger.warning(f"Broken pipe error (detected in OSError): {e}")
                 except:
                     pass
-                return ExtractSkillsResponse(
-                    skills=[],
-                    matches=[],
-                    count=0,
-                    stats={"total_matches": 0, "error": "stderr_pipe_closed", "message": str(e)}
+                return _empty_skills_response(
+                    {"total_matches": 0, "error": "stderr_pipe_closed", "message": str(e)}
                 )
             # Not a broken pipe - log and re-raise
             try:
@@ -1398,11 +2028,8 @@ async def _extract_skills_internal(request: ExtractSkillsRequest):
                 logger.warning(f"Broken pipe error (wrapped in exception): {e}")
             except:
                 pass
-            return ExtractSkillsResponse(
-                skills=[],
-                matches=[],
-                count=0,
-                stats={"total_matches": 0, "error": "stderr_pipe_closed", "message": str(e)}
+            return _empty_skills_response(
+                {"total_matches": 0, "error": "stderr_pipe_closed", "message": str(e)}
             )
         
         # For other exceptions, try to log but don't fail if logging fails
@@ -1416,13 +2043,93 @@ async def _extract_skills_internal(request: ExtractSkillsRequest):
         )
 
 
+@app.post(
+    "/match",
+    response_model=MatchResponse,
+    responses={200: {"content": {MSGPACK_MEDIA_TYPE: {}}, "description": "JSON, or msgpack when accepted"}},
+)
+async def match_resume_skills(request: MatchRequest, http_request: Request):
+    """
+    Match resume skills against a job description's skills.
+    
+    Both sides are resolved to canonical IDs (JD text is extracted as by
+    /extract-skills); equal IDs are `matched`. The remaining JD x resume
+    pairs are scored as one similarity matrix (skill_match.py), and pairs
+    above the threshold come back as `semantic` matches; the rest of the JD
+    skills are `missing`.
+    
+    Args:
+        request: JD text or skills, resume skills and options
+        
+    Returns:
+        Response with matched, semantic and missing skills and the coverage score
+    """
+    if not SKILLS_MATCHER_AVAILABLE:
+        raise HTTPException(
+            status_code=503,
+            detail="Skills matcher module not available. Check server logs."
+        )
+    
+    # Same pool and admission queue as /extract-skills: JD text means an extraction
+    async with EXTRACT_ADMISSION.admit():
+        payload = await run_in_extraction_executor(_match_internal, request)
+    return negotiated_response(payload, http_request.headers.get("accept"))
+
+
+def _match_internal(request: MatchRequest) -> Dict[str, Any]:
+    """
+    Resolve both sides and match them; returns a plain dict in the
+    MatchResponse shape, ready for negotiated_response.
+    """
+    try:
+        skills_db = get_skills_database()
+        fuzzy = skills_db.get_fuzzy_matcher() if request.use_fuzzy else None
+        
+        if request.jd_text is not None:
+            text = preprocess_text(request.jd_text)
+            matches = []
+            if text.strip():
+                matches = extract_skills_with_phrasematcher(
+                    text,
+                    load_spacy_model(),
+                    skills_db,
+                    use_fuzzy=request.use_fuzzy,
+                    use_context_filter=True,
+                    boilerplate=BOILERPLATE_STORE,
+                    paragraph_cache=PARAGRAPH_CACHE
+                )
+            jd = from_extraction(matches, skills_db)
+        else:
+            jd = resolve_skills(request.jd_skills, skills_db, fuzzy)
+        resume = resolve_skills(request.resume_skills, skills_db, fuzzy)
+        
+        payload = match_skills(jd, resume, skills_db.get_similarity_scorer(), request.threshold)
+        observe_stage("match_similarity", payload["stats"]["similarity_ms"] / 1000)
+        return payload
+    except Exception as e:
+        try:
+            logger.error(f"Error matching skills: {e}", exc_info=False)
+        except:
+            pass
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to match skills: {str(e)}"
+        )
+
+
 @app.get("/")
 async def root():
     """Root endpoint with API information"""
     endpoints = {
             "health": "/health",
+        "ready": "/ready - Warm-up status and per-stage startup timings",
         "extract": "/extract (POST) - Legacy keyword extraction",
         "extract-skills": "/extract-skills (POST) - PhraseMatcher-based skill extraction",
+        "extract-skills-stream": "/extract-skills/stream (POST) - Paragraph-by-paragraph skill extraction as NDJSON events",
+        "match": "/match (POST) - Matched, missing and semantically similar skills of a resume against a JD",
+        "diagnostics": "/diagnostics - Recent logs and skills database stats",
+        "metrics": "/metrics - Prometheus metrics (request, stage, cache, executor, batch size)",
+        "admin-profiles": "/admin/profiles - cProfile summaries of sampled /extract-skills requests",
             "docs": "/docs"
         }
     
@@ -0,0 +1,373 @@
+"""
+Skill Matcher Engines
+=====================
+Dictionary matching of every skill in SkillsDatabase.skills, behind one
+call contract so the engine can be chosen per deployment:
+
+    engine(doc) -> [(match_id, start, end), ...]
+
+token offsets into a spaCy Doc, sorted by (start, end) and case-insensitive,
+exactly what spacy.matcher.PhraseMatcher returns. PhraseMatcherExtraction
+turns them into spans, so validation, context filtering and the
+(skill, canonical, weight) results do not depend on the engine.
+
+    phrasematcher   spaCy PhraseMatcher on LOWER; building it tokenizes every
+                    skill (~3 s for 40k skills)
+    aho_corasick    one Aho-Corasick automaton over the lowercased skill
+                    strings, built in ~0.1 s (pyahocorasick) or ~1 s (pure
+                    Python fallback). Scans the raw text and keeps the hits
+                    that start and end on token boundaries; find(text) does
+                    the same on word boundaries without spaCy at all.
+
+On corpus v1 both engines return identical matches. PhraseMatcher scans a
+parsed doc faster (it walks tokens, the automaton walks characters and
+filters substring hits), so aho_corasick pays off in build time and
+memory, and wherever no Doc is needed.
+
+VariantLookup runs after either engine and adds spellings that differ from a
+skill only in case and separators ("nodejs", "R-A-G", "machine-learning"):
+token n-grams are reduced to SkillsDatabase._normalize form and looked up
+in skills_dict, so custom keywords no longer need one pattern per variation.
+
+Environment:
+    NLP_MATCHER_ENGINE  - "phrasematcher" or "aho_corasick" (default: phrasematcher)
+    NLP_VARIANT_LOOKUP  - "0" to match enumerated custom keyword variations as
+                          patterns instead (default: enabled)
+"""
+
+import os
+import re
+import time
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+PHRASE_MATCHER = "phrasematcher"
+AHO_CORASICK = "aho_corasick"
+ENGINES = (PHRASE_MATCHER, AHO_CORASICK)
+
+MATCHER_ENGINE = os.environ.get("NLP_MATCHER_ENGINE", PHRASE_MATCHER).strip().lower()
+if MATCHER_ENGINE not in ENGINES:
+    raise ValueError(f"NLP_MATCHER_ENGINE must be one of {ENGINES}, got {MATCHER_ENGINE!r}")
+
+MATCH_LABEL = "SKILLS"
+
+VARIANT_LOOKUP = os.environ.get("NLP_VARIANT_LOOKUP", "1") != "0"
+# Tokens in one n-gram: "R-A-G" is five
+MAX_VARIANT_TOKENS = 7
+# Polynomial string hash over uint64 (wrapping); equal keys always hash equal,
+# and every hash hit is checked against the key itself
+_HASH_BASE = 1099511628211
+_HASH_MASK = (1 << 64) - 1
+# Low bits of the key hashes, as a bitmap that rules out most n-grams before searchsorted
+_BITMAP_BITS = 20
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]")
+_SEPARATORS_RE = re.compile(r"([\s._\-]+)")
+_SEPARATOR_TOKEN_RE = re.compile(r"[._\-]+")
+
+
+def normalize_pattern(skill: str) -> str:
+    """Lowercase with single spaces: what the automaton stores for a skill"""
+    return " ".join(skill.lower().split())
+
+
+def _lower_keeping_offsets(text: str) -> str:
+    """text.lower(), except characters whose lowercase changes length stay as they are"""
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered
+    return "".join(char if len(char.lower()) != 1 else char.lower() for char in text)
+
+
+def variant_key(text: str) -> str:
+    """Lowercase without spaces, dots, dashes and underscores ("Node.js" -> "nodejs")"""
+    return _SEPARATORS_RE.sub("", text.lower())
+
+
+def _gaps(text: str) -> Tuple[str, set, set]:
+    """variant_key(text), the offsets in it of gaps with whitespace, and of all gaps"""
+    glued = []
+    spaces, gaps = set(), set()
+    offset = 0
+    for index, part in enumerate(_SEPARATORS_RE.split(text.lower())):
+        if index % 2:
+            gaps.add(offset)
+            if any(char.isspace() for char in part):
+                spaces.add(offset)
+        else:
+            glued.append(part)
+            offset += len(part)
+    return "".join(glued), spaces, gaps
+
+
+def is_variant(text: str, skill: str) -> bool:
+    """
+    Whether `text` spells `skill` up to case and separators: dots, dashes and
+    underscores may stand for nothing ("nodejs", "R-A-G") or for a space
+    ("machine-learning"), but a space never disappears ("or a" is not "ORA").
+    """
+    text_key, text_spaces, text_gaps = _gaps(text)
+    skill_key, skill_spaces, skill_gaps = _gaps(skill)
+    return text_key == skill_key and text_spaces <= skill_gaps and skill_spaces <= text_gaps
+
+
+class PhraseMatcherEngine:
+    """spaCy PhraseMatcher (attr LOWER) holding every skill under the SKILLS label"""
+
+    name = PHRASE_MATCHER
+
+    def __init__(self, matcher, pattern_count: int = 0, build_seconds: float = 0.0, duplicates: int = 0):
+        self.matcher = matcher
+        self.pattern_count = pattern_count
+        self.build_seconds = build_seconds
+        self.duplicates = duplicates
+
+    @classmethod
+    def build(cls, nlp_model, skills: Iterable[str], dedupe: bool = True) -> "PhraseMatcherEngine":
+        """
+        Add every skill as a pattern. With `dedupe`, skills with the same
+        lowercase text (the same LOWER token sequence, so the same matches)
+        are tokenized and added once, as the first of them.
+        """
+        from spacy.matcher import PhraseMatcher
+
+        start = time.perf_counter()
+        skills = list(skills)
+        texts = skills
+        if dedupe:
+            by_lower: Dict[str, str] = {}
+            for skill in skills:
+                by_lower.setdefault(skill.lower(), skill)
+            texts = list(by_lower.values())
+        matcher = PhraseMatcher(nlp_model.vocab, attr="LOWER")
+        # tokenizer.pipe is equivalent to make_doc per skill but avoids per-call overhead
+        patterns = list(nlp_model.tokenizer.pipe(texts))
+        matcher.add(MATCH_LABEL, patterns)
+        return cls(matcher, len(patterns), time.perf_counter() - start, duplicates=len(skills) - len(patterns))
+
+    def __call__(self, doc) -> List[Tuple[int, int, int]]:
+        return self.matcher(doc)
+
+
+class _PythonAutomaton:
+    """Aho-Corasick automaton in pure Python (used when pyahocorasick is not installed)"""
+
+    def __init__(self, patterns: List[str]):
+        # Transitions keyed by (state << 21) | code point: one flat dict instead of a dict per node
+        transitions: Dict[int, int] = {}
+        children: List[List[Tuple[int, int]]] = [[]]
+        outputs: List[Tuple[int, ...]] = [()]
+        for pattern in patterns:
+            state = 0
+            for char in pattern:
+                key = (state << 21) | ord(char)
+                child = transitions.get(key)
+                if child is None:
+                    child = len(children)
+                    transitions[key] = child
+                    children[state].append((ord(char), child))
+                    children.append([])
+                    outputs.append(())
+                state = child
+            outputs[state] = (len(pattern),)
+
+        fail = [0] * len(children)
+        queue = deque(child for _, child in children[0])
+        while queue:
+            state = queue.popleft()
+            for code, child in children[state]:
+                queue.append(child)
+                target = fail[state]
+                while target and ((target << 21) | code) not in transitions:
+                    target = fail[target]
+                target = transitions.get((target << 21) | code, 0)
+                fail[child] = target if target != child else 0
+                if outputs[fail[child]]:
+                    outputs[child] = outputs[child] + outputs[fail[child]]
+        self.transitions = transitions
+        self.fail = fail
+        self.outputs = outputs
+        self.node_count = len(children)
+
+    def iter(self, text: str):
+        """Yield (end_index, length) for every pattern occurrence, like pyahocorasick's Automaton.iter"""
+        transitions, fail, outputs = self.transitions, self.fail, self.outputs
+        state = 0
+        for index, char in enumerate(text):
+            code = ord(char)
+            while state and ((state << 21) | code) not in transitions:
+                state = fail[state]
+            state = transitions.get((state << 21) | code, 0)
+            for length in outputs[state]:
+                yield index, length
+
+
+class AhoCorasickEngine:
+    """Aho-Corasick automaton over the normalized skill strings, matched on token or word boundaries"""
+
+    name = AHO_CORASICK
+
+    def __init__(self, skills: Iterable[str], native: bool = True):
+        """Build the automaton; `native` uses pyahocorasick when it is installed"""
+        start = time.perf_counter()
+        skills = list(skills)
+        patterns = sorted({normalize_pattern(skill) for skill in skills} - {""})
+        if native and ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for pattern in patterns:
+                automaton.add_word(pattern, len(pattern))
+            automaton.make_automaton()
+            self.implementation = "pyahocorasick"
+        else:
+            automaton = _PythonAutomaton(patterns)
+            self.implementation = "python"
+        self.automaton = automaton
+        self.pattern_count = len(patterns)
+        self.duplicates = len(skills) - len(patterns)
+        self.build_seconds = time.perf_counter() - start
+
+    def _hits(self, text: str) -> np.ndarray:
+        """(end_exclusive, start) of every occurrence of a pattern in `text`"""
+        hits = np.array(list(self.automaton.iter(_lower_keeping_offsets(text))), dtype=np.int64).reshape(-1, 2)
+        ends = hits[:, 0] + 1
+        return np.stack([ends, ends - hits[:, 1]], axis=1)
+
+    def __call__(self, doc) -> List[Tuple[int, int, int]]:
+        """PhraseMatcher-compatible matches: hits that start and end on token boundaries"""
+        from spacy.attrs import IDX, LENGTH
+
+        text = doc.text
+        hits = self._hits(text)
+        if not len(hits) or not len(doc):
+            return []
+        tokens = doc.to_array([IDX, LENGTH]).astype(np.int64).reshape(-1, 2)
+        # Character offset -> token index starting/ending there (-1: not a boundary)
+        start_token = np.full(len(text) + 1, -1, dtype=np.int64)
+        end_token = np.full(len(text) + 1, -1, dtype=np.int64)
+        start_token[tokens[:, 0]] = np.arange(len(tokens))
+        end_token[tokens[:, 0] + tokens[:, 1]] = np.arange(1, len(tokens) + 1)
+        ends = end_token[hits[:, 0]]
+        starts = start_token[hits[:, 1]]
+        keep = (starts >= 0) & (ends >= 0)
+        match_id = doc.vocab.strings.add(MATCH_LABEL)
+        return [(match_id, start, end) for start, end in sorted(zip(starts[keep].tolist(), ends[keep].tolist()))]
+
+    def find(self, text: str) -> List[Tuple[int, int, str]]:
+        """
+        Dictionary lookup without spaCy: (start_char, end_char, matched_text) of
+        every skill occurrence not preceded or followed by a letter or digit.
+        """
+        hits = self._hits(text)
+        found = []
+        for end, start in sorted(hits.tolist(), key=lambda hit: (hit[1], hit[0])):
+            if start > 0 and text[start - 1].isalnum() and text[start].isalnum():
+                continue
+            if end < len(text) and text[end].isalnum() and text[end - 1].isalnum():
+                continue
+            found.append((start, end, text[start:end]))
+        return found
+
+
+def _key_hash(key: str) -> Tuple[int, int]:
+    """(polynomial hash of `key`, _HASH_BASE ** len(key)), both mod 2**64"""
+    value = 0
+    for char in key:
+        value = (value * _HASH_BASE + ord(char)) & _HASH_MASK
+    return value, pow(_HASH_BASE, len(key), 1 << 64)
+
+
+class VariantLookup:
+    """
+    Case- and separator-insensitive skill lookup over token n-grams.
+
+    An n-gram starts and ends on a token with letters or digits and may span
+    separator tokens (".", "-", "_"); its key is the SkillsDatabase._normalize
+    form of its tokens. Keys of all n-grams up to max_tokens are hashed at
+    once with numpy (hash(a + b) = hash(a) * BASE**len(b) + hash(b)), filtered
+    by a bitmap of their low bits and compared with the sorted hashes of the
+    skills_dict keys. A key found in
+    skills_dict is a match only if the text is a variant of the skill (see
+    is_variant), so "C#" never resolves to "C" and "or a" never to "ORA".
+    """
+
+    def __init__(self, skills_dict: Dict[str, str], max_tokens: int = MAX_VARIANT_TOKENS):
+        self.skills_dict = skills_dict
+        self.max_tokens = max_tokens
+        self._hashes = np.unique(np.array([_key_hash(key)[0] for key in skills_dict], dtype=np.uint64))
+        self._bitmap = np.zeros(1 << _BITMAP_BITS, dtype=bool)
+        self._bitmap[self._hashes & np.uint64((1 << _BITMAP_BITS) - 1)] = True
+        # Lexeme (LOWER hash) -> (normalized key, kind, key hash, BASE ** len); kind 1 for a
+        # word, 0 for a separator, -1 for anything else
+        self._token_keys: Dict[int, Tuple[str, int, int, int]] = {}
+
+    def lookup(self, text: str) -> Optional[str]:
+        """The skill `text` is a variant of, or None"""
+        skill = self.skills_dict.get(_NON_ALNUM_RE.sub("", text.lower()))
+        if skill is not None and is_variant(text, skill):
+            return skill
+        return None
+
+    def _token_key(self, lower: int, strings) -> Tuple[str, int, int, int]:
+        entry = self._token_keys.get(lower)
+        if entry is None:
+            if len(self._token_keys) >= 200_000:
+                self._token_keys.clear()
+            text = strings[lower]
+            key = _NON_ALNUM_RE.sub("", text)
+            kind = 1 if key else (0 if _SEPARATOR_TOKEN_RE.fullmatch(text) else -1)
+            entry = self._token_keys[lower] = (key, kind, *_key_hash(key))
+        return entry
+
+    def __call__(self, doc, matches: List[Tuple[int, int, int]]) -> List[Tuple[int, int, int]]:
+        """`matches` plus the n-gram matches at other token offsets, sorted by (start, end)"""
+        from spacy.attrs import LOWER
+
+        count = len(doc)
+        if not count:
+            return matches
+        strings = doc.vocab.strings
+        entries = [self._token_key(lower, strings) for lower in doc.to_array(LOWER).tolist()]
+        _, kinds, hashes, powers = zip(*entries)
+        kinds = np.array(kinds, dtype=np.int8)
+        hashes = np.array(hashes, dtype=np.uint64)
+        powers = np.array(powers, dtype=np.uint64)
+        words = kinds == 1
+
+        found = []
+        bitmap_mask = np.uint64((1 << _BITMAP_BITS) - 1)
+        key_hashes = np.zeros(count, dtype=np.uint64)
+        open_ngrams = words.copy()  # n-grams starting at a word with no other token kind inside
+        for length in range(1, min(self.max_tokens, count) + 1):
+            size = count - length + 1
+            last = slice(length - 1, count)
+            key_hashes = key_hashes[:size] * powers[last] + hashes[last]
+            open_ngrams = open_ngrams[:size] & (kinds[last] >= 0)
+            if not open_ngrams.any():
+                break
+            candidates = open_ngrams & words[last] & self._bitmap[key_hashes & bitmap_mask]
+            starts = np.flatnonzero(candidates)
+            positions = np.searchsorted(self._hashes, key_hashes[starts]).clip(max=len(self._hashes) - 1)
+            starts = starts[self._hashes[positions] == key_hashes[starts]]
+            found.extend((start, start + length) for start in starts.tolist())
+        if not found:
+            return matches
+
+        seen = {(start, end) for _, start, end in matches}
+        added = []
+        for start, end in found:
+            if (start, end) in seen:
+                continue
+            skill = self.skills_dict.get("".join(entry[0] for entry in entries[start:end]))
+            if skill is not None and is_variant(doc[start:end].text, skill):
+                added.append((start, end))
+        if not added:
+            return matches
+        match_id = strings.add(MATCH_LABEL)
+        return sorted(matches + [(match_id, start, end) for start, end in added], key=lambda match: (match[1], match[2]))
@@ -0,0 +1,279 @@
+"""
+Metrics
+=======
+Minimal Prometheus-style metrics (counters, gauges, histograms) rendered in
+the text exposition format served by the /metrics endpoint.
+
+Kept dependency-free on purpose: the hot path only takes a lock and bumps a
+few floats, and main.py/skills_matcher.py record into the module-level
+metrics defined at the bottom of this file.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Latency buckets in seconds (1ms .. 60s) - extraction ranges from a few ms
+# for short JDs to tens of seconds for pasted resumes on a cold classifier
+DEFAULT_LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+
+# Batch-size buckets for model inference calls
+BATCH_SIZE_BUCKETS: Tuple[float, ...] = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512)
+TOKEN_COUNT_BUCKETS: Tuple[float, ...] = (16, 32, 64, 128, 256, 512, 1024, 2048, 4096, 8192)
+
+
+def _format_labels(labelnames: Sequence[str], labelvalues: Sequence[str], extra: str = "") -> str:
+    """Format a label set as {a="x",b="y"}"""
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, labelvalues)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Base class: a named metric with optional labels"""
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+        lines.extend(self._samples())
+        return lines
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter"""
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in items]
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, or be computed on scrape via set_function"""
+
+    metric_type = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._function: Optional[Callable[[], Dict[Tuple[str, ...], float]]] = None
+
+    def set(self, value: float, **labels) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def get(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def set_function(self, function: Callable[[], Dict[Tuple[str, ...], float]]) -> None:
+        """Compute values at scrape time: function returns {label_values_tuple: value}"""
+        self._function = function
+
+    def _samples(self) -> List[str]:
+        if self._function is not None:
+            try:
+                items = sorted(self._function().items())
+            except Exception:
+                items = []
+        else:
+            with self._lock:
+                items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in items]
+
+
+class Histogram(_Metric):
+    """Cumulative histogram with fixed buckets, plus _sum and _count"""
+
+    metric_type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        self._counts: Dict[Tuple[str, ...], List[int]] = {}
+        self._sums: Dict[Tuple[str, ...], float] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts = self._counts.get(key)
+            if counts is None:
+                counts = self._counts[key] = [0] * len(self.buckets)
+                self._sums[key] = 0.0
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            self._sums[key] += value
+
+    def snapshot(self, **labels) -> Tuple[int, float]:
+        """Return (count, sum) for a label set"""
+        key = self._key(labels)
+        with self._lock:
+            counts = self._counts.get(key)
+            return (sum(counts) if counts else 0, self._sums.get(key, 0.0))
+
+    def _samples(self) -> List[str]:
+        lines = []
+        with self._lock:
+            items = sorted((key, list(counts), self._sums[key]) for key, counts in self._counts.items())
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                le = 'le="' + _format_value(bound) + '"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+# All metrics register themselves here on construction
+REGISTRY: List[_Metric] = []
+
+
+def render_metrics() -> str:
+    """Render every registered metric in the Prometheus text format"""
+    lines: List[str] = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# ============================================================================
+# Service Metrics
+# ============================================================================
+
+REQUEST_COUNT = Counter(
+    "nlp_requests_total", "HTTP requests by endpoint and status code", ["endpoint", "method", "status"]
+)
+REQUEST_LATENCY = Histogram(
+    "nlp_request_duration_seconds", "HTTP request latency by endpoint", ["endpoint", "method"]
+)
+STAGE_LATENCY = Histogram(
+    "nlp_stage_duration_seconds",
+    "Extraction pipeline latency by stage (spacy_parse, phrase_matcher, batch_classification, "
+    "context_filtering, collapse, classification_3section, fuzzy, response_build, preprocess)",
+    ["stage"],
+)
+CACHE_REQUESTS = Counter(
+    "nlp_cache_requests_total", "Cache lookups by cache name and result (hit/miss)", ["cache", "result"]
+)
+EXECUTOR_QUEUE_DEPTH = Gauge(
+    "nlp_executor_queue_depth", "Extraction jobs waiting for a worker thread"
+)
+EXECUTOR_ACTIVE = Gauge(
+    "nlp_executor_active", "Extraction jobs currently running on a worker thread"
+)
+INFERENCE_BATCH_SIZE = Histogram(
+    "nlp_inference_batch_size", "Number of inputs per sentence-transformer encode call", ["call"],
+    buckets=BATCH_SIZE_BUCKETS,
+)
+PARSED_TOKENS = Histogram(
+    "nlp_parsed_tokens", "Tokens spaCy parsed per /extract-skills request", buckets=TOKEN_COUNT_BUCKETS,
+)
+CLASSIFIER_STATS = Gauge(
+    "nlp_classifier_stat", "SkillClassifier.get_stats() counters", ["stat"]
+)
+
+
+# Recent per-stage cost (EWMA, seconds), read by deadline-aware extraction to
+# decide which optional stages still fit in a request's latency budget
+STAGE_COST_ALPHA = 0.2
+_stage_costs: Dict[str, float] = {}
+_stage_costs_lock = threading.Lock()
+
+
+def update_stage_cost(stage: str, seconds: float) -> None:
+    """Fold one observation into the stage's recent-cost average"""
+    with _stage_costs_lock:
+        previous = _stage_costs.get(stage)
+        _stage_costs[stage] = seconds if previous is None else previous + STAGE_COST_ALPHA * (seconds - previous)
+
+
+def expected_stage_seconds(stage: str) -> Optional[float]:
+    """Recent average duration of a stage, or None if it has never run"""
+    return _stage_costs.get(stage)
+
+
+def observe_stage(stage: str, seconds: float) -> None:
+    """Record the duration of one pipeline stage"""
+    STAGE_LATENCY.observe(seconds, stage=stage)
+    update_stage_cost(stage, seconds)
+
+
+@contextmanager
+def stage_timer(stage: str):
+    """Time the enclosed block as a pipeline stage"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_stage(stage, time.perf_counter() - start)
+
+
+def record_cache(cache: str, hit: bool) -> None:
+    """Count one cache lookup"""
+    CACHE_REQUESTS.inc(cache=cache, result="hit" if hit else "miss")
+
+
+def record_batch_size(call: str, size: int) -> None:
+    """Record the size of one model-inference batch"""
+    INFERENCE_BATCH_SIZE.observe(size, call=call)
+
+
+def record_parsed_tokens(count: int) -> None:
+    """Record how many tokens spaCy parsed for one request"""
+    PARSED_TOKENS.observe(count)
@@ -0,0 +1,274 @@
+"""
+Near-Duplicate Job Descriptions
+===============================
+Reuses the /extract-skills result of a recently processed posting when the
+same posting comes in again with small differences: another job board's
+tracking footer, reordered bullets, a changed "Posted 3 days ago" line.
+
+Each cleaned text is reduced to a MinHash signature over the word 3-grams
+of its lines (3-grams never cross a line break, so reordered bullets keep
+them; NUM_PERMUTATIONS values; the share of equal values estimates the Jaccard
+similarity of the two 3-gram sets). Signatures are indexed with LSH: split
+into BANDS bands, and postings sharing any band are candidates, so a lookup
+compares against a handful of entries instead of all of them. The most
+similar candidate at or above NLP_NEAR_DUPLICATE_THRESHOLD is a hit.
+
+    refresh   (default) a hit is only reused when both texts have the same
+              set of lines (reordered, re-cased or re-spaced); otherwise the
+              text is extracted again, and the paragraph cache
+              (paragraph_cache.py) limits the work to the paragraphs that
+              differ, so an edited JD never gets its old result back
+    reuse     a hit returns the stored payload as is, with
+              stats.near_duplicate_similarity added, even when a line was
+              added (a new requirement scores like a tracking footer)
+
+Only payloads of complete extractions are stored (not degraded by a latency
+budget, no error), per request options. The index is an LRU of at most
+NLP_NEAR_DUPLICATE_CACHE_SIZE postings, each ~4 KB of signature and LSH keys
+plus its payload, kept in process memory.
+
+Environment:
+    NLP_NEAR_DUPLICATE_CACHE_SIZE  - postings kept, "0" disables (default: 1000)
+    NLP_NEAR_DUPLICATE_THRESHOLD   - estimated Jaccard similarity for a hit (default: 0.9)
+    NLP_NEAR_DUPLICATE_MODE        - "refresh" or "reuse" (default: refresh)
+"""
+
+import hashlib
+import os
+import re
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from .metrics import Gauge, record_cache
+except ImportError:
+    from metrics import Gauge, record_cache
+
+NEAR_DUPLICATE_ENTRIES = Gauge("nlp_near_duplicate_entries", "Postings held by the near-duplicate index")
+
+REUSE = "reuse"
+REFRESH = "refresh"
+
+NUM_PERMUTATIONS = 128
+# 16 bands of 8 rows: postings at 0.9 similarity share a band with probability
+# > 0.999, postings below 0.5 almost never do
+BANDS = 16
+SHINGLE_WORDS = 3
+
+_WORD_RE = re.compile(r"\w+")
+# Universal hashing h(x) = (a*x + b) >> 32 over uint64 (wrapping), one (a, b) per permutation
+_rng = np.random.default_rng(20240611)
+_PERMUTATION_A = _rng.integers(1, 2**63, NUM_PERMUTATIONS, dtype=np.uint64) | np.uint64(1)
+_PERMUTATION_B = _rng.integers(0, 2**63, NUM_PERMUTATIONS, dtype=np.uint64)
+# Odd multipliers that combine the word hashes of a 3-gram (position matters)
+_SHINGLE_MIX = (np.uint64(0x9E3779B97F4A7C15), np.uint64(0xC2B2AE3D27D4EB4F), np.uint64(0x165667B19E3779F9))
+
+
+def _shingle_hashes(text: str) -> np.ndarray:
+    """Hashes of the word 3-grams within each line (a line of fewer words is one shingle)"""
+    words: List[str] = []
+    line_ids: List[int] = []
+    short_lines: List[Tuple[int, int]] = []
+    for line_id, line in enumerate(text.lower().splitlines()):
+        line_words = _WORD_RE.findall(line)
+        if not line_words:
+            continue
+        if len(line_words) < SHINGLE_WORDS:
+            short_lines.append((len(words), len(line_words)))
+        words.extend(line_words)
+        line_ids.extend([line_id] * len(line_words))
+    if not words:
+        return np.empty(0, dtype=np.uint64)
+    hashes = np.fromiter((zlib.crc32(word.encode("utf-8", "surrogatepass")) for word in words),
+                         dtype=np.uint64, count=len(words))
+    lines = np.asarray(line_ids)
+    count = max(len(words) - SHINGLE_WORDS + 1, 0)
+    shingles = hashes[:count] * _SHINGLE_MIX[0]
+    for offset in range(1, SHINGLE_WORDS):
+        shingles ^= hashes[offset:offset + count] * _SHINGLE_MIX[offset]
+    # Keep 3-grams that do not cross a line break, so reordered bullets keep their shingles
+    shingles = shingles[lines[:count] == lines[SHINGLE_WORDS - 1:]]
+    if short_lines:
+        mix = np.array(_SHINGLE_MIX, dtype=np.uint64)
+        extra = [np.bitwise_xor.reduce(hashes[start:start + length] * mix[:length]) for start, length in short_lines]
+        shingles = np.concatenate([shingles, np.array(extra, dtype=np.uint64)])
+    return shingles
+
+
+def minhash_signature(text: str) -> Optional[np.ndarray]:
+    """MinHash signature (uint32[NUM_PERMUTATIONS]) of the shingles of `text`, or None without words"""
+    shingles = _shingle_hashes(text)
+    if not len(shingles):
+        return None
+    permuted = (_PERMUTATION_A[:, None] * (shingles[None, :] >> np.uint64(32)) + _PERMUTATION_B[:, None]) >> np.uint64(32)
+    return permuted.min(axis=1).astype(np.uint32)
+
+
+def similarity(first: np.ndarray, second: np.ndarray) -> float:
+    """Estimated Jaccard similarity of two signatures"""
+    return float(np.count_nonzero(first == second)) / NUM_PERMUTATIONS
+
+
+def _digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+def line_set_digest(text: str) -> bytes:
+    """Digest of the set of non-empty lines, ignoring order, case and whitespace"""
+    lines = {" ".join(line.lower().split()) for line in text.splitlines()}
+    lines.discard("")
+    return _digest("\n".join(sorted(lines)))
+
+
+class NearDuplicateCheck:
+    """Result of NearDuplicateIndex.lookup(); pass it to store() after extracting"""
+
+    __slots__ = ("digest", "options", "signature", "lines", "payload", "similarity")
+
+    def __init__(self, digest: bytes, options: tuple, signature: Optional[np.ndarray], lines: bytes):
+        self.digest = digest
+        self.options = options
+        self.signature = signature
+        self.lines = lines
+        self.payload: Optional[Dict[str, Any]] = None  # Set on a hit
+        self.similarity = 0.0
+
+
+class _Entry:
+    __slots__ = ("options", "signature", "lines", "payload", "bands")
+
+    def __init__(self, check: NearDuplicateCheck, payload: Dict[str, Any], bands: List[int]):
+        self.options = check.options
+        self.signature = check.signature
+        self.lines = check.lines
+        self.payload = payload
+        self.bands = bands
+
+
+class NearDuplicateIndex:
+    """Bounded LRU of /extract-skills payloads, looked up by MinHash/LSH similarity; thread-safe"""
+
+    def __init__(self, capacity: int = 1000, threshold: float = 0.9, mode: str = REFRESH):
+        if mode not in (REUSE, REFRESH):
+            raise ValueError(f"near-duplicate mode must be '{REUSE}' or '{REFRESH}', got {mode!r}")
+        self.capacity = capacity
+        self.threshold = threshold
+        self.mode = mode
+        self.hits = 0
+        self.near_hits = 0
+        self.refreshed = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[bytes, tuple], _Entry]" = OrderedDict()
+        self._buckets: Dict[int, List[Tuple[bytes, tuple]]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.capacity > 0
+
+    def _bands(self, signature: np.ndarray, options: tuple) -> List[int]:
+        # One int per band: a collision only adds a candidate, which similarity() then rejects
+        rows = NUM_PERMUTATIONS // BANDS
+        return [hash((options, band, signature[band * rows:(band + 1) * rows].tobytes())) for band in range(BANDS)]
+
+    def lookup(self, text: str, *options: Hashable) -> NearDuplicateCheck:
+        """Find the most similar stored posting with the same options; check.payload is set on a hit"""
+        check = NearDuplicateCheck(_digest(text), options, None, b"")
+        if not self.enabled:
+            return check
+        # Hashing is the expensive part: done before taking the lock
+        check.lines = line_set_digest(text)
+        check.signature = minhash_signature(text)
+        with self._lock:
+            entry = self._entries.get((check.digest, options))
+            if entry is not None:
+                best, best_similarity = (check.digest, options), 1.0
+            else:
+                best, best_similarity = None, 0.0
+                if check.signature is not None:
+                    candidates = {key for band in self._bands(check.signature, options) for key in self._buckets.get(band, ())}
+                    for key in candidates:
+                        score = similarity(check.signature, self._entries[key].signature)
+                        if score >= self.threshold and score > best_similarity:
+                            best, best_similarity = key, score
+                if best is not None:
+                    entry = self._entries[best]
+                    if self.mode == REFRESH and entry.lines != check.lines:
+                        # Same posting with changed lines: extract again (unchanged paragraphs are cached)
+                        self.refreshed += 1
+                        entry = None
+            if entry is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(best)
+                self.hits += 1
+                if best_similarity < 1.0:
+                    self.near_hits += 1
+        record_cache("near_duplicate", hit=entry is not None)
+        if entry is not None:
+            check.similarity = best_similarity
+            check.payload = dict(entry.payload)
+            check.payload["stats"] = {**entry.payload.get("stats", {}), "near_duplicate_similarity": round(best_similarity, 3)}
+        return check
+
+    def store(self, check: NearDuplicateCheck, payload: Dict[str, Any]) -> None:
+        """Remember the payload extracted for a lookup() miss (degraded or failed extractions are skipped)"""
+        if not self.enabled or check.payload is not None:
+            return
+        stats = payload.get("stats", {})
+        if stats.get("degraded") or "error" in stats:
+            return
+        key = (check.digest, check.options)
+        with self._lock:
+            if key in self._entries:
+                # Coalesced followers of the same request store the same payload
+                self._entries.move_to_end(key)
+                return
+            signature = check.signature
+            if signature is None:
+                return
+            bands = self._bands(signature, check.options)
+            self._entries[key] = _Entry(check, payload, bands)
+            for band in bands:
+                self._buckets.setdefault(band, []).append(key)
+            while len(self._entries) > self.capacity:
+                self._evict()
+            NEAR_DUPLICATE_ENTRIES.set(len(self._entries))
+
+    def _evict(self) -> None:
+        key, entry = self._entries.popitem(last=False)
+        for band in entry.bands:
+            bucket = self._buckets[band]
+            bucket.remove(key)
+            if not bucket:
+                del self._buckets[band]
+
+    def get_state(self) -> Dict[str, Any]:
+        """Hit rate and size, for /diagnostics"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "mode": self.mode,
+                "threshold": self.threshold,
+                "entries": len(self._entries),
+                "capacity": self.capacity,
+                "hits": self.hits,
+                "near_hits": self.near_hits,
+                "refreshed": self.refreshed,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+def near_duplicate_index_from_env() -> NearDuplicateIndex:
+    """Build a NearDuplicateIndex honouring NLP_NEAR_DUPLICATE_* settings"""
+    return NearDuplicateIndex(
+        capacity=int(os.environ.get("NLP_NEAR_DUPLICATE_CACHE_SIZE", "1000")),
+        threshold=float(os.environ.get("NLP_NEAR_DUPLICATE_THRESHOLD", "0.9")),
+        mode=os.environ.get("NLP_NEAR_DUPLICATE_MODE", REFRESH).strip().lower(),
+    )
@@ -0,0 +1,153 @@
+"""
+Paragraph Result Cache
+======================
+Per-paragraph PhraseMatcher results, so re-running /extract-skills on an
+edited job description only parses and validates the paragraphs that changed.
+
+The text is cut into units (paragraphs separated by blank lines; a short
+paragraph such as a "Requirements" heading is kept with the paragraph after
+it, so its words stay context for the skills below it). For each unit the
+cache keeps what the expensive stages produced:
+
+    candidates  every matched skill text in the unit, in order, with its
+                frequency in the unit, whether the occurrence used for
+                validation had tags, its verdict (skill_name, canonical,
+                base_weight) or rejection reason, and its match offsets
+    counts      PhraseMatcher matches and parsed tokens
+
+Per request only the cheap steps run over all units: summing frequencies,
+picking each candidate's verdict (first tagged occurrence, as for a whole
+document), then the frequency boost, collapse and the 3-section split as
+before. Keys are the exact unit text plus its parse depth (sections.py) and
+the context-filter and fuzzy settings. Results computed while a latency
+budget degraded a stage, or with near-miss words past the fuzzy stage's
+per-request cap, are not stored.
+
+Environment:
+    NLP_PARAGRAPH_CACHE_SIZE    - units kept, "0" disables (default: 5000)
+"""
+
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+try:
+    from .metrics import Gauge, record_cache
+except ImportError:
+    from metrics import Gauge, record_cache
+
+PARAGRAPH_CACHE_ENTRIES = Gauge("nlp_paragraph_cache_entries", "Paragraph units held by the paragraph result cache")
+
+_BLANK_LINES_RE = re.compile(r"\n[ \t]*\n\s*")
+# Shorter paragraphs (headings) are kept with the next one
+UNIT_MIN_CHARS = 80
+# Longer paragraphs (pasted text without blank lines) are cut at line breaks
+UNIT_MAX_CHARS = 2000
+
+# (matched_lower, matched_text, frequency, tagged, skill or None, rejection reason, match offsets in the unit)
+Candidate = Tuple[str, str, int, bool, Optional[Tuple[str, str, float]], Optional[str], Tuple[int, ...]]
+
+
+def split_units(text: str) -> List[Tuple[int, int]]:
+    """(start, end) of each unit of `text`; separators between units belong to none"""
+    paragraphs = []
+    start = 0
+    for separator in _BLANK_LINES_RE.finditer(text):
+        paragraphs.append((start, separator.start()))
+        start = separator.end()
+    paragraphs.append((start, len(text)))
+
+    units: List[Tuple[int, int]] = []
+    unit_start = None
+    last_end = 0
+    for start, end in paragraphs:
+        if start == end:
+            continue
+        last_end = end
+        if unit_start is None:
+            unit_start = start
+        if end - start < UNIT_MIN_CHARS:
+            continue
+        # Cut long paragraphs at the last line break before UNIT_MAX_CHARS
+        while end - unit_start > UNIT_MAX_CHARS:
+            cut = text.rfind("\n", unit_start, unit_start + UNIT_MAX_CHARS)
+            if cut <= unit_start:
+                break
+            units.append((unit_start, cut))
+            unit_start = cut + 1
+        units.append((unit_start, end))
+        unit_start = None
+    if unit_start is not None:
+        units.append((unit_start, last_end))
+    return units
+
+
+def unit_key(unit_text: str, *options: Hashable) -> tuple:
+    """Cache key: digest of the exact unit text plus the options that change its result"""
+    return (hashlib.blake2b(unit_text.encode("utf-8", "surrogatepass"), digest_size=16).digest(), *options)
+
+
+class ParagraphResult:
+    """Cached extraction result of one unit"""
+
+    __slots__ = ("candidates", "match_count", "token_count")
+
+    def __init__(self, candidates: List[Candidate], match_count: int, token_count: int):
+        self.candidates = candidates
+        self.match_count = match_count
+        self.token_count = token_count
+
+
+class ParagraphCache:
+    """Bounded LRU of ParagraphResult by unit key; thread-safe (used from executor threads)"""
+
+    def __init__(self, capacity: int = 5000):
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[tuple, ParagraphResult]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.capacity > 0
+
+    def get(self, key: tuple) -> Optional[ParagraphResult]:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        record_cache("paragraph", hit=result is not None)
+        return result
+
+    def put(self, key: tuple, result: ParagraphResult) -> None:
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+            PARAGRAPH_CACHE_ENTRIES.set(len(self._entries))
+
+    def get_state(self) -> Dict[str, Any]:
+        """Hit rate and size, for /diagnostics"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "capacity": self.capacity,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+def paragraph_cache_from_env() -> ParagraphCache:
+    """Build a ParagraphCache honouring NLP_PARAGRAPH_CACHE_SIZE"""
+    return ParagraphCache(capacity=int(os.environ.get("NLP_PARAGRAPH_CACHE_SIZE", "5000")))
@@ -0,0 +1,183 @@
+"""
+Request Profiling
+=================
+Opt-in cProfile hook for /extract-skills.
+
+A request is profiled when either:
+- it is sampled: NLP_PROFILE_SAMPLE_RATE (0.0-1.0, default 0 = off), or
+- it carries the admin header: X-Profile: <NLP_ADMIN_TOKEN>
+
+The profiler is enabled from the extraction worker thread, and the top-N
+functions by cumulative time are kept in a bounded ring buffer served by
+GET /admin/profiles. On Python 3.12+ (runtime.txt) cProfile is global to the
+interpreter: a profile also records calls made by other threads while it
+runs, and only one can be active at a time. A request that would be profiled
+while another profile is running runs unprofiled instead (counted in
+nlp_profiles_skipped_total).
+
+When disabled the only per-request cost is one header lookup. Without
+NLP_ADMIN_TOKEN the header trigger is off and /admin/* answers 404.
+"""
+
+import cProfile
+import hmac
+import os
+import pstats
+import random
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+try:
+    from .metrics import Counter
+except ImportError:
+    from metrics import Counter
+
+PROFILE_SAMPLE_RATE = min(max(float(os.environ.get("NLP_PROFILE_SAMPLE_RATE", "0") or 0), 0.0), 1.0)
+PROFILE_TOP_N = int(os.environ.get("NLP_PROFILE_TOP_N", "25"))
+PROFILE_BUFFER_SIZE = int(os.environ.get("NLP_PROFILE_BUFFER_SIZE", "20"))
+ADMIN_TOKEN = os.environ.get("NLP_ADMIN_TOKEN") or None
+
+PROFILE_HEADER = "x-profile"
+ADMIN_TOKEN_HEADER = "x-admin-token"
+
+PROFILES: deque = deque(maxlen=PROFILE_BUFFER_SIZE)
+_profile_ids = iter(range(1, 2 ** 62))
+_profile_lock = threading.Lock()
+# Held while a profile runs; never waited on (see run_profiled)
+_profiler_active = threading.Lock()
+
+PROFILED_REQUESTS = Counter(
+    "nlp_profiled_requests_total", "Requests run under cProfile by trigger (sampled/header)", ["reason"]
+)
+PROFILES_SKIPPED = Counter(
+    "nlp_profiles_skipped_total", "Requests run unprofiled because another profile was already running", ["reason"]
+)
+
+
+def profiling_reason(headers) -> Optional[str]:
+    """
+    Decide whether to profile a request.
+
+    Args:
+        headers: Request headers (case-insensitive mapping)
+
+    Returns:
+        "header" or "sampled" if the request should be profiled, else None
+    """
+    if _token_matches(headers.get(PROFILE_HEADER)):
+        return "header"
+    if PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE:
+        return "sampled"
+    return None
+
+
+def _token_matches(value: Optional[str]) -> bool:
+    """Constant-time comparison with NLP_ADMIN_TOKEN; never matches when it is unset"""
+    if ADMIN_TOKEN is None or value is None:
+        return False
+    return hmac.compare_digest(value.encode("utf-8"), ADMIN_TOKEN.encode("utf-8"))
+
+
+def is_admin_enabled() -> bool:
+    """Admin endpoints exist only when NLP_ADMIN_TOKEN is set"""
+    return ADMIN_TOKEN is not None
+
+
+def is_admin_authorized(headers) -> bool:
+    """Admin endpoints are denied unless X-Admin-Token matches NLP_ADMIN_TOKEN (denied when unset)"""
+    return _token_matches(headers.get(ADMIN_TOKEN_HEADER))
+
+
+def _function_label(func: tuple) -> str:
+    filename, lineno, name = func
+    if filename == "~":
+        return name  # built-in
+    return f"{os.path.basename(filename)}:{lineno}({name})"
+
+
+def summarize_profile(profiler: cProfile.Profile, top_n: int = PROFILE_TOP_N) -> List[Dict[str, Any]]:
+    """
+    Reduce a profile to the top-N functions by cumulative time.
+
+    Each entry also names its heaviest caller, which is usually enough to
+    reconstruct the hot stack (e.g. batch_classify_skills <- extract_skills_with_phrasematcher).
+    """
+    stats = pstats.Stats(profiler)
+    rows = []
+    for func, (primitive_calls, total_calls, tottime, cumtime, callers) in stats.stats.items():
+        heaviest_caller = None
+        if callers:
+            caller, caller_stats = max(callers.items(), key=lambda item: item[1][3])
+            heaviest_caller = _function_label(caller)
+        rows.append({
+            "function": _function_label(func),
+            "calls": total_calls,
+            "tottime_ms": round(tottime * 1000, 3),
+            "cumtime_ms": round(cumtime * 1000, 3),
+            "caller": heaviest_caller,
+        })
+    rows.sort(key=lambda row: row["cumtime_ms"], reverse=True)
+    return rows[:top_n]
+
+
+def run_profiled(func, reason: str, label: str, *args):
+    """
+    Run func(*args) under cProfile and record the summary in PROFILES.
+
+    If another profile is running (one at a time per interpreter on 3.12+),
+    func runs unprofiled rather than waiting or failing.
+
+    Args:
+        func: Blocking callable to profile (runs in the calling thread)
+        reason: Why the request is profiled ("sampled" or "header")
+        label: Short description stored with the profile (e.g. endpoint + text length)
+    """
+    if not _profiler_active.acquire(blocking=False):
+        PROFILES_SKIPPED.inc(reason=reason)
+        return func(*args)
+    try:
+        profiler = cProfile.Profile()
+        profiler.enable()
+    except ValueError:
+        # Another profiling tool (not ours) is active
+        _profiler_active.release()
+        PROFILES_SKIPPED.inc(reason=reason)
+        return func(*args)
+    start_time = time.perf_counter()
+    try:
+        return func(*args)
+    finally:
+        profiler.disable()
+        _profiler_active.release()
+        duration_ms = (time.perf_counter() - start_time) * 1000
+        entry = {
+            "timestamp": datetime.now().isoformat(),
+            "reason": reason,
+            "label": label,
+            "duration_ms": round(duration_ms, 1),
+            "top": summarize_profile(profiler),
+        }
+        with _profile_lock:
+            entry["id"] = next(_profile_ids)
+            PROFILES.append(entry)
+        PROFILED_REQUESTS.inc(reason=reason)
+
+
+def get_profiles(limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Return stored profiles, newest first"""
+    with _profile_lock:
+        profiles = list(PROFILES)
+    profiles.reverse()
+    return profiles[:limit] if limit else profiles
+
+
+def get_profiling_config() -> Dict[str, Any]:
+    return {
+        "sample_rate": PROFILE_SAMPLE_RATE,
+        "top_n": PROFILE_TOP_N,
+        "buffer_size": PROFILE_BUFFER_SIZE,
+        "header_enabled": ADMIN_TOKEN is not None,
+    }
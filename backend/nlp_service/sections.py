@@ -0,0 +1,139 @@
+"""
+Job Description Sections
+========================
+Splits a job description into headed sections so spaCy only runs its full
+pipeline (tagger, parser, NER) where skills are expected.
+
+    requirements  "Requirements", "Must Have Skills", "Qualifications",
+                  "Tech stack", "Responsibilities", "About you", ...
+    narrative     "About us", "Company overview", "Benefits", "What we offer",
+                  "Equal Opportunity", "How to apply", "Interview process", ...
+    general       text before the first heading, and a narrative section's
+                  paragraphs that open with an unknown short title
+
+Requirements and general sections are parsed as before. Narrative sections
+are only tokenized: the PhraseMatcher still sees them, so their mentions
+still count towards frequency, but has_skill_context has no tags there and
+only accepts a skill that is new there with explicit wording around it
+("experience with ...").
+
+A heading is the first line of a paragraph (or any line ending in ":") with
+at most 8 words, or the label of an inline "Must have: Python, Go" line, that
+matches the vocabularies below. Requirement words win over narrative ones.
+
+Environment:
+    NLP_SECTION_AWARE_PARSING   - "0" to parse the whole text with the full pipeline (default: enabled)
+"""
+
+import os
+import re
+from typing import List, NamedTuple, Optional
+
+try:
+    from .metrics import Counter
+except ImportError:
+    from metrics import Counter
+
+SECTION_AWARE_PARSING = os.environ.get("NLP_SECTION_AWARE_PARSING", "1") != "0"
+
+SECTION_CHARS = Counter(
+    "nlp_section_chars_total", "Characters of /extract-skills text by detected section kind", ["kind"]
+)
+
+REQUIREMENTS = "requirements"
+NARRATIVE = "narrative"
+GENERAL = "general"
+
+_REQUIREMENT_HEADING_RE = re.compile(
+    r"\b(?:requirements?|qualifications?|skills?|must[- ]haves?|nice[- ]to[- ]haves?|good[- ]to[- ]haves?|"
+    r"what you(?:'ll| will)? (?:need|bring|do|have)|what we(?:'re| are) looking for|you (?:have|bring|are)|"
+    r"about you|experience|expertise|tech(?:nology)? stack|technologies|tools|responsibilit(?:y|ies)|duties|"
+    r"(?:the|your|about the) role|the opportunity|preferred|bonus points|competenc(?:y|ies))\b",
+    re.IGNORECASE,
+)
+_NARRATIVE_HEADING_RE = re.compile(
+    r"\b(?:about us|about the company|about [A-Z]\w+$|company overview|who we are|our (?:mission|values|story|culture)|"
+    r"culture|benefits?|perks|what we offer|why (?:join|work)|compensation|salary|pay range|equal opportunity|"
+    r"diversity|eeo|inclusion|how to apply|application process|interview process|hiring process|"
+    r"how we work|life at|recruitment fraud|fraud alert|privacy notice|similar jobs|disclaimer)\b",
+    re.IGNORECASE,
+)
+_MAX_HEADING_WORDS = 8
+_MAX_HEADING_CHARS = 60
+_MAX_TITLE_WORDS = 5
+
+
+class Section(NamedTuple):
+    kind: str
+    heading: str
+    start: int
+    end: int
+
+
+def heading_kind(label: str) -> Optional[str]:
+    """REQUIREMENTS or NARRATIVE if `label` reads like a section heading of that kind"""
+    label = label.strip().rstrip(":").strip()
+    if not label or len(label) > _MAX_HEADING_CHARS or len(label.split()) > _MAX_HEADING_WORDS:
+        return None
+    if label.endswith((".", "!", "?")):
+        return None
+    if _REQUIREMENT_HEADING_RE.search(label):
+        return REQUIREMENTS
+    if _NARRATIVE_HEADING_RE.search(label):
+        return NARRATIVE
+    return None
+
+
+def _is_title(line: str) -> bool:
+    return len(line.split()) <= _MAX_TITLE_WORDS and not line.endswith((".", "!", "?", ",", ";"))
+
+
+def detect_sections(text: str) -> List[Section]:
+    """Contiguous sections covering all of `text` (section boundaries are line starts)"""
+    sections: List[Section] = []
+    kind, heading, start = GENERAL, "", 0
+    paragraph_start = True
+    offset = 0
+    lines = text.splitlines(keepends=True)
+    for index, line in enumerate(lines):
+        stripped = line.strip()
+        if not stripped:
+            paragraph_start = True
+            offset += len(line)
+            continue
+        label = None
+        if paragraph_start or stripped.endswith(":"):
+            label = stripped
+        colon = stripped.find(":")
+        if 0 < colon < _MAX_HEADING_CHARS and colon < len(stripped) - 1:
+            # Inline label: "Must have: Python, Django"
+            label = stripped[:colon]
+        new_kind = heading_kind(label) if label else None
+        if (new_kind is None and kind == NARRATIVE and paragraph_start and _is_title(stripped)
+                and index + 1 < len(lines) and lines[index + 1].strip()):
+            # Unknown heading with a body ("The team", "Your first six months"): end the narrative
+            new_kind = GENERAL
+        if new_kind:
+            if offset > start:
+                sections.append(Section(kind, heading, start, offset))
+            kind, heading, start = new_kind, label.rstrip(":").strip(), offset
+        paragraph_start = False
+        offset += len(line)
+    if offset > start or not sections:
+        sections.append(Section(kind, heading, start, len(text)))
+    return sections
+
+
+def parse_plan(text: str) -> List[Section]:
+    """
+    detect_sections() with neighbours of the same parse depth merged:
+    each returned section is either NARRATIVE (tokenize only) or parsed.
+    """
+    plan: List[Section] = []
+    for section in detect_sections(text):
+        SECTION_CHARS.inc(section.end - section.start, kind=section.kind)
+        if plan and (plan[-1].kind == NARRATIVE) == (section.kind == NARRATIVE):
+            plan[-1] = plan[-1]._replace(end=section.end)
+        else:
+            plan.append(section)
+    return plan
@@ -0,0 +1,50 @@
+"""
+Serialization
+=============
+Fast JSON rendering for hot endpoints.
+
+Handlers on the hot path build plain dicts/lists and return them wrapped in
+FastJSONResponse. Returning a Response directly makes FastAPI skip
+response_model validation and jsonable_encoder (the response_model on the
+route is then only used for the OpenAPI docs).
+
+orjson is used when installed; otherwise the stdlib json module produces the
+same compact output.
+"""
+
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def to_builtin(obj: Any) -> Any:
+    """Handle numpy scalars and other number-like values from the pipeline"""
+    if hasattr(obj, "item"):
+        return obj.item()
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize plain Python structures to compact UTF-8 JSON bytes"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content, default=to_builtin, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(
+        content, default=to_builtin, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with dumps() (orjson when available)"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -0,0 +1,250 @@
+"""
+Resume-to-JD Skill Matching
+===========================
+Backs POST /match: which job-description skills a resume covers, which it
+is missing, and which it covers under another name.
+
+Both sides are first resolved to canonical IDs, the key /extract-skills
+dedupes on (SkillsDatabase._get_canonical), so "nodejs" in the JD and
+"Node.js" on the resume are a plain match, as are two IDs with the same
+display name ("postgres" and "postgresql" are both PostgreSQL). One-word resume or JD skills not
+in the dictionary go through the typo lookup first ("Kubernets").
+
+Only the JD skills left over are then scored against the resume skills
+left over, as one similarity matrix:
+
+    embedding   with the sentence-transformers model the skill classifier
+                has loaded: one encode call for the names not yet in the
+                embedding cache, normalized, and one matrix product (cosine)
+    string      without it, one rapidfuzz process.cdist call (normalized
+                Indel similarity of the lowercase names); catches spelling
+                variants ("Kafka Stream" / "Kafka Streams"), not synonyms
+
+Pairs at or above the method's threshold are assigned best score first,
+each JD and resume skill at most once.
+
+Environment:
+    NLP_MATCH_THRESHOLD            - min cosine similarity of a semantic match (default: 0.75)
+    NLP_MATCH_STRING_THRESHOLD     - min string similarity when no model is loaded (default: 0.85)
+    NLP_MATCH_EMBEDDING_CACHE_SIZE - skill name embeddings kept across requests (default: 20000)
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+try:
+    from rapidfuzz import process
+    from rapidfuzz.distance import Indel
+except ImportError:
+    process = None
+    Indel = None
+
+try:
+    from .fuzzy_matcher import MIN_WORD_LENGTH
+    from .metrics import record_batch_size, record_cache
+except ImportError:
+    from fuzzy_matcher import MIN_WORD_LENGTH
+    from metrics import record_batch_size, record_cache
+
+MATCH_THRESHOLD = float(os.environ.get("NLP_MATCH_THRESHOLD", "0.75"))
+MATCH_STRING_THRESHOLD = float(os.environ.get("NLP_MATCH_STRING_THRESHOLD", "0.85"))
+MATCH_EMBEDDING_CACHE_SIZE = int(os.environ.get("NLP_MATCH_EMBEDDING_CACHE_SIZE", "20000"))
+
+EMBEDDING = "embedding"
+STRING = "string"
+NONE = "none"
+
+
+class ResolvedSkill(NamedTuple):
+    name: str          # display name
+    canonical: str     # canonical ID, shared by every spelling of the skill
+    weight: float
+
+
+def resolve_skills(skills: Iterable[str], skills_db, fuzzy=None) -> List[ResolvedSkill]:
+    """
+    Resolve free-form skill names to (display name, canonical ID, weight),
+    in input order, one per canonical ID. Names the dictionary does not know
+    keep their own text; `fuzzy` (a FuzzyMatcher) corrects one-word typos.
+    """
+    texts = [skill.strip() for skill in skills if skill and skill.strip()]
+    corrected: Dict[str, Optional[str]] = {}
+    if fuzzy is not None:
+        words = [
+            text.lower() for text in texts
+            if text.isalpha() and len(text) >= MIN_WORD_LENGTH and text.lower() not in fuzzy.lexicon
+            and skills_db.get_canonical_skill(text) is None
+        ]
+        if words:
+            corrected = fuzzy.lookup(words)
+
+    resolved: Dict[str, ResolvedSkill] = {}
+    for text in texts:
+        source = corrected.get(text.lower()) or text
+        canonical = skills_db._get_canonical(source)
+        if not canonical or canonical in resolved:
+            continue
+        name = skills_db.get_canonical_skill(source) or source
+        resolved[canonical] = ResolvedSkill(
+            skills_db.normalize_skill_display(name), canonical, float(skills_db.ontology.get_weight(name))
+        )
+    return list(resolved.values())
+
+
+def from_extraction(matches: Iterable[Tuple[str, str, float]], skills_db) -> List[ResolvedSkill]:
+    """ResolvedSkill for each (skill, canonical, weight) an extraction returned"""
+    resolved: Dict[str, ResolvedSkill] = {}
+    for skill, canonical, weight in matches:
+        if canonical not in resolved:
+            resolved[canonical] = ResolvedSkill(skills_db.normalize_skill_display(skill), canonical, float(weight))
+    return list(resolved.values())
+
+
+class SimilarityScorer:
+    """
+    Pairwise skill-name similarity (0-1) of two name lists as one matrix.
+
+    `model` is a loaded SentenceTransformer, or None for the rapidfuzz
+    string fallback. Embeddings are cached per name (LRU of `cache_size`).
+    """
+
+    def __init__(self, model=None, cache_size: int = MATCH_EMBEDDING_CACHE_SIZE):
+        self.model = model
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def method(self) -> str:
+        if self.model is not None:
+            return EMBEDDING
+        return STRING if process is not None else NONE
+
+    @property
+    def threshold(self) -> float:
+        return MATCH_THRESHOLD if self.model is not None else MATCH_STRING_THRESHOLD
+
+    def _embeddings(self, names: List[str]) -> np.ndarray:
+        """Unit-length embedding of each of `names`, encoding the uncached ones in one batch"""
+        with self._lock:
+            cached = {name: self._cache[name] for name in names if name in self._cache}
+            for name in cached:
+                self._cache.move_to_end(name)
+        new = [name for name in dict.fromkeys(names) if name not in cached]
+        for name in names:
+            record_cache("match_embedding", name in cached)
+        if new:
+            record_batch_size("match_encode", len(new))
+            vectors = self.model.encode(
+                new, convert_to_numpy=True, normalize_embeddings=True, show_progress_bar=False
+            ).astype(np.float32, copy=False)
+            cached.update(zip(new, vectors))
+            if self.cache_size > 0:
+                with self._lock:
+                    for name, vector in zip(new, vectors):
+                        self._cache[name] = vector
+                    while len(self._cache) > self.cache_size:
+                        self._cache.popitem(last=False)
+        return np.stack([cached[name] for name in names])
+
+    def matrix(self, rows: List[str], columns: List[str]) -> np.ndarray:
+        """len(rows) x len(columns) similarity matrix"""
+        if not rows or not columns or self.method == NONE:
+            return np.zeros((len(rows), len(columns)), dtype=np.float32)
+        if self.model is not None:
+            embeddings = self._embeddings(rows + columns)
+            return embeddings[:len(rows)] @ embeddings[len(rows):].T
+        return process.cdist(
+            [row.lower() for row in rows], [column.lower() for column in columns],
+            scorer=Indel.normalized_similarity, dtype=np.float32,
+        )
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+def assign(matrix: np.ndarray, threshold: float) -> List[Tuple[int, int, float]]:
+    """(row, column, score) pairs at or above `threshold`, best first, each row and column used once"""
+    rows, columns = np.nonzero(matrix >= threshold)
+    scores = matrix[rows, columns]
+    pairs = []
+    used_rows, used_columns = set(), set()
+    for index in np.argsort(-scores, kind="stable").tolist():
+        row, column = int(rows[index]), int(columns[index])
+        if row not in used_rows and column not in used_columns:
+            used_rows.add(row)
+            used_columns.add(column)
+            pairs.append((row, column, float(scores[index])))
+    return pairs
+
+
+def _entry(skill: ResolvedSkill) -> Dict[str, Any]:
+    return {"skill": skill.name, "canonical": skill.canonical, "weight": skill.weight}
+
+
+def _by_importance(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return sorted(entries, key=lambda entry: (-entry["weight"], entry["skill"].lower()))
+
+
+def match_skills(jd: List[ResolvedSkill], resume: List[ResolvedSkill], scorer: SimilarityScorer,
+                 threshold: Optional[float] = None) -> Dict[str, Any]:
+    """
+    The /match payload: `matched` (same canonical ID or display name),
+    `semantic` (similar names, with the resume skill and score) and
+    `missing` JD skills, each sorted by weight, and `score`, the share of JD
+    skill weight covered by either kind of match (every skill counts at
+    least 1).
+    """
+    import time
+
+    # Two canonical IDs can share a display name ("postgres", "postgresql": PostgreSQL)
+    resume_by_key: Dict[str, ResolvedSkill] = {}
+    for skill in resume:
+        resume_by_key.setdefault(skill.canonical, skill)
+        resume_by_key.setdefault(skill.name.lower(), skill)
+    used = set()
+    matched, remaining = [], []
+    for skill in jd:
+        found = resume_by_key.get(skill.canonical) or resume_by_key.get(skill.name.lower())
+        if found is None or found.canonical in used:
+            remaining.append(skill)
+        else:
+            used.add(found.canonical)
+            matched.append({**_entry(skill), "resume_skill": found.name})
+    unused = [skill for skill in resume if skill.canonical not in used]
+
+    if threshold is None:
+        threshold = scorer.threshold
+    start = time.perf_counter()
+    scores = scorer.matrix([skill.name for skill in remaining], [skill.name for skill in unused])
+    pairs = assign(scores, threshold)
+    similarity_ms = (time.perf_counter() - start) * 1000
+
+    semantic = [
+        {**_entry(remaining[row]), "resume_skill": unused[column].name, "score": round(score, 3)}
+        for row, column, score in pairs
+    ]
+    paired = {row for row, _, _ in pairs}
+    missing = [_entry(skill) for index, skill in enumerate(remaining) if index not in paired]
+
+    total = sum(max(skill.weight, 1.0) for skill in jd)
+    covered = sum(max(entry["weight"], 1.0) for entry in matched + semantic)
+    return {
+        "matched": _by_importance(matched),
+        "semantic": _by_importance(semantic),
+        "missing": _by_importance(missing),
+        "score": round(covered / total, 3) if total else 0.0,
+        "method": scorer.method,
+        "threshold": threshold,
+        "stats": {
+            "jd_skills": len(jd),
+            "resume_skills": len(resume),
+            "pairs_scored": int(scores.size),
+            "similarity_ms": round(similarity_ms, 3),
+        },
+    }
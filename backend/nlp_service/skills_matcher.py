@@ -15,42 +15,11 @@ import csv
 import re
 import json
 import sys
-from typing import Dict, List, Set, Tuple, Optional
+from typing import Any, Dict, List, Set, Tuple, Optional
 from pathlib import Path
 from collections import defaultdict
 import logging
 
-# CRITICAL FIX: Redirect stderr to stdout at startup to prevent broken pipe errors
-# This must be done BEFORE any imports that might write to stderr
-try:
-    # Redirect stderr to stdout to prevent broken pipe errors
-    # This ensures all output goes to stdout, which is properly handled by Node.js
-    sys.stderr = sys.stdout
-except (BrokenPipeError, OSError, AttributeError):
-    # If redirection fails, create a null device for stderr
-    try:
-        sys.stderr = open(os.devnull, 'w')
-    except:
-        pass  # If all else fails, stderr will use safe_stderr_print
-
-# Helper function to safely write to stderr (handles broken pipe errors)
-def safe_stderr_print(*args, **kwargs):
-    """Safely print to stderr, handling broken pipe errors gracefully"""
-    try:
-        # Since stderr is redirected to stdout, this will write to stdout
-        print(*args, file=sys.stderr, **kwargs)
-    except (BrokenPipeError, OSError):
-        # Broken pipe or other I/O error - stderr pipe was closed
-        # Silently ignore to prevent crashes
-        pass
-
-try:
-    from rapidfuzz import fuzz, process
-except ImportError:
-    fuzz = None
-    process = None
-    logging.warning("rapidfuzz not installed, fuzzy matching will be disabled")
-
 try:
     from sentence_transformers import SentenceTransformer, util
     import torch
@@ -87,23 +56,49 @@ except ImportError as e:
     def get_custom_keywords_normalized_set(keywords, normalize_func):
         return set()
 
-# Safe StreamHandler that handles broken pipe errors
-class SafeStreamHandler(logging.StreamHandler):
-    """Stream handler that safely handles broken pipe errors"""
-    def emit(self, record):
-        try:
-            super().emit(record)
-        except (BrokenPipeError, OSError):
-            # Silently ignore broken pipe errors in logging
-            pass
-
-# Configure root logger with safe handler
-root_logger = logging.getLogger()
-root_logger.setLevel(logging.INFO)
-# Replace any existing handlers with safe handlers
-for handler in root_logger.handlers[:]:
-    root_logger.removeHandler(handler)
-root_logger.addHandler(SafeStreamHandler(sys.stdout))
+try:
+    from .metrics import (
+        Counter, stage_timer, observe_stage, record_cache, record_batch_size, update_stage_cost, record_parsed_tokens,
+    )
+except ImportError:
+    from metrics import (
+        Counter, stage_timer, observe_stage, record_cache, record_batch_size, update_stage_cost, record_parsed_tokens,
+    )
+
+try:
+    from .sections import SECTION_AWARE_PARSING, NARRATIVE, parse_plan
+    from .paragraph_cache import ParagraphResult, split_units, unit_key
+    from .matcher_engines import (
+        MATCHER_ENGINE, PHRASE_MATCHER, VARIANT_LOOKUP, AhoCorasickEngine, PhraseMatcherEngine, VariantLookup,
+        variant_key,
+    )
+    from .fuzzy_matcher import FUZZY_MATCHING, FUZZY_MAX_CANDIDATES, RAPIDFUZZ_AVAILABLE, FuzzyMatcher
+    from .skill_match import SimilarityScorer
+except ImportError:
+    from sections import SECTION_AWARE_PARSING, NARRATIVE, parse_plan
+    from paragraph_cache import ParagraphResult, split_units, unit_key
+    from matcher_engines import (
+        MATCHER_ENGINE, PHRASE_MATCHER, VARIANT_LOOKUP, AhoCorasickEngine, PhraseMatcherEngine, VariantLookup,
+        variant_key,
+    )
+    from fuzzy_matcher import FUZZY_MATCHING, FUZZY_MAX_CANDIDATES, RAPIDFUZZ_AVAILABLE, FuzzyMatcher
+    from skill_match import SimilarityScorer
+
+if not RAPIDFUZZ_AVAILABLE:
+    logging.warning("rapidfuzz not installed, fuzzy matching will be disabled")
+
+FUZZY_CANDIDATES = Counter(
+    "nlp_fuzzy_candidates_total", "Near-miss words seen by the fuzzy stage, by outcome", ["outcome"]
+)
+
+# Logging goes through the shared queue-backed handler (see logging_setup.py).
+# main.py configures it before importing this module; the call below only
+# takes effect when skills_matcher is used standalone (scripts, tests).
+try:
+    from .logging_setup import configure_logging
+except ImportError:
+    from logging_setup import configure_logging
+configure_logging()
 
 # Suppress GPU/CUDA messages from transformers and sentence_transformers
 # This must be done before importing these libraries
@@ -112,15 +107,6 @@ logging.getLogger("sentence_transformers").setLevel(logging.ERROR)
 logging.getLogger("torch").setLevel(logging.ERROR)
 logging.getLogger("transformers.modeling_utils").setLevel(logging.ERROR)
 
-# Ensure logger level is set to INFO to see all messages
-logger.setLevel(logging.INFO)
-if not logger.handlers:
-    handler = SafeStreamHandler(sys.stdout)  # Use stdout instead of stderr for logging
-    handler.setLevel(logging.INFO)
-    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
-
 # ============================================================================
 # Skill Type Enforcement (Problem 1 Fix - MANDATORY)
 # ============================================================================
@@ -618,6 +604,14 @@ CANONICAL_MAP: Dict[str, str] = {
     "data analysis": "data analysis",
 }
 
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]')
+
+# CANONICAL_MAP keyed by SkillsDatabase._normalize form; reversed so that, as in a
+# scan of CANONICAL_MAP, the first key with a given normalized form wins
+CANONICAL_BY_NORMALIZED: Dict[str, str] = {
+    _NON_ALNUM_RE.sub('', key.lower()): canonical for key, canonical in reversed(CANONICAL_MAP.items())
+}
+
 # ============================================================================
 # Skills Database Loader
 # ============================================================================
@@ -740,10 +734,6 @@ class SkillClassifier:
         self.embeddings_metadata_csv = self.embeddings_dir / "embeddings_metadata.csv"
         
         if not SENTENCE_TRANSFORMERS_AVAILABLE:
-            safe_stderr_print("=" * 60)
-            safe_stderr_print("⚠️  [Sentence Transformers] NOT INSTALLED")
-            safe_stderr_print("   Install with: pip install sentence-transformers torch")
-            safe_stderr_print("=" * 60)
             logger.warning("⚠️  Sentence Transformers not available - semantic classification disabled")
             logger.warning("   Install with: pip install sentence-transformers torch")
             self.model = None
@@ -771,13 +761,11 @@ class SkillClassifier:
             # ONLY load from cache - NEVER compute on server
             # Embeddings must be pre-computed on laptop and committed to git
             if self._load_embeddings_from_cache():
-                safe_stderr_print("✅ Loaded pre-computed embeddings from cache", flush=True)
                 logger.info("✅ Loaded pre-computed embeddings from cache - server skipped computation")
                 return
             else:
                 # Cache not found - disable classifier (don't compute on server)
                 error_msg = "❌ Embeddings cache not found - pre-compute on laptop and commit to git"
-                safe_stderr_print(error_msg, flush=True)
                 logger.error(error_msg)
                 logger.error("   Run: cd backend/nlp_service && python3 precompute_embeddings.py")
                 logger.error("   Then commit the .npy files to git")
@@ -791,16 +779,11 @@ class SkillClassifier:
         except Exception as e:
             error_msg = f"❌ Failed to initialize skill classifier: {e}"
             error_type = type(e).__name__
-            safe_stderr_print("=" * 60, flush=True)
-            safe_stderr_print(error_msg, flush=True)
-            safe_stderr_print(f"   Error type: {error_type}", flush=True)
-            safe_stderr_print("=" * 60, flush=True)
             logger.error(error_msg)
             logger.error(f"   Error type: {error_type}")
             import traceback
             traceback_str = traceback.format_exc()
             logger.error(f"   Traceback: {traceback_str}")
-            safe_stderr_print(f"   Traceback: {traceback_str}", flush=True)
             self.model = None
             self.available = False
             self.important_tech_embeddings = None
@@ -962,16 +945,11 @@ class SkillClassifier:
         except Exception as e:
             error_msg = f"❌ Failed to initialize skill classifier: {e}"
             error_type = type(e).__name__
-            safe_stderr_print("=" * 60, flush=True)
-            safe_stderr_print(error_msg, flush=True)
-            safe_stderr_print(f"   Error type: {error_type}", flush=True)
-            safe_stderr_print("=" * 60, flush=True)
             logger.error(error_msg)
             logger.error(f"   Error type: {error_type}")
             import traceback
             traceback_str = traceback.format_exc()
             logger.error(f"   Traceback: {traceback_str}")
-            safe_stderr_print(f"   Traceback: {traceback_str}", flush=True)
             self.model = None
             self.available = False
             # Still try to set embeddings to None explicitly
@@ -1239,6 +1217,7 @@ class SkillClassifier:
                 batch = skills[i:i + batch_size]
                 
                 # Batch encode all skills in this batch at once (MUCH faster)
+                record_batch_size("batch_classify", len(batch))
                 try:
                     skill_embeddings = self.model.encode(batch, convert_to_tensor=True, show_progress_bar=False)
                 except (BrokenPipeError, OSError) as e:
@@ -1288,12 +1267,12 @@ class SkillClassifier:
                 # Progress update
                 if (i + batch_size) % 1000 == 0 or (i + batch_size) >= len(skills):
                     progress_pct = min((i + batch_size) / len(skills) * 100, 100)
-                    logger.info(f"Batch classification progress: {min(i + batch_size, len(skills))}/{len(skills)} ({progress_pct:.1f}%)")
+                    logger.debug("Batch classification progress: %d/%d (%.1f%%)", min(i + batch_size, len(skills)), len(skills), progress_pct)
             
             elapsed_ms = (time.time() - start_time) * 1000
             self.total_time_ms += elapsed_ms
             
-            logger.info(f"✅ Batch classification complete in {elapsed_ms:.0f}ms ({elapsed_ms/len(skills):.2f}ms per skill)")
+            logger.debug("✅ Batch classification complete in %.0fms (%.2fms per skill)", elapsed_ms, elapsed_ms / len(skills))
             
             return technical_skills
             
@@ -1311,6 +1290,7 @@ class SkillClassifier:
         try:
             for i in range(0, len(skills), batch_size):
                 batch = skills[i:i + batch_size]
+                record_batch_size("batch_classify", len(batch))
                 skill_embeddings = self.model.encode(batch, convert_to_tensor=True, show_progress_bar=False)
                 
                 tech_similarities = util.cos_sim(skill_embeddings, self.tech_embeddings)
@@ -1365,7 +1345,14 @@ class SkillsDatabase:
         self.classifier = SkillClassifier()  # Semantic skill classifier
         self.loaded = False
         self.custom_keywords_normalized: Set[str] = set()  # Track normalized custom keywords
-        
+        self.case_variants: Dict[str, str] = {}  # Custom keyword form not added as a pattern -> display form kept
+        self._phrase_matcher = None  # Built once per spaCy vocab (see get_phrase_matcher)
+        self._phrase_matcher_vocab = None
+        self._aho_corasick = None  # Built once (see get_matcher_engine)
+        self._variant_lookup = None  # Built once (see get_variant_lookup)
+        self._fuzzy_matcher = None  # Built once (see get_fuzzy_matcher)
+        self._similarity_scorer = None  # Built once (see get_similarity_scorer)
+
     def load(self) -> None:
         """Load skills from CSV file"""
         if self.loaded:
@@ -1462,20 +1449,11 @@ class SkillsDatabase:
         
         # Also check original CSV for normalized forms (to avoid adding exact duplicates)
         # But we'll still add custom keywords even if they exist in CSV (they might have been filtered out)
-        csv_normalized_set = set()
-        try:
-            with open(self.csv_path, 'r', encoding='utf-8', errors='ignore') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    skill = row.get('Skill', '').strip()
-                    if skill:
-                        skill = skill.replace('"', '').replace('\n', ' ').strip()
-                        if skill and len(skill) > 1:
-                            normalized = self._normalize(skill.lower())
-                            csv_normalized_set.add(normalized)
-        except Exception as e:
-            logger.warning(f"Could not read CSV for duplicate checking: {e}")
-            csv_normalized_set = normalized_skills_set  # Fallback to filtered set
+        csv_normalized_set = {self._normalize(skill.lower()) for skill in all_skills}
+        
+        # Lowercase -> form kept as a pattern: PhraseMatcher matches on LOWER, so forms
+        # differing only in case would be redundant patterns
+        lower_forms = {skill.lower(): skill for skill in skills_set}
         
         # Load custom keywords and merge with CSV skills (bypassing classification filter)
         try:
@@ -1490,22 +1468,32 @@ class SkillsDatabase:
                     for keyword_obj in custom_keywords:
                         base = keyword_obj.get('base', '')
                         variations = keyword_obj.get('variations', [])
+                        if VARIANT_LOOKUP:
+                            # Case and separator variants are matched by VariantLookup:
+                            # one pattern per spelling, the base form first
+                            spellings = {}
+                            for variation in [base] + variations:
+                                spellings.setdefault(variant_key(variation), variation)
+                            variations = list(spellings.values())
                         
                         for variation in variations:
                             normalized = self._normalize(variation.lower())
                             
                             # Check if this exact variation already exists in skills_set (case-insensitive)
                             variation_lower = variation.lower()
-                            skills_lower = [s.lower() for s in skills_set]
+                            kept_form = lower_forms.get(variation_lower)
                             
-                            if variation_lower in skills_lower:
+                            if kept_form is not None:
                                 # Exact variation already exists in skills_set, skip adding but mark as custom
                                 custom_skipped_count += 1
+                                if kept_form != variation:
+                                    self.case_variants[variation] = kept_form
                                 logger.debug(f"Custom keyword '{variation}' already exists in skills_set - will bypass filters during extraction")
                             elif normalized in csv_normalized_set and normalized not in normalized_skills_set:
                                 # Exists in CSV but was filtered out - add it anyway (custom keywords bypass filters)
                                 skills_set.add(variation)
                                 normalized_skills_set.add(normalized)
+                                lower_forms[variation_lower] = variation
                                 custom_added_count += 1
                                 logger.info(f"Added custom keyword '{variation}' (was filtered out from CSV, now added as custom keyword)")
                             elif normalized in normalized_skills_set:
@@ -1513,12 +1501,14 @@ class SkillsDatabase:
                                 # This ensures all variations are available for PhraseMatcher
                                 skills_set.add(variation)
                                 normalized_skills_set.add(normalized)
+                                lower_forms[variation_lower] = variation
                                 custom_added_count += 1
                                 logger.debug(f"Added custom keyword variation '{variation}' (normalized form exists but exact variation doesn't)")
                             else:
                                 # Completely new - add variation to skills_set (bypassing classification filter)
                                 skills_set.add(variation)
                                 normalized_skills_set.add(normalized)
+                                lower_forms[variation_lower] = variation
                                 custom_added_count += 1
                                 logger.debug(f"Added custom keyword variation: '{variation}'")
                     
@@ -1530,10 +1520,9 @@ class SkillsDatabase:
                         self._normalize
                     )
                     
-                    logger.info(f"Custom keywords: {custom_added_count} added, {custom_skipped_count} skipped (duplicates)")
-                    safe_stderr_print(f"✅ [CUSTOM KEYWORDS] Loaded {len(custom_keywords)} keyword definitions", flush=True)
-                    safe_stderr_print(f"   Added {custom_added_count} variations, skipped {custom_skipped_count} duplicates", flush=True)
-                    safe_stderr_print(f"   Custom keywords normalized set: {len(self.custom_keywords_normalized)} entries", flush=True)
+                    logger.info(f"✅ [CUSTOM KEYWORDS] Loaded {len(custom_keywords)} keyword definitions: "
+                                f"{custom_added_count} variations added, {custom_skipped_count} skipped (duplicates), "
+                                f"{len(self.custom_keywords_normalized)} normalized entries")
                 else:
                     self.custom_keywords_normalized = set()
             else:
@@ -1563,9 +1552,120 @@ class SkillsDatabase:
         if self.custom_keywords_normalized:
             logger.info(f"Custom keywords normalized set: {len(self.custom_keywords_normalized)} entries")
     
+    def get_phrase_matcher(self, nlp_model):
+        """
+        Get the PhraseMatcher for all loaded skills, building it on first use.
+
+        Tokenizing ~38k patterns is the most expensive part of a cold request,
+        so the matcher is cached and only rebuilt if a different vocab is used.
+
+        Args:
+            nlp_model: Loaded spaCy model
+
+        Returns:
+            PhraseMatcher with every skill added under the "SKILLS" label
+        """
+        if not self.loaded:
+            self.load()
+
+        if self._phrase_matcher is not None and self._phrase_matcher_vocab is nlp_model.vocab:
+            record_cache("phrase_matcher", hit=True)
+            return self._phrase_matcher
+        record_cache("phrase_matcher", hit=False)
+
+        engine = PhraseMatcherEngine.build(nlp_model, self.skills)
+        self._phrase_matcher = engine.matcher
+        self._phrase_matcher_vocab = nlp_model.vocab
+        logger.info(
+            f"Built PhraseMatcher with {engine.pattern_count} patterns "
+            f"({engine.duplicates} duplicates on LOWER dropped) in {engine.build_seconds * 1000:.0f}ms"
+        )
+        return engine.matcher
+
+    def get_matcher_engine(self, nlp_model, engine: Optional[str] = None):
+        """
+        Get the skill matcher engine (matcher_engines.py), building it on first use.
+
+        Args:
+            nlp_model: Loaded spaCy model
+            engine: "phrasematcher" or "aho_corasick" (default: NLP_MATCHER_ENGINE)
+
+        Returns:
+            Callable doc -> [(match_id, start, end)], like a PhraseMatcher
+        """
+        engine = engine or MATCHER_ENGINE
+        if engine == PHRASE_MATCHER:
+            return PhraseMatcherEngine(self.get_phrase_matcher(nlp_model))
+
+        if not self.loaded:
+            self.load()
+        if self._aho_corasick is not None:
+            record_cache("aho_corasick", hit=True)
+            return self._aho_corasick
+        record_cache("aho_corasick", hit=False)
+        self._aho_corasick = AhoCorasickEngine(self.skills)
+        logger.info(
+            f"Built Aho-Corasick automaton ({self._aho_corasick.implementation}) with "
+            f"{self._aho_corasick.pattern_count} patterns ({self._aho_corasick.duplicates} duplicates dropped) "
+            f"in {self._aho_corasick.build_seconds * 1000:.0f}ms"
+        )
+        return self._aho_corasick
+
+    def get_variant_lookup(self) -> Optional[VariantLookup]:
+        """
+        Get the case/separator-insensitive n-gram lookup over skills_dict, or
+        None when NLP_VARIANT_LOOKUP is off.
+        """
+        if not VARIANT_LOOKUP:
+            return None
+        if not self.loaded:
+            self.load()
+        if self._variant_lookup is None:
+            self._variant_lookup = VariantLookup(self.skills_dict)
+        return self._variant_lookup
+
+    def get_fuzzy_matcher(self) -> Optional[FuzzyMatcher]:
+        """
+        Get the typo lookup over one-word skills and ontology aliases, or None
+        when NLP_FUZZY_MATCHING is off or rapidfuzz is not installed.
+        """
+        if not (FUZZY_MATCHING and RAPIDFUZZ_AVAILABLE):
+            return None
+        if not self.loaded:
+            self.load()
+        if self._fuzzy_matcher is None:
+            import time
+
+            start = time.perf_counter()
+            self.ontology.load()
+            # Aliases resolve to their ontology skill, when that skill is in the dictionary
+            aliases = {}
+            for name, info in self.ontology.ontology.items():
+                skill = self.skills_dict.get(self._normalize(name))
+                if skill is not None:
+                    for alias in info.get('aliases', []):
+                        aliases[alias.lower()] = skill
+            self._fuzzy_matcher = FuzzyMatcher.from_skills(self.skills, aliases, rank=self.ontology.get_weight)
+            logger.info(
+                f"Built fuzzy matcher over {len(self._fuzzy_matcher)} one-word targets "
+                f"in {(time.perf_counter() - start) * 1000:.0f}ms"
+            )
+        return self._fuzzy_matcher
+
+    def get_similarity_scorer(self) -> SimilarityScorer:
+        """
+        Get the skill-name similarity scorer for /match: on the classifier's
+        sentence-transformers model when it is loaded, otherwise rapidfuzz.
+        """
+        if self._similarity_scorer is None:
+            model = self.classifier.model if self.classifier.available else None
+            self._similarity_scorer = SimilarityScorer(model)
+            logger.info(f"Skill similarity scorer: {self._similarity_scorer.method}")
+        return self._similarity_scorer
+
     def _normalize(self, text: str) -> str:
         """Normalize text for matching (remove spaces, special chars)"""
-        return re.sub(r'[^a-z0-9]', '', text.lower())
+        return _NON_ALNUM_RE.sub('', text.lower())
     
     def _get_canonical(self, skill: str) -> str:
         """Get canonical form of a skill"""
@@ -1577,9 +1677,9 @@ class SkillsDatabase:
         
         # Check normalized mapping
         normalized = self._normalize(skill_lower)
-        for key, canonical in CANONICAL_MAP.items():
-            if self._normalize(key) == normalized:
-                return canonical
+        canonical = CANONICAL_BY_NORMALIZED.get(normalized)
+        if canonical is not None:
+            return canonical
         
         # Default: return normalized form
         return normalized
@@ -1862,6 +1962,11 @@ class SkillsDatabase:
         """Get canonical form of a skill, or None if not found"""
         skill_lower = skill.lower().strip()
         canonical = self.canonical_map.get(skill_lower)
+        if canonical is None and VARIANT_LOOKUP:
+            # A spelling found by VariantLookup ("nodejs" for "Node.js")
+            original = self.get_variant_lookup().lookup(skill_lower)
+            if original is not None:
+                canonical = self.canonical_map.get(original.lower())
         if canonical:
             # Return the first skill in the canonical group (prefer original case)
             canonical_skills = self.reverse_canonical.get(canonical, [])
@@ -2162,20 +2267,12 @@ def get_skills_database(csv_path: Optional[str] = None) -> SkillsDatabase:
         logger.info(f"Loading skills database from: {csv_path_str}")
         
         # Check Sentence Transformers availability BEFORE creating database
-        safe_stderr_print("=" * 60, flush=True)
-        safe_stderr_print("🔍 [EMBEDDINGS] Checking Sentence Transformers availability...", flush=True)
         if SENTENCE_TRANSFORMERS_AVAILABLE:
-            safe_stderr_print("✅ [EMBEDDINGS] Sentence Transformers is INSTALLED", flush=True)
             logger.info("✅ [Sentence Transformers] Available - semantic classification will be enabled")
         else:
-            safe_stderr_print("⚠️  [EMBEDDINGS] Sentence Transformers is NOT INSTALLED", flush=True)
-            safe_stderr_print("   To enable: pip install sentence-transformers torch", flush=True)
-            safe_stderr_print("   Continuing without semantic filtering...", flush=True)
             logger.warning("⚠️  [Sentence Transformers] NOT available")
             logger.warning("   To enable: pip install sentence-transformers torch")
             logger.warning("   Continuing without semantic filtering...")
-        safe_stderr_print("=" * 60, flush=True)
-        
         _skills_db = SkillsDatabase(csv_path_str)
         _skills_db.load()
         logger.info(f"Skills database loaded. Classifier available: {_skills_db.classifier.available}")
@@ -2183,6 +2280,13 @@ def get_skills_database(csv_path: Optional[str] = None) -> SkillsDatabase:
     return _skills_db
 
 
+def get_loaded_skills_database() -> Optional[SkillsDatabase]:
+    """Return the skills database if it has finished loading, never triggering a load"""
+    if _skills_db is not None and _skills_db.loaded:
+        return _skills_db
+    return None
+
+
 # ============================================================================
 # PhraseMatcher-based Extraction
 # ============================================================================
@@ -2219,7 +2323,7 @@ def collapse_overlapping_skills(skills: List[Tuple[str, str, float]], skills_db:
             # If kept skill has this as a child, skip this (parent wins)
             if skill_lower in [c.lower() for c in kept_children]:
                 is_subphrase = True
-                logger.debug(f"Removing child skill: '{skill}' (parent '{kept_skill}' already kept)")
+                logger.debug("Removing child skill: '%s' (parent '%s' already kept)", skill, kept_skill)
                 break
             
             # Check if this skill is a parent of kept skill (this should win)
@@ -2229,7 +2333,7 @@ def collapse_overlapping_skills(skills: List[Tuple[str, str, float]], skills_db:
                 kept_skills = [(s, c, w) for s, c, w in kept_skills if s.lower() != kept_lower]
                 normalized_kept.discard(skills_db._normalize(kept_lower))
                 kept_skill_names.discard(kept_lower)
-                logger.debug(f"Replacing child '{kept_skill}' with parent '{skill}'")
+                logger.debug("Replacing child '%s' with parent '%s'", kept_skill, skill)
                 break
         
         # Also check SKILL_HIERARCHY for backwards compatibility
@@ -2240,7 +2344,7 @@ def collapse_overlapping_skills(skills: List[Tuple[str, str, float]], skills_db:
                     for kept_skill, _, _ in kept_skills:
                         if parent in kept_skill.lower():
                             is_subphrase = True
-                            logger.debug(f"Removing subphrase: '{skill}' (covered by '{kept_skill}')")
+                            logger.debug("Removing subphrase: '%s' (covered by '%s')", skill, kept_skill)
                             break
                     if is_subphrase:
                         break
@@ -2288,10 +2392,11 @@ def has_skill_context(span, doc) -> bool:
     is_noun_phrase = any(token.pos_ in ("NOUN", "PROPN") for token in span)
     
     # Check preceding context (look back 5 tokens for skill lists)
+    # Tokens of tokenize-only sections (see parse_by_section) have no lemma: use their text
     start_idx = span.start
     if start_idx > 0:
         prev_tokens = doc[max(0, start_idx - 5):start_idx]
-        prev_text = " ".join([t.lemma_.lower() for t in prev_tokens])
+        prev_text = " ".join([(t.lemma_ or t.text).lower() for t in prev_tokens])
         
         # Check for skill list indicators (e.g., "Must Have Skills:")
         if any(indicator in prev_text for indicator in skill_list_indicators):
@@ -2318,7 +2423,7 @@ def has_skill_context(span, doc) -> bool:
         next_token = doc[start_idx + len(span)]
         tech_followers = {"developer", "programming", "development", "engineer", 
                         "framework", "library", "tool", "platform", "service"}
-        if next_token.lemma_.lower() in tech_followers:
+        if (next_token.lemma_ or next_token.text).lower() in tech_followers:
             return True
     
     # If it's a proper noun or known tech term, accept it
@@ -2330,114 +2435,261 @@ def has_skill_context(span, doc) -> bool:
     return False
 
 
-def extract_skills_with_phrasematcher(
-    text: str,
-    nlp_model,
-    skills_db: SkillsDatabase,
-    use_fuzzy: bool = True,
-    use_context_filter: bool = True
-) -> List[Tuple[str, str, float]]:
+def _prepare_match_text(text: str) -> str:
     """
-    Extract skills from text using spaCy PhraseMatcher.
-    
-    Implements all 3 fixes:
-    1. Filters garbage/non-skill terms
-    2. Collapses overlapping phrases (longest wins)
-    3. Assigns weights to skills
-    
-    Args:
-        text: Input text to extract skills from
-        nlp_model: Loaded spaCy model
-        skills_db: SkillsDatabase instance
-        use_fuzzy: Whether to use fuzzy matching for missed skills
-    
-    Returns:
-        List of tuples: (matched_skill, canonical_form, weight)
+    Replace commas/semicolons with spaces to help PhraseMatcher match across comma boundaries.
+    This helps with comma-separated lists like "Sales, Business Development, CRM".
     """
+    return text.replace(',', ' ').replace(';', ' ')
+
+
+def parse_by_section(nlp_model, text: str) -> list:
+    """
+    Parse `text` with the full pipeline except its narrative sections (sections.py),
+    which are only tokenized.
     
-    try:
-        from spacy.matcher import PhraseMatcher
-    except ImportError:
-        logger.error("spacy.matcher.PhraseMatcher not available")
-        raise ImportError("spaCy PhraseMatcher is required. Make sure spaCy is properly installed.")
+    Returns one Doc per section, in order (a single Doc if nothing is narrative),
+    for PhraseMatcherExtraction.add_docs. doc.user_data["char_offset"] is where
+    the section starts in `text`; tokenize-only docs have user_data["tokenized_only"].
+    Separate docs rather than Doc.from_docs: merging costs more than it saves.
+    """
+    plan = parse_plan(text)
+    if all(section.kind != NARRATIVE for section in plan):
+        return [nlp_model(text)]
+    
+    parsed = nlp_model.pipe(text[s.start:s.end] for s in plan if s.kind != NARRATIVE)
+    docs = []
+    for section in plan:
+        if section.kind == NARRATIVE:
+            doc = nlp_model.make_doc(text[section.start:section.end])
+            doc.user_data["tokenized_only"] = True
+        else:
+            doc = next(parsed)
+        doc.user_data["char_offset"] = section.start
+        docs.append(doc)
+    return docs
+
+
+def split_paragraphs(text: str, max_chars: int = 1500) -> List[str]:
+    """
+    Split text into paragraphs for incremental extraction.
     
-    # Wrap main processing in try-except to handle broken pipe errors
-    try:
+    Splits on blank lines; paragraphs longer than max_chars (pasted text with
+    no blank lines) are packed line by line, then sentence by sentence, into
+    pieces of at most ~max_chars. Empty paragraphs are dropped.
+    """
+    pieces = []
+    for paragraph in re.split(r'\n\s*\n', text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        if len(paragraph) <= max_chars:
+            pieces.append(paragraph)
+            continue
+        units = []
+        for line in paragraph.split('\n'):
+            if len(line) <= max_chars:
+                units.append(line)
+            else:
+                units.extend(re.split(r'(?<=[.!?])\s+', line))
+        current = ''
+        for unit in units:
+            if current and len(current) + len(unit) + 1 > max_chars:
+                pieces.append(current)
+                current = unit
+            else:
+                current = f"{current}\n{unit}" if current else unit
+        if current.strip():
+            pieces.append(current)
+    return pieces
+
+
+class PhraseMatcherExtraction:
+    """
+    Incremental PhraseMatcher extraction over one or more spaCy docs.
+    
+    add_doc() matches a doc and validates the candidates seen for the first
+    time (classification, context and rule-based filters, weights); a
+    candidate's verdict only depends on its first occurrence, so it is final
+    as soon as it is returned. finish() applies the frequency boost over all
+    docs and collapses overlapping skills. With use_fuzzy, near-miss tokens
+    are also looked up as typos of one-word skills (fuzzy_matcher.py) and
+    validated under the skill's text.
+    
+    extract_skills_with_phrasematcher() feeds it the whole text as one doc
+    (or one doc per section, see parse_by_section); the streaming endpoint
+    feeds it one paragraph at a time.
+    """
+
+    def __init__(self, nlp_model, skills_db: SkillsDatabase, use_context_filter: bool = True, deadline=None,
+                 use_fuzzy: bool = True):
         if not skills_db.loaded:
             skills_db.load()
+        self.skills_db = skills_db
+        self.use_context_filter = use_context_filter
+        self.deadline = deadline
+        # Reuse the matcher engine built at warm-up (all skills as patterns, NLP_MATCHER_ENGINE)
+        self.matcher = skills_db.get_matcher_engine(nlp_model)
+        self.variants = skills_db.get_variant_lookup()
+        self.fuzzy = skills_db.get_fuzzy_matcher() if use_fuzzy else None
+        self.fuzzy_limit = FUZZY_MAX_CANDIDATES
+        self.fuzzy_words: Dict[str, Optional[str]] = {}  # Near-miss word -> skill or None, this request
+        self.fuzzy_capped: Set[str] = set()  # Near-miss words beyond FUZZY_MAX_CANDIDATES, not looked up
+        self.fuzzy_seconds = 0.0
         
-        # Create PhraseMatcher
-        matcher = PhraseMatcher(nlp_model.vocab, attr="LOWER")
-        
-        # Add all skills as patterns
-        patterns = [nlp_model.make_doc(skill) for skill in skills_db.skills]
-        matcher.add("SKILLS", patterns)
-        
-        # Process text
-        # Preprocess: Replace commas with spaces to help PhraseMatcher match across comma boundaries
-        # This helps with comma-separated lists like "Sales, Business Development, CRM"
-        preprocessed_text = text.replace(',', ' ').replace(';', ' ')
-        doc = nlp_model(preprocessed_text)
-        
-        # Find matches
-        matches = matcher(doc)
-        
-        # Log if no matches found (for debugging)
-        if len(matches) == 0:
-            logger.warning(f"⚠️  No PhraseMatcher matches found in text (length: {len(text)})")
-            logger.warning(f"   Skills database has {len(skills_db.skills)} skills loaded")
-            if hasattr(skills_db, 'custom_keywords_normalized'):
-                logger.warning(f"   Custom keywords normalized set: {len(skills_db.custom_keywords_normalized)} entries")
-            # Check if any test keywords are in the skills list
-            test_keywords = ['Sales', 'Business Development', 'CRM', 'Salesforce']
-            logger.warning(f"   Checking if test keywords exist in skills list:")
-            for kw in test_keywords:
-                in_list = any(kw.lower() == s.lower() for s in skills_db.skills)
-                logger.warning(f"     {kw}: {'✓' if in_list else '✗'}")
-    
-        # Log total matches found and check for specific skills
-        # Removed verbose debug logging
-        text_lower = text.lower()
-    
-        # Extract matched skills with frequency tracking
         # Track: {skill_lower: {'text': matched_text, 'frequency': count, 'spans': [spans]}}
-        matched_skills_data = {}
-        results = []
-        garbage_count = 0
-        low_priority_count = 0
-        context_filtered = 0
-    
+        self.matched_skills_data = {}
+        # Validated skills in first-occurrence order: {skill_lower: (skill_name, canonical, base_weight)}
+        self.accepted = {}
+        self.match_count = 0
+        self.token_count = 0
+        self.garbage_count = 0
+        self.low_priority_count = 0
+        self.context_filtered = 0
+        self.context_filter_seconds = 0.0  # Summed over all candidates, reported as one stage
+
+    def _match(self, doc) -> List[Tuple[int, int, int]]:
+        """Matcher engine matches plus case/separator variants (VariantLookup)"""
+        matches = self.matcher(doc)
+        if self.variants is not None:
+            matches = self.variants(doc, matches)
+        return matches
+
+    def _fuzzy_enabled(self) -> bool:
+        """Whether the fuzzy stage runs; it is skipped once it no longer fits the deadline"""
+        if self.fuzzy is not None and self.deadline is not None and not self.deadline.allows("fuzzy"):
+            self.fuzzy = None
+            self.deadline.skip("fuzzy")
+        return self.fuzzy is not None
+
+    def _match_spans(self, doc) -> List[Tuple[Any, str]]:
+        """(span, matched text) of every match in `doc`, in order; a typo's text is its skill's"""
+        import time
+
+        with stage_timer("phrase_matcher"):
+            matches = self._match(doc)
+        spans = [(doc[start:end], None) for _, start, end in matches]
+        if self.fuzzy is not None:
+            fuzzy_start = time.perf_counter()
+            candidates = self.fuzzy.candidates(doc, matches)
+            new = [
+                word for word in dict.fromkeys(word for _, word in candidates)
+                if word not in self.fuzzy_words and word not in self.fuzzy_capped
+            ]
+            allowed = max(0, self.fuzzy_limit - len(self.fuzzy_words))
+            if len(new) > allowed:
+                self.fuzzy_capped.update(new[allowed:])
+                FUZZY_CANDIDATES.inc(len(new) - allowed, outcome="capped")
+                new = new[:allowed]
+            if new:
+                found = self.fuzzy.lookup(new)
+                self.fuzzy_words.update(found)
+                matched = sum(skill is not None for skill in found.values())
+                FUZZY_CANDIDATES.inc(matched, outcome="matched")
+                FUZZY_CANDIDATES.inc(len(found) - matched, outcome="unmatched")
+            typos = [(doc[i:i + 1], self.fuzzy_words[word]) for i, word in candidates if self.fuzzy_words.get(word)]
+            if typos:
+                logger.debug("🔤 Fuzzy matches: %s", ", ".join(f"{span.text} -> {skill}" for span, skill in typos))
+                spans = sorted(spans + typos, key=lambda item: (item[0].start, item[0].end))
+            self.fuzzy_seconds += time.perf_counter() - fuzzy_start
+        return [(span, span.text.strip() if skill is None else skill) for span, skill in spans]
+
+    def add_doc(self, doc) -> List[Tuple[str, str, float]]:
+        """Match `doc`; return the newly validated skills as (skill_name, canonical, base_weight)"""
+        return self.add_docs([doc])
+
+    def add_docs(self, docs) -> List[Tuple[str, str, float]]:
+        """
+        Match consecutive pieces of one text (see parse_by_section), then
+        validate their new candidates together, in first-occurrence order.
+        """
+        import time
+
+        skills_db = self.skills_db
+        deadline = self.deadline
+        self._fuzzy_enabled()
+
         # First pass: Count occurrences and collect spans for each skill
-        for match_id, start, end in matches:
-            span = doc[start:end]
-            matched_text = span.text.strip()
-            matched_lower = matched_text.lower()
-        
-            # Removed verbose debug logging
+        new_candidates = []
+        for doc in docs:
+            # Find matches
+            matches = self._match_spans(doc)
+            self.match_count += len(matches)
+            if not doc.user_data.get("tokenized_only"):
+                self.token_count += len(doc)
+            
+            for span, matched_text in matches:
+                matched_lower = matched_text.lower()
+            
+                # Track frequency and store first occurrence text and spans
+                if matched_lower not in self.matched_skills_data:
+                    self.matched_skills_data[matched_lower] = {
+                        'text': matched_text,
+                        'frequency': 0,
+                        'spans': []
+                    }
+                    new_candidates.append(matched_lower)
+                self.matched_skills_data[matched_lower]['frequency'] += 1
+                self.matched_skills_data[matched_lower]['spans'].append(span)
+        
+        candidates = []
+        for matched_lower in new_candidates:
+            skill_data = self.matched_skills_data[matched_lower]
+            # Use the first span for context checking, preferring one with tags (not from a tokenize-only section)
+            span = next((s for s in skill_data['spans'] if s[0].pos), skill_data['spans'][0])
+            candidates.append((matched_lower, skill_data['text'], span, skill_data['frequency']))
+        
+        accepted = []
+        for matched_lower, skill, reason in self.validate(candidates):
+            if skill is None:
+                self.count_rejection(reason)
+            else:
+                self.accepted[matched_lower] = skill
+                accepted.append(skill)
+        return accepted
+
+    def count_rejection(self, reason: str) -> None:
+        """Count a candidate rejected by validate()"""
+        if reason == "low_priority":
+            self.low_priority_count += 1
+        else:
+            self.garbage_count += 1
+            if reason == "context":
+                self.context_filtered += 1
+
+    def validate(self, candidates) -> List[Tuple[Any, Optional[Tuple[str, str, float]], Optional[str]]]:
+        """
+        Validate candidates given as (key, matched_text, span, frequency).
         
-            # Track frequency and store first occurrence text and spans
-            if matched_lower not in matched_skills_data:
-                matched_skills_data[matched_lower] = {
-                    'text': matched_text,
-                    'frequency': 0,
-                    'spans': []
-                }
-            matched_skills_data[matched_lower]['frequency'] += 1
-            matched_skills_data[matched_lower]['spans'].append(span)
+        Batch classification, context and rule-based filters, canonical form and
+        base weight; `span` is the occurrence used for context checking. Returns
+        (key, (skill_name, canonical, base_weight) or None, rejection reason)
+        per candidate, in order. Reasons are "garbage", "context" and
+        "low_priority" (see count_rejection); nothing is counted here.
+        """
+        import time
+
+        skills_db = self.skills_db
+        deadline = self.deadline
     
         # PERFORMANCE FIX: Batch classify all unique skills at once instead of one-by-one
         # This is MUCH faster - processes hundreds of skills at once instead of individually
         technical_skills_set = set()
         technical_skills_lower_set = set()  # Lowercase set for fast case-insensitive lookup
         custom_keywords_set = set()
+        classified_lower_set = set()  # Candidates the classifier actually saw (all, unless capped by a deadline)
         
-        if skills_db.classifier.available and matched_skills_data:
+        if skills_db.classifier.available and candidates:
             # Collect all unique skills that need classification (excluding custom keywords)
             skills_to_classify = []
-            skill_to_data_map = {}  # Map skill text to its data for later lookup
+            skill_frequency = {}  # Map skill text to its frequency (capping order under a deadline)
             
-            for matched_lower, skill_data in matched_skills_data.items():
-                matched_text = skill_data['text']
+            for _, matched_text, _, frequency in candidates:
+                matched_lower = matched_text.lower()
+                if matched_text in skill_frequency:
+                    # Same text in several paragraphs (cached extraction): classify once
+                    skill_frequency[matched_text] += frequency
+                    continue
                 
                 # Check if this is a custom keyword (bypasses classification filter)
                 is_custom = (skills_db.is_custom_keyword(matched_text) or 
@@ -2455,24 +2707,44 @@ def extract_skills_with_phrasematcher(
                 else:
                     # Add to batch classification list
                     skills_to_classify.append(matched_text)
-                    skill_to_data_map[matched_text] = skill_data
+                    skill_frequency[matched_text] = frequency
+            
+            # Under a latency budget, classify only as many candidates as fit (most
+            # frequent first); the rest fall back to the rule-based filters below
+            if skills_to_classify and deadline is not None:
+                kept = deadline.affordable_units("batch_classification_per_skill", len(skills_to_classify))
+                if kept == 0:
+                    deadline.skip("batch_classification")
+                    skills_to_classify = []
+                elif kept < len(skills_to_classify):
+                    deadline.cap("batch_classification", kept, len(skills_to_classify))
+                    skills_to_classify = sorted(
+                        skills_to_classify, key=lambda s: -skill_frequency[s]
+                    )[:kept]
             
             # Batch classify all skills at once (MUCH faster than one-by-one)
             if skills_to_classify:
-                logger.info(f"Batch classifying {len(skills_to_classify)} unique skills...")
-                technical_skills_set = skills_db.classifier.batch_classify_skills(skills_to_classify, threshold=0.10)
+                logger.debug("Batch classifying %d unique skills...", len(skills_to_classify))
+                classify_start = time.perf_counter()
+                with stage_timer("batch_classification"):
+                    technical_skills_set = skills_db.classifier.batch_classify_skills(skills_to_classify, threshold=0.10)
+                update_stage_cost("batch_classification_per_skill", (time.perf_counter() - classify_start) / len(skills_to_classify))
+                classified_lower_set = {s.lower() for s in skills_to_classify}
                 # Create lowercase set for fast case-insensitive lookup
                 technical_skills_lower_set = {s.lower() for s in technical_skills_set}
-                logger.info(f"✅ Batch classification complete: {len(technical_skills_set)} technical, {len(skills_to_classify) - len(technical_skills_set)} non-technical")
+                logger.debug("✅ Batch classification complete: %d technical, %d non-technical", len(technical_skills_set), len(skills_to_classify) - len(technical_skills_set))
             else:
                 technical_skills_lower_set = set()
         
-        # Second pass: Process each unique skill with frequency information
-        for matched_lower, skill_data in matched_skills_data.items():
-            matched_text = skill_data['text']
-            frequency = skill_data['frequency']
-            spans = skill_data['spans']
-            span = spans[0]  # Use first span for context checking
+        if self.use_context_filter and deadline is not None and not deadline.allows("context_filtering"):
+            self.use_context_filter = False
+            deadline.skip("context_filtering")
+        
+        # Second pass: Validate each new unique skill (frequency is applied in finish())
+        results = []
+        text_verdicts = {}
+        for key, matched_text, span, _ in candidates:
+            matched_lower = matched_text.lower()
         
             # PRIMARY FILTER: Semantic classification using Sentence Transformers (embeddings)
             # This is the main filter - uses ML to determine if term is technical
@@ -2491,15 +2763,17 @@ def extract_skills_with_phrasematcher(
                 normalized = skills_db._normalize(matched_lower)
                 is_custom = normalized in skills_db.custom_keywords_normalized
                 if is_custom:
-                    logger.debug(f"✅ Custom keyword detected (via normalized check): '{matched_text}' (normalized: '{normalized}')")
+                    logger.debug("✅ Custom keyword detected (via normalized check): '%s' (normalized: '%s')", matched_text, normalized)
             
             # Log custom keyword detection for debugging
             if is_custom:
-                logger.info(f"🔑 [CUSTOM KEYWORD] '{matched_text}' - bypassing all filters")
-                safe_stderr_print(f"[CUSTOM KEYWORD] ✅ '{matched_text}' detected - bypassing filters", flush=True)
+                logger.debug("🔑 [CUSTOM KEYWORD] '%s' - bypassing all filters", matched_text)
+            
+            # Semantic path only for candidates the classifier saw (a deadline may have capped it)
+            semantic = skills_db.classifier.available and matched_lower in classified_lower_set
             
             # Check if technical using batch classification results
-            if skills_db.classifier.available:
+            if semantic:
                 # Use batch classification results (much faster than individual calls)
                 # Check both original case and lowercase for fast O(1) lookup
                 is_technical = (matched_text in technical_skills_set or 
@@ -2512,7 +2786,7 @@ def extract_skills_with_phrasematcher(
                 else:
                     # Regular skill: apply filter
                     if not is_technical:
-                        garbage_count += 1
+                        results.append((key, None, "garbage"))
                         continue
             else:
                 is_technical = False  # Default when classifier unavailable
@@ -2521,105 +2795,250 @@ def extract_skills_with_phrasematcher(
             # BUT: If semantic classifier says it's technical, be more lenient with context
             # This allows skills in lists like "Must Have Skills: Java, Spring Boot" to pass
             # Custom keywords bypass context filtering
-            if use_context_filter and not is_custom:
-                has_context = has_skill_context(span, doc)
+            if self.use_context_filter and not is_custom:
+                context_start = time.perf_counter()
+                has_context = has_skill_context(span, span.doc)
+                self.context_filter_seconds += time.perf_counter() - context_start
                 # If semantic classifier confirmed it's technical, accept even without perfect context
                 # This handles cases like "Must Have Skills: Java, Spring Boot" where context is minimal
                 if not has_context and not is_technical:
                     # Only filter if BOTH: no context AND classifier says non-technical (or unavailable)
-                    context_filtered += 1
-                    garbage_count += 1
-                    logger.debug(f"Filtering skill without context: {matched_text}")
+                    results.append((key, None, "context"))
+                    logger.debug("Filtering skill without context: %s", matched_text)
                     continue
         
-            # Removed verbose per-match logging
-        
-            # If classifier is NOT available, use rule-based filters
-            # Custom keywords bypass all rule-based filters
-            if not skills_db.classifier.available and not is_custom:
-                # Log when classifier is NOT available (only once)
-                if not hasattr(extract_skills_with_phrasematcher, '_logged_no_classifier'):
-                    safe_stderr_print("=" * 60, flush=True)
-                    safe_stderr_print("⚠️  [EMBEDDINGS] Classifier NOT available - using rule-based filters", flush=True)
-                    safe_stderr_print("   Install: pip install sentence-transformers torch", flush=True)
-                    safe_stderr_print("=" * 60, flush=True)
-                    extract_skills_with_phrasematcher._logged_no_classifier = True
-            
-                # Fallback to rule-based filters only if classifier unavailable and not custom keyword
-                # Step 1: Skill Type Enforcement (HARD GATE) - Check FIRST
-                if not skills_db.is_valid_skill_type(matched_text):
-                    garbage_count += 1
-                    logger.debug(f"❌ Filtering invalid skill type: {matched_text}")
-                    continue
-            
-                # Step 2: Specificity Check (STRICT) - Must pass BOTH
-                if not skills_db.is_specific_enough(matched_text):
-                    garbage_count += 1
-                    logger.debug(f"❌ Filtering non-specific skill: {matched_text}")
-                    continue
-            
-                # Step 3: Additional garbage filtering
-                if skills_db.is_garbage_skill(matched_text):
-                    garbage_count += 1
-                    logger.debug(f"Filtering garbage skill: {matched_text}")
-                    continue
-            
-                # Step 4: Check if low priority (soft skills)
-                if skills_db.is_low_priority(matched_text):
-                    low_priority_count += 1
-                    logger.debug(f"Skipping low priority skill: {matched_text}")
-                    continue
+            # The rest depends only on the text and the classifier outcome: decide once
+            # per text (the same text recurs across paragraphs in cached extraction)
+            verdict_key = (matched_text, semantic, is_technical, is_custom)
+            if verdict_key not in text_verdicts:
+                text_verdicts[verdict_key] = self._text_verdict(matched_text, semantic, is_technical, is_custom)
+            results.append((key, *text_verdicts[verdict_key]))
         
-            # Step 5: Get canonical form (after validation)
-            canonical = skills_db._get_canonical(matched_lower)
-        
-            # ARCHITECTURAL IMPROVEMENT: If skill passed semantic validation but not in database,
-            # still extract it with a default weight (fallback mechanism)
-            if not canonical:
-                # Skill not in database but passed semantic/context filters
-                # Use the matched text as canonical and assign default weight based on semantic similarity
-                canonical = matched_text
-                # Assign default weight: 2 (framework level) if semantic classifier confirmed it's technical
-                # Otherwise use weight 1 (tool level)
-                if skills_db.classifier.available and is_technical:
-                    weight = 2.0  # Default to framework weight for validated technical skills
+        return results
+
+    def _text_verdict(self, matched_text: str, semantic: bool, is_technical: bool,
+                      is_custom: bool) -> Tuple[Optional[Tuple[str, str, float]], Optional[str]]:
+        """validate() after the context check: rule-based filters, canonical form and weight"""
+        skills_db = self.skills_db
+        matched_lower = matched_text.lower()
+        
+        # If classifier is NOT available (or skipped for this candidate), use rule-based filters
+        # Custom keywords bypass all rule-based filters
+        if not semantic and not is_custom:
+            # Log when classifier is NOT available (only once)
+            if not skills_db.classifier.available and not hasattr(extract_skills_with_phrasematcher, '_logged_no_classifier'):
+                logger.warning("⚠️  [EMBEDDINGS] Classifier NOT available - using rule-based filters (pip install sentence-transformers torch)")
+                extract_skills_with_phrasematcher._logged_no_classifier = True
+        
+            # Fallback to rule-based filters only if classifier unavailable and not custom keyword
+            # Step 1: Skill Type Enforcement (HARD GATE) - Check FIRST
+            if not skills_db.is_valid_skill_type(matched_text):
+                logger.debug("❌ Filtering invalid skill type: %s", matched_text)
+                return None, "garbage"
+        
+            # Step 2: Specificity Check (STRICT) - Must pass BOTH
+            if not skills_db.is_specific_enough(matched_text):
+                logger.debug("❌ Filtering non-specific skill: %s", matched_text)
+                return None, "garbage"
+        
+            # Step 3: Additional garbage filtering
+            if skills_db.is_garbage_skill(matched_text):
+                logger.debug("Filtering garbage skill: %s", matched_text)
+                return None, "garbage"
+        
+            # Step 4: Check if low priority (soft skills)
+            if skills_db.is_low_priority(matched_text):
+                logger.debug("Skipping low priority skill: %s", matched_text)
+                return None, "low_priority"
+    
+        # Step 5: Get canonical form (after validation)
+        canonical = skills_db._get_canonical(matched_lower)
+    
+        # ARCHITECTURAL IMPROVEMENT: If skill passed semantic validation but not in database,
+        # still extract it with a default weight (fallback mechanism)
+        if not canonical:
+            # Skill not in database but passed semantic/context filters
+            # Use the matched text as canonical and assign default weight based on semantic similarity
+            canonical = matched_text
+            # Assign default weight: 2 (framework level) if semantic classifier confirmed it's technical
+            # Otherwise use weight 1 (tool level)
+            if semantic and is_technical:
+                weight = 2.0  # Default to framework weight for validated technical skills
+            else:
+                weight = 1.0  # Default to tool weight
+            logger.debug("⚠️  Skill '%s' not in database but validated as technical - using default weight %s", matched_text, weight)
+        else:
+            # Step 6: Assign weight (ONLY for validated skills)
+            weight = skills_db.ontology.get_weight(matched_text)
+        
+            # Step 7: Final weight check (should not be 0 after validation, but double-check)
+            if weight == 0:
+                # If weight is 0 but skill passed semantic validation, assign default weight
+                if semantic and is_technical:
+                    weight = 1.0  # Default weight for validated technical skills
+                    logger.debug("⚠️  Skill '%s' has zero weight but is technical - using default weight %s", matched_text, weight)
                 else:
-                    weight = 1.0  # Default to tool weight
-                safe_stderr_print(f"[EMBEDDINGS] ⚠️  Skill '{matched_text}' not in database but validated as technical - using default weight {weight}", flush=True)
+                    logger.debug("Filtering zero-weight skill after validation: %s", matched_text)
+                    return None, "garbage"
+    
+        # Log that classifier is not available (only once per extraction) - if we're using fallback
+        if not skills_db.classifier.available:
+            if not hasattr(extract_skills_with_phrasematcher, '_logged_classifier_unavailable'):
+                logger.warning("=" * 60)
+                logger.warning("⚠️  [Sentence Transformers] Classifier NOT available")
+                logger.warning("   Install with: pip install sentence-transformers torch")
+                logger.warning("   Using rule-based filters (less accurate)...")
+                logger.warning("=" * 60)
+                extract_skills_with_phrasematcher._logged_classifier_unavailable = True
+    
+        # Get best canonical skill name
+        canonical_skill = skills_db.get_canonical_skill(matched_text)
+        skill_name = canonical_skill if canonical_skill else matched_text
+        
+        return (skill_name, canonical, weight), None
+
+    def add_text_cached(self, nlp_model, text: str, cache) -> List[int]:
+        """
+        Add `text` unit by unit (paragraph_cache.split_units), reusing cached
+        unit results and parsing/validating only the units `cache` misses.
+        
+        Returns the start offsets in `text` of every match of a validated skill
+        (what accepted_offsets() returns for docs added with add_docs).
+        """
+        units = split_units(text)
+        
+        # Parse depth per unit: tokenize only if it lies entirely in narrative sections
+        tokenize_only = [False] * len(units)
+        if SECTION_AWARE_PARSING:
+            narrative = [(s.start, s.end) for s in parse_plan(text) if s.kind == NARRATIVE]
+            for index, (start, end) in enumerate(units):
+                tokenize_only[index] = any(n_start <= start and end <= n_end for n_start, n_end in narrative)
+        
+        fuzzy = self._fuzzy_enabled()
+        keys = [
+            unit_key(text[start:end], tokenize_only[index], self.use_context_filter, fuzzy)
+            for index, (start, end) in enumerate(units)
+        ]
+        results = [cache.get(key) for key in keys]
+        missing = [index for index, result in enumerate(results) if result is None]
+        if missing:
+            for index, result in zip(missing, self._extract_units(nlp_model, text, units, missing, tokenize_only)):
+                results[index] = result
+                self.token_count += result.token_count  # Parsed for this request
+            # Verdicts from a budget-degraded run (capped/skipped stages), or with near-miss
+            # words left unmatched by the per-request cap, are not reused
+            if (self.deadline is None or not (self.deadline.skipped or self.deadline.capped)) and not self.fuzzy_capped:
+                for index in missing:
+                    cache.put(keys[index], results[index])
+        
+        # Aggregate: frequencies add up; each candidate keeps the verdict of its first
+        # tagged occurrence (else its first occurrence), as add_docs does for one text
+        chosen = {}
+        offsets = {}
+        for (unit_start, _), result in zip(units, results):
+            self.match_count += result.match_count
+            for matched_lower, matched_text, frequency, tagged, skill, reason, unit_offsets in result.candidates:
+                skill_data = self.matched_skills_data.get(matched_lower)
+                if skill_data is None:
+                    skill_data = self.matched_skills_data[matched_lower] = {
+                        'text': matched_text,
+                        'frequency': 0,
+                        'spans': []
+                    }
+                    chosen[matched_lower] = (tagged, skill, reason)
+                    offsets[matched_lower] = []
+                elif tagged and not chosen[matched_lower][0]:
+                    chosen[matched_lower] = (tagged, skill, reason)
+                skill_data['frequency'] += frequency
+                offsets[matched_lower].extend(unit_start + offset for offset in unit_offsets)
+        
+        for matched_lower, (_, skill, reason) in chosen.items():
+            if skill is None:
+                self.count_rejection(reason)
             else:
-                # Step 6: Assign weight (ONLY for validated skills)
-                weight = skills_db.ontology.get_weight(matched_text)
-            
-                # Step 7: Final weight check (should not be 0 after validation, but double-check)
-                if weight == 0:
-                    # If weight is 0 but skill passed semantic validation, assign default weight
-                    if skills_db.classifier.available and is_technical:
-                        weight = 1.0  # Default weight for validated technical skills
-                        safe_stderr_print(f"[EMBEDDINGS] ⚠️  Skill '{matched_text}' has zero weight but is technical - using default weight {weight}", flush=True)
-                    else:
-                        garbage_count += 1
-                        logger.debug(f"Filtering zero-weight skill after validation: {matched_text}")
-                        continue
+                self.accepted[matched_lower] = skill
+        return [offset for matched_lower in self.accepted for offset in offsets[matched_lower]]
+
+    def _extract_units(self, nlp_model, text: str, units, indices, tokenize_only) -> List[ParagraphResult]:
+        """Parse, match and validate units[i] for i in `indices` (one classification batch)"""
+        import time
+
+        parse_start = time.perf_counter()
+        parsed = nlp_model.pipe(text[units[i][0]:units[i][1]] for i in indices if not tokenize_only[i])
+        docs = [
+            nlp_model.make_doc(text[units[i][0]:units[i][1]]) if tokenize_only[i] else next(parsed)
+            for i in indices
+        ]
+        observe_stage("spacy_parse", time.perf_counter() - parse_start)
+        
+        # Per unit: {matched_lower: [matched_text, frequency, spans]} in first-occurrence order
+        unit_matches = []
+        match_counts = []
+        for doc in docs:
+            found = {}
+            matches = self._match_spans(doc)
+            for span, matched_text in matches:
+                entry = found.setdefault(matched_text.lower(), [matched_text, 0, []])
+                entry[1] += 1
+                entry[2].append(span)
+            unit_matches.append(found)
+            match_counts.append(len(matches))
+        
+        candidates = []
+        for position, found in enumerate(unit_matches):
+            for matched_lower, (matched_text, frequency, spans) in found.items():
+                span = next((s for s in spans if s[0].pos), spans[0])
+                candidates.append(((position, matched_lower), matched_text, span, frequency))
+        verdicts = {key: (skill, reason) for key, skill, reason in self.validate(candidates)}
         
-            # Log that classifier is not available (only once per extraction) - if we're using fallback
-            if not skills_db.classifier.available:
-                if not hasattr(extract_skills_with_phrasematcher, '_logged_classifier_unavailable'):
-                    safe_stderr_print("=" * 60)
-                    safe_stderr_print("⚠️  [Sentence Transformers] Classifier NOT available")
-                    safe_stderr_print("   Install with: pip install sentence-transformers torch")
-                    safe_stderr_print("   Using rule-based filters (less accurate)...")
-                    safe_stderr_print("=" * 60)
-                    logger.warning("=" * 60)
-                    logger.warning("⚠️  [Sentence Transformers] Classifier NOT available")
-                    logger.warning("   Install with: pip install sentence-transformers torch")
-                    logger.warning("   Using rule-based filters (less accurate)...")
-                    logger.warning("=" * 60)
-                    extract_skills_with_phrasematcher._logged_classifier_unavailable = True
-        
-            # Get best canonical skill name
-            canonical_skill = skills_db.get_canonical_skill(matched_text)
-            skill_name = canonical_skill if canonical_skill else matched_text
+        results = []
+        for position, (doc, found) in enumerate(zip(docs, unit_matches)):
+            unit_candidates = []
+            for matched_lower, (matched_text, frequency, spans) in found.items():
+                skill, reason = verdicts[(position, matched_lower)]
+                unit_candidates.append((
+                    matched_lower, matched_text, frequency, any(s[0].pos for s in spans),
+                    skill, reason, tuple(s.start_char for s in spans),
+                ))
+            token_count = 0 if tokenize_only[indices[position]] else len(doc)
+            results.append(ParagraphResult(unit_candidates, match_counts[position], token_count))
+        return results
+
+    def accepted_offsets(self) -> List[int]:
+        """Start character of every match of a validated skill (all docs added so far)"""
+        return [
+            span.start_char + span.doc.user_data.get("char_offset", 0)
+            for matched_lower in self.accepted
+            for span in self.matched_skills_data[matched_lower]['spans']
+        ]
+
+    def iter_paragraphs(self, nlp_model, paragraphs: List[str], batch_size: int = 4):
+        """
+        Parse `paragraphs` with nlp_model.pipe and add each doc as it comes out.
         
+        Yields (paragraph_index, newly validated skills) per paragraph.
+        """
+        import time
+
+        docs = nlp_model.pipe((_prepare_match_text(p) for p in paragraphs), batch_size=batch_size)
+        index = 0
+        while True:
+            parse_start = time.perf_counter()
+            doc = next(docs, None)
+            if doc is None:
+                break
+            observe_stage("spacy_parse", time.perf_counter() - parse_start)
+            yield index, self.add_doc(doc)
+            index += 1
+
+    def finish(self) -> List[Tuple[str, str, float]]:
+        """Frequency-boosted, collapsed results over every doc added so far"""
+        skills_db = self.skills_db
+        record_parsed_tokens(self.token_count)
+        results = []
+        for matched_lower, (skill_name, canonical, weight) in self.accepted.items():
+            frequency = self.matched_skills_data[matched_lower]['frequency']
+            
             # Boost weight based on frequency (repeated keywords get higher priority)
             # Frequency boost: +0.5 per additional occurrence (capped at +2.0)
             frequency_boost = min((frequency - 1) * 0.5, 2.0)
@@ -2627,74 +3046,122 @@ def extract_skills_with_phrasematcher(
             
             # Log frequency if > 1
             if frequency > 1:
-                safe_stderr_print(f"[EMBEDDINGS] 📈 '{matched_text}' appears {frequency}x - boosting weight from {weight} to {boosted_weight:.1f}", flush=True)
-                logger.info(f"Skill '{matched_text}' appears {frequency} times - weight boosted from {weight} to {boosted_weight:.1f}")
+                logger.debug("📈 '%s' appears %dx - weight boosted from %s to %.1f", skill_name, frequency, weight, boosted_weight)
         
             # Store with boosted weight
             results.append((skill_name, canonical, boosted_weight))
     
+        if self.use_context_filter:
+            observe_stage("context_filtering", self.context_filter_seconds)
+        if self.fuzzy is not None:
+            observe_stage("fuzzy", self.fuzzy_seconds)
+        if self.fuzzy_capped:
+            logger.debug("Fuzzy stage capped: %d near-miss words not looked up", len(self.fuzzy_capped))
+    
         # Problem 2 Fix: Collapse overlapping skills
-        results = collapse_overlapping_skills(results, skills_db)
-    
-        # Log validation statistics
-        logger.info(f"Extracted {len(results)} validated skills")
-        logger.info(f"  - Filtered: {garbage_count} invalid/non-skills")
-        logger.info(f"  - Low priority: {low_priority_count} soft skills")
-        logger.info(f"  - Validated skills: {len(results)} (all passed type + specificity checks)")
-    
-        # Log Sentence Transformers usage if available
-        if skills_db.classifier.available:
-            stats = skills_db.classifier.get_stats()
-            if stats['classifications'] > 0:
-                safe_stderr_print("=" * 60)
-                safe_stderr_print("🤖 [Sentence Transformers] Extraction Classification Stats")
-                safe_stderr_print("=" * 60)
-                safe_stderr_print(f"   Total classifications: {stats['classifications']}")
-                safe_stderr_print(f"   ✅ Kept (technical): {stats['kept']}")
-                safe_stderr_print(f"   🚫 Filtered (non-technical): {stats['filtered']}")
-                safe_stderr_print(f"   Filter rate: {stats['filter_rate']:.1f}%")
-                safe_stderr_print(f"   Total time: {stats['total_time_ms']:.0f}ms")
-                safe_stderr_print(f"   Avg time per skill: {stats['avg_time_ms']:.2f}ms")
-                safe_stderr_print("=" * 60)
-                logger.info("=" * 60)
-                logger.info("🤖 [Sentence Transformers] Extraction Classification Stats")
-                logger.info("=" * 60)
-                logger.info(f"   Total classifications: {stats['classifications']}")
-                logger.info(f"   ✅ Kept (technical): {stats['kept']}")
-                logger.info(f"   🚫 Filtered (non-technical): {stats['filtered']}")
-                logger.info(f"   Filter rate: {stats['filter_rate']:.1f}%")
-                logger.info(f"   Total time: {stats['total_time_ms']:.0f}ms")
-                logger.info(f"   Avg time per skill: {stats['avg_time_ms']:.2f}ms")
-                logger.info("=" * 60)
-        else:
-            safe_stderr_print("⚠️  [Sentence Transformers] Not available - install: pip install sentence-transformers torch")
-            logger.warning("⚠️  [Sentence Transformers] Not available during extraction - install: pip install sentence-transformers torch")
+        with stage_timer("collapse"):
+            results = collapse_overlapping_skills(results, skills_db)
     
-        # Problem 4 Fix: Semantic fallback for unmatched high-weight skills
-        # Only run on unmatched skills with weight >= 2 (frameworks/languages)
-        if use_fuzzy:
-            try:
-                from sentence_transformers import SentenceTransformer
-                import numpy as np
-            
-                # Load model (cached after first load)
-                if not hasattr(extract_skills_with_phrasematcher, '_semantic_model'):
-                    logger.info("Loading semantic model for skill matching...")
-                    extract_skills_with_phrasematcher._semantic_model = SentenceTransformer('all-MiniLM-L6-v2')
-            
-                semantic_model = extract_skills_with_phrasematcher._semantic_model
-            
-                # Get unmatched high-weight skills from JD (for future use)
-                # This would be used to match against resume skills
-                # For now, we just log that semantic matching is available
-                logger.debug("Semantic matching model loaded and ready")
-            
-            except ImportError:
-                logger.debug("sentence-transformers not installed, semantic matching disabled")
-            except Exception as e:
-                logger.warning(f"Semantic matching unavailable: {e}")
+        # Log validation statistics (per-request: DEBUG only, see main.should_log_request for sampled summaries)
+        logger.debug(
+            "Extracted %d validated skills (filtered=%d, low_priority=%d, context_filtered=%d)",
+            len(results), self.garbage_count, self.low_priority_count, self.context_filtered
+        )
+    
+        # Cumulative Sentence Transformers stats are exported via /metrics (nlp_classifier_stat)
+        if skills_db.classifier.available and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🤖 [Sentence Transformers] Classification stats: %s", skills_db.classifier.get_stats())
     
         return results
+
+
+def extract_skills_with_phrasematcher(
+    text: str,
+    nlp_model,
+    skills_db: SkillsDatabase,
+    use_fuzzy: bool = True,
+    use_context_filter: bool = True,
+    deadline=None,
+    boilerplate=None,
+    paragraph_cache=None
+) -> List[Tuple[str, str, float]]:
+    """
+    Extract skills from text using spaCy PhraseMatcher.
+    
+    Implements all 3 fixes:
+    1. Filters garbage/non-skill terms
+    2. Collapses overlapping phrases (longest wins)
+    3. Assigns weights to skills
+    
+    Args:
+        text: Input text to extract skills from
+        nlp_model: Loaded spaCy model
+        skills_db: SkillsDatabase instance
+        use_fuzzy: Whether to look up near-miss tokens as typos of skills (fuzzy_matcher.py)
+        use_context_filter: Whether to require skill-relevant context around matches
+        deadline: Optional deadline.Deadline; optional stages that no longer fit in
+            the remaining budget are capped or skipped (and recorded on it)
+        boilerplate: Optional boilerplate.BoilerplateStore; known boilerplate
+            paragraphs are removed before parsing and the rest are recorded
+        paragraph_cache: Optional paragraph_cache.ParagraphCache; only paragraphs
+            without a cached result are parsed and validated
+    
+    Returns:
+        List of tuples: (matched_skill, canonical_form, weight)
+    """
+    
+    try:
+        from spacy.matcher import PhraseMatcher
+    except ImportError:
+        logger.error("spacy.matcher.PhraseMatcher not available")
+        raise ImportError("spaCy PhraseMatcher is required. Make sure spaCy is properly installed.")
+    
+    # Wrap main processing in try-except to handle broken pipe errors
+    try:
+        extraction = PhraseMatcherExtraction(
+            nlp_model, skills_db, use_context_filter=use_context_filter, deadline=deadline, use_fuzzy=use_fuzzy
+        )
+
+        # Drop paragraphs already seen in other postings without any skill (EEO, benefits, ...)
+        boilerplate_check = boilerplate.check(text) if boilerplate is not None and boilerplate.enabled else None
+        if boilerplate_check is not None:
+            text = boilerplate_check.text
+
+        skill_offsets = None
+        if paragraph_cache is not None and paragraph_cache.enabled:
+            # Unchanged paragraphs (same text as an earlier request) reuse their matches and verdicts
+            skill_offsets = extraction.add_text_cached(nlp_model, _prepare_match_text(text), paragraph_cache)
+        else:
+            # Process text (narrative sections such as "About us" or "Benefits" are only tokenized)
+            with stage_timer("spacy_parse"):
+                if SECTION_AWARE_PARSING:
+                    docs = parse_by_section(nlp_model, _prepare_match_text(text))
+                else:
+                    docs = [nlp_model(_prepare_match_text(text))]
+            
+            extraction.add_docs(docs)
+        # _prepare_match_text keeps offsets, so match offsets index into boilerplate_check.text.
+        # A budget-degraded run (capped/skipped stages, capped near-miss words) may have missed
+        # skills, so it would wrongly mark their paragraphs skill-free: learn only from full runs
+        degraded = (deadline is not None and (deadline.skipped or deadline.capped)) or extraction.fuzzy_capped
+        if boilerplate_check is not None and not degraded:
+            boilerplate.learn(
+                boilerplate_check, extraction.accepted_offsets() if skill_offsets is None else skill_offsets
+            )
+        
+        # Log if no matches found (for debugging)
+        # Gated: the keyword check below scans the whole skills list
+        if extraction.match_count == 0 and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("⚠️  No PhraseMatcher matches found in text (length: %d, skills loaded: %d)", len(text), len(skills_db.skills))
+            if hasattr(skills_db, 'custom_keywords_normalized'):
+                logger.debug("   Custom keywords normalized set: %d entries", len(skills_db.custom_keywords_normalized))
+            # Check if any test keywords are in the skills list
+            test_keywords = ['Sales', 'Business Development', 'CRM', 'Salesforce']
+            for kw in test_keywords:
+                in_list = any(kw.lower() == s.lower() for s in skills_db.skills)
+                logger.debug("     %s: %s", kw, '✓' if in_list else '✗')
+        
+        return extraction.finish()
     except (BrokenPipeError, OSError) as e:
         # Handle broken pipe errors during processing
         is_broken_pipe = (
@@ -2716,62 +3183,31 @@ def extract_skills_with_phrasematcher(
 def semantic_skill_match(
     jd_skill: str,
     resume_skills: List[str],
-    threshold: float = 0.75
+    threshold: Optional[float] = None
 ) -> Optional[Tuple[str, float]]:
     """
-    Problem 4 Fix: Semantic fallback for unmatched skills.
+    Semantic fallback for one unmatched skill: the most similar resume skill.
     
-    Matches "continuous integration" with "ci/cd" using embeddings.
-    Only for high-weight skills (weight >= 2).
+    Matches "continuous integration" with "ci/cd" using the skills database's
+    similarity scorer (get_similarity_scorer; embeddings are cached, so
+    repeated resume skills are not re-encoded). /match scores all unmatched
+    JD skills at once with skill_match.match_skills.
     
     Args:
         jd_skill: Skill from job description
         resume_skills: List of skills from resume
-        threshold: Minimum cosine similarity (0.75 = 75% similar)
+        threshold: Minimum similarity (default: the scorer's, 0.75 cosine)
     
     Returns:
         Tuple of (matched_resume_skill, similarity_score) or None
     """
-    try:
-        from sentence_transformers import SentenceTransformer
-        import numpy as np
-        
-        # Load model
-        if not hasattr(semantic_skill_match, '_model'):
-            semantic_skill_match._model = SentenceTransformer('all-MiniLM-L6-v2')
-        
-        model = semantic_skill_match._model
-        
-        # Generate embeddings - wrap in try-except to handle broken pipe
-        try:
-            jd_embedding = model.encode([jd_skill])
-            resume_embeddings = model.encode(resume_skills)
-        except (BrokenPipeError, OSError) as e:
-            # Handle broken pipe during encoding
-            if isinstance(e, OSError) and e.errno != 32:
-                raise  # Re-raise if not broken pipe
-            # For broken pipe, return empty results
-            return []
-        
-        # Calculate cosine similarities manually (no sklearn dependency)
-        # cosine_similarity = dot(a, b) / (norm(a) * norm(b))
-        jd_norm = np.linalg.norm(jd_embedding)
-        resume_norms = np.linalg.norm(resume_embeddings, axis=1)
-        similarities = np.dot(jd_embedding, resume_embeddings.T)[0] / (jd_norm * resume_norms)
-        
-        # Find best match
-        best_idx = np.argmax(similarities)
-        best_score = similarities[best_idx]
-        
-        if best_score >= threshold:
-            return (resume_skills[best_idx], float(best_score))
-        
-        return None
-        
-    except ImportError:
-        logger.debug("sentence-transformers not available for semantic matching")
-        return None
-    except Exception as e:
-        logger.warning(f"Semantic matching error: {e}")
+    import numpy as np
+    
+    if not resume_skills:
         return None
-
+    scorer = get_skills_database().get_similarity_scorer()
+    scores = scorer.matrix([jd_skill], list(resume_skills))[0]
+    best_idx = int(np.argmax(scores))
+    if scores[best_idx] >= (scorer.threshold if threshold is None else threshold):
+        return (resume_skills[best_idx], float(scores[best_idx]))
+    return None
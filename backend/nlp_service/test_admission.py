@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test admission control for /extract-skills (in-flight limit, bounded queue, shedding)
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fastapi import HTTPException
+
+from admission import AdmissionController, ADMISSION_SHED
+
+
+async def _hold(controller, started, release):
+    async with controller.admit():
+        started.set()
+        await release.wait()
+
+
+def test_queue_full_is_shed_with_429():
+    async def scenario():
+        controller = AdmissionController(max_in_flight=1, max_queue=1, max_wait_s=5)
+        release = asyncio.Event()
+        running = asyncio.Event()
+        holder = asyncio.create_task(_hold(controller, running, release))
+        await running.wait()
+        waiter = asyncio.create_task(_hold(controller, asyncio.Event(), release))
+        await asyncio.sleep(0)
+        assert controller.queued == 1
+
+        shed_before = ADMISSION_SHED.get(reason="queue_full")
+        try:
+            async with controller.admit():
+                raise AssertionError("should have been shed")
+        except HTTPException as e:
+            assert e.status_code == 429
+            assert int(e.headers["Retry-After"]) >= 1
+        assert ADMISSION_SHED.get(reason="queue_full") - shed_before == 1
+
+        release.set()
+        await asyncio.gather(holder, waiter)
+        assert controller.in_flight == 0 and controller.queued == 0
+
+    asyncio.run(scenario())
+
+
+def test_queue_timeout_is_shed_with_503():
+    async def scenario():
+        controller = AdmissionController(max_in_flight=1, max_queue=4, max_wait_s=0.05)
+        release = asyncio.Event()
+        running = asyncio.Event()
+        holder = asyncio.create_task(_hold(controller, running, release))
+        await running.wait()
+
+        try:
+            async with controller.admit():
+                raise AssertionError("should have timed out")
+        except HTTPException as e:
+            assert e.status_code == 503
+            assert "Retry-After" in e.headers
+        assert controller.queued == 0
+
+        release.set()
+        await holder
+        # Slot is free again
+        async with controller.admit():
+            assert controller.in_flight == 1
+
+    asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    test_queue_full_is_shed_with_429()
+    test_queue_timeout_is_shed_with_503()
+    print("✅ admission tests passed")
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Test the boilerplate paragraph store
+"""
+
+import sys
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from boilerplate import BoilerplateStore
+from deadline import Deadline
+
+EEO = "We are an equal opportunity employer and value diversity. All qualified applicants receive consideration."
+STACK = "Our stack: Python services on AWS, deployed with Kubernetes and Terraform by every team here."
+
+
+def _posting(core: str) -> str:
+    return f"{core}\n\n{EEO}\n\n{STACK}"
+
+
+def _learn(store: BoilerplateStore, text: str) -> None:
+    check = store.check(text)
+    # The only accepted skill match is "Python" in the stack paragraph
+    store.learn(check, [check.text.find("Python")])
+
+
+def test_learns_skill_free_paragraphs_across_documents():
+    store = BoilerplateStore(capacity=100, min_documents=2, min_chars=20)
+
+    # The same posting requested again is still one document
+    _learn(store, _posting("Backend engineer for the payments team."))
+    _learn(store, _posting("Backend engineer for the payments team."))
+    assert store.check(_posting("Data engineer")).skipped == 0
+
+    _learn(store, _posting("Data engineer for the analytics team."))
+    check = store.check(_posting("Data engineer"))
+    assert check.skipped == 1
+    assert check.text == f"Data engineer\n\n{STACK}"
+    # The stack paragraph contributed a skill, so it is kept and still tracked
+    assert [check.text[start:end] for _, start, end in check.paragraphs] == [STACK]
+    state = store.get_state()
+    assert state["boilerplate_paragraphs"] == 1
+    assert state["hits"] == 1
+
+
+def test_capacity_is_bounded():
+    store = BoilerplateStore(capacity=3, min_documents=1, min_chars=1)
+    for i in range(10):
+        store.learn(store.check(f"Paragraph number {i}"), [])
+    assert store.get_state()["entries"] == 3
+    assert store.check("Paragraph number 9").skipped == 1
+    assert store.check("Paragraph number 0").skipped == 0
+    assert not BoilerplateStore(capacity=0).enabled
+
+
+def test_degraded_runs_are_not_learned():
+    import spacy
+
+    from skills_matcher import extract_skills_with_phrasematcher, get_skills_database
+
+    nlp = spacy.blank("en")
+    skills_db = get_skills_database()
+    store = BoilerplateStore(capacity=100, min_documents=1, min_chars=20)
+    text = f"Senior Python developer.\n\n{EEO}"
+
+    # A stage skipped or capped for the budget may have missed skills: nothing is learned
+    degraded = [Deadline(60000), Deadline(60000)]
+    degraded[0].skip("fuzzy")
+    degraded[1].cap("batch_classification", kept=1, total=2)
+    for deadline in degraded:
+        extract_skills_with_phrasematcher(text, nlp, skills_db, deadline=deadline, boilerplate=store)
+        assert store.get_state()["entries"] == 0
+
+    extract_skills_with_phrasematcher(text, nlp, skills_db, deadline=Deadline(60000), boilerplate=store)
+    assert store.check(f"Go developer.\n\n{EEO}").skipped == 1
+
+
+if __name__ == "__main__":
+    test_learns_skill_free_paragraphs_across_documents()
+    test_capacity_is_bounded()
+    test_degraded_runs_are_not_learned()
+    print("✅ boilerplate store tests passed")
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test single-flight coalescing of identical in-flight requests
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from coalescing import SingleFlight, COALESCED_REQUESTS, text_key
+
+
+def test_identical_requests_share_one_computation():
+    async def scenario():
+        flight = SingleFlight("/test")
+        calls = []
+        release = asyncio.Event()
+
+        async def compute(tag):
+            calls.append(tag)
+            await release.wait()
+            return {"tag": tag}
+
+        key = text_key("Python and Docker", True, True, None)
+        other = text_key("Python and Docker", False, True, None)
+        coalesced_before = COALESCED_REQUESTS.get(endpoint="/test")
+
+        waiters = [asyncio.create_task(flight.do(key, lambda i=i: compute(i))) for i in range(5)]
+        waiters.append(asyncio.create_task(flight.do(other, lambda: compute("other"))))
+        await asyncio.sleep(0)
+        assert flight.in_flight() == 2
+
+        release.set()
+        results = await asyncio.gather(*waiters)
+        assert calls == [0, "other"]
+        assert all(result is results[0] for result in results[:5])
+        assert results[5] == {"tag": "other"}
+        assert COALESCED_REQUESTS.get(endpoint="/test") - coalesced_before == 4
+        assert flight.in_flight() == 0
+
+    asyncio.run(scenario())
+
+
+def test_errors_are_shared_and_not_remembered():
+    async def scenario():
+        flight = SingleFlight("/test")
+        release = asyncio.Event()
+
+        async def failing():
+            await release.wait()
+            raise ValueError("boom")
+
+        key = text_key("text")
+        waiters = [asyncio.create_task(flight.do(key, failing)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+        assert all(isinstance(result, ValueError) for result in results)
+
+        # The next request starts a fresh computation
+        async def ok():
+            return "ok"
+        assert await flight.do(key, ok) == "ok"
+
+    asyncio.run(scenario())
+
+
+if __name__ == "__main__":
+    test_identical_requests_share_one_computation()
+    test_errors_are_shared_and_not_remembered()
+    print("✅ coalescing tests passed")
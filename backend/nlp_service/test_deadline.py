@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Test per-request latency budgets (header/field parsing, stage affordability)
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from deadline import Deadline, DEGRADED_STAGES
+from metrics import update_stage_cost
+
+
+def test_from_request_takes_tighter_budget():
+    assert Deadline.from_request(None, None) is None
+    assert Deadline.from_request("not-a-number", None) is None
+    assert Deadline.from_request("0", None) is None
+    assert Deadline.from_request("250", None).budget_ms == 250
+    assert Deadline.from_request(None, 400).budget_ms == 400
+    assert Deadline.from_request("250", 400).budget_ms == 250
+    assert Deadline.from_request("900", 400).budget_ms == 400
+
+
+def test_stage_affordability_uses_recent_cost():
+    # Unknown stages are always allowed
+    deadline = Deadline(50)
+    assert deadline.allows("test_unseen_stage")
+    assert deadline.affordable_units("test_unseen_stage", 7) == 7
+
+    update_stage_cost("test_per_item", 0.010)
+    assert deadline.allows("test_per_item", 1)
+    assert not deadline.allows("test_per_item", 100)
+    assert 0 < deadline.affordable_units("test_per_item", 100) < 10
+
+    expired = Deadline(1, start=time.perf_counter() - 1)
+    assert expired.affordable_units("test_per_item", 100) == 0
+
+    skipped_before = DEGRADED_STAGES.get(stage="test_stage", action="skipped")
+    expired.skip("test_stage")
+    expired.cap("test_capped", kept=3, total=10)
+    stats = expired.to_stats()
+    assert stats["degraded"] is True
+    assert stats["skipped_stages"] == ["test_stage"]
+    assert stats["capped_stages"] == {"test_capped": {"kept": 3, "total": 10}}
+    assert DEGRADED_STAGES.get(stage="test_stage", action="skipped") - skipped_before == 1
+
+
+if __name__ == "__main__":
+    test_from_request_takes_tighter_budget()
+    test_stage_affordability_uses_recent_cost()
+    print("✅ deadline tests passed")
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Test the typo lookup of near-miss tokens (fuzzy_matcher.py)
+"""
+
+import sys
+from pathlib import Path
+
+import spacy
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fuzzy_matcher import FuzzyMatcher
+
+SKILLS = ["Kubernetes", "Python", "Pyston", "Django", "Entourage", "Machine Learning", "Jenkins"]
+RANK = {"Python": 3}
+
+
+def build():
+    return FuzzyMatcher.from_skills(SKILLS, {"postgres": "PostgreSQL"}, rank=lambda skill: RANK.get(skill, 0))
+
+
+def test_lookup():
+    fuzzy = build()
+    found = fuzzy.lookup(["kubernets", "postgress", "pyhton", "djnago", "kubernetes", "kbrnetes", "jenkisn"])
+    assert found["kubernets"] == "Kubernetes" and found["postgress"] == "PostgreSQL"
+    # One edit from Python and Pyston: the higher-ranked target wins
+    assert found["pyhton"] == "Python" and found["djnago"] == "Django"
+    # An exact spelling resolves to itself; two edits, or another last letter, are too far
+    assert found["kubernetes"] == "Kubernetes" and found["kbrnetes"] is None and found["jenkisn"] is None
+
+
+def test_candidates():
+    fuzzy = build()
+    nlp = spacy.blank("en")
+    doc = nlp.make_doc("We encourage machine learning with Kubernets, Djnago and Pyhton.")
+    # Short words, stop words, words of dictionary skills ("machine") and matched tokens
+    # ("Djnago" here) are never candidates
+    candidates = fuzzy.candidates(doc, [(0, 7, 8)])
+    assert candidates == [(1, "encourage"), (5, "kubernets"), (9, "pyhton")]
+    # "encourage" is one edit from Entourage; once a skill uses the word, it is not a candidate
+    assert fuzzy.lookup(["encourage"])["encourage"] == "Entourage"
+    fuzzy = FuzzyMatcher.from_skills(SKILLS + ["Encourage Innovation"])
+    assert [word for _, word in fuzzy.candidates(doc, [])] == ["kubernets", "djnago", "pyhton"]
+
+
+if __name__ == "__main__":
+    test_lookup()
+    test_candidates()
+    print("✅ fuzzy matcher tests passed")
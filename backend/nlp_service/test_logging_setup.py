@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test the queue-backed log handler drop-on-overflow policy and the
+/diagnostics log buffer
+"""
+
+import io
+import logging
+import queue
+import sys
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from logging_setup import BufferHandler, DroppingQueueHandler, PipeStreamHandler, LOG_BUFFER, LOG_RECORDS_DROPPED, get_buffered_logs
+
+
+class ClosedPipe(io.StringIO):
+    def write(self, s):
+        raise BrokenPipeError(32, "Broken pipe")
+
+
+def _record(msg):
+    return logging.LogRecord("test", logging.INFO, __file__, 1, msg, None, None)
+
+
+def test_queue_handler_drops_when_full():
+    dropped_before = LOG_RECORDS_DROPPED.get(reason="queue_full")
+    log_queue = queue.Queue(maxsize=2)
+    handler = DroppingQueueHandler(log_queue)
+
+    for i in range(5):
+        handler.handle(_record("message %d" % i))
+
+    assert log_queue.qsize() == 2
+    assert LOG_RECORDS_DROPPED.get(reason="queue_full") - dropped_before == 3
+    # Records are queued unformatted
+    assert log_queue.get_nowait().getMessage() == "message 0"
+
+
+def test_stream_handler_stops_after_broken_pipe():
+    dropped_before = LOG_RECORDS_DROPPED.get(reason="pipe_closed")
+    handler = PipeStreamHandler(ClosedPipe())
+
+    handler.handle(_record("first"))
+    handler.handle(_record("second"))
+
+    assert handler.closed_pipe
+    assert LOG_RECORDS_DROPPED.get(reason="pipe_closed") - dropped_before == 2
+
+
+def test_buffer_keeps_formatted_entries():
+    handler = BufferHandler()
+    try:
+        raise ValueError("bad input")
+    except ValueError:
+        record = logging.LogRecord("test", logging.ERROR, __file__, 1, "failed on %r", ("Python, Docker",), sys.exc_info())
+    handler.handle(record)
+
+    # Formatted on the listener thread: no record, args or traceback kept alive
+    entry = LOG_BUFFER[-1]
+    assert isinstance(entry, dict) and entry["level"] == "ERROR" and entry["logger"] == "test"
+    assert "failed on 'Python, Docker'" in entry["message"] and "ValueError: bad input" in entry["message"]
+    assert get_buffered_logs(1) == [entry]
+    assert get_buffered_logs(0) == []
+
+
+if __name__ == "__main__":
+    test_queue_handler_drops_when_full()
+    test_stream_handler_stops_after_broken_pipe()
+    test_buffer_keeps_formatted_entries()
+    print("✅ logging_setup tests passed")
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Test that the Aho-Corasick matcher engine agrees with PhraseMatcher, and the
+case/separator variant lookup
+"""
+
+import re
+import sys
+from pathlib import Path
+
+import spacy
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from matcher_engines import AhoCorasickEngine, PhraseMatcherEngine, VariantLookup, is_variant
+
+SKILLS = ["Python", "Node.js", "machine learning", "Machine  Learning", "C++", "Go", "SQL", "PostgreSQL"]
+TEXT = (
+    "We use Python, node.js and Go at Google. Machine learning with C++ is a plus; "
+    "PostgreSQL or MySQL (SQL) experience, no Golang or pythonic trivia."
+)
+
+
+def test_matches_phrasematcher():
+    nlp = spacy.blank("en")
+    doc = nlp.make_doc(TEXT)
+    expected = PhraseMatcherEngine.build(nlp, SKILLS)(doc)
+    engine = AhoCorasickEngine(SKILLS, native=False)
+    assert engine.pattern_count == len(SKILLS) - 1
+    assert engine(doc) == expected
+    found = [doc[start:end].text for _, start, end in engine(doc)]
+    # "go" inside "Google"/"Golang" and "sql" inside "MySQL"/"PostgreSQL" are not tokens
+    assert found == ["Python", "node.js", "Go", "Machine learning", "C++", "PostgreSQL", "SQL"]
+    assert engine(nlp.make_doc("")) == []
+
+
+def test_phrasematcher_dedupe():
+    nlp = spacy.blank("en")
+    doc = nlp.make_doc(TEXT)
+    engine = PhraseMatcherEngine.build(nlp, SKILLS + ["python", "POSTGRESQL"])
+    assert (engine.pattern_count, engine.duplicates) == (len(SKILLS), 2)
+    assert engine(doc) == PhraseMatcherEngine.build(nlp, SKILLS, dedupe=False)(doc)
+
+
+def test_find_on_word_boundaries():
+    engine = AhoCorasickEngine(SKILLS, native=False)
+    found = [text for _, _, text in engine.find(TEXT)]
+    assert found == ["Python", "node.js", "Go", "Machine learning", "C++", "PostgreSQL", "SQL"]
+    start, end, text = engine.find("Senior Go developer")[0]
+    assert (start, end, text) == (7, 9, "Go")
+
+
+def test_variant_lookup():
+    assert is_variant("R-A-G", "RAG") and is_variant("machine_learning", "Machine Learning")
+    assert not is_variant("or a", "ORA") and not is_variant("C#", "C")
+    # skills_dict as SkillsDatabase builds it: letters and digits only -> skill
+    skills = ["Node.js", "RAG", "Machine Learning", "C", "ORA", "End-to-End"]
+    lookup = VariantLookup({re.sub(r"[^a-z0-9]", "", skill.lower()): skill for skill in skills})
+    nlp = spacy.blank("en")
+    doc = nlp.make_doc("Nodejs, R-A-G and machine-learning end to end in C#, or a plus")
+    matches = lookup(doc, [])
+    assert [doc[start:end].text for _, start, end in matches] == ["Nodejs", "R-A-G", "machine-learning", "end to end", "C"]
+    # Matches the engine already found are kept once
+    assert lookup(doc, matches[:1]) == matches
+    assert lookup.lookup("NODE JS") == "Node.js" and lookup.lookup("no dejs") is None
+
+
+if __name__ == "__main__":
+    test_matches_phrasematcher()
+    test_phrasematcher_dedupe()
+    test_find_on_word_boundaries()
+    test_variant_lookup()
+    print("✅ matcher engine tests passed")
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Test the Prometheus-style metrics (metrics.py): histogram buckets, label
+escaping and the per-stage cost average
+"""
+
+import sys
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import metrics
+from metrics import Counter, Histogram, expected_stage_seconds, update_stage_cost
+
+
+def _unregistered(metric):
+    """Keep test metrics out of the service's /metrics output"""
+    metrics.REGISTRY.remove(metric)
+    return metric
+
+
+def _samples(metric):
+    """{sample name with labels: value} from the rendered text"""
+    lines = [line for line in metric.render() if not line.startswith("#")]
+    return dict(line.rsplit(" ", 1) for line in lines)
+
+
+def test_histogram_buckets_are_cumulative():
+    histogram = _unregistered(Histogram("test_latency_seconds", "Test", ["stage"], buckets=(0.1, 1.0, 0.5)))
+    assert histogram.buckets == (0.1, 0.5, 1.0, float("inf"))
+    for value in (0.05, 0.1, 0.3, 0.7, 2.0, 30.0):
+        histogram.observe(value, stage="parse")
+
+    samples = _samples(histogram)
+    # A bound counts every observation at or below it, +Inf counts them all
+    assert samples['test_latency_seconds_bucket{stage="parse",le="0.1"}'] == "2"
+    assert samples['test_latency_seconds_bucket{stage="parse",le="0.5"}'] == "3"
+    assert samples['test_latency_seconds_bucket{stage="parse",le="1"}'] == "4"
+    assert samples['test_latency_seconds_bucket{stage="parse",le="+Inf"}'] == "6"
+    assert samples['test_latency_seconds_count{stage="parse"}'] == "6"
+    assert float(samples['test_latency_seconds_sum{stage="parse"}']) == 33.15
+    assert histogram.snapshot(stage="parse") == (6, 33.15)
+    assert histogram.snapshot(stage="never") == (0, 0.0)
+
+    buckets = [int(value) for name, value in samples.items() if "_bucket" in name]
+    assert buckets == sorted(buckets)
+
+
+def test_label_escaping():
+    counter = _unregistered(Counter("test_requests_total", "Test", ["endpoint", "error"]))
+    counter.inc(endpoint='/say "hi"', error="C:\\path\nline two")
+    counter.inc(2, endpoint="/plain", error="")
+
+    lines = counter.render()
+    assert lines[:2] == ["# HELP test_requests_total Test", "# TYPE test_requests_total counter"]
+    samples = _samples(counter)
+    assert samples['test_requests_total{endpoint="/say \\"hi\\"",error="C:\\\\path\\nline two"}'] == "1"
+    assert samples['test_requests_total{endpoint="/plain",error=""}'] == "2"
+    # Escaped values never split a sample across lines
+    assert all("\n" not in line for line in lines)
+
+
+def test_stage_cost_ewma():
+    stage = "test_stage"
+    assert expected_stage_seconds(stage) is None
+    try:
+        # The first observation seeds the average, later ones move it by alpha
+        update_stage_cost(stage, 1.0)
+        assert expected_stage_seconds(stage) == 1.0
+        update_stage_cost(stage, 2.0)
+        assert abs(expected_stage_seconds(stage) - (1.0 + metrics.STAGE_COST_ALPHA * 1.0)) < 1e-12
+        for _ in range(100):
+            update_stage_cost(stage, 0.5)
+        assert abs(expected_stage_seconds(stage) - 0.5) < 1e-6
+    finally:
+        metrics._stage_costs.pop(stage, None)
+
+
+if __name__ == "__main__":
+    test_histogram_buckets_are_cumulative()
+    test_label_escaping()
+    test_stage_cost_ewma()
+    print("✅ metrics tests passed")
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Test MinHash signatures and the near-duplicate result index
+"""
+
+import sys
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from near_duplicates import REFRESH, REUSE, NearDuplicateIndex, minhash_signature, similarity
+
+POSTING = "\n".join([
+    "Senior Backend Engineer",
+    "We build payment software for banks across Europe and North America.",
+    "Requirements",
+    "Five years of Python and Django in production",
+    "Experience running PostgreSQL and Redis at scale",
+    "Comfortable with Kubernetes, Terraform and GitHub Actions",
+    "Benefits",
+    "Remote work, a learning budget and thirty days of paid leave",
+])
+REORDERED = "\n".join(POSTING.split("\n")[:3] + POSTING.split("\n")[3:6][::-1] + POSTING.split("\n")[6:])
+FOOTER = "\nApply on JobBoard Pro"
+PAYLOAD = {"skills": ["Python", "Django"], "stats": {"total_matches": 2}}
+
+
+def test_signature():
+    signature = minhash_signature(POSTING)
+    assert similarity(signature, minhash_signature(POSTING.upper())) == 1.0
+    # Shingles stay within a line: reordered bullets keep the same set
+    assert similarity(signature, minhash_signature(REORDERED)) == 1.0
+    assert 0.8 < similarity(signature, minhash_signature(POSTING + FOOTER)) < 1.0
+    assert similarity(signature, minhash_signature("Data analyst with SQL and Tableau\nSales targets")) < 0.1
+    assert minhash_signature(" \n - ") is None
+
+
+def test_index_reuse():
+    index = NearDuplicateIndex(capacity=2, threshold=0.8, mode=REUSE)
+    check = index.lookup(POSTING, True, False)
+    assert check.payload is None
+    index.store(check, PAYLOAD)
+
+    near = index.lookup(POSTING + FOOTER, True, False)
+    assert near.payload["skills"] == ["Python", "Django"]
+    assert 0.8 <= near.payload["stats"]["near_duplicate_similarity"] < 1.0
+    assert "near_duplicate_similarity" not in PAYLOAD["stats"]
+    assert index.lookup(POSTING, True, False).payload["stats"]["near_duplicate_similarity"] == 1.0
+    # Other request options never share a result
+    assert index.lookup(POSTING, False, False).payload is None
+
+    # Degraded results are not stored; the LRU keeps `capacity` postings
+    other = index.lookup("Data analyst with SQL and Tableau", True, False)
+    index.store(other, {"skills": [], "stats": {"degraded": True}})
+    assert index.get_state()["entries"] == 1
+    for text in ("Data analyst with SQL and Tableau", "Account executive selling to retail banks"):
+        index.store(index.lookup(text, True, False), PAYLOAD)
+    assert index.get_state()["entries"] == 2
+    assert index.lookup(POSTING + FOOTER, True, False).payload is None
+
+    state = index.get_state()
+    assert state["hits"] == 2 and state["near_hits"] == 1
+
+
+def test_index_refresh():
+    index = NearDuplicateIndex(threshold=0.8)
+    assert index.mode == REFRESH
+    index.store(index.lookup(POSTING), PAYLOAD)
+    assert index.lookup(REORDERED).payload is not None
+    # A changed line is extracted again
+    assert index.lookup(POSTING + FOOTER).payload is None
+    # An edited JD (one added requirement) never gets the old result back
+    edited = POSTING + "\nMust have strong experience with Kubernetes and Terraform"
+    assert similarity(minhash_signature(POSTING), minhash_signature(edited)) >= 0.8
+    assert index.lookup(edited).payload is None
+    assert index.get_state()["refreshed"] == 2
+
+
+if __name__ == "__main__":
+    test_signature()
+    test_index_reuse()
+    test_index_refresh()
+    print("✅ near-duplicate tests passed")
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Test paragraph unit splitting and the paragraph result cache
+"""
+
+import sys
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from paragraph_cache import UNIT_MAX_CHARS, ParagraphCache, ParagraphResult, split_units, unit_key
+
+BODY = "We run Python services on Kubernetes and Postgres, deployed with Terraform and GitHub Actions."
+
+
+def test_split_units():
+    text = f"Requirements\n\n{BODY}\n\n\n{BODY}\nShort line"
+    units = split_units(text)
+    # The heading stays with the paragraph after it; blank lines belong to no unit
+    assert [text[start:end] for start, end in units] == [f"Requirements\n\n{BODY}", f"{BODY}\nShort line"]
+    assert split_units("") == []
+    assert split_units("Python") == [(0, 6)]
+
+    # Paragraphs without blank lines are cut at line breaks
+    long_text = "\n".join([BODY] * 60)
+    units = split_units(long_text)
+    assert len(units) > 1 and all(end - start <= UNIT_MAX_CHARS for start, end in units)
+    assert "\n".join(long_text[start:end] for start, end in units) == long_text
+
+
+def test_cache_lru():
+    cache = ParagraphCache(capacity=2)
+    first, second, third = (unit_key(f"{BODY} {n}", False, True) for n in range(3))
+    assert unit_key(BODY, False, True) != unit_key(BODY, True, True)
+    assert cache.get(first) is None
+
+    cache.put(first, ParagraphResult([], 0, 10))
+    cache.put(second, ParagraphResult([], 0, 20))
+    assert cache.get(first).token_count == 10  # Most recently used now
+    cache.put(third, ParagraphResult([], 0, 30))
+    assert cache.get(second) is None and cache.get(third).token_count == 30
+
+    state = cache.get_state()
+    assert state["entries"] == 2 and state["hits"] == 2 and state["misses"] == 2
+    assert state["hit_rate"] == 0.5
+    assert not ParagraphCache(capacity=0).enabled
+
+
+if __name__ == "__main__":
+    test_split_units()
+    test_cache_lru()
+    print("✅ paragraph cache tests passed")
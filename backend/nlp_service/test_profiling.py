@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Test the profiling triggers (header, sampling) and /admin/profiles auth
+"""
+
+import sys
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import profiling
+
+
+@contextmanager
+def _config(token=None, sample_rate=0.0, draw=None):
+    """Temporarily set NLP_ADMIN_TOKEN, the sample rate and (optionally) random.random()"""
+    saved = profiling.ADMIN_TOKEN, profiling.PROFILE_SAMPLE_RATE, profiling.random.random
+    profiling.ADMIN_TOKEN, profiling.PROFILE_SAMPLE_RATE = token, sample_rate
+    if draw is not None:
+        profiling.random.random = lambda: draw
+    try:
+        yield
+    finally:
+        profiling.ADMIN_TOKEN, profiling.PROFILE_SAMPLE_RATE, profiling.random.random = saved
+
+
+def test_header_trigger():
+    with _config(token="s3cret"):
+        assert profiling.profiling_reason({"x-profile": "s3cret"}) == "header"
+        assert profiling.profiling_reason({"x-profile": "wrong"}) is None
+        assert profiling.profiling_reason({"x-profile": "sécret"}) is None
+        assert profiling.profiling_reason({}) is None
+
+    # No token configured: the header never triggers, whatever it carries
+    with _config(token=None):
+        assert profiling.profiling_reason({"x-profile": ""}) is None
+        assert profiling.profiling_reason({"x-profile": "None"}) is None
+
+
+def test_sample_rate():
+    with _config(sample_rate=0.25, draw=0.1):
+        assert profiling.profiling_reason({}) == "sampled"
+    with _config(sample_rate=0.25, draw=0.5):
+        assert profiling.profiling_reason({}) is None
+    with _config(sample_rate=0.0, draw=0.0):
+        assert profiling.profiling_reason({}) is None
+    # The header wins over sampling
+    with _config(token="s3cret", sample_rate=1.0, draw=0.0):
+        assert profiling.profiling_reason({"x-profile": "s3cret"}) == "header"
+
+
+def test_admin_auth():
+    with _config(token=None):
+        assert not profiling.is_admin_enabled()
+        assert not profiling.is_admin_authorized({})
+        assert not profiling.is_admin_authorized({"x-admin-token": ""})
+    with _config(token="s3cret"):
+        assert profiling.is_admin_enabled()
+        assert profiling.is_admin_authorized({"x-admin-token": "s3cret"})
+        assert not profiling.is_admin_authorized({"x-admin-token": "s3cre"})
+        assert not profiling.is_admin_authorized({})
+
+
+def test_admin_profiles_endpoint():
+    from fastapi.testclient import TestClient
+
+    import main
+
+    client = TestClient(main.app)
+    with _config(token=None):
+        assert client.get("/admin/profiles").status_code == 404
+    with _config(token="s3cret"):
+        assert client.get("/admin/profiles").status_code == 403
+        assert client.get("/admin/profiles", headers={"X-Admin-Token": "nope"}).status_code == 403
+        response = client.get("/admin/profiles", headers={"X-Admin-Token": "s3cret"})
+        assert response.status_code == 200 and response.json()["config"]["header_enabled"] is True
+
+
+def test_concurrent_profiles():
+    started, release = threading.Event(), threading.Event()
+    results = {}
+
+    def slow(value):
+        started.set()
+        release.wait(5)
+        return value
+
+    profiles_before = len(profiling.PROFILES)
+    skipped_before = profiling.PROFILES_SKIPPED.get(reason="sampled")
+    first = threading.Thread(target=lambda: results.update(first=profiling.run_profiled(slow, "header", "first", 1)))
+    first.start()
+    assert started.wait(5)
+    try:
+        # The overlapping request runs unprofiled instead of failing
+        results["second"] = profiling.run_profiled(lambda value: value, "sampled", "second", 2)
+    finally:
+        release.set()
+        first.join(5)
+
+    assert results == {"first": 1, "second": 2}
+    assert profiling.PROFILES_SKIPPED.get(reason="sampled") - skipped_before == 1
+    assert len(profiling.PROFILES) - profiles_before == 1 and profiling.PROFILES[-1]["label"] == "first"
+    # The lock is released: the next request is profiled again
+    assert profiling.run_profiled(lambda: 3, "sampled", "third") == 3
+    assert profiling.PROFILES[-1]["label"] == "third"
+
+
+if __name__ == "__main__":
+    test_header_trigger()
+    test_sample_rate()
+    test_admin_auth()
+    test_admin_profiles_endpoint()
+    test_concurrent_profiles()
+    print("✅ profiling tests passed")
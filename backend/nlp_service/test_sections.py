@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test job-description section detection and section-aware parsing
+"""
+
+import sys
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import spacy
+
+from sections import GENERAL, NARRATIVE, REQUIREMENTS, detect_sections, heading_kind, parse_plan
+from skills_matcher import parse_by_section
+
+JD = (
+    "Senior Backend Engineer\n\n"
+    "About us\nWe build payment software for banks.\n\n"
+    "The team\nSix engineers running Kafka and Postgres.\n\n"
+    "Requirements\nPython and Django.\nMust have: Kubernetes\n\n"
+    "Benefits\nRemote work and a learning budget.\n"
+)
+
+
+def test_heading_kind():
+    assert heading_kind("Must Have Skills:") == REQUIREMENTS
+    assert heading_kind("Nice to have") == REQUIREMENTS
+    assert heading_kind("Compensation and benefits") == NARRATIVE
+    assert heading_kind("Equal Opportunity Statement") == NARRATIVE
+    assert heading_kind("We offer great benefits to everyone who joins.") is None
+    assert heading_kind("Location") is None
+
+
+def test_detect_sections():
+    sections = detect_sections(JD)
+    assert [(s.kind, s.heading) for s in sections] == [
+        (GENERAL, ""), (NARRATIVE, "About us"), (GENERAL, "The team"),
+        (REQUIREMENTS, "Requirements"), (REQUIREMENTS, "Must have"), (NARRATIVE, "Benefits"),
+    ]
+    # Contiguous and covering the whole text
+    assert sections[0].start == 0 and sections[-1].end == len(JD)
+    assert all(a.end == b.start for a, b in zip(sections, sections[1:]))
+    assert JD[sections[4].start:].startswith("Must have: Kubernetes")
+
+    # Same parse depth merged
+    assert [s.kind for s in parse_plan(JD)] == [GENERAL, NARRATIVE, GENERAL, NARRATIVE]
+    assert detect_sections("") == [(GENERAL, "", 0, 0)]
+
+
+def test_parse_by_section():
+    nlp = spacy.blank("en")
+    docs = parse_by_section(nlp, JD)
+    assert "".join(doc.text for doc in docs) == JD
+    assert [bool(doc.user_data.get("tokenized_only")) for doc in docs] == [False, True, False, True]
+    for doc in docs:
+        assert JD[doc.user_data["char_offset"]:].startswith(doc.text)
+    assert len(parse_by_section(nlp, "Python, Go and SQL")) == 1
+
+
+if __name__ == "__main__":
+    test_heading_kind()
+    test_detect_sections()
+    test_parse_by_section()
+    print("✅ section tests passed")
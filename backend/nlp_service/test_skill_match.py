@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test resume-to-JD skill matching for /match (skill_match.py)
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from skill_match import SimilarityScorer, assign, match_skills, resolve_skills
+from skills_matcher import get_skills_database
+
+
+class CountingEncoder:
+    """Bag-of-letters embeddings; records the batches it is asked to encode"""
+
+    def __init__(self):
+        self.batches = []
+
+    def encode(self, names, convert_to_numpy=True, normalize_embeddings=True, show_progress_bar=False):
+        self.batches.append(list(names))
+        vectors = np.zeros((len(names), 26), dtype=np.float32)
+        for row, name in enumerate(names):
+            for char in name.lower():
+                if char.isalpha():
+                    vectors[row, ord(char) - ord("a")] += 1
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def test_assign():
+    matrix = np.array([[0.9, 0.95], [0.8, 0.7], [0.1, 0.2]], dtype=np.float32)
+    # Best pair first; each row and column is used at most once
+    pairs = assign(matrix, 0.75)
+    assert [(row, column) for row, column, _ in pairs] == [(0, 1), (1, 0)] and round(pairs[0][2], 2) == 0.95
+    assert assign(matrix, 0.99) == []
+
+
+def test_scorer():
+    scorer = SimilarityScorer()
+    assert scorer.method == "string"
+    scores = scorer.matrix(["Kafka Streams", "React"], ["kafka stream", "React Native", "Go"])
+    assert scores.shape == (2, 3) and scores[0, 0] > 0.9 and scores[1, 1] < 0.85
+    assert scorer.matrix([], ["Go"]).shape == (0, 1)
+
+    # With a model: one encode call per matrix, and only for names not seen before
+    encoder = CountingEncoder()
+    scorer = SimilarityScorer(encoder)
+    assert scorer.method == "embedding"
+    scores = scorer.matrix(["Terraform", "Ansible"], ["terraform", "Puppet"])
+    assert np.isclose(scores[0, 0], 1.0)
+    scorer.matrix(["Terraform"], ["Puppet", "Chef"])
+    assert encoder.batches == [["Terraform", "Ansible", "terraform", "Puppet"], ["Chef"]]
+
+
+def test_match_skills():
+    skills_db = get_skills_database()
+    fuzzy = skills_db.get_fuzzy_matcher()
+    jd = resolve_skills(["Python", "nodejs", "PostgreSQL", "Kubernetes", "React", "Kafka Streams"], skills_db, fuzzy)
+    resume = resolve_skills(["python", "Node.js", "Postgres", "Kubernets", "React Native", "Kafka Stream"], skills_db, fuzzy)
+    result = match_skills(jd, resume, SimilarityScorer())
+
+    # Same canonical ID, same display name, or a typo of a dictionary skill
+    matched = {entry["skill"]: entry["resume_skill"] for entry in result["matched"]}
+    assert matched == {"Python": "Python", "Node.js": "Node.js", "PostgreSQL": "PostgreSQL", "Kubernetes": "Kubernetes"}
+    # Only the two JD skills left over were scored, against the two resume skills left over
+    assert result["stats"]["pairs_scored"] == 4
+    assert [(e["skill"], e["resume_skill"]) for e in result["semantic"]] == [("Kafka Streams", "Kafka Stream")]
+    assert [e["skill"] for e in result["missing"]] == ["React"]
+    assert 0 < result["score"] < 1 and result["method"] == "string"
+
+
+if __name__ == "__main__":
+    test_assign()
+    test_scorer()
+    test_match_skills()
+    print("✅ skill match tests passed")
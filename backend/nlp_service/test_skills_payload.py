@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Test the /extract-skills payload built from collapsed matches (full and compact)
+"""
+
+import sys
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import main
+from skills_matcher import get_skills_database
+
+# Two canonicals with one display name, and a name JS would reorder as an object key
+MATCHES = [
+    ("Docker", "docker", 1.0),
+    ("Postgres", "postgres", 2.0),
+    ("PostgreSQL", "postgresql", 2.0),
+    ("Python", "python", 3.0),
+    ("3", "3", 1.0),
+]
+
+
+def _payload(compact: bool):
+    request = main.ExtractSkillsRequest(text="unused", compact=compact)
+    return main._build_skills_payload(request, MATCHES, get_skills_database())
+
+
+def test_full_payload_dedupes_display_names():
+    payload = _payload(compact=False)
+    assert payload["skills"].count("PostgreSQL") == 1
+    assert payload["count"] == len(payload["skills"]) == len(payload["matches"]) == payload["stats"]["unique_skills"]
+
+
+def test_compact_payload_is_ordered_pairs():
+    full = _payload(compact=False)
+    compact = _payload(compact=True)
+    assert "skills" not in compact and "matches" not in compact
+    assert isinstance(compact["weights"], list) and all(len(pair) == 2 for pair in compact["weights"])
+
+    # Same skills, same order as the full payload, no name listed twice
+    names = [name for name, _ in compact["weights"]]
+    assert names == full["skills"] and len(set(names)) == len(names)
+    assert compact["count"] == len(compact["weights"])
+    assert compact["weights"][0] == ["Python", 3.0]
+    weights = [weight for _, weight in compact["weights"]]
+    assert weights == sorted(weights, reverse=True)
+
+
+if __name__ == "__main__":
+    test_full_payload_dedupes_display_names()
+    test_compact_payload_is_ordered_pairs()
+    print("✅ skills payload tests passed")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test paragraph splitting and the event stream of /extract-skills/stream
+"""
+
+import asyncio
+import sys
+import threading
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from skills_matcher import split_paragraphs
+
+
+def test_split_paragraphs():
+    text = "Requirements:\n- Python\n- Docker\n\n\n  \nNice to have: Kubernetes\n\n   "
+    assert split_paragraphs(text) == ["Requirements:\n- Python\n- Docker", "Nice to have: Kubernetes"]
+    assert split_paragraphs("   \n\n ") == []
+
+    # A pasted wall of text without blank lines is packed into bounded pieces
+    lines = [f"Line {i} mentions Python and SQL." for i in range(100)]
+    pieces = split_paragraphs("\n".join(lines), max_chars=200)
+    assert len(pieces) > 1
+    assert all(len(piece) <= 200 for piece in pieces)
+    assert "\n".join(pieces) == "\n".join(lines)
+
+    sentences = " ".join(f"Sentence {i} is about Go." for i in range(50))
+    pieces = split_paragraphs(sentences, max_chars=120)
+    assert all(len(piece) <= 120 for piece in pieces)
+    assert " ".join(piece.replace("\n", " ") for piece in pieces) == sentences
+
+
+def test_empty_summary_follows_compact():
+    import main
+
+    for compact in (True, False):
+        request = main.ExtractSkillsRequest(text="   \n ", compact=compact)
+        events = list(main._stream_skills_internal(request, threading.Event()))
+        assert [event["event"] for event in events] == ["summary"]
+        assert events[0]["count"] == 0 and events[0]["paragraphs"] == 0
+        assert ("weights" in events[0]) == compact and ("skills" in events[0]) != compact
+
+
+def test_disconnect_before_body_stops_worker():
+    import main
+
+    started, finished = threading.Event(), threading.Event()
+    stops = []
+
+    def stream(request, stop):
+        stops.append(stop)
+        started.set()
+        # Keeps the worker (and its admission slot) busy until told to stop
+        stop.wait(10)
+        finished.set()
+        return iter(())
+
+    async def disconnect_at_once():
+        response = await main.extract_skills_stream(main.ExtractSkillsRequest(text="Python"), None)
+        await asyncio.to_thread(started.wait, 10)
+
+        async def receive():
+            await asyncio.sleep(0.05)
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                await asyncio.sleep(10)  # slow client: still sending headers when it goes away
+
+        # The disconnect cancels the response before the body is iterated: ndjson() never starts
+        await response({"type": "http", "asgi": {"spec_version": "2.4"}}, receive, send)
+        assert await asyncio.to_thread(finished.wait, 10)
+        await asyncio.sleep(0.05)  # worker done callback releases the slot
+
+    original = main._stream_skills_internal
+    main._stream_skills_internal = stream
+    try:
+        asyncio.run(disconnect_at_once())
+    finally:
+        main._stream_skills_internal = original
+    assert len(stops) == 1 and stops[0].is_set()
+
+if __name__ == "__main__":
+    test_split_paragraphs()
+    test_empty_summary_follows_compact()
+    test_disconnect_before_body_stops_worker()
+    print("✅ streaming tests passed")
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Test markup and page-chrome cleanup ahead of spaCy
+"""
+
+import sys
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from text_preprocessing import iter_clean_paragraphs, preprocess_text
+
+
+def test_markup_is_stripped():
+    html_text = (
+        "<html><head><style>p { color: red; }</style></head><body>"
+        "<h2>Requirements</h2><ul><li>5+ years of <b>Python</b> &amp; SQL</li>"
+        "<li>Docker&nbsp;and&nbsp;Kubernetes</li></ul><!-- tracking -->"
+        "<p>Send your CV to &lt;your name&gt;@example.com</p></body></html>"
+    )
+    assert list(iter_clean_paragraphs(html_text)) == [
+        "Requirements",
+        "5+ years of Python & SQL\nDocker and Kubernetes",
+        "Send your CV to <your name>@example.com",
+    ]
+    # Text that only looks like markup is left alone
+    assert preprocess_text("Use <your name> when a < b") == "Use <your name> when a < b"
+
+
+def test_chrome_lines_are_dropped():
+    text = (
+        "Home | About Us | Careers | Contact\n"
+        "Careers > Engineering > Backend\n"
+        "Apply now   Save job\n"
+        "•  Python | Java | SQL\n"
+        "  3.  Experience\twith   AWS \n"
+        "\n\n\n"
+        "----\n"
+        "© 2024 Example Corp. All rights reserved."
+    )
+    assert preprocess_text(text) == "Python | Java | SQL\nExperience with AWS"
+
+
+def test_paragraph_breaks_are_kept():
+    text = "About the role\r\n\r\nWe use Go.\n \nNice to have:\nRust\u200b"
+    assert preprocess_text(text) == "About the role\n\nWe use Go.\n\nNice to have:\nRust"
+    assert preprocess_text("") == ""
+
+
+if __name__ == "__main__":
+    test_markup_is_stripped()
+    test_chrome_lines_are_dropped()
+    test_paragraph_breaks_are_kept()
+    print("✅ text preprocessing tests passed")
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Test msgpack/JSON content negotiation (transport.py)
+"""
+
+import sys
+from pathlib import Path
+
+import msgpack
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import transport
+from transport import MSGPACK_MEDIA_TYPE, NegotiatedRoute, negotiated_response
+
+
+class EchoRequest(BaseModel):
+    text: str
+    compact: bool = False
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.router.route_class = NegotiatedRoute
+
+    @app.post("/echo")
+    async def echo(request: EchoRequest, http_request: Request):
+        return negotiated_response(
+            {"text": request.text, "compact": request.compact, "request": type(http_request).__name__},
+            http_request.headers.get("accept"),
+        )
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_msgpack_body():
+    client = _client()
+    body = msgpack.packb({"text": "Python and Docker", "compact": True})
+    response = client.post("/echo", content=body, headers={"Content-Type": MSGPACK_MEDIA_TYPE})
+    assert response.status_code == 200 and response.headers["content-type"].startswith("application/json")
+    assert response.json() == {"text": "Python and Docker", "compact": True, "request": "MsgpackRequest"}
+
+    # Accept: msgpack gets a msgpack response; the legacy x-msgpack type is accepted too
+    response = client.post("/echo", content=body, headers={
+        "Content-Type": "application/x-msgpack", "Accept": MSGPACK_MEDIA_TYPE,
+    })
+    assert response.status_code == 200 and response.headers["content-type"] == MSGPACK_MEDIA_TYPE
+    assert msgpack.unpackb(response.content)["text"] == "Python and Docker"
+
+    # Field validation still applies to decoded bodies
+    response = client.post("/echo", content=msgpack.packb({"compact": True}),
+                           headers={"Content-Type": MSGPACK_MEDIA_TYPE})
+    assert response.status_code == 422
+
+
+def test_json_fallback():
+    client = _client()
+    response = client.post("/echo", json={"text": "Go"})
+    assert response.status_code == 200
+    assert response.json() == {"text": "Go", "compact": False, "request": "Request"}
+
+    # Without the msgpack package, msgpack bodies are refused and responses stay JSON
+    original = transport.MSGPACK_AVAILABLE
+    transport.MSGPACK_AVAILABLE = False
+    try:
+        response = client.post("/echo", content=msgpack.packb({"text": "Go"}),
+                               headers={"Content-Type": MSGPACK_MEDIA_TYPE})
+        assert response.status_code == 415
+        response = client.post("/echo", json={"text": "Go"}, headers={"Accept": MSGPACK_MEDIA_TYPE})
+        assert response.status_code == 200 and response.json()["text"] == "Go"
+    finally:
+        transport.MSGPACK_AVAILABLE = original
+
+
+def test_unknown_content_type():
+    # Not decoded as msgpack: FastAPI rejects the body as not being an object
+    response = _client().post("/echo", content=b"text=Go", headers={"Content-Type": "text/plain"})
+    assert response.status_code == 422
+
+
+def test_malformed_msgpack_body():
+    client = _client()
+    bodies = [
+        b"\xc1",                                                      # reserved byte
+        msgpack.packb({"text": "Go"})[:-1],                           # truncated
+        msgpack.packb({"text": "Go"}) + b"\x01",                      # trailing data
+        msgpack.packb({"text": b"\xff\xfe"}, use_bin_type=True),      # bin, not UTF-8
+        msgpack.packb([b"\xff"], use_bin_type=True),
+        msgpack.packb({"text": msgpack.ExtType(1, b"x")}),
+        msgpack.packb({1: "Go"}),                                     # non-string map key
+    ]
+    for body in bodies:
+        response = client.post("/echo", content=body, headers={"Content-Type": MSGPACK_MEDIA_TYPE})
+        assert response.status_code == 400, (body, response.status_code)
+        assert response.json()["detail"].startswith("Invalid msgpack body")
+
+
+if __name__ == "__main__":
+    test_msgpack_body()
+    test_json_fallback()
+    test_unknown_content_type()
+    test_malformed_msgpack_body()
+    print("✅ transport tests passed")
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test warm-up retries and the startup state /health and /ready report
+"""
+
+import sys
+from pathlib import Path
+
+# Add current directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import main
+
+
+def _reset_state():
+    main.STARTUP_STATE.update(ready=False, stage="pending", error=None, attempts=0, timings_ms={})
+
+
+def _flaky(failures: int):
+    """A warm-up that fails in warmup_skills `failures` times, then succeeds"""
+    calls = []
+
+    def warm_up_once():
+        calls.append(1)
+        main.STARTUP_STATE["stage"] = "warmup_skills"
+        if len(calls) <= failures:
+            raise RuntimeError("embeddings cache unreadable")
+
+    return warm_up_once
+
+
+def test_warm_up_retries_with_backoff():
+    original = main._warm_up_once
+    try:
+        _reset_state()
+        delays = []
+        main._warm_up_once = _flaky(3)
+        assert main.warm_up_service(max_attempts=5, sleep=delays.append)
+        assert delays == [1, 2, 4]
+        state = main.STARTUP_STATE
+        assert state["ready"] and state["stage"] == "ready" and state["error"] is None and state["attempts"] == 4
+
+        # Out of attempts: not ready, and the failed stage is reported
+        _reset_state()
+        delays = []
+        main._warm_up_once = _flaky(10)
+        assert not main.warm_up_service(max_attempts=2, sleep=delays.append)
+        assert delays == [1]
+        assert not state["ready"] and state["stage"] == "failed:warmup_skills" and state["attempts"] == 2
+        assert state["error"] == "embeddings cache unreadable"
+    finally:
+        main._warm_up_once = original
+        _reset_state()
+
+
+def test_health_reports_stage():
+    import asyncio
+    import json
+
+    _reset_state()
+    main.STARTUP_STATE["stage"] = "failed:skills_database"
+    body = json.loads(asyncio.run(main.health_check()).body)
+    assert body["ready"] is False and body["stage"] == "failed:skills_database"
+    _reset_state()
+
+
+if __name__ == "__main__":
+    test_warm_up_retries_with_backoff()
+    test_health_reports_stage()
+    print("✅ warm-up tests passed")
@@ -0,0 +1,172 @@
+"""
+Text Preprocessing
+==================
+Cleans scraped job-page text before spaCy sees it.
+
+The extension (content.jsx) and users pasting careers pages send markup
+remnants, entities, bullet glyphs, runs of whitespace and page chrome
+(navigation, cookie banners, share/apply buttons, footers). All of it costs
+tokenizer/tagger/parser time and can only produce junk candidates.
+
+Paragraph by paragraph, line by line:
+
+    markup      <script>/<style> blocks and comments dropped; block tags become
+                paragraph or line breaks, inline tags are removed; entities
+                decoded. Only known HTML tag names are touched, so text like
+                "<your name>" or "a < b" survives.
+    characters  zero-width characters removed, Unicode spaces and bullet glyphs
+                become spaces, leading list markers ("- ", "3. ") removed
+    lines       whitespace collapsed; chrome lines and lines without letters
+                dropped
+    paragraphs  empty paragraphs dropped; paragraphs are joined by one blank
+                line, so /extract-skills/stream still sees paragraph breaks
+
+The cleaned text is also what identical-request coalescing keys on, so two
+scrapes of one posting that differ only in markup or whitespace coalesce.
+
+Environment:
+    NLP_PREPROCESS_TEXT     - "0" to send request text to spaCy unchanged (default: enabled)
+"""
+
+import html
+import os
+import re
+import time
+from typing import Iterator, Optional
+
+try:
+    from .metrics import Counter, observe_stage
+except ImportError:
+    from metrics import Counter, observe_stage
+
+PREPROCESS_ENABLED = os.environ.get("NLP_PREPROCESS_TEXT", "1") != "0"
+
+PREPROCESS_CHARS = Counter(
+    "nlp_preprocess_chars_total", "Characters before (raw) and after (clean) text preprocessing", ["kind"]
+)
+PREPROCESS_LINES_DROPPED = Counter(
+    "nlp_preprocess_lines_dropped_total", "Lines removed by text preprocessing", ["reason"]
+)
+
+# Paragraph / line breaks stand in for block tags until lines are split
+_PARAGRAPH_BREAK = "\x1d"
+_LINE_BREAK = "\x1e"
+
+_DROPPED_BLOCK_RE = re.compile(
+    r"<\s*(script|style|noscript|svg|head|template)\b[^>]*>.*?<\s*/\s*\1\s*>|<!--.*?-->",
+    re.IGNORECASE | re.DOTALL,
+)
+_PARAGRAPH_TAG_RE = re.compile(
+    r"<\s*/?\s*(?:p|div|h[1-6]|ul|ol|dl|table|thead|tbody|section|article|header|footer|nav|aside|main|"
+    r"form|blockquote|pre|hr|body|html)\b[^<>]*>",
+    re.IGNORECASE,
+)
+_LINE_TAG_RE = re.compile(r"<\s*/?\s*(?:br|li|tr|dt|dd|option|button|label)\b[^<>]*>", re.IGNORECASE)
+_CELL_TAG_RE = re.compile(r"<\s*/?\s*(?:td|th|img|input|meta|link|iframe)\b[^<>]*>", re.IGNORECASE)
+_INLINE_TAG_RE = re.compile(
+    r"<\s*/?\s*(?:span|a|b|strong|em|i|u|s|small|big|sup|sub|font|mark|code|abbr|cite|time|wbr)\b[^<>]*>",
+    re.IGNORECASE,
+)
+_BLANK_LINES_RE = re.compile(r"\n[ \t\r\f\v]*\n\s*")
+
+_ZERO_WIDTH = "\u200b\u200c\u200d\u2060\ufeff\u00ad"
+_SPACE_CHARS = "\u00a0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a\u202f\u205f\u3000"
+# Bullets, arrows and check marks used as list markers or separators
+_BULLETS = ("\u2022\u2023\u2043\u2219\u00b7\u25aa\u25ab\u25cf\u25cb\u25e6\u25a0\u25a1"
+            "\u25b6\u25ba\u27a2\u27a4\u2713\u2714\u2605\u2606\u2756\u2666")
+# str.translate instead of per-character regexes: one C-level pass over the text
+_CHARACTER_TABLE = str.maketrans({
+    **{char: " " for char in _SPACE_CHARS + _BULLETS},
+    **{char: None for char in _ZERO_WIDTH},
+})
+_LIST_MARKER_RE = re.compile(r"^(?:[-*+>]|\(?\d{1,2}[.)])\s+")
+_HAS_LETTER_RE = re.compile(r"[^\W\d_]")
+
+# Whole lines made only of page actions ("Apply now Save job", "Show more")
+_ACTION_LINE_RE = re.compile(
+    r"^(?:(?:apply now|easy apply|apply|save job|save|share|report this job|show more|show less|see more|"
+    r"read more|see less|sign in|log in|login|sign up|back to search results|back to jobs|"
+    r"skip to main content|skip to content|accept all cookies|accept cookies|reject all|"
+    r"manage preferences|cookie settings)\s*[|/,.:]?\s*)+$",
+    re.IGNORECASE,
+)
+# Banners and footers, recognised by how they start (or end with "all rights reserved")
+_CHROME_LINE_RE = re.compile(
+    r"(?:share this (?:job|posting)\b|we use cookies\b|this (?:web)?site uses cookies\b|follow us\b|"
+    r"(?:\u00a9|\(c\)|copyright)\s*\d{4}\b|posted \d+\+? (?:minutes?|hours?|days?|weeks?|months?) ago\b|"
+    r"\d+\+? applicants?$)",
+    re.IGNORECASE,
+)
+# Separated menus: "Home | About Us | Careers" or breadcrumbs "Careers > Engineering > ..."
+_MENU_CHARS = frozenset("|>\u203a\u00bb")
+_MENU_SEPARATOR_RE = re.compile(r"\s+(?:\||>|\u203a|\u00bb)\s+")
+_BREADCRUMB_RE = re.compile(r"\s(?:>|\u203a|\u00bb)\s")
+_NAV_TERMS = frozenset({
+    "home", "about", "about us", "careers", "jobs", "blog", "contact", "contact us", "log in", "login",
+    "sign in", "sign up", "register", "privacy", "privacy policy", "terms", "terms of use",
+    "terms of service", "cookie policy", "cookie settings", "accessibility", "sitemap", "investors",
+    "newsroom", "news", "press", "help", "support", "faq", "linkedin", "twitter", "x", "facebook",
+    "youtube", "instagram", "email", "search", "all jobs", "job search",
+})
+
+
+def _chrome_reason(line: str) -> Optional[str]:
+    """Why `line` is page chrome (a metrics label), or None for content"""
+    if not _HAS_LETTER_RE.search(line):
+        return "no_letters"
+    if len(line) <= 80 and _ACTION_LINE_RE.match(line):
+        return "action"
+    if _CHROME_LINE_RE.match(line) or line[-22:].lower().rstrip(".").endswith("all rights reserved"):
+        return "banner"
+    if _MENU_CHARS.isdisjoint(line):
+        return None
+    segments = _MENU_SEPARATOR_RE.split(line)
+    if len(segments) >= 3:
+        # Mostly navigation words; "Python | Java | SQL" is a skill list and stays
+        nav = sum(1 for segment in segments if segment.strip(" .:").lower() in _NAV_TERMS)
+        if nav * 2 >= len(segments) or (_BREADCRUMB_RE.search(line) and all(len(s.split()) <= 4 for s in segments)):
+            return "navigation"
+    return None
+
+
+def iter_clean_paragraphs(text: str) -> Iterator[str]:
+    """Yield cleaned, non-empty paragraphs of `text` (lines joined by newlines)"""
+    if "<" in text:
+        text = _DROPPED_BLOCK_RE.sub(" ", text)
+        text = _PARAGRAPH_TAG_RE.sub(_PARAGRAPH_BREAK, text)
+        text = _LINE_TAG_RE.sub(_LINE_BREAK, text)
+        text = _CELL_TAG_RE.sub(" ", text)
+        text = _INLINE_TAG_RE.sub("", text)
+    if "&" in text:
+        text = html.unescape(text)
+    text = text.translate(_CHARACTER_TABLE).replace("\r\n", "\n").replace("\r", "\n")
+    text = _BLANK_LINES_RE.sub(_PARAGRAPH_BREAK, text)
+
+    for paragraph in text.split(_PARAGRAPH_BREAK):
+        lines = []
+        for line in paragraph.replace(_LINE_BREAK, "\n").split("\n"):
+            # Collapses runs of spaces/tabs and trims
+            line = " ".join(line.split())
+            if line[:1] in "-*+>(0123456789":
+                line = _LIST_MARKER_RE.sub("", line)
+            if not line:
+                continue
+            reason = _chrome_reason(line)
+            if reason:
+                PREPROCESS_LINES_DROPPED.inc(reason=reason)
+                continue
+            lines.append(line)
+        if lines:
+            yield "\n".join(lines)
+
+
+def preprocess_text(text: str) -> str:
+    """Cleaned text for spaCy (paragraphs separated by a blank line); unchanged if disabled"""
+    if not PREPROCESS_ENABLED or not text:
+        return text
+    start = time.perf_counter()
+    cleaned = "\n\n".join(iter_clean_paragraphs(text))
+    observe_stage("preprocess", time.perf_counter() - start)
+    PREPROCESS_CHARS.inc(len(text), kind="raw")
+    PREPROCESS_CHARS.inc(len(cleaned), kind="clean")
+    return cleaned
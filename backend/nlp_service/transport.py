@@ -0,0 +1,135 @@
+"""
+Transport
+=========
+Optional binary encoding between the Node backend and the NLP service.
+
+Requests with `Content-Type: application/msgpack` are decoded by
+NegotiatedRoute before FastAPI validates the body, so endpoints keep their
+pydantic request models. Responses are msgpack when the client's Accept
+header asks for it, JSON (FastJSONResponse) otherwise.
+
+msgpack is optional: without it, msgpack request bodies get 415 and every
+response is JSON. Unix domain sockets need no code here; start uvicorn with
+`--uds <path>` (keywords.js does this when NLP_SERVICE_SOCKET is set).
+"""
+
+from typing import Any, Callable, Optional
+
+from fastapi import HTTPException, Request, Response
+from fastapi.routing import APIRoute
+
+try:
+    from .serialization import FastJSONResponse, to_builtin
+except ImportError:
+    from serialization import FastJSONResponse, to_builtin
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+_MSGPACK_MEDIA_TYPES = (MSGPACK_MEDIA_TYPE, "application/x-msgpack")
+
+
+def is_msgpack(media_type: Optional[str]) -> bool:
+    """True if a Content-Type / Accept value names msgpack"""
+    if not media_type:
+        return False
+    media_type = media_type.lower()
+    return any(candidate in media_type for candidate in _MSGPACK_MEDIA_TYPES)
+
+
+def _reject_binary(value: Any) -> None:
+    if isinstance(value, bytes):
+        raise ValueError("bin values are not allowed, send text as str")
+
+
+def _check_map(pairs: dict) -> dict:
+    for key, value in pairs.items():
+        _reject_binary(key)
+        _reject_binary(value)
+    return pairs
+
+
+def _check_array(items: list) -> list:
+    for item in items:
+        _reject_binary(item)
+    return items
+
+
+def _reject_ext(code: int, data: bytes) -> Any:
+    raise ValueError(f"ext type {code} is not allowed")
+
+
+def unpack_body(body: bytes) -> Any:
+    """
+    Decode a msgpack body into JSON types.
+
+    bin and ext values have no JSON equivalent (and undecodable bytes would
+    break FastAPI's validation error response), so they are rejected during
+    decoding rather than passed on to validation.
+    """
+    value = msgpack.unpackb(
+        body, raw=False, object_hook=_check_map, list_hook=_check_array, ext_hook=_reject_ext
+    )
+    _reject_binary(value)
+    return value
+
+
+class MsgpackRequest(Request):
+    """Request whose body is msgpack; json() returns the decoded object"""
+
+    async def json(self) -> Any:
+        if not hasattr(self, "_json"):
+            try:
+                self._json = unpack_body(await self.body())
+            except Exception as e:
+                raise HTTPException(status_code=400, detail=f"Invalid msgpack body: {e!r}")
+        return self._json
+
+
+class NegotiatedRoute(APIRoute):
+    """
+    APIRoute that accepts msgpack request bodies.
+
+    FastAPI only parses bodies whose Content-Type is JSON, so msgpack
+    requests are re-labelled as application/json and handed over as a
+    MsgpackRequest, whose json() decodes msgpack instead.
+    """
+
+    def get_route_handler(self) -> Callable:
+        original_handler = super().get_route_handler()
+
+        async def negotiated_handler(request: Request) -> Response:
+            if is_msgpack(request.headers.get("content-type")):
+                if not MSGPACK_AVAILABLE:
+                    raise HTTPException(
+                        status_code=415,
+                        detail="msgpack bodies need the msgpack package (pip install msgpack); send JSON instead"
+                    )
+                scope = dict(request.scope)
+                scope["headers"] = [
+                    (name, b"application/json" if name == b"content-type" else value)
+                    for name, value in request.scope["headers"]
+                ]
+                request = MsgpackRequest(scope, request.receive)
+            return await original_handler(request)
+
+        return negotiated_handler
+
+
+class MsgpackResponse(Response):
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return msgpack.packb(content, default=to_builtin, use_bin_type=True)
+
+
+def negotiated_response(content: Any, accept: Optional[str]) -> Response:
+    """msgpack if the client accepts it (and msgpack is installed), JSON otherwise"""
+    if MSGPACK_AVAILABLE and is_msgpack(accept):
+        return MsgpackResponse(content)
+    return FastJSONResponse(content)
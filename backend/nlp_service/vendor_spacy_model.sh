@@ -0,0 +1,40 @@
+#!/bin/bash
+# Vendor the pinned spaCy model into models/ for offline, download-free startup
+# Run this once on a machine with network access and commit/ship models/
+# (same workflow as embeddings_cache/, see precompute_embeddings.sh)
+
+set -e
+
+cd "$(dirname "$0")"
+
+MODEL_NAME="en_core_web_sm"
+MODEL_VERSION="3.7.1"  # Keep in sync with SPACY_MODEL_VERSION in main.py and requirements.txt
+WHEEL_URL="https://github.com/explosion/spacy-models/releases/download/${MODEL_NAME}-${MODEL_VERSION}/${MODEL_NAME}-${MODEL_VERSION}-py3-none-any.whl"
+TARGET_DIR="models/${MODEL_NAME}-${MODEL_VERSION}"
+
+echo "=========================================="
+echo "Vendoring spaCy model ${MODEL_NAME}-${MODEL_VERSION}"
+echo "=========================================="
+echo ""
+
+if [ -f "${TARGET_DIR}/config.cfg" ]; then
+    echo "✅ Model already vendored at ${TARGET_DIR}"
+    exit 0
+fi
+
+TMP_DIR="$(mktemp -d)"
+trap 'rm -rf "$TMP_DIR"' EXIT
+
+echo "Downloading ${WHEEL_URL}..."
+curl -fsSL -o "${TMP_DIR}/model.whl" "${WHEEL_URL}"
+
+echo "Extracting model data..."
+python3 -m zipfile -e "${TMP_DIR}/model.whl" "${TMP_DIR}/wheel"
+
+mkdir -p models
+rm -rf "${TARGET_DIR}"
+cp -R "${TMP_DIR}/wheel/${MODEL_NAME}/${MODEL_NAME}-${MODEL_VERSION}" "${TARGET_DIR}"
+
+echo ""
+echo "Done! Model vendored at ${TARGET_DIR}"
+echo "main.py loads it from there automatically (or set SPACY_MODEL_PATH)"
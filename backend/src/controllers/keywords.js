@@ -20,9 +20,30 @@ const Fuse = require('fuse.js');
 const NLP_SERVICE_URL = process.env.NLP_SERVICE_URL || 'http://127.0.0.1:8001';
 const NLP_SERVICE_PORT = new URL(NLP_SERVICE_URL).port || '8001';
 const NLP_SERVICE_TIMEOUT = parseInt(process.env.NLP_SERVICE_TIMEOUT) || 120000; // 2 minutes (allows time for model download)
+// Optional per-request latency budget: the service skips optional stages to answer in time
+const NLP_LATENCY_BUDGET_MS = parseInt(process.env.NLP_LATENCY_BUDGET_MS) || null;
 const HEALTH_CHECK_TIMEOUT = parseInt(process.env.HEALTH_CHECK_TIMEOUT) || 120000; // 120 seconds (allows time for Sentence Transformers model download on first run)
 const MAX_PRESENT_SKILLS = 15; // Maximum number of present skills to show
 
+// Co-located deployments: talk to the service over a Unix domain socket instead of TCP.
+// The spawned service listens on this path (uvicorn --uds); NLP_SERVICE_URL then only
+// supplies the request path prefix.
+const NLP_SERVICE_SOCKET = process.env.NLP_SERVICE_SOCKET || null;
+
+// Request/response encoding: 'json' (default) or 'msgpack' (needs `npm install @msgpack/msgpack`
+// here and `pip install msgpack` in the NLP service; falls back to JSON otherwise)
+const NLP_SERVICE_ENCODING = (process.env.NLP_SERVICE_ENCODING || 'json').toLowerCase();
+const MSGPACK_MEDIA_TYPE = 'application/msgpack';
+
+let msgpack = null;
+if (NLP_SERVICE_ENCODING === 'msgpack') {
+  try {
+    msgpack = require('@msgpack/msgpack');
+  } catch (error) {
+    console.warn('[Keywords] ⚠️  NLP_SERVICE_ENCODING=msgpack but @msgpack/msgpack is not installed - using JSON');
+  }
+}
+
 // ============================================================================
 // HTTP Client with Connection Pooling
 // ============================================================================
@@ -51,6 +72,7 @@ const nlpHttpClient = axios.create({
   timeout: NLP_SERVICE_TIMEOUT,
   httpAgent: httpAgent,
   httpsAgent: httpsAgent,
+  ...(NLP_SERVICE_SOCKET ? { socketPath: NLP_SERVICE_SOCKET } : {}),
   headers: {
     'Content-Type': 'application/json',
     'Connection': 'keep-alive'
@@ -59,6 +81,71 @@ const nlpHttpClient = axios.create({
   validateStatus: (status) => status < 500 // Don't throw on 4xx errors
 });
 
+/**
+ * Decode an NLP service response body fetched as an arraybuffer (msgpack or JSON)
+ * @param {Object} response - axios response with responseType 'arraybuffer'
+ * @returns {*} Decoded body
+ */
+function decodeNlpResponseBody(response) {
+  const body = Buffer.from(response.data || []);
+  const contentType = String(response.headers?.['content-type'] || '');
+  if (contentType.includes(MSGPACK_MEDIA_TYPE)) {
+    return msgpack.decode(body);
+  }
+  const text = body.toString('utf8');
+  try {
+    return JSON.parse(text);
+  } catch (error) {
+    return text;
+  }
+}
+
+/**
+ * POST to the NLP service using the configured encoding (JSON or msgpack).
+ * Responses (including error responses) come back with `data` decoded, as with plain axios.
+ * @param {string} url - Endpoint URL
+ * @param {Object} payload - Request body
+ * @returns {Promise<Object>} axios response
+ */
+async function postToNlpService(url, payload) {
+  if (!msgpack) {
+    return nlpHttpClient.post(url, payload);
+  }
+  try {
+    const response = await nlpHttpClient.post(url, Buffer.from(msgpack.encode(payload)), {
+      headers: {
+        'Content-Type': MSGPACK_MEDIA_TYPE,
+        'Accept': `${MSGPACK_MEDIA_TYPE}, application/json;q=0.9`
+      },
+      responseType: 'arraybuffer'
+    });
+    response.data = decodeNlpResponseBody(response);
+    return response;
+  } catch (error) {
+    if (error.response) {
+      error.response.data = decodeNlpResponseBody(error.response);
+    }
+    throw error;
+  }
+}
+
+/**
+ * Reply 503 with the NLP service's Retry-After hint when it sheds load (429/503 from admission control)
+ * @param {Object} res - Express response
+ * @param {Object} nlpResponse - axios response from the NLP service
+ */
+function sendNlpBusy(res, nlpResponse) {
+  const retryAfter = nlpResponse.headers?.['retry-after'];
+  if (retryAfter) {
+    res.set('Retry-After', retryAfter);
+  }
+  return res.status(503).json({
+    error: 'NLP service busy',
+    message: nlpResponse.data?.detail || 'Too many keyword requests in progress. Please retry shortly.',
+    retry_after_seconds: Number(retryAfter) || null
+  });
+}
+
 /**
  * Normalize URL by removing trailing slashes
  * @param {string} url - URL to normalize
@@ -536,6 +623,34 @@ function updateHealthCache(serviceUrl, isHealthy) {
   };
 }
 
+/**
+ * Classify a /health body by warm-up state
+ * @param {Object} data - /health response body
+ * @returns {string} 'ready', 'warming' (still loading; older builds omit `ready`)
+ *   or 'failed' (`stage: failed:<stage>`: warm-up failed, the service retries it
+ *   and exits for a restart once out of attempts)
+ */
+function classifyHealth(data) {
+  if (data?.ready !== false) {
+    return 'ready';
+  }
+  return typeof data.stage === 'string' && data.stage.startsWith('failed:') ? 'failed' : 'warming';
+}
+
+/**
+ * Error for a service that is up but whose warm-up failed
+ * @param {Object} data - /health response body
+ * @returns {Error} Error with code NLP_WARMUP_FAILED
+ */
+function warmupFailedError(data) {
+  const error = new Error(`NLP service warm-up failed at ${data.stage.slice('failed:'.length)} (retrying)`);
+  error.code = 'NLP_WARMUP_FAILED';
+  return error;
+}
+
+// Warm-up state seen by the last health poll: null when the service did not answer
+let lastHealthState = null;
+
 async function waitForServiceHealth(serviceUrl, timeoutMs = HEALTH_CHECK_TIMEOUT) {
   const startTime = Date.now();
   const pollInterval = 500; // Reduced to 500ms for faster startup
@@ -546,8 +661,10 @@ async function waitForServiceHealth(serviceUrl, timeoutMs = HEALTH_CHECK_TIMEOUT
   const normalizedUrl = normalizeUrl(serviceUrl);
   const healthUrl = `${normalizedUrl}/health`;
   
+  lastHealthState = null;
   while (Date.now() - startTime < timeoutMs) {
     attemptCount++;
+    let failedHealth = null;
     try {
       // Use pooled HTTP client for better performance
       const response = await nlpHttpClient.get(healthUrl, { 
@@ -556,12 +673,18 @@ async function waitForServiceHealth(serviceUrl, timeoutMs = HEALTH_CHECK_TIMEOUT
       });
       
       if (response.status === 200 && response.data?.status === 'healthy') {
-        const elapsed = Date.now() - startTime;
-        updateHealthCache(serviceUrl, true);
-        if (isDev || attemptCount > 1) {
-          console.log(`[NLP Service] ✅ Healthy (${elapsed}ms)`);
+        lastHealthState = classifyHealth(response.data);
+        if (lastHealthState === 'ready') {
+          const elapsed = Date.now() - startTime;
+          updateHealthCache(serviceUrl, true);
+          if (isDev || attemptCount > 1) {
+            console.log(`[NLP Service] ✅ Healthy (${elapsed}ms)`);
+          }
+          return true;
+        }
+        if (lastHealthState === 'failed') {
+          failedHealth = response.data;
         }
-        return true;
       }
     } catch (error) {
       // Only log every 5th attempt to reduce noise
@@ -571,6 +694,13 @@ async function waitForServiceHealth(serviceUrl, timeoutMs = HEALTH_CHECK_TIMEOUT
       }
     }
     
+    // Failed warm-up: don't wait out the timeout as if it were still loading
+    if (failedHealth) {
+      updateHealthCache(serviceUrl, false);
+      console.error(`[NLP Service] ❌ Warm-up failed at stage ${failedHealth.stage} (service is retrying)`);
+      throw warmupFailedError(failedHealth);
+    }
+    
     await new Promise(resolve => setTimeout(resolve, pollInterval));
   }
   
@@ -586,6 +716,9 @@ async function waitForServiceHealth(serviceUrl, timeoutMs = HEALTH_CHECK_TIMEOUT
  * @returns {boolean} True if remote URL
  */
 function isRemoteNlpService(serviceUrl) {
+  if (NLP_SERVICE_SOCKET) {
+    return false; // Unix socket: always co-located
+  }
   try {
     const url = new URL(serviceUrl);
     const hostname = url.hostname.toLowerCase();
@@ -620,10 +753,19 @@ async function ensureNlpService(serviceUrl) {
         validateStatus: (status) => status === 200
       });
       if (response.status === 200 && response.data?.status === 'healthy') {
-        updateHealthCache(serviceUrl, true);
-        return;
+        const state = classifyHealth(response.data);
+        if (state === 'ready') {
+          updateHealthCache(serviceUrl, true);
+          return;
+        }
+        if (state === 'failed') {
+          throw warmupFailedError(response.data);
+        }
       }
     } catch (error) {
+      if (error.code === 'NLP_WARMUP_FAILED') {
+        throw error;
+      }
       // Service still unhealthy, continue with full check
     }
   }
@@ -633,6 +775,15 @@ async function ensureNlpService(serviceUrl) {
     return;
   }
   
+  // Running but still warming up: wait for it instead of spawning a second process
+  if (lastHealthState === 'warming') {
+    const isReady = await waitForServiceHealth(serviceUrl, HEALTH_CHECK_TIMEOUT);
+    if (!isReady) {
+      throw new Error('NLP service did not finish warming up within timeout period');
+    }
+    return;
+  }
+  
   // If using remote service (Railway, etc.), don't try to spawn locally
   if (isRemoteNlpService(serviceUrl)) {
     if (isDev) {
@@ -680,8 +831,9 @@ async function ensureNlpService(serviceUrl) {
     const args = [
       '-m', 'uvicorn',
       'main:app',
-      '--host', '127.0.0.1',
-      '--port', NLP_SERVICE_PORT
+      ...(NLP_SERVICE_SOCKET
+        ? ['--uds', NLP_SERVICE_SOCKET]
+        : ['--host', '127.0.0.1', '--port', NLP_SERVICE_PORT])
     ];
     
     // Spawn the NLP service process
@@ -1026,6 +1178,15 @@ const generateKeywords = async (req, res, next) => {
       await ensureNlpService(NLP_SERVICE_URL);
     } catch (error) {
       console.error(`[Keywords] ❌ NLP service error: ${error.message}`);
+      if (error.code === 'NLP_WARMUP_FAILED') {
+        // The service is up and retrying its warm-up (or about to restart)
+        res.set('Retry-After', '10');
+        return res.status(503).json({
+          error: 'Service unavailable',
+          message: 'NLP service failed to warm up and is retrying. Please try again shortly.',
+          details: process.env.NODE_ENV === 'development' ? error.message : undefined
+        });
+      }
       return res.status(503).json({
         error: 'Service unavailable',
         message: 'NLP service could not be started. Please ensure Python dependencies are installed. Check server logs for details.',
@@ -1041,11 +1202,13 @@ const generateKeywords = async (req, res, next) => {
     let extractResponse;
     try {
       // Use pooled HTTP client for better performance
-      extractResponse = await nlpHttpClient.post(
+      extractResponse = await postToNlpService(
         extractSkillsUrl,
         { 
           text: finalDescription,
-          use_fuzzy: true
+          use_fuzzy: true,
+          compact: true, // `weights` map instead of duplicated skills/matches lists
+          ...(NLP_LATENCY_BUDGET_MS ? { latency_budget_ms: NLP_LATENCY_BUDGET_MS } : {})
         }
       );
       if (isDev) {
@@ -1080,6 +1243,11 @@ const generateKeywords = async (req, res, next) => {
         });
       }
       
+      if (error.response?.status === 503 && error.response.headers?.['retry-after']) {
+        // Admission control: waited too long for an extraction slot
+        return sendNlpBusy(res, error.response);
+      }
+      
       if (error.response?.status === 503) {
         return res.status(503).json({
           error: 'Skills matcher unavailable',
@@ -1097,15 +1265,33 @@ const generateKeywords = async (req, res, next) => {
       throw error;
     }
     
+    // Admission control shed the request (extraction queue full); 4xx responses don't throw
+    if (extractResponse.status === 429) {
+      console.warn(`[Keywords] ⚠️  NLP service busy, retry after ${extractResponse.headers?.['retry-after']}s`);
+      return sendNlpBusy(res, extractResponse);
+    }
+    
     // Extract skills from response (already cleaned, canonicalized, weighted, and normalized)
     // Skills are normalized: "ts" → "TypeScript", "node" → "Node.js"
-    const jdSkills = Array.isArray(extractResponse.data?.skills) 
-      ? extractResponse.data.skills 
-      : [];
+    // Compact responses carry ordered `weights` [skill, weight] pairs; full responses carry skills + matches.
+    // An object (older NLP service) is still accepted, though JS moves integer-like keys to the front.
+    const rawWeights = extractResponse.data?.weights;
+    const compactWeights = Array.isArray(rawWeights)
+      ? rawWeights
+      : (rawWeights && typeof rawWeights === 'object' ? Object.entries(rawWeights) : null);
+    const jdSkills = compactWeights
+      ? compactWeights.map(([skill]) => skill)
+      : (Array.isArray(extractResponse.data?.skills) ? extractResponse.data.skills : []);
     
-    // Extract skill weights from matches
+    // Extract skill weights
     const skillWeights = new Map();
-    if (Array.isArray(extractResponse.data?.matches)) {
+    if (compactWeights) {
+      compactWeights.forEach(([skill, weight]) => {
+        if (skill && weight) {
+          skillWeights.set(skill.toLowerCase(), weight);
+        }
+      });
+    } else if (Array.isArray(extractResponse.data?.matches)) {
       extractResponse.data.matches.forEach(match => {
         if (match.skill && match.weight) {
           skillWeights.set(match.skill.toLowerCase(), match.weight);
@@ -1118,7 +1304,7 @@ const generateKeywords = async (req, res, next) => {
     // Extract 3-section classification from NLP service response
     const importantSkills = Array.isArray(extractResponse.data?.important_skills)
       ? extractResponse.data.important_skills
-      : (Array.isArray(extractResponse.data?.skills) ? extractResponse.data.skills : []);
+      : jdSkills;
     const lessImportantSkills = Array.isArray(extractResponse.data?.less_important_skills)
       ? extractResponse.data.less_important_skills
       : [];
@@ -1739,7 +1925,9 @@ const generateKeywords = async (req, res, next) => {
           name: "spaCy PhraseMatcher",
           description: "Extract skills using PhraseMatcher with 38k skills database",
           total_matches: stats.total_matches || 0,
-          raw_matches: extractResponse.data?.matches?.slice(0, 20) || [], // First 20 matches
+          raw_matches: compactWeights // First 20 matches
+            ? compactWeights.slice(0, 20).map(([skill, weight]) => ({ skill, weight }))
+            : (extractResponse.data?.matches?.slice(0, 20) || []),
           stats: {
             total_matches: stats.total_matches || 0,
             garbage_filtered: stats.garbage_filtered || 0,
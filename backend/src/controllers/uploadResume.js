@@ -11,6 +11,9 @@ const { spawn } = require('child_process');
 const NLP_SERVICE_URL = process.env.NLP_SERVICE_URL || 'http://127.0.0.1:8001';
 const NLP_SERVICE_PORT = new URL(NLP_SERVICE_URL).port || '8001';
 const NLP_SERVICE_TIMEOUT = 120000; // 2 minutes
+// Same Unix socket option as keywords.js, so both controllers share one service
+const NLP_SERVICE_SOCKET = process.env.NLP_SERVICE_SOCKET || null;
+const NLP_SOCKET_OPTIONS = NLP_SERVICE_SOCKET ? { socketPath: NLP_SERVICE_SOCKET } : {};
 
 /**
  * Normalize URL by removing trailing slashes
@@ -65,6 +68,7 @@ async function waitForServiceHealth(serviceUrl, timeoutMs = 15000) {
     attemptCount++;
     try {
       const response = await axios.get(healthUrl, { 
+        ...NLP_SOCKET_OPTIONS,
         timeout: 2000,
         validateStatus: (status) => status === 200
       });
@@ -91,6 +95,9 @@ async function waitForServiceHealth(serviceUrl, timeoutMs = 15000) {
  * @returns {boolean} True if remote URL
  */
 function isRemoteNlpService(serviceUrl) {
+  if (NLP_SERVICE_SOCKET) {
+    return false; // Unix socket: always co-located
+  }
   try {
     const url = new URL(serviceUrl);
     const hostname = url.hostname.toLowerCase();
@@ -144,8 +151,9 @@ async function ensureNlpService(serviceUrl) {
     const args = [
       '-m', 'uvicorn',
       'main:app',
-      '--host', '127.0.0.1',
-      '--port', NLP_SERVICE_PORT
+      ...(NLP_SERVICE_SOCKET
+        ? ['--uds', NLP_SERVICE_SOCKET]
+        : ['--host', '127.0.0.1', '--port', NLP_SERVICE_PORT])
     ];
     
     // Set environment variables to prevent broken pipe errors
@@ -389,6 +397,7 @@ const uploadResume = async (req, res, next) => {
           use_fuzzy: true
         },
         { 
+          ...NLP_SOCKET_OPTIONS,
           timeout: NLP_SERVICE_TIMEOUT,
           headers: { 'Content-Type': 'application/json' }
         }
@@ -57,9 +57,6 @@ $PYTHON_CMD -c "import fastapi, uvicorn, spacy" 2>/dev/null
 if [ $? -ne 0 ]; then
     echo "⚠️  Some dependencies missing. Installing requirements..."
     $PIP_CMD install -r requirements.txt
-    echo ""
-    echo "📦 Downloading spaCy model..."
-    $PYTHON_CMD -m spacy download en_core_web_sm
 fi
 
 # Set environment variables